@@ -21,7 +21,10 @@ TARGET_SITES = {
             'description': '.news-description',
             'date': '.news-date'
         },
+        'parser': 'auto',          # 解析器：lxml、html5lib、html.parser 或 auto（有 lxml 時使用 lxml，否則 html.parser）
+        'partial_parse': True,     # 只解析符合 selector.article 的元素（html5lib 不支援；只省下建樹，約快5-10%）
         'allowed_domains': ['example.com'],
+        'pagination': None,        # 分頁連結選擇器（例如 'a.next'），None表示只爬取起始頁
         'use_random_delay': True,
         'min_delay': 1.0,
         'max_delay': 3.0
@@ -29,6 +32,57 @@ TARGET_SITES = {
     # 可以添加更多網站配置
 }
 
+# HTTP傳輸層配置（所有爬蟲共用）
+HTTP_CONFIG = {
+    'pool_size': 10,        # 每個主機的連線池大小
+    'connect_timeout': 5,   # 連線逾時（秒）
+    'read_timeout': 30,     # 讀取逾時（秒）
+}
+
+# 重試與斷路器配置
+RETRY_CONFIG = {
+    'max_attempts': 5,                # 單一請求的最大嘗試次數
+    'base_delay': 2.0,                # 指數退避的基準秒數
+    'max_delay': 60.0,                # 單次等待上限（秒）
+    'breaker_failure_threshold': 8,   # 連續失敗多少次後開啟斷路器
+    'breaker_reset_timeout': None,    # 斷路器開啟後多久放行試探請求，None表示本次執行不再恢復
+}
+
+# 非同步多站爬蟲配置
+ASYNC_SCRAPER_CONFIG = {
+    'max_concurrency': 64,          # 整個程序同時進行的請求上限
+    'per_domain_concurrency': 2,    # 每個網域同時進行的請求上限（可在 TARGET_SITES 以 max_concurrency 覆寫）
+}
+
+# 多站爬取排程配置
+CRAWL_CONFIG = {
+    'max_workers': 8,               # 全域工作執行緒數
+    'per_site_concurrency': 1,      # 每個網站同時進行的請求上限（可在 TARGET_SITES 以 max_concurrency 覆寫）
+    'report_interval': 10.0,        # 進度報告間隔（秒），0 表示只在結束時報告
+    'output_dir': os.path.join(DATA_DIR, 'sites'),  # 各網站的輸出目錄
+    'follow_links': False,          # 是否跟隨項目連結（分頁連結只要配置了 pagination 就會跟隨）
+    'max_depth': 1,                 # 跟隨連結的最大深度（起始URL為0）
+    'max_pages': 1000,              # 每個網站最多爬取的頁數，None表示不限
+    'expected_urls': 1000000,       # 未限制頁數時預期的URL數量（決定去重索引使用集合或布隆過濾器）
+    'frontier_spill_dir': None,     # 待爬佇列溢出到磁碟的目錄，None表示系統暫存目錄
+    'validators_path': os.path.join(DATA_DIR, 'sites', 'validators.json'),  # 各頁面的 ETag / Last-Modified 與上次解析結果
+}
+
+# 寵物登記爬蟲配置
+PET_SCRAPER_CONFIG = {
+    'max_workers': 4,             # 並行抓取的工作執行緒數
+    'requests_per_second': 0.5,   # 全域每秒請求預算（由所有執行緒共享）
+    'cache_dir': os.path.join(DATA_DIR, 'cache'),  # API回應快取目錄
+    'cache_max_bytes': 100 * 1024 * 1024,          # 快取大小上限
+    'open_period_cache_ttl': 6 * 3600,             # 未結束年度的快取存活秒數
+    'granularity': 'year',        # 時間粒度：year、quarter、month 或 day
+    'split_after_retries': 2,     # 窗口拆分前的嘗試次數
+    'max_split_depth': 3,         # 窗口最多被二分的層數
+    'checkpoint_path': os.path.join(DATA_DIR, 'checkpoint.jsonl'),  # 分區檢查點日誌
+    'db_path': os.path.join(DATA_DIR, 'pet_registration.db'),       # SQLite 記錄庫（main.py --db）
+    'shards_dir': os.path.join(PUBLIC_DIR, 'data', 'shards'),       # 按年份×動物類型的分片輸出（main.py --shards）
+}
+
 # 輸出文件配置
 OUTPUT_FILES = {
     'json': os.path.join(DATA_DIR, 'scraped_data.json'),
@@ -0,0 +1,188 @@
+"""
+非同步多站爬蟲控制器
+在單一程序中並行抓取多個網站，解析邏輯沿用同步的 ScraperController
+"""
+
+import time
+import asyncio
+import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
+
+from app.config import TARGET_SITES, HTTP_CONFIG, ASYNC_SCRAPER_CONFIG
+from app.controllers.scraper import ScraperController, create_scraper, site_type_for_url
+from app.models.data_model import ScrapedData
+from app.utils.helpers import SitePoliteness, extract_domain
+from app.utils.transport import get_session, request as http_request
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp 為選用依賴，未安裝時在執行緒中使用同步傳輸層
+    aiohttp = None
+
+logger = logging.getLogger('async_scraper')
+
+
+class DomainThrottle:
+    """單一網站（或網域）的非同步節流器
+
+    並行上限與請求間隔的規則由 SitePoliteness 記帳（與 CrawlScheduler 的 SiteQueue 共用）；
+    此類別以信號量等待並行名額，再以 asyncio.sleep 等到預約的開始時間。
+    """
+
+    def __init__(self, politeness: SitePoliteness):
+        self.politeness = politeness
+        self._semaphore = asyncio.Semaphore(politeness.concurrency)
+
+    async def __aenter__(self) -> 'DomainThrottle':
+        await self._semaphore.acquire()
+        # 預約後各自等待，等待中的請求不會阻擋同一網站其他請求的預約
+        loop = asyncio.get_running_loop()
+        start = self.politeness.reserve(loop.time())
+        try:
+            wait = start - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.politeness.release()
+        self._semaphore.release()
+
+
+class AsyncScraperController:
+    """非同步爬蟲控制器：並行抓取多個URL
+
+    每個URL依網域對應到 TARGET_SITES 中的網站，並由 create_scraper 建立對應的爬蟲負責解析。
+    同一網站的請求共用一個 DomainThrottle（並行上限與 min_delay/max_delay 間隔），
+    通過網站節流後的請求另受全域並行上限限制。安裝 aiohttp 時使用其非同步客戶端，
+    否則在大小為全域並行上限的專用執行緒池中使用同步傳輸層。
+    頁面解析（BeautifulSoup）在執行緒中進行，不會阻塞事件循環上其他請求的下載。
+    """
+
+    def __init__(self, sites: Optional[Dict[str, Dict[str, Any]]] = None,
+                 max_concurrency: Optional[int] = None, per_domain_concurrency: Optional[int] = None):
+        """初始化非同步爬蟲控制器
+
+        Args:
+            sites: 網站配置，默認為 TARGET_SITES
+            max_concurrency: 全域並行請求上限，默認取自 ASYNC_SCRAPER_CONFIG
+            per_domain_concurrency: 每個網站的並行請求上限，默認取自 ASYNC_SCRAPER_CONFIG
+        """
+        self.sites = sites if sites is not None else TARGET_SITES
+        self.max_concurrency = max_concurrency or ASYNC_SCRAPER_CONFIG['max_concurrency']
+        self.per_domain_concurrency = per_domain_concurrency or ASYNC_SCRAPER_CONFIG['per_domain_concurrency']
+        self.backend = 'aiohttp' if aiohttp is not None else 'thread'
+        self._throttles: Dict[str, DomainThrottle] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.stats = {'pages': 0, 'failures': 0, 'items': 0, 'elapsed': 0.0}
+
+    def _throttle_for(self, url: str, site_type: Optional[str]) -> DomainThrottle:
+        """取得URL所屬網站的節流器（未配置的網域各自使用預設上限，不加間隔）"""
+        key = site_type or extract_domain(url)
+        throttle = self._throttles.get(key)
+        if throttle is None:
+            config = self.sites.get(site_type, {}) if site_type else {}
+            throttle = self._throttles[key] = DomainThrottle(
+                SitePoliteness.from_config(config, self.per_domain_concurrency)
+            )
+        return throttle
+
+    async def _fetch(self, client: Any, url: str, headers: Dict[str, str]) -> bytes:
+        """下載頁面內容
+
+        Raises:
+            Exception: 請求失敗或回應狀態碼表示錯誤
+        """
+        if client is not None:
+            async with client.get(url, headers=headers) as response:
+                response.raise_for_status()
+                return await response.read()
+
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            self._executor, functools.partial(http_request, get_session(url), 'GET', url, headers=headers)
+        )
+        response.raise_for_status()
+        return response.content
+
+    async def scrape(self, client: Any, url: str, global_limit: asyncio.Semaphore) -> ScrapedData:
+        """抓取並解析單一URL
+
+        Args:
+            client: aiohttp.ClientSession，未安裝 aiohttp 時為None
+            url: 目標URL
+            global_limit: 全域並行上限
+
+        Returns:
+            ScrapedData: 爬取的數據結果（失敗時 error 欄位記錄原因）
+        """
+        site_type = site_type_for_url(url, self.sites)
+        scraper: ScraperController = create_scraper(site_type or 'default', url, self.sites.get(site_type))
+
+        try:
+            # 先通過網站節流（含請求間隔的等待），再佔用全域名額，
+            # 使等待中的慢速網站不會佔住全域名額而阻擋其他網站
+            async with self._throttle_for(url, site_type), global_limit:
+                logger.info(f"正在獲取頁面: {url}")
+                content = await self._fetch(client, url, scraper.headers)
+        except Exception as e:
+            logger.error(f"獲取頁面時發生錯誤: {url}: {e}")
+            scraper.data.error = f"獲取頁面失敗: {str(e)}"
+            self.stats['failures'] += 1
+            return scraper.data
+
+        self.stats['pages'] += 1
+        data = await asyncio.to_thread(scraper.parse_content, content)
+        self.stats['items'] += len(data.items)
+        return data
+
+    async def run_many_async(self, urls: List[str]) -> List[ScrapedData]:
+        """並行抓取多個URL
+
+        Args:
+            urls: 目標URL列表
+
+        Returns:
+            List[ScrapedData]: 與 urls 順序相同的結果列表
+        """
+        # 信號量需在事件循環內建立
+        self._throttles = {}
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        start = time.perf_counter()
+
+        if aiohttp is not None:
+            timeout = aiohttp.ClientTimeout(sock_connect=HTTP_CONFIG['connect_timeout'],
+                                            sock_read=HTTP_CONFIG['read_timeout'])
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=HTTP_CONFIG['pool_size'])
+            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as client:
+                results = await asyncio.gather(*(self.scrape(client, url, global_limit) for url in urls))
+        else:
+            # 預設執行緒池的大小與 CPU 數有關，改用與全域並行上限相同大小的專用執行緒池
+            with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='async-fetch') as executor:
+                self._executor = executor
+                try:
+                    results = await asyncio.gather(*(self.scrape(None, url, global_limit) for url in urls))
+                finally:
+                    self._executor = None
+
+        self.stats['elapsed'] += time.perf_counter() - start
+        logger.info(f"非同步抓取完成（{self.backend}）: {self.stats['pages']} 個頁面成功，"
+                    f"{self.stats['failures']} 個失敗，共 {self.stats['items']} 個項目，"
+                    f"耗時 {self.stats['elapsed']:.2f} 秒")
+        return list(results)
+
+    def run_many(self, urls: List[str]) -> List[ScrapedData]:
+        """同步介面：在新的事件循環中並行抓取多個URL
+
+        Args:
+            urls: 目標URL列表
+
+        Returns:
+            List[ScrapedData]: 與 urls 順序相同的結果列表
+        """
+        return asyncio.run(self.run_many_async(urls))
@@ -0,0 +1,262 @@
+"""
+多站爬取排程器
+讀取 TARGET_SITES 中的所有網站，以每站的禮貌佇列加上全域工作執行緒池並行爬取
+"""
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Optional, Dict, Any, List, Tuple
+
+from app.config import TARGET_SITES, CRAWL_CONFIG
+from app.controllers.scraper import PageResult, create_scraper
+from app.models.data_model import ScrapedData
+from app.utils.frontier import URLFrontier
+from app.utils.helpers import SitePoliteness, get_absolute_url, filter_urls
+from app.utils.validators import ValidatorStore
+
+logger = logging.getLogger('crawl_scheduler')
+
+
+class SiteQueue:
+    """單一網站的禮貌佇列
+
+    同一網站同時進行的請求數不超過 max_concurrency，
+    相鄰兩次請求的開始時間相隔 uniform(min_delay, max_delay) 秒（use_random_delay 為真時），
+    規則由 SitePoliteness 記帳（與 AsyncScraperController 的 DomainThrottle 共用）。
+    待爬URL保存在 URLFrontier 中：正規化去重，並套用 max_depth 與 max_pages。
+    """
+
+    def __init__(self, site_type: str, config: Dict[str, Any], default_concurrency: int = 1,
+                 follow_links: bool = False, max_depth: int = 0, max_pages: Optional[int] = None):
+        self.site_type = site_type
+        self.config = config
+        self.allowed_domains = config.get('allowed_domains')
+        self.politeness = SitePoliteness.from_config(config, default_concurrency)
+        self.follow_links = config.get('follow_links', follow_links)
+
+        self.frontier = URLFrontier(
+            max_depth=config.get('max_depth', max_depth),
+            max_pages=config.get('max_pages', max_pages),
+            expected_urls=config.get('max_pages') or max_pages or CRAWL_CONFIG['expected_urls'],
+            spill_dir=CRAWL_CONFIG['frontier_spill_dir']
+        )
+        self.data = ScrapedData(source_url=config.get('url'))
+        self.pages = 0
+        self.failures = 0
+        self.not_modified = 0
+        self.discovered = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def push(self, url: str, depth: int = 0) -> bool:
+        return self.frontier.push(url, depth)
+
+    @property
+    def in_flight(self) -> int:
+        return self.politeness.in_flight
+
+    def ready_at(self, now: float) -> Optional[float]:
+        """返回最早可以發送下一個請求的時間；佇列為空或並行數已滿時返回None"""
+        if not len(self.frontier):
+            return None
+        return self.politeness.ready_at(now)
+
+    def take(self, now: float) -> Tuple[str, int]:
+        """取出下一個URL（及其深度）並預約下一次請求的時間（呼叫前 ready_at 應已不晚於 now）"""
+        self.politeness.reserve(now)
+        if self.started_at is None:
+            self.started_at = now
+        return self.frontier.pop()
+
+    def release(self) -> None:
+        """請求結束，歸還並行名額"""
+        self.politeness.release()
+
+    @property
+    def done(self) -> bool:
+        return not len(self.frontier) and self.in_flight == 0
+
+    def stats(self, now: float) -> Dict[str, Any]:
+        """返回吞吐量與佇列深度"""
+        elapsed = ((self.finished_at or now) - self.started_at) if self.started_at is not None else 0.0
+        return {
+            'pages': self.pages,
+            'failures': self.failures,
+            'not_modified': self.not_modified,
+            'items': len(self.data.items),
+            'queue_depth': len(self.frontier),
+            'in_flight': self.in_flight,
+            'discovered': self.discovered,
+            'duplicates': self.frontier.duplicates,
+            'pages_per_second': round(self.pages / elapsed, 2) if elapsed > 0 else 0.0,
+            'items_per_second': round(len(self.data.items) / elapsed, 2) if elapsed > 0 else 0.0,
+        }
+
+
+class CrawlScheduler:
+    """多站爬取排程器
+
+    主執行緒負責排程：只有未達並行上限且已過等待時間的網站會被派發，
+    頁面下載與解析在全域執行緒池中進行。
+    解析出的項目連結會以 get_absolute_url 轉為絕對URL，並以網站的 allowed_domains 經 filter_urls 過濾。
+    網站配置了 pagination 時，分頁連結以相同深度加入佇列；
+    follow_links 為真時，項目連結以深度+1 加入佇列（受 max_depth 限制）。
+    提供 validators 時以條件請求獲取頁面，回應 304 的頁面沿用上次的解析結果。
+    """
+
+    def __init__(self, sites: Optional[Dict[str, Dict[str, Any]]] = None, max_workers: Optional[int] = None,
+                 report_interval: Optional[float] = None, follow_links: Optional[bool] = None,
+                 max_depth: Optional[int] = None, max_pages: Optional[int] = None,
+                 validators: Optional[ValidatorStore] = None):
+        """初始化排程器
+
+        Args:
+            sites: 網站配置，默認為 TARGET_SITES
+            max_workers: 全域工作執行緒數，默認取自 CRAWL_CONFIG
+            report_interval: 進度報告的間隔秒數，默認取自 CRAWL_CONFIG
+            follow_links: 是否跟隨項目連結，默認取自 CRAWL_CONFIG（網站配置可覆寫）
+            max_depth: 最大連結深度，默認取自 CRAWL_CONFIG（網站配置可覆寫）
+            max_pages: 每個網站最多爬取的頁數，默認取自 CRAWL_CONFIG（網站配置可覆寫）
+            validators: ETag / Last-Modified 存放區，None表示不使用條件請求
+        """
+        self.sites = sites if sites is not None else TARGET_SITES
+        self.max_workers = max_workers or CRAWL_CONFIG['max_workers']
+        self.report_interval = report_interval if report_interval is not None else CRAWL_CONFIG['report_interval']
+        self.validators = validators
+        self.queues: Dict[str, SiteQueue] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+        follow_links = CRAWL_CONFIG['follow_links'] if follow_links is None else follow_links
+        max_depth = CRAWL_CONFIG['max_depth'] if max_depth is None else max_depth
+        max_pages = CRAWL_CONFIG['max_pages'] if max_pages is None else max_pages
+        for site_type, config in self.sites.items():
+            queue = self.queues[site_type] = SiteQueue(
+                site_type, config, CRAWL_CONFIG['per_site_concurrency'], follow_links, max_depth, max_pages
+            )
+            for url in config.get('urls') or [config['url']]:
+                queue.push(url)
+
+    def _crawl_page(self, site_type: str, url: str) -> Tuple[Optional[PageResult], List[str], Optional[str]]:
+        """下載並解析單一頁面（在工作執行緒中執行）
+
+        Returns:
+            (頁面結果, 過濾後的項目連結, 錯誤訊息)
+        """
+        queue = self.queues[site_type]
+        scraper = create_scraper(site_type, url, queue.config, self.validators)
+        page = scraper.crawl_page()
+        if page is None:
+            return None, [], scraper.data.error
+
+        for item in page.items:
+            item.link = get_absolute_url(url, item.link)
+        links = filter_urls([item.link for item in page.items], queue.allowed_domains)
+        return page, links, None
+
+    def _on_page_done(self, queue: SiteQueue, url: str, depth: int, future: Future) -> None:
+        queue.release()
+        try:
+            page, links, error = future.result()
+        except Exception as e:
+            page, links, error = None, [], str(e)
+
+        if error is not None:
+            queue.failures += 1
+            queue.data.error = error
+            logger.error(f"[{queue.site_type}] 爬取失敗: {url}: {error}")
+        else:
+            queue.pages += 1
+            if page.not_modified:
+                queue.not_modified += 1
+            for item in page.items:
+                queue.data.add_item(item)
+            queue.discovered += len(links) + len(page.next_pages)
+            for next_url in page.next_pages:
+                queue.push(next_url, depth)
+            if queue.follow_links:
+                for link in links:
+                    queue.push(link, depth + 1)
+        if queue.done:
+            queue.finished_at = time.monotonic()
+
+    def run(self) -> Dict[str, ScrapedData]:
+        """執行爬取直到所有網站的佇列清空
+
+        Returns:
+            Dict[str, ScrapedData]: 各網站的爬取結果
+        """
+        self.started_at = time.monotonic()
+        last_report = self.started_at
+        pending: Dict[Future, Tuple[SiteQueue, str, int]] = {}
+        logger.info(f"開始爬取 {len(self.queues)} 個網站，使用 {self.max_workers} 個工作執行緒")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                now = time.monotonic()
+                next_wake = None
+                # 派發所有已可發送的網站，直到執行緒池滿載
+                for queue in self.queues.values():
+                    while len(pending) < self.max_workers:
+                        ready_at = queue.ready_at(now)
+                        if ready_at is None:
+                            break
+                        if ready_at > now:
+                            next_wake = ready_at if next_wake is None else min(next_wake, ready_at)
+                            break
+                        url, depth = queue.take(now)
+                        pending[executor.submit(self._crawl_page, queue.site_type, url)] = (queue, url, depth)
+
+                if not pending and next_wake is None:
+                    break
+
+                timeout = max(0.0, next_wake - now) if next_wake is not None else None
+                if self.report_interval:
+                    until_report = max(0.0, last_report + self.report_interval - now)
+                    timeout = until_report if timeout is None else min(timeout, until_report)
+                if pending:
+                    done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        queue, url, depth = pending.pop(future)
+                        self._on_page_done(queue, url, depth, future)
+                else:
+                    # 沒有進行中的請求，只需等到下一個網站可以發送
+                    time.sleep(timeout)
+
+                if self.report_interval and time.monotonic() - last_report >= self.report_interval:
+                    self.log_report()
+                    last_report = time.monotonic()
+
+        self.finished_at = time.monotonic()
+        for queue in self.queues.values():
+            queue.frontier.close()
+        self.log_report()
+        return {site_type: queue.data for site_type, queue in self.queues.items()}
+
+    def report(self) -> Dict[str, Any]:
+        """返回整體與各網站的吞吐量及佇列深度"""
+        now = time.monotonic()
+        sites = {site_type: queue.stats(now) for site_type, queue in self.queues.items()}
+        elapsed = ((self.finished_at or now) - self.started_at) if self.started_at is not None else 0.0
+        pages = sum(site['pages'] for site in sites.values())
+        items = sum(site['items'] for site in sites.values())
+        return {
+            'elapsed': round(elapsed, 2),
+            'pages': pages,
+            'items': items,
+            'pages_per_second': round(pages / elapsed, 2) if elapsed > 0 else 0.0,
+            'items_per_second': round(items / elapsed, 2) if elapsed > 0 else 0.0,
+            'sites': sites,
+        }
+
+    def log_report(self) -> None:
+        """將吞吐量及佇列深度寫入日誌"""
+        report = self.report()
+        logger.info(f"整體: {report['pages']} 頁 ({report['pages_per_second']} 頁/秒)，"
+                    f"{report['items']} 項 ({report['items_per_second']} 項/秒)，耗時 {report['elapsed']} 秒")
+        for site_type, site in report['sites'].items():
+            logger.info(f"[{site_type}] {site['pages']} 頁 ({site['pages_per_second']} 頁/秒)，"
+                        f"{site['items']} 項 ({site['items_per_second']} 項/秒)，"
+                        f"未變更 {site['not_modified']} 頁，佇列深度 {site['queue_depth']}，"
+                        f"進行中 {site['in_flight']}，失敗 {site['failures']}")
@@ -5,16 +5,27 @@
 
 import requests
 import logging
-import time
 import json
 import random
-from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional, Any, Tuple, Literal
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, date
+from typing import Dict, List, Optional, Any, Tuple, NamedTuple, Union
 
-from app.models.data_model import ScrapedData, ScrapedItem
-from app.utils.helpers import random_delay, clean_text
+from app.models.data_model import (
+    ScrapedData, ScrapedItem, RECORD_INT_FIELDS
+)
+from app.models.record_store import RecordStore
+from app.config import PET_SCRAPER_CONFIG, RETRY_CONFIG
+from app.utils.cache import ResponseCache
+from app.utils.checkpoint import CheckpointJournal
+from app.utils import json_codec
+from app.utils.json_codec import JSONDecodeError
+from app.utils.helpers import RateLimiter, split_year, period_granularity, extract_domain
+from app.utils.retry import (
+    RetryPolicy, FailureKind, CircuitOpenError, classify_status, parse_retry_after, get_circuit_breaker
+)
+from app.utils.transport import get_session, request as http_request, transport_stats
 
 # 設定日誌
 logger = logging.getLogger('pet_gov_tw_scraper')
@@ -26,15 +37,156 @@ ANIMAL_TYPE = {
     "ALL": "2"  # 合計，將分別爬取狗和貓，然後合併數據
 }
 
+# 動物類型代碼對應的中文名稱
+ANIMAL_NAME = {
+    ANIMAL_TYPE["DOG"]: "狗",
+    ANIMAL_TYPE["CAT"]: "貓",
+}
+
+# 同一筆記錄的識別欄位，用於增量合併（年度粒度的記錄沒有「期間」欄位）
+RECORD_KEY_FIELDS = ('縣市', '年份', '動物類型', '期間')
+
+# API 日期格式
+DATE_FORMAT = '%Y/%m/%d'
+
+# 模擬數據的錯誤訊息前綴：輸出的JSON保留此標記，增量模式與資料庫不會沿用或寫入模擬數據
+MOCK_DATA_ERROR = '無法從網站獲取數據，以下為模擬數據'
+
+
+# PostData.ashx 項目欄位到標準欄位名稱的映射
+API_FIELD_MAP = (
+    ("fld01", "登記單位數"),
+    ("fld02", "登記數(A)"),
+    ("fld03", "除戶數(B)"),
+    ("fld04", "絕育數(E)"),
+    ("fld05", "轉讓數(C)"),
+    ("fld06", "變更數(D)"),
+    ("fld07", "免絕育數(G)"),
+    ("fld08", "絕育除戶數(F)"),
+    ("fld10", "免絕育除戶數(H)"),
+    ("j", "絕育率(E-F)/(A-B)"),
+    ("k", "繁殖管理率(E-F)+(G-H)/(A-B)"),
+)
+
+# 縣市名稱可能出現的欄位名稱（依優先順序）
+API_AREA_KEYS = ("AreaName", "areaName")
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ApiRowDecoder:
+    """PostData.ashx 項目的表驅動解碼器
+    
+    欄位映射與縣市欄位別名在建立時編譯成元組，
+    解碼時對項目列表只走一次，並在同一次迴圈中補算缺少的絕育率。
+    輸出 extra_data 形式的字典（數值為字串），供檢查點、快取與JSON輸出直接使用；
+    需要原生數值時由 ScrapedData.iter_records 轉換為 PetRegistrationRecord（見 ColumnarScrapedData）。
+    """
+    
+    NEUTERING_RATE = "絕育率(E-F)/(A-B)"
+    
+    def __init__(self, field_map=API_FIELD_MAP, area_keys=API_AREA_KEYS):
+        """編譯解碼表
+        
+        Args:
+            field_map: (API欄位, 標準欄位) 的序列
+            area_keys: 縣市名稱的欄位別名
+        """
+        self.field_map = tuple(field_map)
+        self.area_keys = tuple(area_keys)
+        api_field = {standard: api for api, standard in self.field_map}
+        # 補算絕育率所需的 A、B、E、F 欄位與比率本身在API中的名稱
+        self._rate_field = api_field[self.NEUTERING_RATE]
+        self._rate_inputs = tuple(api_field[name] for name in ("登記數(A)", "除戶數(B)", "絕育數(E)", "絕育除戶數(F)"))
+    
+    def _derived_rate(self, item: Dict[str, Any]) -> Optional[float]:
+        """由 (E-F)/(A-B) 計算絕育率，資料不足或分母不為正時返回None"""
+        values = [_to_int(item.get(field)) for field in self._rate_inputs]
+        if None in values:
+            return None
+        registrations, removals, neutered, neutered_removals = values
+        if registrations - removals <= 0:
+            return None
+        return (neutered - neutered_removals) / (registrations - removals) * 100
+    
+    def decode_rows(self, items: List[Any]) -> List[Dict[str, str]]:
+        """解碼為 extra_data 形式的字典列表
+        
+        Args:
+            items: API 回傳的項目列表
+            
+        Returns:
+            List[Dict[str, str]]: 每個項目一個字典；沒有任何已知欄位的項目會被略過
+        """
+        rows = []
+        append = rows.append
+        field_map = self.field_map
+        area_keys = self.area_keys
+        rate_field = self._rate_field
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            row = {}
+            for key in area_keys:
+                if key in item:
+                    row["縣市"] = item[key]
+                    break
+            get = item.get
+            for api_field, standard_field in field_map:
+                value = get(api_field)
+                if value is not None:
+                    row[standard_field] = str(value)
+            if rate_field not in item:
+                rate = self._derived_rate(item)
+                if rate is not None:
+                    row[self.NEUTERING_RATE] = f"{rate:.2f}"
+            if row:
+                append(row)
+        return rows
+
+
+class Partition(NamedTuple):
+    """抓取分區：某動物類型在一個日期窗口內的數據"""
+    year: int
+    animal_type: str
+    start_date: str               # 'yyyy/MM/dd'
+    end_date: str                 # 'yyyy/MM/dd'
+    period: Optional[str] = None  # 非年度粒度時的期間標籤，如 '2020-03'
+
+
 class PetGovTwScraper:
     """寵物登記管理資訊網爬蟲"""
     
     BASE_URL = "https://www.pet.gov.tw/Web/O302.aspx"
     API_URL = "https://www.pet.gov.tw/Handler/PostData.ashx"  # 正確的API端點
     
-    def __init__(self):
-        """初始化爬蟲"""
-        self.session = requests.Session()
+    # API項目解碼器（類別載入時編譯一次）
+    ROW_DECODER = ApiRowDecoder()
+    
+    def __init__(self, max_workers: Optional[int] = None, requests_per_second: Optional[float] = None,
+                 cache: Optional[ResponseCache] = None, checkpoint: Optional[CheckpointJournal] = None):
+        """初始化爬蟲
+        
+        Args:
+            max_workers: 並行抓取的工作執行緒數，默認取自 PET_SCRAPER_CONFIG
+            requests_per_second: 全域每秒請求預算，默認取自 PET_SCRAPER_CONFIG
+            cache: API回應的磁碟快取，None表示不使用快取
+            checkpoint: 分區檢查點日誌，已記錄的分區不會重新抓取；None表示不使用
+        """
+        if max_workers is None:
+            max_workers = PET_SCRAPER_CONFIG['max_workers']
+        if requests_per_second is None:
+            requests_per_second = PET_SCRAPER_CONFIG['requests_per_second']
+            
+        # 與其他爬蟲共用同一主機的連線池，連線池大小至少等於工作執行緒數
+        self.session = get_session(self.BASE_URL, pool_size=max(1, max_workers))
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
                          '(KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
@@ -47,38 +199,122 @@ class PetGovTwScraper:
             'Connection': 'keep-alive',
         }
         self.data = ScrapedData(source_url=self.BASE_URL)
-        self.max_retries = 5  # 增加最大重試次數
-        self.retry_delay = 3  # 重試間隔（秒）
+        # 重試策略（指數退避加抖動）與 pet.gov.tw 共用的斷路器
+        self.retry_policy = RetryPolicy(
+            max_attempts=RETRY_CONFIG['max_attempts'],
+            base_delay=RETRY_CONFIG['base_delay'],
+            max_delay=RETRY_CONFIG['max_delay']
+        )
+        self.circuit_breaker = get_circuit_breaker(
+            extract_domain(self.API_URL),
+            failure_threshold=RETRY_CONFIG['breaker_failure_threshold'],
+            reset_timeout=RETRY_CONFIG['breaker_reset_timeout']
+        )
+        self.max_workers = max(1, max_workers)
+        # 所有執行緒共享的速率限制器，取代每次請求後的隨機延遲
+        self.rate_limiter = RateLimiter(requests_per_second)
+        # 會話預熱狀態：只在首次請求或偵測到會話失效時重新訪問初始頁面
+        self.warmup_count = 0
+        self._session_valid = False
+        self._session_lock = threading.Lock()
+        self.cache = cache
+        self.checkpoint = checkpoint
+        self.resumed_partitions = 0
+        self.failed_partitions = 0
+        # 最近一次 run_incremental 的統計
+        self.incremental_stats: Dict[str, Any] = {}
+        # 自適應拆分：窗口抓取失敗時先以較少的重試次數嘗試，再二分窗口
+        self.split_after_retries = PET_SCRAPER_CONFIG['split_after_retries']
+        self.max_split_depth = PET_SCRAPER_CONFIG['max_split_depth']
         
     def get_initial_state(self) -> None:
-        """獲取初始頁面狀態"""
+        """獲取初始頁面狀態
+        
+        這個請求的目的是取得會話 Cookie，因此一律完整請求（不送條件請求：304 回應可能不帶 Set-Cookie）。
+        """
         try:
             # 獲取初始頁面
-            response = self.session.get(self.BASE_URL, headers=self.headers)
+            self.rate_limiter.acquire()
+            response = http_request(self.session, 'GET', self.BASE_URL, headers=self.headers)
             response.raise_for_status()
             
-            logger.info("成功訪問初始頁面")
+            self.warmup_count += 1
+            logger.info(f"成功訪問初始頁面（第 {self.warmup_count} 次預熱）")
         except Exception as e:
             logger.error(f"獲取初始狀態時出錯: {e}")
             raise
+    
+    def _ensure_session(self) -> int:
+        """確保會話已預熱，多個執行緒只會觸發一次預熱
+        
+        Returns:
+            int: 目前會話的預熱世代（即預熱次數），供失效時比對使用
+        """
+        with self._session_lock:
+            if not self._session_valid:
+                self.get_initial_state()
+                self._session_valid = True
+            return self.warmup_count
+    
+    def _invalidate_session(self, generation: int) -> None:
+        """標記會話失效，下次請求前將重新預熱
+        
+        若其他執行緒已在此期間重新預熱（世代不同），則忽略此次標記。
+        
+        Args:
+            generation: 發出請求時使用的會話世代
+        """
+        with self._session_lock:
+            if self._session_valid and generation == self.warmup_count:
+                logger.info("偵測到會話可能已失效，將重新訪問初始頁面")
+                self._session_valid = False
         
-    def fetch_data_by_date_range(self, start_date: str, end_date: str, animal_type: str = ANIMAL_TYPE["DOG"]) -> List[Dict[str, Any]]:
+    def fetch_data_by_date_range(self, start_date: str, end_date: str, animal_type: str = ANIMAL_TYPE["DOG"],
+                                 max_retries: Optional[int] = None) -> List[Dict[str, Any]]:
         """根據日期範圍和動物類型獲取數據
         
         Args:
             start_date: 開始日期，格式 'yyyy/MM/dd'
             end_date: 結束日期，格式 'yyyy/MM/dd'
             animal_type: 動物類型，'0'表示狗，'1'表示貓
+            max_retries: 最大嘗試次數，默認為重試策略的上限
             
         Returns:
             List[Dict[str, Any]]: 包含數據的列表
+            
+        Raises:
+            CircuitOpenError: 對 pet.gov.tw 的連續失敗已觸發斷路器
         """
-        retry_count = 0
+        generation = self.warmup_count
+        cache_key = {
+            'Method': 'O302_2',
+            'SDATE': start_date,
+            'EDATE': end_date,
+            'Animal': animal_type
+        }
         
-        while retry_count < self.max_retries:
+        # 優先使用快取中的原始回應
+        if self.cache is not None:
+            cached_body = self.cache.get(cache_key)
+            if cached_body is not None:
+                try:
+                    table_data = self._decode_response(cached_body)
+                except JSONDecodeError:
+                    table_data = None
+                if table_data:
+                    logger.debug(f"使用快取數據: {start_date} - {end_date}, 動物類型 {animal_type}")
+                    return table_data
+        
+        attempt = 0
+        while True:
+            attempt += 1
+            # 斷路器開啟時直接拋出 CircuitOpenError，讓整個執行快速失敗
+            self.circuit_breaker.before_request()
+            retry_after = None
+            
             try:
-                # 訪問初始頁面獲取cookies
-                self.get_initial_state()
+                # 確保已訪問初始頁面獲取cookies（僅在首次或會話失效時）
+                generation = self._ensure_session()
                 
                 # 設置請求參數（使用表單格式）
                 form_data = {
@@ -91,61 +327,141 @@ class PetGovTwScraper:
                 }
                 
                 # 發送 POST 請求
-                response = self.session.post(
+                self.rate_limiter.acquire()
+                response = http_request(
+                    self.session,
+                    'POST',
                     self.API_URL,
                     data=form_data,
                     headers=self.headers
                 )
                 response.raise_for_status()
                 
-                # 解析回應
-                response_text = response.text
+                # 直接使用原始位元組，省去 response.text 的編碼偵測與解碼
+                body = response.content
                 
                 # 檢查回應是否有效
-                if not response_text or response_text.startswith('{"d":null}'):
-                    logger.warning(f"未獲取到數據，回應為: {response_text}")
-                    retry_count += 1
-                    time.sleep(self.retry_delay)
-                    continue
-                
-                # 解析JSON回應
-                try:
-                    # 嘗試直接解析JSON
-                    json_data = json.loads(response_text)
-                    
-                    # 如果是表格數據（包含fld01, fld02等欄位）
-                    if "\"fld01\":" in response_text or "\"fld02\":" in response_text:
-                        # 將數據轉換為標準格式
-                        table_data = self._parse_api_data(json_data)
-                        return table_data
+                if not body.strip() or body.startswith(b'{"d":null}'):
+                    logger.warning(f"未獲取到數據，回應為: {body[:200].decode('utf-8', 'replace')}")
+                    failure = FailureKind.EMPTY
+                else:
+                    # 解析JSON回應
+                    try:
+                        table_data = self._decode_response(body)
+                    except JSONDecodeError as e:
+                        logger.error(f"JSON解析錯誤: {e}, 回應內容: {body[:200].decode('utf-8', 'replace')}")
+                        failure = FailureKind.BAD_JSON
                     else:
-                        logger.warning(f"未找到預期的數據格式: {json_data}")
-                        retry_count += 1
-                        time.sleep(self.retry_delay)
-                        continue
-                    
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON解析錯誤: {e}, 回應內容: {response_text[:200]}")
-                    retry_count += 1
-                    time.sleep(self.retry_delay)
-                    continue
+                        if table_data is not None:
+                            self.circuit_breaker.record_success()
+                            if self.cache is not None and table_data:
+                                self.cache.set(cache_key, body, self._cache_ttl(end_date))
+                            return table_data
+                        failure = FailureKind.UNEXPECTED_FORMAT
                 
             except requests.exceptions.HTTPError as e:
                 logger.error(f"HTTP錯誤: {e}")
-                retry_count += 1
-                time.sleep(self.retry_delay * (retry_count + 1))  # 逐漸增加等待時間
-                continue
+                if e.response is not None:
+                    failure = classify_status(e.response.status_code)
+                    retry_after = parse_retry_after(e.response.headers.get('Retry-After'))
+                else:
+                    failure = FailureKind.TRANSPORT
                 
             except Exception as e:
                 logger.error(f"獲取數據時出錯: {e}")
-                retry_count += 1
-                time.sleep(self.retry_delay)
-                continue
+                failure = FailureKind.TRANSPORT
+            
+            self.retry_policy.record_failure(failure)
+            self.circuit_breaker.record_failure(failure)
+            
+            # 空回應或 4xx 通常代表 cookies/會話過期
+            if failure in (FailureKind.EMPTY, FailureKind.HTTP_CLIENT):
+                self._invalidate_session(generation)
+            
+            if not self.retry_policy.should_retry(failure, attempt, max_retries):
+                break
+            self.retry_policy.sleep(attempt, retry_after)
         
         # 如果所有重試都失敗
-        logger.error(f"在 {self.max_retries} 次嘗試後仍然無法獲取數據")
+        logger.error(f"在 {attempt} 次嘗試後仍然無法獲取 {start_date} - {end_date} 的數據（最後錯誤: {failure.value}）")
         return []
     
+    def _decode_response(self, body: bytes) -> Optional[List[Dict[str, Any]]]:
+        """解析API回應內容
+        
+        回應只解析一次：Message 欄位若是JSON字符串會在此解碼並放回原物件，
+        之後 _parse_api_data 直接使用已解碼的項目列表。
+        
+        Args:
+            body: API回應的原始位元組
+            
+        Returns:
+            解析後的數據列表，回應不是預期的表格格式時返回None
+            
+        Raises:
+            JSONDecodeError: 回應（或其中的 Message 欄位）不是有效的JSON
+        """
+        json_data = json_codec.loads(body)
+        items = self._extract_items(json_data)
+        
+        # 如果是表格數據（項目包含fld01, fld02等欄位）
+        if items is None:
+            logger.warning(f"未找到預期的數據格式: {body[:200].decode('utf-8', 'replace')}")
+            return None
+        
+        if isinstance(json_data, dict) and 'Message' in json_data:
+            json_data['Message'] = items
+        # 將數據轉換為標準格式
+        return self._parse_api_data(json_data)
+    
+    @staticmethod
+    def _extract_items(json_data: Any) -> Optional[List[Dict[str, Any]]]:
+        """從已解析的回應中取出表格項目並檢查結構
+        
+        Args:
+            json_data: 已解析的API回應
+            
+        Returns:
+            項目列表；沒有任何項目包含 fld01/fld02 欄位，或 Message 回應的 Success 不為真
+            （API回報錯誤）時返回None
+            
+        Raises:
+            JSONDecodeError: Message 欄位是無效的JSON字符串
+        """
+        if isinstance(json_data, dict) and 'Message' in json_data:
+            # _parse_api_data 只在 Success 為真時讀取 Message，否則會把外層物件當作數據列解碼成空結果
+            if not json_data.get('Success', False):
+                return None
+            items = json_data['Message']
+            if isinstance(items, str):
+                items = json_codec.loads(items)
+        else:
+            items = json_data
+        if isinstance(items, dict):
+            items = [items]
+        if not isinstance(items, list):
+            return None
+        
+        for item in items:
+            if isinstance(item, dict) and ('fld01' in item or 'fld02' in item):
+                return items
+        return None
+    
+    @staticmethod
+    def _cache_ttl(end_date: str) -> Optional[float]:
+        """決定快取存活時間：已結束的年度永久有效，進行中的期間只快取數小時
+        
+        Args:
+            end_date: 查詢的結束日期，格式 'yyyy/MM/dd'
+            
+        Returns:
+            存活秒數，None表示永久有效
+        """
+        end = datetime.strptime(end_date, '%Y/%m/%d')
+        if end.year < datetime.now().year:
+            return None
+        return PET_SCRAPER_CONFIG['open_period_cache_ttl']
+    
     def _parse_api_data(self, json_data: Dict) -> List[Dict[str, Any]]:
         """解析API回傳的JSON數據
         
@@ -155,133 +471,34 @@ class PetGovTwScraper:
         Returns:
             List[Dict[str, Any]]: 包含數據的列表
         """
-        try:
-            # 創建一個空的結果列表
-            table_data = []
-            
-            # 檢查Message欄位（根據日誌顯示，數據位於此欄位）
-            if 'Message' in json_data and json_data.get('Success', False):
-                # 嘗試解析Message字段
-                message_content = json_data['Message']
-                
-                # 如果是字符串，嘗試解析JSON
-                if isinstance(message_content, str):
-                    try:
-                        message_data = json.loads(message_content)
-                        if isinstance(message_data, list):
-                            items = message_data
-                        else:
-                            items = [message_data]
-                    except json.JSONDecodeError:
-                        logger.error("無法解析Message欄位中的JSON數據")
-                        return []
-                elif isinstance(message_content, list):
-                    items = message_content
-                else:
-                    items = [message_content]
-                
-                # 處理每個項目
-                for item in items:
-                    row_data = {}
-                    
-                    # 縣市名稱
-                    if "AreaName" in item:
-                        row_data["縣市"] = item["AreaName"]
-                    elif "areaName" in item:
-                        row_data["縣市"] = item["areaName"]
-                    
-                    # 轉換常見的數值欄位
-                    field_mapping = {
-                        "fld01": "登記單位數",
-                        "fld02": "登記數(A)",
-                        "fld03": "除戶數(B)",
-                        "fld04": "絕育數(E)",
-                        "fld05": "轉讓數(C)",
-                        "fld06": "變更數(D)",
-                        "fld07": "免絕育數(G)",
-                        "fld08": "絕育除戶數(F)",
-                        "fld10": "免絕育除戶數(H)",
-                        "j": "絕育率(E-F)/(A-B)",
-                        "k": "繁殖管理率(E-F)+(G-H)/(A-B)"
-                    }
-                    
-                    # 將API欄位轉換為標準欄位名稱
-                    for api_field, standard_field in field_mapping.items():
-                        if api_field in item:
-                            row_data[standard_field] = str(item[api_field])
-                    
-                    # 計算絕育率（如果沒有提供）
-                    if "絕育率(E-F)/(A-B)" not in row_data and "登記數(A)" in row_data and "除戶數(B)" in row_data and "絕育數(E)" in row_data and "絕育除戶數(F)" in row_data:
-                        try:
-                            reg = int(row_data["登記數(A)"])
-                            rem = int(row_data["除戶數(B)"])
-                            neu = int(row_data["絕育數(E)"])
-                            neu_rem = int(row_data["絕育除戶數(F)"])
-                            
-                            if (reg - rem) > 0:
-                                rate = (neu - neu_rem) / (reg - rem) * 100
-                                row_data["絕育率(E-F)/(A-B)"] = f"{rate:.2f}"
-                        except (ValueError, ZeroDivisionError):
-                            pass
-                    
-                    if row_data:  # 確保行數據不為空
-                        table_data.append(row_data)
-                
-                return table_data
+        # 檢查Message欄位（根據日誌顯示，數據位於此欄位）
+        if isinstance(json_data, dict) and 'Message' in json_data and json_data.get('Success', False):
+            items = json_data['Message']
             
+            # 如果是字符串，嘗試解析JSON
+            if isinstance(items, str):
+                try:
+                    items = json_codec.loads(items)
+                except JSONDecodeError:
+                    logger.error("無法解析Message欄位中的JSON數據")
+                    return []
+        else:
             # 如果沒有Message欄位，嘗試直接解析數據
-            items = []
-            if isinstance(json_data, list):
-                items = json_data
-            else:
-                items = [json_data]
-            
-            # 解析每個數據項
-            for item in items:
-                # 標準欄位映射
-                row_data = {}
-                
-                # 縣市名稱
-                if "AreaName" in item:
-                    row_data["縣市"] = item["AreaName"]
-                elif "areaName" in item:
-                    row_data["縣市"] = item["areaName"]
-                
-                # 其他欄位解析（保持與上面相同的邏輯）
-                field_mapping = {
-                    "fld01": "登記單位數",
-                    "fld02": "登記數(A)",
-                    "fld03": "除戶數(B)",
-                    "fld04": "絕育數(E)",
-                    "fld05": "轉讓數(C)",
-                    "fld06": "變更數(D)",
-                    "fld07": "免絕育數(G)",
-                    "fld08": "絕育除戶數(F)",
-                    "fld10": "免絕育除戶數(H)",
-                    "j": "絕育率(E-F)/(A-B)",
-                    "k": "繁殖管理率(E-F)+(G-H)/(A-B)"
-                }
-                
-                for api_field, standard_field in field_mapping.items():
-                    if api_field in item:
-                        row_data[standard_field] = str(item[api_field])
-                
-                if row_data:  # 確保行數據不為空
-                    table_data.append(row_data)
-            
-            return table_data
-                
-        except Exception as e:
-            logger.error(f"解析API數據時出錯: {e}")
-            return []
+            items = json_data
         
-    def scrape_yearly_data(self, start_year: int, end_year: int = None, animal_types: List[str] = [ANIMAL_TYPE["DOG"], ANIMAL_TYPE["CAT"]]) -> List[Dict[str, Any]]:
+        if not isinstance(items, list):
+            items = [items]
+        return self.ROW_DECODER.decode_rows(items)
+        
+    def scrape_yearly_data(self, start_year: int, end_year: int = None, animal_types: List[str] = [ANIMAL_TYPE["DOG"], ANIMAL_TYPE["CAT"]],
+                           granularity: str = 'year') -> List[Dict[str, Any]]:
         """爬取指定年份範圍和動物類型的數據
         
         Args:
             start_year: 開始年份
             end_year: 結束年份，默認為當前年份
             animal_types: 動物類型列表，默認為[狗, 貓]
+            granularity: 時間粒度，'year'、'quarter'、'month' 或 'day'
             
         Returns:
             List[Dict[str, Any]]: 包含所有年份數據的列表
@@ -290,64 +507,412 @@ class PetGovTwScraper:
         if end_year is None:
             end_year = datetime.now().year
             
-        all_data = []
+        # 依年份、動物類型、期間的固定順序建立分區，並行抓取後仍按此順序合併
+        partitions = self.build_partitions(start_year, end_year, animal_types, granularity)
+        all_data = self.scrape_partitions(partitions)
         
-        # 爬取數據
+        # 將收集到的數據轉換為模型對象
+        for item in self._build_items(all_data):
+            self.data.add_item(item)
+            
+        return all_data
+    
+    @staticmethod
+    def build_partitions(start_year: int, end_year: int, animal_types: List[str],
+                         granularity: str = 'year') -> List[Partition]:
+        """按時間粒度建立抓取分區
+        
+        年度粒度沿用整年窗口（1月1日至12月31日）；更細的粒度會略過尚未開始的窗口。
+        
+        Args:
+            start_year: 開始年份
+            end_year: 結束年份
+            animal_types: 動物類型列表
+            granularity: 時間粒度，'year'、'quarter'、'month' 或 'day'
+            
+        Returns:
+            List[Partition]: 按年份、期間、動物類型排序的分區
+        """
+        today = date.today()
+        partitions = []
         for year in range(start_year, end_year + 1):
-            for animal_type in animal_types:
-                animal_name = "狗" if animal_type == ANIMAL_TYPE["DOG"] else "貓"
-                logger.info(f"爬取 {year} 年的{animal_name}數據...")
-                
-                # 設置日期範圍 (按年度區分：1月1日至12月31日)
-                start_date = f"{year}/01/01"
-                end_date = f"{year}/12/31"
-                
-                # 獲取數據
-                year_data = self.fetch_data_by_date_range(start_date, end_date, animal_type)
-                
-                if year_data:
-                    # 添加年份和動物類型信息
-                    for item in year_data:
-                        item['年份'] = str(year)
-                        item['動物類型'] = animal_name
-                    all_data.extend(year_data)
-                    logger.info(f"成功獲取 {year} 年{animal_name}數據，共 {len(year_data)} 條記錄")
-                else:
-                    logger.warning(f"未獲取到 {year} 年的{animal_name}數據")
-                    
-                # 添加延遲，避免頻繁請求
-                random_delay(2.0, 5.0)
+            windows = split_year(year, granularity)
+            for window_start, window_end, label in windows:
+                if granularity != 'year' and window_start > today:
+                    break
+                for animal_type in animal_types:
+                    partitions.append(Partition(
+                        year=year,
+                        animal_type=animal_type,
+                        start_date=window_start.strftime(DATE_FORMAT),
+                        end_date=window_end.strftime(DATE_FORMAT),
+                        period=label if granularity != 'year' else None
+                    ))
+        return partitions
+    
+    def scrape_partitions(self, partitions: List[Partition]) -> List[Dict[str, Any]]:
+        """抓取指定的分區並標記年份、動物類型與期間
+        
+        Args:
+            partitions: 分區列表
+            
+        Returns:
+            List[Dict[str, Any]]: 按分區順序排列的數據
+        """
+        all_data = []
+        results = self._fetch_partitions(partitions)
+        
+        for partition, partition_data in zip(partitions, results):
+            animal_name = ANIMAL_NAME.get(partition.animal_type, "貓")
+            if partition_data:
+                # 添加年份、動物類型和期間信息
+                for item in partition_data:
+                    item['年份'] = str(partition.year)
+                    item['動物類型'] = animal_name
+                    if partition.period is not None:
+                        item['期間'] = partition.period
+                all_data.extend(partition_data)
                 
-        # 將收集到的數據轉換為模型對象
+        return all_data
+    
+    def _build_items(self, all_data: List[Dict[str, Any]]) -> List[ScrapedItem]:
+        """將原始數據轉換為 ScrapedItem 列表
+        
+        Args:
+            all_data: 已標記年份與動物類型的原始數據
+            
+        Returns:
+            List[ScrapedItem]: 模型對象列表
+        """
+        items = []
         for item_data in all_data:
             # 將原始數據存儲到 extra_data
             animal_type = item_data.get('動物類型', '未知')
             city = item_data.get('縣市', '全國')
             year = item_data.get('年份', '')
+            period = item_data.get('期間')
             
             # 獲取登記數和絕育率
             registrations = item_data.get('登記數(A)', '0')
             neutering_rate = item_data.get('絕育率(E-F)/(A-B)', '0')
             
             # 構建標題和描述
-            item = ScrapedItem(
-                title=f"{year}年 {city}{animal_type}寵物登記數據",
+            items.append(ScrapedItem(
+                title=f"{period or year + '年'} {city}{animal_type}寵物登記數據",
                 link=self.BASE_URL,
                 description=f"登記數: {registrations}, 絕育率: {neutering_rate}%",
-                date=year,
+                date=period or year,
                 extra_data=item_data
-            )
-            self.data.add_item(item)
+            ))
+        return items
+    
+    def plan_incremental(self, existing: Union[ScrapedData, RecordStore], start_year: int, end_year: int,
+                         animal_types: List[str], stale_months: int = 3,
+                         granularity: str = 'year') -> Tuple[List[Partition], List[Partition]]:
+        """比對既有數據，決定哪些分區需要重新抓取
+        
+        缺少數據的分區，以及結束日期落在最近 stale_months 個月內的分區（含當前年度）
+        會被重新抓取，其餘分區沿用既有數據。既有數據的時間粒度與 granularity 不同時，
+        其記錄不算作已存在，因此這些年份會以新的粒度重新抓取。
+        傳入 RecordStore 時以 count() 逐分區查詢，不需載入整個資料表。
+        
+        Args:
+            existing: 先前輸出的數據，或記錄庫
+            start_year: 開始年份
+            end_year: 結束年份
+            animal_types: 動物類型列表
+            stale_months: 視為可能仍會變動的最近月數
+            granularity: 時間粒度
             
-        return all_data
+        Returns:
+            (需要抓取的分區, 沿用的分區)
+        """
+        if isinstance(existing, RecordStore):
+            def is_present(year: str, animal: str, period: Optional[str]) -> bool:
+                return existing.count(year=int(year), animal=animal, period=period or '') > 0
+        else:
+            present = set()
+            for item in existing.items:
+                extra = item.extra_data
+                if period_granularity(extra.get('期間')) == granularity:
+                    present.add((extra.get('年份'), extra.get('動物類型'), extra.get('期間')))
+            
+            def is_present(year: str, animal: str, period: Optional[str]) -> bool:
+                return (year, animal, period) in present
+        
+        now = datetime.now()
+        # 結束日期晚於此界線的分區視為可能仍在更新
+        months = now.year * 12 + now.month - 1 - stale_months
+        stale_since = datetime(months // 12, months % 12 + 1, 1)
+        
+        to_fetch = []
+        reused = []
+        for partition in self.build_partitions(start_year, end_year, animal_types, granularity):
+            missing = not is_present(str(partition.year), ANIMAL_NAME.get(partition.animal_type, "貓"),
+                                     partition.period)
+            stale = datetime.strptime(partition.end_date, DATE_FORMAT) >= stale_since
+            if missing or stale:
+                to_fetch.append(partition)
+            else:
+                reused.append(partition)
+        return to_fetch, reused
+    
+    def run_incremental(self, existing: Union[ScrapedData, RecordStore], start_year: int = 2000, end_year: int = None,
+                        animal_types: List[str] = [ANIMAL_TYPE["DOG"], ANIMAL_TYPE["CAT"]],
+                        stale_months: int = 3, granularity: str = 'year') -> ScrapedData:
+        """增量執行爬蟲：只抓取缺少或可能過期的分區，並合併到既有數據
+        
+        各（年份, 動物類型）的數據只會是單一時間粒度，避免下游按年份加總時重複計算：
+        既有數據的粒度與 granularity 不同時，該年份的所有新分區都抓取成功後才以新數據整批取代舊粒度的記錄；
+        任一分區失敗時捨棄該年份的新數據，保留舊粒度的記錄。
+        被取代的（年份, 動物類型）記錄在 incremental_stats['regranulated']，寫入資料庫前需先刪除舊記錄。
+        
+        傳入 RecordStore 時以記錄庫規劃分區，抓取完成後才載入既有記錄進行合併（輸出需要完整數據）。
+        
+        Args:
+            existing: 先前輸出的數據，或記錄庫
+            start_year: 開始年份，默認為2000年
+            end_year: 結束年份，默認為當前年份
+            animal_types: 動物類型列表，默認為[狗, 貓]
+            stale_months: 視為可能仍會變動的最近月數
+            granularity: 時間粒度
+            
+        Returns:
+            合併後的數據
+        """
+        if end_year is None:
+            end_year = datetime.now().year
+        
+        to_fetch, reused = self.plan_incremental(existing, start_year, end_year, animal_types,
+                                                 stale_months, granularity)
+        logger.info(f"增量模式: 沿用 {len(reused)} 個分區，重新抓取 {len(to_fetch)} 個分區")
+        
+        rows = self.scrape_partitions(to_fetch)
+        if isinstance(existing, RecordStore):
+            existing = existing.load()
+        fetched = {(row['年份'], row['動物類型'], row.get('期間')) for row in rows}
+        failed = [p for p in to_fetch
+                  if (str(p.year), ANIMAL_NAME.get(p.animal_type, "貓"), p.period) not in fetched]
+        if failed:
+            logger.warning(f"{len(failed)} 個分區抓取失敗，保留既有數據: "
+                           f"{[(p.start_date, p.end_date, p.animal_type) for p in failed]}")
+        
+        # 既有數據中粒度與本次不同的（年份, 動物類型）
+        other_granularity = {
+            (item.extra_data.get('年份'), item.extra_data.get('動物類型'))
+            for item in existing.items if period_granularity(item.extra_data.get('期間')) != granularity
+        }
+        incomplete = {(str(p.year), ANIMAL_NAME.get(p.animal_type, "貓")) for p in failed} & other_granularity
+        if incomplete:
+            logger.warning(f"{len(incomplete)} 個年份的新粒度數據不完整，保留原粒度的數據: {sorted(incomplete)}")
+            rows = [row for row in rows if (row['年份'], row['動物類型']) not in incomplete]
+        regranulated = {(row['年份'], row['動物類型']) for row in rows} & other_granularity
+        
+        self.data = existing
+        self.data.source_url = self.BASE_URL
+        self.data.error = None
+        if regranulated:
+            before = len(self.data.items)
+            self.data.items = [
+                item for item in self.data.items
+                if (item.extra_data.get('年份'), item.extra_data.get('動物類型')) not in regranulated
+                or period_granularity(item.extra_data.get('期間')) == granularity
+            ]
+            logger.info(f"以{granularity}粒度取代 {len(regranulated)} 個年份的舊粒度數據，"
+                        f"移除 {before - len(self.data.items)} 條")
+        added, replaced = self.data.merge_items(self._build_items(rows), RECORD_KEY_FIELDS)
+        
+        # 按年份、期間、動物類型排序，同一分區內保持原有的縣市順序
+        animal_order = {ANIMAL_NAME[t]: i for i, t in enumerate([ANIMAL_TYPE["DOG"], ANIMAL_TYPE["CAT"]])}
+        self.data.items.sort(key=lambda item: (item.extra_data.get('年份', ''),
+                                               item.extra_data.get('期間') or '',
+                                               animal_order.get(item.extra_data.get('動物類型'), len(animal_order))))
+        self.data.last_updated = datetime.now()
+        
+        self.incremental_stats = {
+            'reused_partitions': len(reused),
+            'refetched_partitions': len(to_fetch) - len(failed),
+            'failed_partitions': len(failed),
+            'added_rows': added,
+            'replaced_rows': replaced,
+            'regranulated': sorted(regranulated),
+        }
+        logger.info(f"增量合併完成: 新增 {added} 條、更新 {replaced} 條，共 {len(self.data.items)} 條數據")
+        self.log_summary()
+        return self.data
+    
+    def summary(self) -> Dict[str, Any]:
+        """返回本次執行的統計摘要（預熱、檢查點、快取、傳輸、重試與斷路器）"""
+        result = {
+            'warmups': self.warmup_count,
+            'resumed_partitions': self.resumed_partitions,
+            'failed_partitions': self.failed_partitions,
+            'transport': transport_stats.summary(),
+            'retry': self.retry_policy.stats(),
+            'circuit_breaker': self.circuit_breaker.stats(),
+        }
+        if self.cache is not None:
+            result['cache'] = self.cache.stats()
+        return result
+    
+    def log_summary(self) -> None:
+        """將統計摘要寫入日誌"""
+        summary = self.summary()
+        logger.info(f"會話預熱次數: {summary['warmups']}")
+        if self.checkpoint is not None:
+            logger.info(f"從檢查點恢復 {summary['resumed_partitions']} 個分區")
+        logger.info(f"失敗分區: {summary['failed_partitions']}")
+        logger.info(f"傳輸統計: {summary['transport']}")
+        logger.info(f"重試統計: {summary['retry']}")
+        logger.info(f"斷路器: {summary['circuit_breaker']}")
+        if 'cache' in summary:
+            logger.info(f"快取命中 {summary['cache']['hits']} 次，未命中 {summary['cache']['misses']} 次")
+    
+    def _fetch_partitions(self, partitions: List[Partition]) -> List[List[Dict[str, Any]]]:
+        """並行抓取多個分區
+        
+        Args:
+            partitions: 分區列表
+            
+        Returns:
+            List[List[Dict[str, Any]]]: 與 partitions 順序一一對應的結果
+        """
+        if self.max_workers <= 1 or len(partitions) <= 1:
+            return [self._fetch_partition(partition) for partition in partitions]
+        
+        logger.info(f"使用 {self.max_workers} 個工作執行緒並行抓取 {len(partitions)} 個分區")
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            # executor.map 會按輸入順序返回結果，確保輸出順序固定
+            return list(executor.map(self._fetch_partition, partitions))
+        except CircuitOpenError:
+            # 斷路器開啟時取消尚未開始的分區，快速結束
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+    
+    def _fetch_partition(self, partition: Partition) -> List[Dict[str, Any]]:
+        """抓取單一分區
+        
+        Args:
+            partition: 抓取分區
+            
+        Returns:
+            List[Dict[str, Any]]: 該分區的數據
+        """
+        animal_name = ANIMAL_NAME.get(partition.animal_type, "貓")
+        label = partition.period or f"{partition.year} 年"
+        
+        # 已記錄在檢查點日誌中的分區直接沿用
+        key = CheckpointJournal.make_key(partition.start_date, partition.end_date, partition.animal_type)
+        if self.checkpoint is not None:
+            partition_data = self.checkpoint.get(key)
+            if partition_data is not None:
+                logger.info(f"從檢查點恢復 {label} 的{animal_name}數據，共 {len(partition_data)} 條記錄")
+                with self._session_lock:
+                    self.resumed_partitions += 1
+                return partition_data
+        
+        logger.info(f"爬取 {label} 的{animal_name}數據...")
+        
+        partition_data = self._fetch_window(
+            partition.animal_type,
+            datetime.strptime(partition.start_date, DATE_FORMAT).date(),
+            datetime.strptime(partition.end_date, DATE_FORMAT).date()
+        )
+        
+        if partition_data and self.checkpoint is not None:
+            self.checkpoint.record(key, partition_data)
+        
+        if partition_data:
+            logger.info(f"成功獲取 {label} {animal_name}數據，共 {len(partition_data)} 條記錄")
+        else:
+            logger.warning(f"未獲取到 {label} 的{animal_name}數據")
+            with self._session_lock:
+                self.failed_partitions += 1
+        return partition_data
+    
+    def _fetch_window(self, animal_type: str, start: date, end: date, depth: int = 0) -> List[Dict[str, Any]]:
+        """自適應抓取日期窗口：窗口抓取失敗時二分後分別抓取，再合併子窗口結果
+        
+        Args:
+            animal_type: 動物類型代碼
+            start: 開始日期
+            end: 結束日期
+            depth: 目前拆分深度
+            
+        Returns:
+            List[Dict[str, Any]]: 該窗口的數據，任一子窗口失敗時返回空列表
+        """
+        can_split = depth < self.max_split_depth and start < end
+        rows = self.fetch_data_by_date_range(
+            start.strftime(DATE_FORMAT),
+            end.strftime(DATE_FORMAT),
+            animal_type,
+            max_retries=self.split_after_retries if can_split else None
+        )
+        if rows or not can_split:
+            return rows
+        
+        middle = start + (end - start) // 2
+        logger.info(f"拆分日期窗口 {start} - {end} 為 {start} - {middle} 與 {middle + timedelta(days=1)} - {end}")
+        left = self._fetch_window(animal_type, start, middle, depth + 1)
+        right = self._fetch_window(animal_type, middle + timedelta(days=1), end, depth + 1)
+        if not left or not right:
+            # 部分子窗口缺失時不輸出不完整的合計
+            return []
+        return self._coalesce_rows([left, right])
+    
+    @staticmethod
+    def _coalesce_rows(parts: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """按縣市合併多個子窗口的數據
+        
+        計數欄位相加（登記單位數取最大值），比率由合併後的計數重新計算。
         
-    def run(self, start_year: int = 2000, end_year: int = None, animal_types: List[str] = [ANIMAL_TYPE["DOG"], ANIMAL_TYPE["CAT"]]) -> ScrapedData:
+        Args:
+            parts: 各子窗口的數據
+            
+        Returns:
+            List[Dict[str, Any]]: 合併後的數據，保持首次出現的縣市順序
+        """
+        merged: Dict[str, Dict[str, int]] = {}
+        for rows in parts:
+            for row in rows:
+                totals = merged.setdefault(row.get('縣市', '全國'), {})
+                for key, _ in RECORD_INT_FIELDS:
+                    if key not in row:
+                        continue
+                    try:
+                        value = int(row[key])
+                    except ValueError:
+                        continue
+                    if key == '登記單位數':
+                        totals[key] = max(totals.get(key, 0), value)
+                    else:
+                        totals[key] = totals.get(key, 0) + value
+        
+        result = []
+        for city, totals in merged.items():
+            row = {'縣市': city, **{key: str(value) for key, value in totals.items()}}
+            base = totals.get('登記數(A)', 0) - totals.get('除戶數(B)', 0)
+            if base > 0:
+                neutered = totals.get('絕育數(E)', 0) - totals.get('絕育除戶數(F)', 0)
+                exempt = totals.get('免絕育數(G)', 0) - totals.get('免絕育除戶數(H)', 0)
+                row['絕育率(E-F)/(A-B)'] = f"{neutered / base * 100:.2f}"
+                row['繁殖管理率(E-F)+(G-H)/(A-B)'] = f"{(neutered + exempt) / base * 100:.2f}"
+            result.append(row)
+        return result
+        
+    def run(self, start_year: int = 2000, end_year: int = None, animal_types: List[str] = [ANIMAL_TYPE["DOG"], ANIMAL_TYPE["CAT"]],
+            granularity: str = 'year') -> ScrapedData:
         """執行爬蟲
         
         Args:
             start_year: 開始年份，默認為2000年
             end_year: 結束年份，默認為當前年份
             animal_types: 動物類型列表，默認為[狗, 貓]
+            granularity: 時間粒度，'year'、'quarter'、'month' 或 'day'
             
         Returns:
             爬取的數據
@@ -357,15 +922,22 @@ class PetGovTwScraper:
             logger.info(f"開始爬取{animal_types_str}寵物登記數據 (從 {start_year} 到 {end_year or '現在'})")
             
             # 爬取實際數據
-            data = self.scrape_yearly_data(start_year, end_year, animal_types)
+            data = self.scrape_yearly_data(start_year, end_year, animal_types, granularity)
             
             # 如果沒有獲取到數據，使用模擬數據
             if not data:
                 logger.warning("無法從網站獲取數據，將使用模擬數據")
-                self.generate_mock_data(start_year, end_year, animal_types)
+                self.generate_mock_data(start_year, end_year, animal_types, granularity)
                 
             logger.info(f"爬取完成，共獲取 {len(self.data.items)} 條數據")
+            self.log_summary()
             return self.data
+        except CircuitOpenError as e:
+            # 網站持續無法連線時不以模擬數據掩蓋，直接讓整個執行失敗
+            logger.error(f"爬蟲執行中止: {e}")
+            self.data.error = str(e)
+            self.log_summary()
+            raise
         except Exception as e:
             logger.error(f"爬蟲執行失敗: {e}")
             self.data.error = str(e)
@@ -373,18 +945,24 @@ class PetGovTwScraper:
             # 如果獲取數據失敗，生成模擬數據
             if len(self.data.items) == 0:
                 logger.warning("爬蟲失敗，將使用模擬數據")
-                self.generate_mock_data(start_year, end_year, animal_types)
+                self.generate_mock_data(start_year, end_year, animal_types, granularity)
                 logger.info(f"已生成模擬數據，共 {len(self.data.items)} 條")
                 
             return self.data
             
-    def generate_mock_data(self, start_year: int, end_year: int, animal_types: List[str]):
+    def generate_mock_data(self, start_year: int, end_year: int, animal_types: List[str],
+                           granularity: str = 'year'):
         """生成模擬數據（當網站抓取失敗時使用）
         
+        非年度粒度時按 split_year 的窗口產生帶期間標籤的記錄（略過尚未開始的窗口），
+        計數按窗口數攤分，與真實抓取的數據形狀一致。
+        錯誤訊息會加上 MOCK_DATA_ERROR 標記（見 is_mock_data），模擬數據不會寫入資料庫或在增量模式中沿用。
+        
         Args:
             start_year: 開始年份
             end_year: 結束年份
             animal_types: 動物類型列表
+            granularity: 時間粒度
         """
         if end_year is None:
             end_year = datetime.now().year
@@ -399,66 +977,98 @@ class PetGovTwScraper:
             # 基準年份係數（越近的年份數據越多）
             year_coef = min(1.0, 0.3 + (year - start_year) / max(1, end_year - start_year) * 0.7)
             
+            windows = split_year(year, granularity)
+            if granularity != 'year':
+                windows = [window for window in windows if window[0] <= date.today()]
+            if not windows:
+                continue
+            
             for animal_type in animal_types:
                 animal_name = "狗" if animal_type == ANIMAL_TYPE["DOG"] else "貓"
                 
-                # 為每個縣市生成數據
-                for city in cities:
-                    # 城市人口係數（模擬大城市有更多寵物）
-                    city_coef = 1.0
-                    if city in ["臺北市", "新北市", "臺中市", "臺南市", "高雄市"]:
-                        city_coef = 1.5
-                    elif city in ["桃園市", "基隆市", "新竹市", "彰化縣"]:
-                        city_coef = 1.2
-                        
-                    # 基本數據生成
-                    registrations = int(random.randint(1000, 5000) * year_coef * city_coef)
-                    if animal_name == "貓":
-                        registrations = int(registrations * 0.7)  # 貓的登記數較少
-                        
-                    units = int(random.randint(50, 300) * city_coef)
-                    removals = int(registrations * random.uniform(0.02, 0.07))
-                    transfers = int(registrations * random.uniform(0.8, 1.2))
-                    changes = int(registrations * random.uniform(0.2, 0.5))
-                    neutering = int(registrations * random.uniform(0.3, 0.6))
-                    neutering_removals = int(neutering * random.uniform(0.01, 0.03))
-                    exempt = int(registrations * random.uniform(0.01, 0.05))
-                    exempt_removals = int(exempt * random.uniform(0, 0.01))
+                # 為每個期間、縣市生成數據
+                for _, _, label in windows:
+                    period = label if granularity != 'year' else None
+                    for city in cities:
+                        mock_data = self._mock_row(city, year, animal_name, year_coef / len(windows))
+                        if period is not None:
+                            mock_data['期間'] = period
+                        self.data.add_item(ScrapedItem(
+                            title=f"{period or str(year) + '年'} {city}{animal_name}寵物登記數據",
+                            link=self.BASE_URL,
+                            description=f"登記數: {mock_data['登記數(A)']}, "
+                                        f"絕育率: {mock_data['絕育率(E-F)/(A-B)']}%",
+                            date=period or str(year),
+                            extra_data=mock_data
+                        ))
                     
-                    # 計算絕育率
-                    if registrations - removals > 0:
-                        neutering_rate = (neutering - neutering_removals) / (registrations - removals) * 100
-                        breeding_rate = ((neutering - neutering_removals) + (exempt - exempt_removals)) / (registrations - removals) * 100
-                    else:
-                        neutering_rate = 0
-                        breeding_rate = 0
-                        
-                    # 創建模擬數據項
-                    mock_data = {
-                        "縣市": city,
-                        "年份": str(year),
-                        "動物類型": animal_name,
-                        "登記單位數": str(units),
-                        "登記數(A)": str(registrations),
-                        "除戶數(B)": str(removals),
-                        "轉讓數(C)": str(transfers),
-                        "變更數(D)": str(changes),
-                        "絕育數(E)": str(neutering),
-                        "絕育除戶數(F)": str(neutering_removals),
-                        "免絕育數(G)": str(exempt),
-                        "免絕育除戶數(H)": str(exempt_removals),
-                        "絕育率(E-F)/(A-B)": f"{neutering_rate:.2f}",
-                        "繁殖管理率(E-F)+(G-H)/(A-B)": f"{breeding_rate:.2f}"
-                    }
-                    
-                    # 添加到數據模型
-                    item = ScrapedItem(
-                        title=f"{year}年 {city}{animal_name}寵物登記數據",
-                        link=self.BASE_URL,
-                        description=f"登記數: {registrations}, 絕育率: {neutering_rate:.2f}%",
-                        date=str(year),
-                        extra_data=mock_data
-                    )
-                    self.data.add_item(item)
-                    
-                logger.info(f"已生成 {year} 年{animal_name}模擬數據，共 {len(cities)} 條記錄")
+                logger.info(f"已生成 {year} 年{animal_name}模擬數據，共 {len(cities) * len(windows)} 條記錄")
+        
+        # 標記為模擬數據（保留原本的錯誤原因）
+        self.data.error = f"{MOCK_DATA_ERROR}: {self.data.error}" if self.data.error else MOCK_DATA_ERROR
+    
+    @staticmethod
+    def is_mock_data(data: ScrapedData) -> bool:
+        """判斷數據是否為 generate_mock_data 產生的模擬數據（包括從輸出的JSON讀回的數據）"""
+        return bool(data.error) and data.error.startswith(MOCK_DATA_ERROR)
+    
+    @staticmethod
+    def _mock_row(city: str, year: int, animal_name: str, scale: float) -> Dict[str, str]:
+        """產生單一縣市的模擬數據列
+        
+        Args:
+            city: 縣市
+            year: 年份
+            animal_name: 動物類型名稱
+            scale: 計數的縮放係數（年份係數除以期間數）
+            
+        Returns:
+            模擬的原始欄位字典
+        """
+        # 城市人口係數（模擬大城市有更多寵物）
+        city_coef = 1.0
+        if city in ["臺北市", "新北市", "臺中市", "臺南市", "高雄市"]:
+            city_coef = 1.5
+        elif city in ["桃園市", "基隆市", "新竹市", "彰化縣"]:
+            city_coef = 1.2
+        
+        # 基本數據生成
+        registrations = int(random.randint(1000, 5000) * scale * city_coef)
+        if animal_name == "貓":
+            registrations = int(registrations * 0.7)  # 貓的登記數較少
+        
+        units = int(random.randint(50, 300) * city_coef)
+        removals = int(registrations * random.uniform(0.02, 0.07))
+        transfers = int(registrations * random.uniform(0.8, 1.2))
+        changes = int(registrations * random.uniform(0.2, 0.5))
+        neutering = int(registrations * random.uniform(0.3, 0.6))
+        neutering_removals = int(neutering * random.uniform(0.01, 0.03))
+        exempt = int(registrations * random.uniform(0.01, 0.05))
+        exempt_removals = int(exempt * random.uniform(0, 0.01))
+        
+        # 計算絕育率
+        if registrations - removals > 0:
+            neutering_rate = (neutering - neutering_removals) / (registrations - removals) * 100
+            breeding_rate = ((neutering - neutering_removals) + (exempt - exempt_removals)) / (registrations - removals) * 100
+        else:
+            neutering_rate = 0
+            breeding_rate = 0
+        
+        # 創建模擬數據項
+        mock_data = {
+            "縣市": city,
+            "年份": str(year),
+            "動物類型": animal_name,
+            "登記單位數": str(units),
+            "登記數(A)": str(registrations),
+            "除戶數(B)": str(removals),
+            "轉讓數(C)": str(transfers),
+            "變更數(D)": str(changes),
+            "絕育數(E)": str(neutering),
+            "絕育除戶數(F)": str(neutering_removals),
+            "免絕育數(G)": str(exempt),
+            "免絕育除戶數(H)": str(exempt_removals),
+            "絕育率(E-F)/(A-B)": f"{neutering_rate:.2f}",
+            "繁殖管理率(E-F)+(G-H)/(A-B)": f"{breeding_rate:.2f}"
+        }
+        return mock_data
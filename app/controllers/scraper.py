@@ -1,8 +1,14 @@
-import requests
 from bs4 import BeautifulSoup
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, NamedTuple
 from app.models.data_model import ScrapedData, ScrapedItem
+from app.config import TARGET_SITES
+from app.utils.helpers import extract_domain, get_absolute_url, filter_urls
+from app.utils.extraction import ItemExtractor, compile_select
+from app.utils.frontier import URLFrontier
+from app.utils.html_parser import make_soup, resolve_parser
+from app.utils.transport import get_session, request as http_request
+from app.utils.validators import ValidatorStore
 
 # 設定日誌
 logging.basicConfig(
@@ -12,15 +18,34 @@ logging.basicConfig(
 logger = logging.getLogger('scraper_controller')
 
 
+class PageResult(NamedTuple):
+    """單一頁面的解析結果"""
+    items: List[ScrapedItem]
+    next_pages: List[str]
+    not_modified: bool = False  # 伺服器回應 304，結果沿用自上次執行
+
+
 class ScraperController:
     """控制器層：負責處理爬蟲邏輯和數據提取"""
     
-    def __init__(self, url: str, headers: Optional[Dict[str, str]] = None):
+    # 網站配置沒有提供 selector 時使用的示例選擇器
+    DEFAULT_SELECTORS = {
+        'article': 'article.news-item',
+        'title': 'h2',
+        'link': 'a',
+        'description': 'p.summary',
+        'date': 'time'
+    }
+    
+    def __init__(self, url: str, headers: Optional[Dict[str, str]] = None,
+                 site_config: Optional[Dict[str, Any]] = None, validators: Optional[ValidatorStore] = None):
         """初始化爬蟲控制器
         
         Args:
             url: 目標網站URL
             headers: 請求頭，用於模擬瀏覽器行為
+            site_config: TARGET_SITES 中的網站配置（選擇器、解析器等），None表示使用默認值
+            validators: ETag / Last-Modified 存放區，用於條件請求；None表示每次都下載完整頁面
         """
         self.url = url
         self.headers = headers or {
@@ -28,44 +53,128 @@ class ScraperController:
                          '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.data = ScrapedData(source_url=url)
+        self.site_config = site_config or {}
+        self.selectors: Dict[str, str] = self.site_config.get('selector') or self.DEFAULT_SELECTORS
+        self.extractor = ItemExtractor(self.selectors)
+        # 分頁連結選擇器（例如 'a.next'），None表示不跟隨分頁
+        self.pagination = self.site_config.get('pagination')
+        self._select_pagination = compile_select(self.pagination) if self.pagination else None
+        # 解析器後端，以及只解析文章元素的部分解析（需要分頁連結時解析整頁）
+        self.parser = resolve_parser(self.site_config.get('parser'))
+        partial = self.site_config.get('partial_parse', True) and not self.pagination
+        self.parse_only = self.selectors.get('article') if partial else None
+        self.validators = validators
     
-    def fetch_page(self) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: Optional[str] = None) -> Optional[BeautifulSoup]:
         """獲取目標頁面內容
         
+        Args:
+            url: 要獲取的頁面，默認為 self.url
+            
         Returns:
             BeautifulSoup物件，用於解析HTML
         """
+        url = url or self.url
         try:
-            logger.info(f"正在獲取頁面: {self.url}")
-            response = requests.get(self.url, headers=self.headers, timeout=10)
+            logger.info(f"正在獲取頁面: {url}")
+            response = http_request(get_session(url), 'GET', url, headers=self.headers)
             response.raise_for_status()  # 如果請求失敗則拋出異常
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            return soup
+            return self.make_soup(response.content)
             
         except Exception as e:
             logger.error(f"獲取頁面時發生錯誤: {e}")
             self.data.error = f"獲取頁面失敗: {str(e)}"
             return None
     
+    def crawl_page(self, url: Optional[str] = None) -> Optional[PageResult]:
+        """獲取並解析單一頁面，支援條件請求
+        
+        有 validators 且記錄了上次的結果時，送出 If-None-Match / If-Modified-Since；
+        伺服器回應 304 時不下載也不解析，直接沿用上次的項目與分頁連結。
+        
+        Args:
+            url: 要獲取的頁面，默認為 self.url
+            
+        Returns:
+            PageResult；獲取或解析失敗時返回None（原因記錄在 self.data.error）
+        """
+        url = url or self.url
+        previous = self.validators.result(url) if self.validators is not None else None
+        headers = self.headers
+        if previous is not None:
+            headers = {**self.headers, **self.validators.conditional_headers(url)}
+        
+        try:
+            logger.info(f"正在獲取頁面: {url}")
+            response = http_request(get_session(url), 'GET', url, headers=headers)
+            if response.status_code == 304 and previous is not None:
+                self.validators.record_not_modified()
+                logger.info(f"頁面未變更，沿用上次的解析結果: {url}")
+                return PageResult([ScrapedItem.from_dict(item) for item in previous['items']],
+                                  previous['next_pages'], True)
+            response.raise_for_status()
+            soup = self.make_soup(response.content)
+        except Exception as e:
+            logger.error(f"獲取頁面時發生錯誤: {e}")
+            self.data.error = f"獲取頁面失敗: {str(e)}"
+            return None
+        
+        try:
+            items = list(self.iter_items(soup))
+            next_pages = self.next_page_urls(soup, url)
+        except Exception as e:
+            logger.error(f"解析數據時發生錯誤: {e}")
+            self.data.error = f"解析數據失敗: {str(e)}"
+            return None
+        
+        if self.validators is not None:
+            self.validators.record(url, response.headers,
+                                   {'items': [item.to_dict() for item in items], 'next_pages': next_pages})
+        return PageResult(items, next_pages)
+    
+    def make_soup(self, content: bytes) -> BeautifulSoup:
+        """將頁面內容解析為 BeautifulSoup 物件
+        
+        Args:
+            content: 頁面原始內容
+            
+        Returns:
+            BeautifulSoup物件
+        """
+        return make_soup(content, self.parser, self.parse_only)
+    
+    def parse_content(self, content: bytes) -> ScrapedData:
+        """解析已下載的頁面內容（供非同步抓取等自行下載頁面的呼叫者使用）
+        
+        Args:
+            content: 頁面原始內容
+            
+        Returns:
+            ScrapedData: 爬取的數據結果
+        """
+        self.parse_data(self.make_soup(content))
+        return self.data
+    
+    def iter_items(self, soup: BeautifulSoup) -> Iterator[ScrapedItem]:
+        """逐一產生頁面中的項目（選擇器取自網站配置的 selector 區塊）
+        
+        Args:
+            soup: BeautifulSoup物件
+            
+        Yields:
+            ScrapedItem: 爬取的項目
+        """
+        return self.extractor.iter_items(soup)
+    
     def parse_data(self, soup: BeautifulSoup) -> None:
         """解析HTML並提取數據
         
-        這個方法需要根據目標網站的結構進行自定義
-        
         Args:
             soup: BeautifulSoup物件
         """
         try:
-            # 這裡的選擇器需要根據目標網站結構進行自定義
-            # 這只是一個示例，實際使用時需要根據具體網站進行調整
-            for article in soup.select('article.news-item'):
-                item = ScrapedItem(
-                    title=article.select_one('h2').text.strip(),
-                    link=article.select_one('a')['href'],
-                    description=article.select_one('p.summary').text.strip() if article.select_one('p.summary') else None,
-                    date=article.select_one('time').text.strip() if article.select_one('time') else None
-                )
+            for item in self.iter_items(soup):
                 self.data.add_item(item)
                 
             logger.info(f"成功解析 {len(self.data.items)} 個項目")
@@ -74,59 +183,104 @@ class ScraperController:
             logger.error(f"解析數據時發生錯誤: {e}")
             self.data.error = f"解析數據失敗: {str(e)}"
     
-    def run(self) -> ScrapedData:
+    def next_page_urls(self, soup: BeautifulSoup, page_url: Optional[str] = None) -> List[str]:
+        """找出頁面中的分頁連結
+        
+        Args:
+            soup: BeautifulSoup物件
+            page_url: 頁面的URL，用於解析相對連結，默認為 self.url
+            
+        Returns:
+            List[str]: 允許網域內的絕對URL；網站沒有配置 pagination 時為空列表
+        """
+        if self._select_pagination is None:
+            return []
+        base_url = page_url or self.url
+        urls = [get_absolute_url(base_url, a['href']) for a in self._select_pagination(soup) if a.get('href')]
+        return filter_urls(urls, self.site_config.get('allowed_domains'))
+    
+    def run(self, max_pages: Optional[int] = None) -> ScrapedData:
         """執行爬蟲流程
         
+        網站配置了 pagination 時會跟隨分頁連結，直到沒有新頁面或達到 max_pages。
+        
+        Args:
+            max_pages: 最多獲取的頁數，默認取自網站配置的 max_pages（未配置時為1）
+            
         Returns:
             ScrapedData: 爬取的數據結果
         """
-        soup = self.fetch_page()
-        if soup:
-            self.parse_data(soup)
+        if max_pages is None:
+            max_pages = self.site_config.get('max_pages', 1)
+        frontier = URLFrontier(max_pages=max_pages)
+        frontier.push(self.url)
+        
+        try:
+            while True:
+                entry = frontier.pop()
+                if entry is None:
+                    break
+                page_url, _ = entry
+                page = self.crawl_page(page_url)
+                if page is None:
+                    break
+                for item in page.items:
+                    self.data.add_item(item)
+                logger.info(f"成功解析 {len(page.items)} 個項目")
+                for next_url in page.next_pages:
+                    frontier.push(next_url)
+        finally:
+            frontier.close()
         return self.data
 
 
 # 特定網站的爬蟲實現示例
 class ExampleNewsScraper(ScraperController):
-    """特定網站的爬蟲實現示例"""
+    """特定網站的爬蟲實現示例
     
-    def parse_data(self, soup: BeautifulSoup) -> None:
-        """為特定網站自定義解析邏輯"""
-        try:
-            for article in soup.select('.news-container .news-item'):
-                title_elem = article.select_one('.news-title')
-                link_elem = article.select_one('a.news-link')
-                desc_elem = article.select_one('.news-description')
-                date_elem = article.select_one('.news-date')
-                
-                if title_elem and link_elem:
-                    item = ScrapedItem(
-                        title=title_elem.text.strip(),
-                        link=link_elem['href'],
-                        description=desc_elem.text.strip() if desc_elem else None,
-                        date=date_elem.text.strip() if date_elem else None
-                    )
-                    self.data.add_item(item)
-            
-            logger.info(f"成功解析 {len(self.data.items)} 個新聞項目")
-                
-        except Exception as e:
-            logger.error(f"解析新聞數據時發生錯誤: {e}")
-            self.data.error = f"解析新聞數據失敗: {str(e)}"
+    選擇器已移至 TARGET_SITES['example_news']['selector']，由通用的 parse_data 處理；
+    保留此類別供需要覆寫其他行為（例如 make_soup 或 run）的網站參考。
+    """
+
+
+def site_type_for_url(url: str, sites: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[str]:
+    """根據URL的網域找出 TARGET_SITES 中對應的網站類型
+    
+    Args:
+        url: 目標URL
+        sites: 網站配置，默認為 TARGET_SITES
+        
+    Returns:
+        網站類型，沒有任何網站允許該網域時返回None
+    """
+    if sites is None:
+        sites = TARGET_SITES
+    # 去掉連接埠後再比對
+    domain = extract_domain(url).rsplit(':', 1)[0]
+    for site_type, config in sites.items():
+        # 與 filter_urls 相同的網域比對規則
+        if any(domain.endswith(allowed) for allowed in config.get('allowed_domains', [])):
+            return site_type
+    return None
 
 
-def create_scraper(site_type: str, url: str) -> ScraperController:
+def create_scraper(site_type: str, url: str, site_config: Optional[Dict[str, Any]] = None,
+                   validators: Optional[ValidatorStore] = None) -> ScraperController:
     """工廠方法：根據網站類型創建對應的爬蟲控制器
     
     Args:
         site_type: 網站類型
         url: 目標URL
+        site_config: 網站配置，默認取自 TARGET_SITES[site_type]
+        validators: 條件請求使用的驗證器存放區
         
     Returns:
         適合該網站類型的爬蟲控制器實例
     """
+    if site_config is None:
+        site_config = TARGET_SITES.get(site_type)
     if site_type == 'example_news':
-        return ExampleNewsScraper(url)
+        return ExampleNewsScraper(url, site_config=site_config, validators=validators)
     # 可以根據需要添加更多類型
     else:
-        return ScraperController(url)  # 默認爬蟲
+        return ScraperController(url, site_config=site_config, validators=validators)  # 默認爬蟲
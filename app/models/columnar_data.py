@@ -0,0 +1,300 @@
+from array import array
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterable, Tuple, Sequence
+
+from app.models.data_model import (
+    ScrapedData, PetRegistrationRecord, RECORD_INT_FIELDS, RECORD_FLOAT_FIELDS
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 為選用依賴，未安裝時使用純Python的分組計算
+    np = None
+
+
+# 分組維度（以整數代碼保存）
+DIMENSIONS = ('縣市', '年份', '動物類型')
+
+# 期間維度（季、月、日粒度的期間標籤，例如 '2020-03'）；年度粒度的記錄沒有期間，代碼固定為0（空字串）
+PERIOD = '期間'
+
+# 數值欄位
+INT_FIELDS = tuple(key for key, _ in RECORD_INT_FIELDS)
+FLOAT_FIELDS = tuple(key for key, _ in RECORD_FLOAT_FIELDS)
+
+# 由加總值重新計算的比率欄位
+NEUTERING_RATE = '絕育率(E-F)/(A-B)'
+BREEDING_RATE = '繁殖管理率(E-F)+(G-H)/(A-B)'
+
+
+class ColumnarScrapedData:
+    """以欄為單位保存寵物登記數據的容器
+
+    每個欄位是一個 array 模組的連續陣列：縣市、動物類型與期間以字典代碼保存，
+    年份保存為整數，計數欄位為 64 位整數（缺值記為0），比率欄位為浮點數（缺值為NaN）。
+    安裝 NumPy 時，分組加總會直接在陣列緩衝區上以向量化方式計算。
+    """
+
+    def __init__(self, source_url: Optional[str] = None):
+        self.source_url = source_url
+        self.last_updated = datetime.now()
+        self.error: Optional[str] = None
+        # 字典編碼的取值表
+        self.dictionaries: Dict[str, List[str]] = {'縣市': [], '動物類型': [], PERIOD: ['']}
+        self._codes: Dict[str, Dict[str, int]] = {'縣市': {}, '動物類型': {}, PERIOD: {'': 0}}
+        self.columns: Dict[str, array] = {
+            '縣市': array('i'),
+            '年份': array('i'),
+            '動物類型': array('i'),
+            PERIOD: array('i'),
+            **{name: array('q') for name in INT_FIELDS},
+            **{name: array('d') for name in FLOAT_FIELDS},
+        }
+
+    def __len__(self) -> int:
+        return len(self.columns['年份'])
+
+    def _encode(self, dimension: str, value: str) -> int:
+        codes = self._codes[dimension]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self.dictionaries[dimension].append(value)
+        return code
+
+    @classmethod
+    def from_scraped_data(cls, data: ScrapedData) -> 'ColumnarScrapedData':
+        """由 ScrapedData 建立欄式容器（經由 PetRegistrationRecord，字串數值只解析一次）
+
+        Raises:
+            KeyError: 缺少年份或動物類型
+            ValueError: 動物類型不是 AnimalType，或數值無法解析
+        """
+        columnar = cls(source_url=data.source_url)
+        columnar.last_updated = data.last_updated
+        columnar.error = data.error
+        columnar.add_records(data.iter_records())
+        return columnar
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """批量附加 extra_data 形式的數據列
+
+        Args:
+            rows: 數據列（縣市、年份、動物類型、期間及各數值欄位）
+
+        Returns:
+            int: 附加的列數
+        """
+        city_column = array('i')
+        year_column = array('i')
+        animal_column = array('i')
+        period_column = array('i')
+        int_columns = [(name, array('q')) for name in INT_FIELDS]
+        float_columns = [(name, array('d')) for name in FLOAT_FIELDS]
+        nan = float('nan')
+
+        count = 0
+        for row in rows:
+            city_column.append(self._encode('縣市', row.get('縣市') or '全國'))
+            year_column.append(int(row['年份']))
+            animal_column.append(self._encode('動物類型', row['動物類型']))
+            period_column.append(self._encode(PERIOD, row.get(PERIOD) or ''))
+            for name, column in int_columns:
+                value = row.get(name)
+                column.append(int(value) if value not in (None, '') else 0)
+            for name, column in float_columns:
+                value = row.get(name)
+                column.append(float(value) if value not in (None, '') else nan)
+            count += 1
+
+        # 先在暫存陣列中累積，再一次性附加到各欄，避免逐欄逐列擴容
+        self.columns['縣市'].extend(city_column)
+        self.columns['年份'].extend(year_column)
+        self.columns['動物類型'].extend(animal_column)
+        self.columns[PERIOD].extend(period_column)
+        for name, column in int_columns + float_columns:
+            self.columns[name].extend(column)
+        return count
+
+    def add_records(self, records: Iterable[PetRegistrationRecord]) -> int:
+        """批量附加 PetRegistrationRecord（直接讀取已解析的數值屬性，不經過字串）
+
+        Args:
+            records: 寵物登記記錄
+
+        Returns:
+            int: 附加的列數
+        """
+        city_column = array('i')
+        year_column = array('i')
+        animal_column = array('i')
+        period_column = array('i')
+        int_columns = [(name, attr, array('q')) for name, attr in RECORD_INT_FIELDS]
+        float_columns = [(name, attr, array('d')) for name, attr in RECORD_FLOAT_FIELDS]
+        nan = float('nan')
+
+        count = 0
+        for record in records:
+            city_column.append(self._encode('縣市', record.city))
+            year_column.append(record.year)
+            animal_column.append(self._encode('動物類型', record.animal.value))
+            period_column.append(self._encode(PERIOD, record.period or ''))
+            for _, attr, column in int_columns:
+                value = getattr(record, attr)
+                column.append(value if value is not None else 0)
+            for _, attr, column in float_columns:
+                value = getattr(record, attr)
+                column.append(value if value is not None else nan)
+            count += 1
+
+        self.columns['縣市'].extend(city_column)
+        self.columns['年份'].extend(year_column)
+        self.columns['動物類型'].extend(animal_column)
+        self.columns[PERIOD].extend(period_column)
+        for name, _, column in int_columns + float_columns:
+            self.columns[name].extend(column)
+        return count
+
+    def extend_columns(self, cities: Sequence[str], years: Sequence[int], animal_types: Sequence[str],
+                       values: Dict[str, Sequence[Any]], periods: Optional[Sequence[str]] = None) -> int:
+        """以整欄的方式批量附加數據（已是欄式的來源可略過逐列轉換）
+
+        Args:
+            cities: 縣市名稱序列
+            years: 年份序列
+            animal_types: 動物類型序列
+            values: 數值欄位名稱到取值序列的映射，未提供的欄位以缺值填充
+            periods: 期間標籤序列，None表示年度粒度（沒有期間）
+
+        Returns:
+            int: 附加的列數
+        """
+        count = len(years)
+        self.columns['縣市'].extend(array('i', (self._encode('縣市', c) for c in cities)))
+        self.columns['年份'].extend(array('i', years))
+        self.columns['動物類型'].extend(array('i', (self._encode('動物類型', a) for a in animal_types)))
+        if periods is None:
+            self.columns[PERIOD].extend(array('i', bytes(4 * count)))
+        else:
+            self.columns[PERIOD].extend(array('i', (self._encode(PERIOD, p or '') for p in periods)))
+        for name in INT_FIELDS:
+            column = values.get(name)
+            self.columns[name].extend(array('q', column) if column is not None else array('q', bytes(8 * count)))
+        for name in FLOAT_FIELDS:
+            column = values.get(name)
+            self.columns[name].extend(array('d', column) if column is not None else array('d', [float('nan')]) * count)
+        return count
+
+    def _decode_key(self, dimension: str, code: int) -> str:
+        if dimension == '年份':
+            return str(code)
+        return self.dictionaries[dimension][code]
+
+    def group_by(self, keys: Tuple[str, ...] = DIMENSIONS) -> Tuple[List[Tuple[str, ...]], Dict[str, Any]]:
+        """按維度分組加總所有計數欄位，並由加總值重新計算比率
+
+        Args:
+            keys: 分組維度，為 DIMENSIONS 加上 PERIOD 的子集（PERIOD 的鍵在年度粒度的記錄為空字串）
+
+        Returns:
+            (分組鍵列表, 欄位名稱到各分組數值序列的映射)；
+            安裝 NumPy 時數值序列為 ndarray，否則為 list
+        """
+        if np is not None:
+            return self._group_by_numpy(keys)
+        return self._group_by_python(keys)
+
+    def _group_by_numpy(self, keys: Tuple[str, ...]):
+        key_arrays = [np.frombuffer(self.columns[k], dtype=np.int32) for k in keys]
+        if len(self) == 0:
+            return [], {name: np.zeros(0) for name in INT_FIELDS + (NEUTERING_RATE, BREEDING_RATE, 'count')}
+
+        # 將多個維度代碼（減去最小值後）合併為單一整數鍵
+        offsets = [int(codes.min()) for codes in key_arrays]
+        sizes = [int(codes.max()) - offset + 1 for codes, offset in zip(key_arrays, offsets)]
+        composite = np.zeros(len(self), dtype=np.int64)
+        for codes, offset, size in zip(key_arrays, offsets, sizes):
+            composite = composite * size + (codes - offset)
+
+        key_space = int(np.prod(sizes, dtype=np.float64))
+        if key_space <= max(len(self), 1 << 20):
+            # 鍵空間不大時直接以鍵作為 bincount 的桶，無需排序
+            counts = np.bincount(composite, minlength=key_space)
+            present = np.nonzero(counts)[0]
+            group_codes = present
+            sums = {
+                name: np.bincount(composite, weights=np.frombuffer(self.columns[name], dtype=np.int64),
+                                  minlength=key_space)[present]
+                for name in INT_FIELDS
+            }
+            sums['count'] = counts[present].astype(np.float64)
+        else:
+            group_codes, inverse = np.unique(composite, return_inverse=True)
+            groups = len(group_codes)
+            sums = {
+                name: np.bincount(inverse, weights=np.frombuffer(self.columns[name], dtype=np.int64),
+                                  minlength=groups)
+                for name in INT_FIELDS
+            }
+            sums['count'] = np.bincount(inverse, minlength=groups).astype(np.float64)
+
+        base = sums['登記數(A)'] - sums['除戶數(B)']
+        neutered = sums['絕育數(E)'] - sums['絕育除戶數(F)']
+        exempt = sums['免絕育數(G)'] - sums['免絕育除戶數(H)']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sums[NEUTERING_RATE] = np.where(base > 0, neutered / base * 100, np.nan)
+            sums[BREEDING_RATE] = np.where(base > 0, (neutered + exempt) / base * 100, np.nan)
+
+        # 由合併鍵還原各維度代碼
+        decoded = []
+        remainder = group_codes
+        for size, offset in zip(reversed(sizes), reversed(offsets)):
+            decoded.append(remainder % size + offset)
+            remainder = remainder // size
+        decoded.reverse()
+        group_keys = [
+            tuple(self._decode_key(k, int(codes[i])) for k, codes in zip(keys, decoded))
+            for i in range(len(group_codes))
+        ]
+        return group_keys, sums
+
+    def _group_by_python(self, keys: Tuple[str, ...]):
+        key_columns = [self.columns[k] for k in keys]
+        value_columns = [self.columns[name] for name in INT_FIELDS]
+        index: Dict[Tuple[int, ...], int] = {}
+        totals: List[List[float]] = []
+
+        for row, key in enumerate(zip(*key_columns)):
+            slot = index.get(key)
+            if slot is None:
+                slot = index[key] = len(totals)
+                totals.append([0] * (len(INT_FIELDS) + 1))
+            acc = totals[slot]
+            for i, column in enumerate(value_columns):
+                acc[i] += column[row]
+            acc[-1] += 1
+
+        # 按鍵代碼排序，與 NumPy 版本的輸出順序一致
+        ordered = sorted(index.items())
+        sums: Dict[str, Any] = {name: [totals[slot][i] for _, slot in ordered] for i, name in enumerate(INT_FIELDS)}
+        sums['count'] = [totals[slot][-1] for _, slot in ordered]
+
+        nan = float('nan')
+        sums[NEUTERING_RATE] = []
+        sums[BREEDING_RATE] = []
+        for a, b, e, f, g, h in zip(sums['登記數(A)'], sums['除戶數(B)'], sums['絕育數(E)'],
+                                    sums['絕育除戶數(F)'], sums['免絕育數(G)'], sums['免絕育除戶數(H)']):
+            base = a - b
+            sums[NEUTERING_RATE].append((e - f) / base * 100 if base > 0 else nan)
+            sums[BREEDING_RATE].append(((e - f) + (g - h)) / base * 100 if base > 0 else nan)
+
+        group_keys = [tuple(self._decode_key(k, code) for k, code in zip(keys, key)) for key, _ in ordered]
+        return group_keys, sums
+
+    def aggregate(self, keys: Tuple[str, ...] = DIMENSIONS) -> Dict[Tuple[str, ...], Dict[str, float]]:
+        """分組加總並以字典形式返回：{分組鍵: {欄位: 數值}}"""
+        group_keys, sums = self.group_by(keys)
+        return {
+            key: {name: float(values[i]) for name, values in sums.items()}
+            for i, key in enumerate(group_keys)
+        }
@@ -1,6 +1,8 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from enum import Enum
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
 
 
 @dataclass
@@ -21,6 +23,18 @@ class ScrapedItem:
             'date': self.date,
             **self.extra_data
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScrapedItem':
+        """從字典（to_dict的輸出）還原對象"""
+        extra_data = {k: v for k, v in data.items() if k not in ('title', 'link', 'description', 'date')}
+        return cls(
+            title=data.get('title', ''),
+            link=data.get('link', ''),
+            description=data.get('description'),
+            date=data.get('date'),
+            extra_data=extra_data
+        )
 
 
 @dataclass
@@ -35,6 +49,42 @@ class ScrapedData:
         """添加一個爬取項目"""
         self.items.append(item)
     
+    def merge_items(self, items: Iterable[ScrapedItem], key_fields: Tuple[str, ...]) -> Tuple[int, int]:
+        """按鍵欄位合併項目：相同鍵的項目會被取代，其餘則附加
+        
+        Args:
+            items: 要合併的項目
+            key_fields: extra_data 中用於識別同一記錄的欄位
+            
+        Returns:
+            (新增數量, 取代數量)
+        """
+        index = {}
+        for i, item in enumerate(self.items):
+            index[tuple(item.extra_data.get(f) for f in key_fields)] = i
+        
+        added = replaced = 0
+        for item in items:
+            key = tuple(item.extra_data.get(f) for f in key_fields)
+            if key in index:
+                self.items[index[key]] = item
+                replaced += 1
+            else:
+                index[key] = len(self.items)
+                self.items.append(item)
+                added += 1
+        return added, replaced
+    
+    def iter_records(self) -> Iterator['PetRegistrationRecord']:
+        """逐項產生 PetRegistrationRecord（需為寵物登記數據）"""
+        for item in self.items:
+            yield PetRegistrationRecord.from_item(item)
+    
+    def iter_item_dicts(self) -> Iterator[Dict[str, Any]]:
+        """逐項產生字典形式的項目，避免一次建立完整列表"""
+        for item in self.items:
+            yield item.to_dict()
+    
     def to_dict(self) -> Dict[str, Any]:
         """將整個數據對象轉換為字典"""
         return {
@@ -43,3 +93,135 @@ class ScrapedData:
             'error': self.error,
             'items': [item.to_dict() for item in self.items]
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ScrapedData':
+        """從字典（to_dict的輸出）還原對象"""
+        last_updated = data.get('last_updated')
+        return cls(
+            items=[ScrapedItem.from_dict(item) for item in data.get('items', [])],
+            last_updated=datetime.fromisoformat(last_updated) if last_updated else datetime.now(),
+            source_url=data.get('source_url'),
+            error=data.get('error')
+        )
+
+
+class AnimalType(Enum):
+    """寵物登記數據的動物類型"""
+    DOG = '狗'
+    CAT = '貓'
+
+
+# 寵物登記記錄的欄位定義：(原始欄位名稱, 屬性名稱)
+RECORD_INT_FIELDS = (
+    ('登記單位數', 'registration_units'),
+    ('登記數(A)', 'registrations'),
+    ('除戶數(B)', 'removals'),
+    ('轉讓數(C)', 'transfers'),
+    ('變更數(D)', 'changes'),
+    ('絕育數(E)', 'neutered'),
+    ('絕育除戶數(F)', 'neutered_removals'),
+    ('免絕育數(G)', 'exempt'),
+    ('免絕育除戶數(H)', 'exempt_removals'),
+)
+RECORD_FLOAT_FIELDS = (
+    ('絕育率(E-F)/(A-B)', 'neutering_rate'),
+    ('繁殖管理率(E-F)+(G-H)/(A-B)', 'breeding_rate'),
+)
+
+
+def _parse_int(value: Any) -> Optional[int]:
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return int(float(value))
+
+
+def _parse_float(value: Any) -> Optional[float]:
+    if value is None or value == '':
+        return None
+    return float(value)
+
+
+@dataclass(slots=True)
+class PetRegistrationRecord:
+    """單筆寵物登記統計記錄
+    
+    與 ScrapedItem 的 extra_data 字典相比，使用 __slots__ 與原生數值型別保存，
+    縣市名稱經過 sys.intern 共用同一字串，動物類型使用 AnimalType 列舉。
+    缺少的數值以 None 表示；年度粒度的記錄沒有期間標籤（period 為 None）。
+    """
+    city: str
+    year: int
+    animal: AnimalType
+    period: Optional[str] = None
+    registration_units: Optional[int] = None
+    registrations: Optional[int] = None
+    removals: Optional[int] = None
+    transfers: Optional[int] = None
+    changes: Optional[int] = None
+    neutered: Optional[int] = None
+    neutered_removals: Optional[int] = None
+    exempt: Optional[int] = None
+    exempt_removals: Optional[int] = None
+    neutering_rate: Optional[float] = None
+    breeding_rate: Optional[float] = None
+    
+    @classmethod
+    def from_extra_data(cls, data: Dict[str, Any]) -> 'PetRegistrationRecord':
+        """從 ScrapedItem.extra_data 形式的字典建立記錄
+        
+        Raises:
+            ValueError: 缺少年份或動物類型，或數值無法解析
+        """
+        record = cls(
+            city=sys.intern(data.get('縣市') or '全國'),
+            year=int(data['年份']),
+            animal=AnimalType(data['動物類型']),
+            period=data.get('期間') or None
+        )
+        for key, attr in RECORD_INT_FIELDS:
+            if key in data:
+                setattr(record, attr, _parse_int(data[key]))
+        for key, attr in RECORD_FLOAT_FIELDS:
+            if key in data:
+                setattr(record, attr, _parse_float(data[key]))
+        return record
+    
+    @classmethod
+    def from_item(cls, item: ScrapedItem) -> 'PetRegistrationRecord':
+        """從 ScrapedItem 建立記錄"""
+        return cls.from_extra_data(item.extra_data)
+    
+    def to_extra_data(self) -> Dict[str, str]:
+        """轉換為 ScrapedItem.extra_data 形式的字典（數值以字串保存，與爬蟲輸出一致）"""
+        data = {
+            '縣市': self.city,
+            '年份': str(self.year),
+            '動物類型': self.animal.value,
+        }
+        if self.period:
+            data['期間'] = self.period
+        for key, attr in RECORD_INT_FIELDS:
+            value = getattr(self, attr)
+            if value is not None:
+                data[key] = str(value)
+        for key, attr in RECORD_FLOAT_FIELDS:
+            value = getattr(self, attr)
+            if value is not None:
+                data[key] = f"{value:.2f}"
+        return data
+    
+    def to_item(self, link: str = '') -> ScrapedItem:
+        """轉換為 ScrapedItem，供現有的格式化器使用"""
+        registrations = self.registrations if self.registrations is not None else 0
+        neutering_rate = f"{self.neutering_rate:.2f}" if self.neutering_rate is not None else '0'
+        return ScrapedItem(
+            title=f"{self.period or str(self.year) + '年'} {self.city}{self.animal.value}寵物登記數據",
+            link=link,
+            description=f"登記數: {registrations}, 絕育率: {neutering_rate}%",
+            date=self.period or str(self.year),
+            extra_data=self.to_extra_data()
+        )
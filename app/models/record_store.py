@@ -0,0 +1,274 @@
+import json
+import sqlite3
+import logging
+from datetime import datetime
+from itertools import islice
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
+
+from app.models.data_model import ScrapedData, ScrapedItem, RECORD_INT_FIELDS, RECORD_FLOAT_FIELDS
+
+logger = logging.getLogger('record_store')
+
+# extra_data 鍵到資料表欄位的映射（主鍵欄位在前）
+KEY_COLUMNS = (('縣市', 'city'), ('年份', 'year'), ('動物類型', 'animal'), ('期間', 'period'))
+INT_COLUMNS = RECORD_INT_FIELDS
+FLOAT_COLUMNS = RECORD_FLOAT_FIELDS
+ITEM_COLUMNS = ('title', 'link', 'description', 'date')
+
+# 有專屬欄位的 extra_data 鍵；其餘鍵以JSON保存在 extra 欄位
+_MAPPED_KEYS = frozenset(key for key, _ in KEY_COLUMNS + INT_COLUMNS + FLOAT_COLUMNS)
+
+# 參與變更比對的欄位（主鍵以外的所有數據欄位）
+_VALUE_COLUMNS = (
+    tuple(column for _, column in INT_COLUMNS + FLOAT_COLUMNS) + ITEM_COLUMNS + ('extra',)
+)
+_ALL_COLUMNS = tuple(column for _, column in KEY_COLUMNS) + _VALUE_COLUMNS + ('updated_at',)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS records (
+    city TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    animal TEXT NOT NULL,
+    period TEXT NOT NULL DEFAULT '',
+    {', '.join(f'{column} INTEGER' for _, column in INT_COLUMNS)},
+    {', '.join(f'{column} REAL' for _, column in FLOAT_COLUMNS)},
+    title TEXT,
+    link TEXT,
+    description TEXT,
+    date TEXT,
+    extra TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (city, year, animal, period)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_records_year ON records (year, animal);
+CREATE INDEX IF NOT EXISTS idx_records_animal ON records (animal, year);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# 主鍵衝突時只在數據確實不同時更新，未變更的列不會被寫入
+_UPSERT = (
+    f"INSERT INTO records ({', '.join(_ALL_COLUMNS)}) VALUES ({', '.join('?' for _ in _ALL_COLUMNS)}) "
+    f"ON CONFLICT (city, year, animal, period) DO UPDATE SET "
+    f"{', '.join(f'{column} = excluded.{column}' for column in _VALUE_COLUMNS + ('updated_at',))} "
+    f"WHERE {' OR '.join(f'records.{column} IS NOT excluded.{column}' for column in _VALUE_COLUMNS)}"
+)
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return int(float(value))
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or value == '':
+        return None
+    return float(value)
+
+
+class RecordStore:
+    """以本機 SQLite 保存寵物登記數據的儲存後端
+
+    每筆記錄以（縣市, 年份, 動物類型, 期間）為主鍵，年度粒度的期間為空字串。
+    寫入以 executemany 分批執行，主鍵已存在時只更新數據有變更的列，
+    因此增量執行只會改動實際變更的記錄。資料庫使用 WAL 模式，
+    讀取端可在寫入進行時照常查詢；查詢以游標逐列產生結果，不需載入整個資料表。
+    """
+
+    def __init__(self, path: str, batch_size: int = 500):
+        """開啟（必要時建立）資料庫
+
+        Args:
+            path: SQLite 資料庫文件路徑，':memory:' 表示記憶體資料庫
+            batch_size: 每次 executemany 寫入的列數
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        # WAL 模式下 NORMAL 已能保證資料庫一致，只有斷電時可能遺失最後的交易
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> 'RecordStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @staticmethod
+    def _to_params(item: ScrapedItem, updated_at: str) -> Tuple[Any, ...]:
+        """將 ScrapedItem 轉換為 _UPSERT 的參數"""
+        data = item.extra_data
+        extra = {key: value for key, value in data.items() if key not in _MAPPED_KEYS}
+        return (
+            data.get('縣市') or '全國',
+            int(data['年份']),
+            data['動物類型'],
+            data.get('期間') or '',
+            *(_to_int(data.get(key)) for key, _ in INT_COLUMNS),
+            *(_to_float(data.get(key)) for key, _ in FLOAT_COLUMNS),
+            item.title,
+            item.link,
+            item.description,
+            item.date,
+            json.dumps(extra, ensure_ascii=False, sort_keys=True) if extra else None,
+            updated_at,
+        )
+
+    def upsert_items(self, items: Iterable[ScrapedItem]) -> Dict[str, int]:
+        """批量寫入項目
+
+        Args:
+            items: 寵物登記項目（extra_data 需包含年份與動物類型）
+
+        Returns:
+            {'inserted': 新增列數, 'updated': 更新列數, 'unchanged': 未變更列數}
+
+        Raises:
+            KeyError: 項目缺少年份或動物類型
+        """
+        updated_at = datetime.now().isoformat()
+        params = (self._to_params(item, updated_at) for item in items)
+        total = changed = 0
+        with self._conn:
+            before = self.count()
+            while True:
+                batch = list(islice(params, self.batch_size))
+                if not batch:
+                    break
+                cursor = self._conn.executemany(_UPSERT, batch)
+                total += len(batch)
+                changed += cursor.rowcount
+            inserted = self.count() - before
+        stats = {'inserted': inserted, 'updated': changed - inserted, 'unchanged': total - changed}
+        logger.info(f"寫入 {total} 筆記錄: 新增 {stats['inserted']}、更新 {stats['updated']}、"
+                    f"未變更 {stats['unchanged']}")
+        return stats
+
+    def upsert_data(self, data: ScrapedData) -> Dict[str, int]:
+        """寫入 ScrapedData 的所有項目，並保存來源與更新時間"""
+        stats = self.upsert_items(data.items)
+        self.set_meta('source_url', data.source_url)
+        self.set_meta('last_updated', data.last_updated.isoformat())
+        return stats
+
+    def set_meta(self, key: str, value: Optional[str]) -> None:
+        with self._conn:
+            self._conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    @staticmethod
+    def _where(city: Optional[str], year: Optional[int], animal: Optional[str],
+               period: Optional[str]) -> Tuple[str, List[Any]]:
+        clauses = []
+        params: List[Any] = []
+        for column, value in (('city', city), ('year', year), ('animal', animal), ('period', period)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def count(self, city: Optional[str] = None, year: Optional[int] = None,
+              animal: Optional[str] = None, period: Optional[str] = None) -> int:
+        """返回符合條件的記錄數"""
+        where, params = self._where(city, year, animal, period)
+        return self._conn.execute(f'SELECT COUNT(*) FROM records{where}', params).fetchone()[0]
+
+    def delete(self, city: Optional[str] = None, year: Optional[int] = None,
+               animal: Optional[str] = None, period: Optional[str] = None) -> int:
+        """刪除符合條件的記錄（至少需指定一個條件），返回刪除的記錄數"""
+        where, params = self._where(city, year, animal, period)
+        if not where:
+            raise ValueError('刪除記錄至少需要一個條件')
+        with self._conn:
+            return self._conn.execute(f'DELETE FROM records{where}', params).rowcount
+
+    def iter_item_dicts(self, city: Optional[str] = None, year: Optional[int] = None,
+                        animal: Optional[str] = None, period: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """逐列產生 ScrapedItem.to_dict() 形式的字典（數值以字串表示，與爬蟲輸出一致）
+
+        按年份、期間、動物類型、縣市排序；各參數為None時不篩選該欄位。
+
+        Args:
+            city: 縣市
+            year: 年份
+            animal: 動物類型（'狗' 或 '貓'）
+            period: 期間標籤，年度粒度的記錄為空字串
+        """
+        where, params = self._where(city, year, animal, period)
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(_ALL_COLUMNS[:-1])} FROM records{where} ORDER BY year, period, animal, city",
+            params
+        )
+        int_offset = len(KEY_COLUMNS)
+        float_offset = int_offset + len(INT_COLUMNS)
+        item_offset = float_offset + len(FLOAT_COLUMNS)
+        for row in cursor:
+            result = dict(zip(ITEM_COLUMNS, row[item_offset:item_offset + len(ITEM_COLUMNS)]))
+            result['縣市'] = row[0]
+            result['年份'] = str(row[1])
+            result['動物類型'] = row[2]
+            if row[3]:
+                result['期間'] = row[3]
+            for (key, _), value in zip(INT_COLUMNS, row[int_offset:float_offset]):
+                if value is not None:
+                    result[key] = str(value)
+            for (key, _), value in zip(FLOAT_COLUMNS, row[float_offset:item_offset]):
+                if value is not None:
+                    result[key] = f"{value:.2f}"
+            if row[-1] is not None:
+                result.update(json.loads(row[-1]))
+            yield result
+
+    def iter_items(self, **filters: Any) -> Iterator[ScrapedItem]:
+        """逐列產生 ScrapedItem（篩選參數同 iter_item_dicts）"""
+        for row in self.iter_item_dicts(**filters):
+            yield ScrapedItem.from_dict(row)
+
+    def query(self, **filters: Any) -> 'RecordQuery':
+        """返回可供格式化器串流讀取的查詢結果（篩選參數同 iter_item_dicts）"""
+        return RecordQuery(self, filters)
+
+    def load(self, **filters: Any) -> ScrapedData:
+        """將符合條件的記錄載入為 ScrapedData（篩選參數同 iter_item_dicts）"""
+        last_updated = self.get_meta('last_updated')
+        return ScrapedData(
+            items=list(self.iter_items(**filters)),
+            last_updated=datetime.fromisoformat(last_updated) if last_updated else datetime.now(),
+            source_url=self.get_meta('source_url')
+        )
+
+
+class RecordQuery:
+    """RecordStore 的查詢結果
+
+    提供與 ScrapedData 相同的 last_updated、source_url、error 屬性與 iter_item_dicts()，
+    DataFormatter 的JSON/JS串流輸出可以直接逐列讀取資料庫，不需先載入所有記錄。
+    """
+
+    def __init__(self, store: RecordStore, filters: Dict[str, Any]):
+        self.store = store
+        self.filters = filters
+        last_updated = store.get_meta('last_updated')
+        self.last_updated = datetime.fromisoformat(last_updated) if last_updated else datetime.now()
+        self.source_url = store.get_meta('source_url')
+        self.error: Optional[str] = None
+
+    def __len__(self) -> int:
+        return self.store.count(**self.filters)
+
+    def iter_item_dicts(self) -> Iterator[Dict[str, Any]]:
+        return self.store.iter_item_dicts(**self.filters)
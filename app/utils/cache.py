@@ -0,0 +1,146 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger('response_cache')
+
+
+class ResponseCache:
+    """磁碟上的HTTP回應快取
+
+    每個快取項目以請求參數（例如 Method、SDATE、EDATE、Animal）為鍵，
+    存成一個檔案：第一行為JSON格式的中繼資料（鍵、到期時間），其後為原始回應內容。
+    總大小超過上限時，依最後存取時間淘汰最舊的項目。
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 100 * 1024 * 1024):
+        """初始化回應快取
+
+        Args:
+            cache_dir: 快取目錄
+            max_bytes: 快取總大小上限（位元組）
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._total_bytes = sum(os.path.getsize(path) for path in self._entry_paths())
+
+    @staticmethod
+    def _digest(key: Dict[str, Any]) -> str:
+        """計算快取鍵的雜湊值"""
+        raw = json.dumps(key, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key: Dict[str, Any]) -> str:
+        return os.path.join(self.cache_dir, f"{self._digest(key)}.cache")
+
+    def _entry_paths(self):
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.cache'):
+                yield os.path.join(self.cache_dir, name)
+
+    def get(self, key: Dict[str, Any]) -> Optional[bytes]:
+        """讀取快取內容
+
+        Args:
+            key: 快取鍵
+
+        Returns:
+            原始回應內容，未命中或已過期時返回None
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline().decode('utf-8'))
+                body = f.read()
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        expires_at = meta.get('expires_at')
+        if expires_at is not None and expires_at < time.time():
+            logger.debug(f"快取已過期: {key}")
+            self._remove(path)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # 更新存取時間，供LRU淘汰使用
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return body
+
+    def set(self, key: Dict[str, Any], body: bytes, ttl: Optional[float] = None) -> None:
+        """寫入快取內容
+
+        Args:
+            key: 快取鍵
+            body: 原始回應內容
+            ttl: 存活秒數，None表示永久有效
+        """
+        path = self._path(key)
+        meta = {
+            'key': key,
+            'created_at': time.time(),
+            'expires_at': time.time() + ttl if ttl is not None else None,
+        }
+        header = (json.dumps(meta, ensure_ascii=False) + '\n').encode('utf-8')
+
+        # 先寫入暫存檔再替換，避免中斷時留下不完整的快取
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            f.write(body)
+
+        with self._lock:
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+            self._total_bytes += len(header) + len(body) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _remove(self, path: str) -> None:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            self._total_bytes -= size
+
+    def _evict(self) -> None:
+        """依最後存取時間淘汰項目，直到總大小低於上限（呼叫時需持有鎖）"""
+        entries = []
+        for path in self._entry_paths():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        for _, size, path in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._total_bytes -= size
+            logger.debug(f"淘汰快取項目: {path}")
+
+    def stats(self) -> Dict[str, int]:
+        """返回快取命中統計"""
+        return {'hits': self.hits, 'misses': self.misses, 'bytes': self._total_bytes}
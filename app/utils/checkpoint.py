@@ -0,0 +1,102 @@
+import os
+import json
+import logging
+import threading
+from typing import Optional, Dict, List, Any
+
+logger = logging.getLogger('checkpoint')
+
+
+class CheckpointJournal:
+    """分區抓取的檢查點日誌
+
+    以 JSON Lines 格式追加寫入，每完成一個分區寫入一行並立即 fsync，
+    因此即使程式中途終止，已完成的分區也不會遺失。
+    重新啟動時讀取日誌即可略過已完成的分區。
+    """
+
+    def __init__(self, path: str):
+        """初始化檢查點日誌
+
+        Args:
+            path: 日誌文件路徑
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._completed: Dict[str, List[Dict[str, Any]]] = {}
+
+    @staticmethod
+    def make_key(start_date: str, end_date: str, animal_type: str) -> str:
+        """由日期範圍與動物類型組成分區鍵"""
+        return f"{start_date}|{end_date}|{animal_type}"
+
+    def load(self) -> int:
+        """讀取既有日誌
+
+        最後一行若因中斷而不完整（沒有換行結尾）會被忽略，並將文件截斷到最後一個完整的行，
+        使之後追加的記錄從新的一行開始。
+
+        Returns:
+            int: 已完成的分區數
+        """
+        self._completed = {}
+        if not os.path.exists(self.path):
+            return 0
+
+        with open(self.path, 'rb') as f:
+            content = f.read()
+        complete = content.rfind(b'\n') + 1
+        if complete < len(content):
+            logger.warning(f"檢查點日誌最後一行不完整，截斷 {len(content) - complete} 位元組: {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(complete)
+                f.flush()
+                os.fsync(f.fileno())
+
+        for line_number, line in enumerate(content[:complete].decode('utf-8', errors='replace').splitlines(), 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+                self._completed[entry['key']] = entry['rows']
+            except (ValueError, KeyError):
+                logger.warning(f"略過檢查點日誌第 {line_number} 行（內容不完整）")
+
+        logger.info(f"從檢查點日誌載入 {len(self._completed)} 個已完成分區: {self.path}")
+        return len(self._completed)
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """取得已完成分區的數據（返回副本），未完成時返回None"""
+        rows = self._completed.get(key)
+        if rows is None:
+            return None
+        return [dict(row) for row in rows]
+
+    def record(self, key: str, rows: List[Dict[str, Any]]) -> None:
+        """記錄一個已完成的分區，寫入後立即同步到磁碟
+
+        Args:
+            key: 分區鍵
+            rows: 分區數據
+        """
+        line = json.dumps({'key': key, 'rows': rows}, ensure_ascii=False) + '\n'
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._completed[key] = [dict(row) for row in rows]
+
+    def clear(self) -> None:
+        """刪除日誌文件（整個執行成功完成後呼叫）"""
+        with self._lock:
+            self._completed = {}
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def __len__(self) -> int:
+        return len(self._completed)
@@ -0,0 +1,97 @@
+import logging
+from typing import Optional, Dict, List, Callable, Iterator
+
+import soupsieve
+from bs4 import Tag
+
+from app.models.data_model import ScrapedItem
+from app.utils.html_parser import parse_simple_selector
+
+logger = logging.getLogger('extraction')
+
+# ScrapedItem 的固定欄位；其餘欄位寫入 extra_data
+ITEM_FIELDS = ('title', 'link', 'description', 'date')
+
+# 缺少任一欄位的項目會被略過
+REQUIRED_FIELDS = ('title', 'link')
+
+# 取屬性而非文字的欄位
+ATTRIBUTE_FIELDS = {'link': 'href'}
+
+
+def compile_select_one(selector: str) -> Callable[[Tag], Optional[Tag]]:
+    """編譯選擇器為「返回第一個符合的子孫元素」的函數
+
+    簡單選擇器（tag、.class、#id、tag.class、tag#id）使用 Tag.find，
+    其餘交給預先編譯的 soupsieve 選擇器。
+    """
+    parsed = parse_simple_selector(selector)
+    if parsed is not None:
+        name, attrs = parsed
+        return lambda node: node.find(name, attrs)
+    return soupsieve.compile(selector).select_one
+
+
+def compile_select(selector: str) -> Callable[[Tag], List[Tag]]:
+    """編譯選擇器為「返回所有符合的子孫元素」的函數"""
+    parsed = parse_simple_selector(selector)
+    if parsed is not None:
+        name, attrs = parsed
+        return lambda node: node.find_all(name, attrs)
+    return soupsieve.compile(selector).select
+
+
+class ItemExtractor:
+    """宣告式的項目提取器
+
+    以 TARGET_SITES 中的 selector 區塊建立：'article' 選出每個項目的節點，
+    其餘鍵各自是一個欄位。所有選擇器在建立時編譯一次，
+    每個節點上的每個欄位只求值一次。
+    """
+
+    def __init__(self, selectors: Dict[str, str]):
+        """編譯選擇器
+
+        Args:
+            selectors: {'article': 項目選擇器, 欄位名稱: 欄位選擇器, ...}
+        """
+        self.selectors = dict(selectors)
+        self._select_articles = compile_select(self.selectors['article'])
+        self._fields = tuple(
+            (name, compile_select_one(selector), ATTRIBUTE_FIELDS.get(name))
+            for name, selector in self.selectors.items() if name != 'article'
+        )
+
+    def extract_fields(self, node: Tag) -> Dict[str, Optional[str]]:
+        """提取單一節點的所有欄位（找不到的欄位為None）"""
+        values = {}
+        for name, select_one, attribute in self._fields:
+            element = select_one(node)
+            if element is None:
+                values[name] = None
+            elif attribute is not None:
+                values[name] = element.get(attribute)
+            else:
+                values[name] = element.get_text().strip()
+        return values
+
+    def iter_items(self, soup: Tag) -> Iterator[ScrapedItem]:
+        """逐一產生頁面中的項目
+
+        Args:
+            soup: 已解析的頁面
+
+        Yields:
+            ScrapedItem: 每個具備標題與連結的項目
+        """
+        for node in self._select_articles(soup):
+            values = self.extract_fields(node)
+            if any(not values.get(name) for name in REQUIRED_FIELDS):
+                continue
+            yield ScrapedItem(
+                title=values.pop('title'),
+                link=values.pop('link'),
+                description=values.pop('description', None),
+                date=values.pop('date', None),
+                extra_data=values
+            )
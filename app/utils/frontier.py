@@ -0,0 +1,276 @@
+import os
+import math
+import heapq
+import hashlib
+import logging
+import tempfile
+from collections import deque
+from typing import Optional, Dict, List, Tuple, Set, Union
+
+from app.utils.helpers import normalize_url
+
+logger = logging.getLogger('url_frontier')
+
+
+def _url_digest(url: str) -> bytes:
+    """正規化URL的16位元組雜湊"""
+    return hashlib.blake2b(normalize_url(url).encode('utf-8'), digest_size=16).digest()
+
+
+class BloomFilter:
+    """以 bytearray 實作的布隆過濾器
+
+    可能誤判「已存在」（機率約為 error_rate），但不會誤判「不存在」。
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """依預期數量與誤判率計算位元數與雜湊次數
+
+        Args:
+            capacity: 預期加入的元素數
+            error_rate: 可接受的誤判率
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, digest: bytes) -> List[int]:
+        # 以兩個64位元雜湊的線性組合產生 k 個位置（Kirsch-Mitzenmacher）
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:16], 'little') | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add(self, digest: bytes) -> bool:
+        """加入元素
+
+        Returns:
+            bool: 加入前是否（可能）已存在
+        """
+        present = True
+        bits = self._bits
+        for position in self._positions(digest):
+            byte = position >> 3
+            mask = 1 << (position & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        if not present:
+            self.count += 1
+        return present
+
+    def __contains__(self, digest: bytes) -> bool:
+        bits = self._bits
+        for position in self._positions(digest):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class SeenIndex:
+    """已見URL的去重索引
+
+    以正規化URL的雜湊為鍵：預期數量不超過 exact_limit 時使用精確的集合（每個URL一個64位元整數），
+    否則使用布隆過濾器，記憶體固定且與實際數量無關。
+    """
+
+    def __init__(self, expected: int = 100000, exact_limit: int = 200000, error_rate: float = 0.001):
+        self._exact: Optional[Set[int]] = set() if expected <= exact_limit else None
+        self._bloom = BloomFilter(expected, error_rate) if self._exact is None else None
+        self.kind = 'exact' if self._exact is not None else 'bloom'
+
+    def add(self, url: str) -> bool:
+        """記錄URL
+
+        Returns:
+            bool: 是否為新URL（布隆過濾器可能把極少數新URL誤判為已見）
+        """
+        digest = _url_digest(url)
+        if self._exact is not None:
+            key = int.from_bytes(digest[:8], 'little')
+            if key in self._exact:
+                return False
+            self._exact.add(key)
+            return True
+        return not self._bloom.add(digest)
+
+    def __contains__(self, url: str) -> bool:
+        digest = _url_digest(url)
+        if self._exact is not None:
+            return int.from_bytes(digest[:8], 'little') in self._exact
+        return digest in self._bloom
+
+    def __len__(self) -> int:
+        return len(self._exact) if self._exact is not None else self._bloom.count
+
+
+class DiskQueue:
+    """記憶體有上限的先進先出佇列
+
+    新項目寫入記憶體中的尾端緩衝區，緩衝區滿時整批追加到暫存檔；
+    取出時依序讀取頭端緩衝區、暫存檔、尾端緩衝區，因此順序與寫入順序一致，
+    記憶體中最多保留約 2 × chunk_size 個項目。
+    """
+
+    def __init__(self, chunk_size: int = 10000, directory: Optional[str] = None):
+        self.chunk_size = chunk_size
+        self.directory = directory
+        self._head: deque = deque()
+        self._tail: List[str] = []
+        self._file = None
+        self._read_offset = 0
+        self._spilled = 0
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def push(self, line: str) -> None:
+        self._tail.append(line)
+        self._length += 1
+        if len(self._tail) >= self.chunk_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(mode='w+', encoding='utf-8', dir=self.directory)
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(''.join(line + '\n' for line in self._tail))
+        self._spilled += len(self._tail)
+        self._tail = []
+
+    def _refill(self) -> None:
+        if self._spilled:
+            self._file.seek(self._read_offset)
+            for _ in range(min(self.chunk_size, self._spilled)):
+                self._head.append(self._file.readline().rstrip('\n'))
+            self._read_offset = self._file.tell()
+            self._spilled -= len(self._head)
+            if not self._spilled:
+                # 暫存檔已讀完，截斷以釋放磁碟空間
+                self._file.seek(0)
+                self._file.truncate()
+                self._read_offset = 0
+        else:
+            self._head.extend(self._tail)
+            self._tail = []
+
+    def pop(self) -> str:
+        if not self._head:
+            self._refill()
+        self._length -= 1
+        return self._head.popleft()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class URLFrontier:
+    """具優先順序的URL邊界（待爬佇列）
+
+    每個優先順序（整數，越小越先）一個 DiskQueue，同一優先順序內先進先出，
+    因此待爬URL數量再多，記憶體也只與優先順序的個數成正比。
+    加入時以 SeenIndex 去除重複（正規化後相同的URL只會加入一次），
+    並套用深度上限與總頁數上限。
+    """
+
+    def __init__(self, max_depth: Optional[int] = None, max_pages: Optional[int] = None,
+                 expected_urls: int = 100000, chunk_size: int = 10000,
+                 seen: Optional[SeenIndex] = None, spill_dir: Optional[str] = None):
+        """初始化URL邊界
+
+        Args:
+            max_depth: 最大連結深度（起始URL為0），None表示不限
+            max_pages: 最多出隊的URL數，None表示不限
+            expected_urls: 預期的URL數量，用於決定去重索引的實作
+            chunk_size: 每個優先順序在記憶體中保留的項目數
+            seen: 共用的去重索引，默認依 expected_urls 建立
+            spill_dir: 暫存檔目錄，默認為系統暫存目錄
+        """
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.chunk_size = chunk_size
+        self.spill_dir = spill_dir
+        self.seen = seen if seen is not None else SeenIndex(expected_urls)
+        self._queues: Dict[int, DiskQueue] = {}
+        self._priorities: List[int] = []
+        self.popped = 0
+        self.duplicates = 0
+        self.rejected = 0
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def push(self, url: str, depth: int = 0, priority: Optional[int] = None) -> bool:
+        """加入URL
+
+        Args:
+            url: 目標URL
+            depth: 連結深度
+            priority: 優先順序（越小越先），默認等於深度
+
+        Returns:
+            bool: 是否加入（重複、超過深度或已達頁數上限時為False）
+        """
+        url = url.strip()
+        if '\n' in url or '\t' in url:
+            self.rejected += 1
+            return False
+        if self.max_depth is not None and depth > self.max_depth:
+            self.rejected += 1
+            return False
+        if self.max_pages is not None and self.popped + len(self) >= self.max_pages:
+            self.rejected += 1
+            return False
+        if not self.seen.add(url):
+            self.duplicates += 1
+            return False
+
+        priority = depth if priority is None else priority
+        queue = self._queues.get(priority)
+        if queue is None:
+            queue = self._queues[priority] = DiskQueue(self.chunk_size, self.spill_dir)
+            heapq.heappush(self._priorities, priority)
+        queue.push(f"{depth}\t{url}")
+        return True
+
+    def pop(self) -> Optional[Tuple[str, int]]:
+        """取出優先順序最高的URL
+
+        Returns:
+            (URL, 深度)，佇列為空時返回None
+        """
+        while self._priorities:
+            priority = self._priorities[0]
+            queue = self._queues[priority]
+            if len(queue):
+                depth, url = queue.pop().split('\t', 1)
+                self.popped += 1
+                return url, int(depth)
+            queue.close()
+            del self._queues[priority]
+            heapq.heappop(self._priorities)
+        return None
+
+    def stats(self) -> Dict[str, Union[int, str]]:
+        return {
+            'queued': len(self),
+            'popped': self.popped,
+            'seen': len(self.seen),
+            'duplicates': self.duplicates,
+            'rejected': self.rejected,
+            'dedup': self.seen.kind,
+        }
+
+    def close(self) -> None:
+        for queue in self._queues.values():
+            queue.close()
@@ -2,8 +2,11 @@ import os
 import time
 import random
 import logging
-from typing import Optional, List, Dict, Any
-from urllib.parse import urlparse, urljoin
+import calendar
+import threading
+from datetime import date, timedelta
+from typing import Optional, List, Dict, Any, Tuple
+from urllib.parse import urlparse, urljoin, urlsplit, urlunsplit
 
 logger = logging.getLogger('scraper_helpers')
 
@@ -46,6 +49,95 @@ def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
     time.sleep(delay)
 
 
+class RateLimiter:
+    """全域速率限制器，可在多個執行緒之間共享同一份每秒請求預算
+
+    每次呼叫 acquire() 會預約下一個可用的時間槽，
+    因此並行的請求會被平均分散，而不是各自固定等待。
+    """
+
+    def __init__(self, requests_per_second: float = 1.0):
+        """初始化速率限制器
+
+        Args:
+            requests_per_second: 每秒允許的請求數，小於等於0表示不限速
+        """
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """等待直到取得下一個請求時間槽
+
+        Returns:
+            float: 實際等待的秒數
+        """
+        if self.interval <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        wait = slot - now
+        if wait > 0:
+            logger.debug(f"速率限制，等待 {wait:.2f} 秒...")
+            time.sleep(wait)
+        return wait
+
+
+class SitePoliteness:
+    """單一網站的禮貌規則：並行請求上限，以及相鄰兩次請求的開始時間相隔 uniform(min_delay, max_delay) 秒
+
+    只負責記帳、不會等待，由呼叫端以自己的方式等到預約的時間：
+    同步排程器（CrawlScheduler）據此決定何時派發，非同步節流器（DomainThrottle）據此 asyncio.sleep。
+    """
+
+    def __init__(self, concurrency: int = 1, min_delay: float = 0.0, max_delay: float = 0.0):
+        self.concurrency = concurrency
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.in_flight = 0
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], default_concurrency: int = 1) -> 'SitePoliteness':
+        """由 TARGET_SITES 的網站配置建立（只有 use_random_delay 為真時才加入間隔）"""
+        delayed = config.get('use_random_delay', False)
+        return cls(config.get('max_concurrency', default_concurrency),
+                   config.get('min_delay', 0.0) if delayed else 0.0,
+                   config.get('max_delay', 0.0) if delayed else 0.0)
+
+    def ready_at(self, now: float) -> Optional[float]:
+        """返回最早可以開始下一個請求的時間；並行數已滿時返回None"""
+        with self._lock:
+            if self.in_flight >= self.concurrency:
+                return None
+            return max(now, self._next_start)
+
+    def reserve(self, now: float) -> float:
+        """佔用一個並行名額並預約開始時間
+
+        Args:
+            now: 目前時間（與 ready_at 使用同一個時鐘）
+
+        Returns:
+            float: 預約的開始時間，呼叫端應等到此時間才發送請求
+        """
+        with self._lock:
+            self.in_flight += 1
+            start = max(now, self._next_start)
+            self._next_start = start + random.uniform(self.min_delay, self.max_delay)
+            return start
+
+    def release(self) -> None:
+        """請求結束，歸還並行名額"""
+        with self._lock:
+            self.in_flight -= 1
+
+
 def clean_text(text: Optional[str]) -> Optional[str]:
     """清理文本，移除多餘的空白字符
     
@@ -73,6 +165,27 @@ def extract_domain(url: str) -> str:
     return parsed_url.netloc
 
 
+def normalize_url(url: str) -> str:
+    """將URL正規化，用於去重
+    
+    協定與主機名轉為小寫、去掉預設連接埠與片段（#...）、
+    查詢參數排序（保留原本的編碼），空路徑補為 '/'。
+    
+    Args:
+        url: 完整URL
+        
+    Returns:
+        str: 正規化後的URL
+    """
+    parsed = urlsplit(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+    query = '&'.join(sorted(part for part in parsed.query.split('&') if part))
+    return urlunsplit((scheme, netloc, parsed.path or '/', query, ''))
+
+
 def is_valid_url(url: str) -> bool:
     """檢查URL是否有效
     
@@ -107,8 +220,71 @@ def filter_urls(urls: List[str], allowed_domains: Optional[List[str]] = None) ->
         if not is_valid_url(url):
             continue
         
-        domain = extract_domain(url)
+        domain = extract_domain(url).rsplit(':', 1)[0]  # 比對時忽略連接埠
         if any(domain.endswith(allowed_domain) for allowed_domain in allowed_domains):
             filtered_urls.append(url)
             
     return filtered_urls
+
+
+# 支援的時間粒度
+GRANULARITIES = ('year', 'quarter', 'month', 'day')
+
+
+def split_year(year: int, granularity: str = 'year') -> List[Tuple[date, date, str]]:
+    """將一個年度切分為指定粒度的日期窗口
+    
+    Args:
+        year: 年份
+        granularity: 時間粒度，'year'、'quarter'、'month' 或 'day'
+        
+    Returns:
+        List[Tuple[date, date, str]]: (開始日期, 結束日期, 期間標籤) 列表，
+        標籤格式分別為 '2020'、'2020-Q1'、'2020-03'、'2020-03-05'
+    """
+    if granularity == 'year':
+        return [(date(year, 1, 1), date(year, 12, 31), str(year))]
+    
+    if granularity == 'quarter':
+        windows = []
+        for quarter in range(4):
+            first_month = quarter * 3 + 1
+            last_month = first_month + 2
+            windows.append((
+                date(year, first_month, 1),
+                date(year, last_month, calendar.monthrange(year, last_month)[1]),
+                f"{year}-Q{quarter + 1}"
+            ))
+        return windows
+    
+    if granularity == 'month':
+        return [
+            (date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1]), f"{year}-{month:02d}")
+            for month in range(1, 13)
+        ]
+    
+    if granularity == 'day':
+        windows = []
+        current = date(year, 1, 1)
+        while current.year == year:
+            windows.append((current, current, current.isoformat()))
+            current += timedelta(days=1)
+        return windows
+    
+    raise ValueError(f"不支援的時間粒度: {granularity}")
+
+
+def period_granularity(period: Optional[str]) -> str:
+    """由 split_year 產生的期間標籤判斷時間粒度，沒有標籤時為年度粒度
+    
+    Args:
+        period: 期間標籤（'2020-Q1'、'2020-03'、'2020-03-05'），年度粒度為None或空字串
+        
+    Returns:
+        str: 'year'、'quarter'、'month' 或 'day'
+    """
+    if not period:
+        return 'year'
+    if '-Q' in period:
+        return 'quarter'
+    return 'day' if period.count('-') == 2 else 'month'
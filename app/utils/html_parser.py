@@ -0,0 +1,103 @@
+import re
+import logging
+from typing import Optional, List, Dict, Tuple
+
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
+
+logger = logging.getLogger('html_parser')
+
+# BeautifulSoup 解析器，依速度排序；'auto' 會選用第一個已安裝的
+PARSER_BACKENDS = ('lxml', 'html5lib', 'html.parser')
+AUTO_PREFERENCE = ('lxml', 'html.parser')
+
+# 不支援 parse_only（SoupStrainer）的解析器
+_NO_STRAINER = ('html5lib',)
+
+# 可轉換為 SoupStrainer 的簡單選擇器：tag、.class、#id、tag.class、tag#id
+_SIMPLE_SELECTOR = re.compile(r'^(?P<tag>[a-zA-Z][\w-]*)?(?:\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+))?$')
+
+_available: Optional[List[str]] = None
+
+
+def available_parsers() -> List[str]:
+    """返回目前環境中可用的解析器"""
+    global _available
+    if _available is None:
+        _available = []
+        for name in PARSER_BACKENDS:
+            try:
+                BeautifulSoup('', name)
+            except FeatureNotFound:
+                continue
+            _available.append(name)
+    return _available
+
+
+def resolve_parser(name: Optional[str] = None) -> str:
+    """解析網站配置中的解析器名稱
+
+    Args:
+        name: 'lxml'、'html5lib'、'html.parser' 或 'auto'；None 等同 'html.parser'
+
+    Returns:
+        str: 實際使用的解析器；指定的解析器未安裝時退回 html.parser
+    """
+    if name is None:
+        return 'html.parser'
+    if name == 'auto':
+        return next(parser for parser in AUTO_PREFERENCE if parser in available_parsers())
+    if name not in available_parsers():
+        logger.warning(f"未安裝解析器 {name}，改用 html.parser")
+        return 'html.parser'
+    return name
+
+
+def parse_simple_selector(selector: Optional[str]) -> Optional[Tuple[Optional[str], Dict[str, str]]]:
+    """將簡單的CSS選擇器拆為標籤名稱與屬性條件
+
+    Args:
+        selector: 例如 '.news-item'、'article.news-item'、'div#main'
+
+    Returns:
+        (標籤名稱或None, 屬性條件)；選擇器為None或過於複雜（組合器、多個類別、屬性選擇器等）時返回None
+    """
+    if not selector:
+        return None
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if match is None or not any(match.groupdict().values()):
+        return None
+    attrs = {}
+    if match.group('cls'):
+        attrs['class'] = match.group('cls')
+    if match.group('id'):
+        attrs['id'] = match.group('id')
+    return match.group('tag'), attrs
+
+
+def strainer_for(selector: Optional[str]) -> Optional[SoupStrainer]:
+    """將簡單的CSS選擇器轉換為 SoupStrainer，無法轉換時返回None
+
+    SoupStrainer 只減少建立的節點，解析器仍需斷詞整頁，因此節省有限：
+    在 benchmarks/bench_html_parsers.py 的合成頁面（240 KB、500篇文章）上，
+    lxml 與 html.parser 的部分解析加上查詢都只比整頁快約5-10%，主要好處是較小的樹與記憶體用量。
+    """
+    parsed = parse_simple_selector(selector)
+    if parsed is None:
+        return None
+    name, attrs = parsed
+    return SoupStrainer(name, attrs=attrs)
+
+
+def make_soup(content: bytes, parser: str = 'html.parser', parse_only: Optional[str] = None) -> BeautifulSoup:
+    """解析HTML（直接接受位元組，由 BeautifulSoup 偵測編碼）
+
+    Args:
+        content: 頁面原始內容
+        parser: 解析器名稱（應先經 resolve_parser 處理）
+        parse_only: 只保留符合此選擇器的元素（及其子樹）；無法轉換為 SoupStrainer 時解析整頁
+
+    Returns:
+        BeautifulSoup物件
+    """
+    strainer = strainer_for(parse_only) if parser not in _NO_STRAINER else None
+    return BeautifulSoup(content, parser, parse_only=strainer)
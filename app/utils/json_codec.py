@@ -0,0 +1,46 @@
+import json
+import logging
+from typing import Any, Union
+
+logger = logging.getLogger('json_codec')
+
+# 選用的高速JSON後端：優先使用 orjson，其次 msgspec，皆未安裝時使用標準庫 json
+try:
+    import orjson
+
+    JSON_BACKEND = 'orjson'
+    JSONDecodeError = (orjson.JSONDecodeError, ValueError)
+
+    def _loads(data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    try:
+        import msgspec
+
+        JSON_BACKEND = 'msgspec'
+        JSONDecodeError = (msgspec.DecodeError, ValueError)
+        _decoder = msgspec.json.Decoder()
+
+        def _loads(data: Union[bytes, str]) -> Any:
+            return _decoder.decode(data)
+    except ImportError:
+        JSON_BACKEND = 'json'
+        JSONDecodeError = (ValueError,)  # json.JSONDecodeError 與 UnicodeDecodeError 皆為其子類
+
+        def _loads(data: Union[bytes, str]) -> Any:
+            return json.loads(data)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """解析JSON（接受 bytes 或 str，bytes 不需先解碼為文字）
+
+    Args:
+        data: JSON內容
+
+    Returns:
+        解析後的Python物件
+
+    Raises:
+        JSONDecodeError 中的任一例外: 內容不是有效的JSON
+    """
+    return _loads(data)
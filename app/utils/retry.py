@@ -0,0 +1,240 @@
+import time
+import random
+import logging
+import threading
+from enum import Enum
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger('retry_policy')
+
+
+class FailureKind(Enum):
+    """請求失敗的類別，各類別有不同的重試上限"""
+    EMPTY = 'empty'                    # 空回應或 {"d":null}，通常是會話失效
+    BAD_JSON = 'bad_json'              # 回應不是有效的JSON
+    UNEXPECTED_FORMAT = 'unexpected'   # JSON有效但不是預期的表格格式
+    HTTP_CLIENT = 'http_4xx'           # 4xx 回應（429 除外）
+    RATE_LIMITED = 'http_429'          # 429 Too Many Requests
+    HTTP_SERVER = 'http_5xx'           # 5xx 回應
+    TRANSPORT = 'transport'            # 連線錯誤、逾時等傳輸層錯誤
+
+
+def classify_status(status_code: int) -> FailureKind:
+    """依HTTP狀態碼分類失敗"""
+    if status_code == 429:
+        return FailureKind.RATE_LIMITED
+    if 400 <= status_code < 500:
+        return FailureKind.HTTP_CLIENT
+    return FailureKind.HTTP_SERVER
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析 Retry-After 標頭（秒數或HTTP日期）
+
+    Returns:
+        需要等待的秒數，無法解析時返回None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class CircuitOpenError(Exception):
+    """斷路器已開啟，拒絕再向該主機發送請求"""
+
+
+class RetryPolicy:
+    """重試策略：指數退避加完全抖動（full jitter），並依失敗類別限制嘗試次數
+
+    第 n 次失敗後的等待時間為 uniform(0, min(max_delay, base_delay * 2 ** (n - 1)))；
+    若伺服器提供 Retry-After，則至少等待該秒數。
+    """
+
+    # 各失敗類別的最大嘗試次數（None 表示使用整體上限）
+    DEFAULT_KIND_ATTEMPTS = {
+        FailureKind.EMPTY: 3,
+        FailureKind.BAD_JSON: 2,
+        FailureKind.UNEXPECTED_FORMAT: 2,
+        FailureKind.HTTP_CLIENT: 2,
+        FailureKind.RATE_LIMITED: None,
+        FailureKind.HTTP_SERVER: None,
+        FailureKind.TRANSPORT: None,
+    }
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 1.0, max_delay: float = 60.0,
+                 kind_attempts: Optional[Dict[FailureKind, Optional[int]]] = None):
+        """初始化重試策略
+
+        Args:
+            max_attempts: 單一請求的最大嘗試次數
+            base_delay: 退避的基準秒數
+            max_delay: 單次等待的上限秒數
+            kind_attempts: 覆寫各失敗類別的最大嘗試次數
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.kind_attempts = {**self.DEFAULT_KIND_ATTEMPTS, **(kind_attempts or {})}
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.sleep_seconds = 0.0
+        self.failures = {kind.value: 0 for kind in FailureKind}
+
+    def record_failure(self, kind: FailureKind) -> None:
+        """記錄一次失敗"""
+        with self._lock:
+            self.failures[kind.value] += 1
+
+    def should_retry(self, kind: FailureKind, attempt: int, max_attempts: Optional[int] = None) -> bool:
+        """判斷第 attempt 次嘗試以 kind 類別失敗後是否應該重試
+
+        Args:
+            kind: 失敗類別
+            attempt: 已進行的嘗試次數（從1開始）
+            max_attempts: 覆寫整體最大嘗試次數
+
+        Returns:
+            bool: 是否重試
+        """
+        limit = max_attempts if max_attempts is not None else self.max_attempts
+        kind_limit = self.kind_attempts.get(kind)
+        if kind_limit is not None:
+            limit = min(limit, kind_limit)
+        return attempt < limit
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """計算第 attempt 次失敗後的等待秒數"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def sleep(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """依退避策略等待，並記錄重試統計
+
+        Returns:
+            float: 實際等待的秒數
+        """
+        delay = self.backoff(attempt, retry_after)
+        with self._lock:
+            self.retries += 1
+            self.sleep_seconds += delay
+        logger.debug(f"第 {attempt} 次嘗試失敗，等待 {delay:.2f} 秒後重試")
+        time.sleep(delay)
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        """返回重試統計"""
+        with self._lock:
+            return {
+                'retries': self.retries,
+                'sleep_seconds': round(self.sleep_seconds, 2),
+                'failures': {kind: count for kind, count in self.failures.items() if count},
+            }
+
+
+class CircuitBreaker:
+    """單一主機的斷路器
+
+    連續發生 failure_threshold 次傳輸錯誤、5xx 或 429 後開啟，
+    開啟期間所有請求立即以 CircuitOpenError 失敗。
+    reset_timeout 為 None 時在本次執行中保持開啟；否則逾時後放行一次試探請求（半開）：
+    試探請求成功，或失敗但主機有回應（4xx、空回應等不計入斷路的類型）時關閉，
+    再次發生傳輸錯誤、5xx 或 429 時重新開啟。
+    """
+
+    TRIP_KINDS = (FailureKind.TRANSPORT, FailureKind.HTTP_SERVER, FailureKind.RATE_LIMITED)
+
+    def __init__(self, host: str, failure_threshold: int = 8, reset_timeout: Optional[float] = None):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.trips = 0
+        self.rejected = 0
+        self._half_open_probe = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if self._half_open_probe:
+            return 'half-open'
+        return 'open'
+
+    def before_request(self) -> None:
+        """發送請求前檢查斷路器
+
+        Raises:
+            CircuitOpenError: 斷路器開啟中
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if (self.reset_timeout is not None and not self._half_open_probe
+                    and time.monotonic() - self.opened_at >= self.reset_timeout):
+                # 半開：放行一次試探請求
+                self._half_open_probe = True
+                return
+            self.rejected += 1
+            raise CircuitOpenError(
+                f"{self.host} 連續失敗 {self.consecutive_failures} 次，斷路器已開啟，停止發送請求"
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._half_open_probe = False
+
+    def record_failure(self, kind: FailureKind) -> None:
+        with self._lock:
+            if kind not in self.TRIP_KINDS:
+                if self._half_open_probe:
+                    # 試探請求得到主機的回應，只是內容不符預期：主機已恢復，關閉斷路器
+                    self.consecutive_failures = 0
+                    self.opened_at = None
+                    self._half_open_probe = False
+                return
+            self.consecutive_failures += 1
+            if self._half_open_probe or (self.opened_at is None
+                                         and self.consecutive_failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                self._half_open_probe = False
+                self.trips += 1
+                logger.error(f"{self.host} 連續失敗 {self.consecutive_failures} 次，開啟斷路器")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'host': self.host,
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'trips': self.trips,
+                'rejected': self.rejected,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str, failure_threshold: int = 8,
+                        reset_timeout: Optional[float] = None) -> CircuitBreaker:
+    """取得指定主機共用的斷路器（同一主機的所有爬蟲共享狀態）"""
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(host, failure_threshold, reset_timeout)
+        return breaker
@@ -0,0 +1,201 @@
+import time
+import logging
+import threading
+from typing import Optional, Dict, Any, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from app.config import HTTP_CONFIG
+from app.utils.helpers import extract_domain
+
+logger = logging.getLogger('http_transport')
+
+# urllib3 只有在安裝 brotli 套件時才能解碼 br 壓縮
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+# 每個執行緒目前請求的連線計時（由連線類別寫入，由 request() 讀取）
+_timing = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """記錄建立TCP連線（含DNS解析）耗時的HTTP連線"""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        conn = super()._new_conn()
+        _timing.connect = time.perf_counter() - start
+        return conn
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """記錄建立TCP連線（含DNS解析）與TLS握手耗時的HTTPS連線"""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        conn = super()._new_conn()
+        _timing.connect = time.perf_counter() - start
+        return conn
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _timing.tls = time.perf_counter() - start - getattr(_timing, 'connect', 0.0)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """使用可計時連線的連線池適配器"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
+
+
+class TransportStats:
+    """累計所有請求的計時統計，用於熱點分析"""
+
+    FIELDS = ('connect', 'tls', 'ttfb', 'body', 'total')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.new_connections = 0
+            self.bytes = 0
+            self.totals = {name: 0.0 for name in self.FIELDS}
+
+    def record(self, timing: Dict[str, Any]) -> None:
+        with self._lock:
+            self.requests += 1
+            self.bytes += timing['bytes']
+            if timing['new_connection']:
+                self.new_connections += 1
+            for name in self.FIELDS:
+                self.totals[name] += timing[name]
+
+    def summary(self) -> Dict[str, Any]:
+        """返回請求數、新建連線數與各階段平均耗時（毫秒）"""
+        with self._lock:
+            count = max(1, self.requests)
+            return {
+                'requests': self.requests,
+                'new_connections': self.new_connections,
+                'bytes': self.bytes,
+                **{f'avg_{name}_ms': round(self.totals[name] / count * 1000, 1) for name in self.FIELDS},
+            }
+
+
+transport_stats = TransportStats()
+
+_sessions: Dict[str, requests.Session] = {}
+_session_pool_sizes: Dict[str, int] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(url: str, pool_size: Optional[int] = None) -> requests.Session:
+    """取得指定主機共用的連線池會話
+
+    同一主機的所有爬蟲共用一個 Session，以重用 keep-alive 連線並共享cookies。
+
+    Args:
+        url: 目標URL或主機名稱
+        pool_size: 連線池大小，默認取自 HTTP_CONFIG；若大於現有大小則擴大連線池
+
+    Returns:
+        requests.Session: 該主機的共用會話
+    """
+    host = extract_domain(url) or url
+    pool_size = max(pool_size or 0, HTTP_CONFIG['pool_size'])
+
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                'Accept-Encoding': ACCEPT_ENCODING,
+                'Connection': 'keep-alive',
+            })
+            _sessions[host] = session
+            _session_pool_sizes[host] = 0
+
+        if pool_size > _session_pool_sizes[host]:
+            adapter = TimedHTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                                       max_retries=0, pool_block=False)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session_pool_sizes[host] = pool_size
+            logger.debug(f"{host} 的連線池大小設為 {pool_size}")
+
+        return session
+
+
+def request(session: requests.Session, method: str, url: str,
+            timeout: Optional[Tuple[float, float]] = None, **kwargs) -> requests.Response:
+    """發送請求並記錄各階段耗時
+
+    記錄的階段包括：建立連線（含DNS，重用連線時為0）、TLS握手、
+    首位元組時間（TTFB）與下載回應內容的時間。
+
+    Args:
+        session: 使用的會話
+        method: HTTP方法
+        url: 目標URL
+        timeout: (連線逾時, 讀取逾時)，默認取自 HTTP_CONFIG
+        **kwargs: 其他傳給 requests 的參數
+
+    Returns:
+        requests.Response: 已讀取完整內容的回應
+    """
+    if timeout is None:
+        timeout = (HTTP_CONFIG['connect_timeout'], HTTP_CONFIG['read_timeout'])
+
+    _timing.connect = 0.0
+    _timing.tls = 0.0
+    start = time.perf_counter()
+    response = session.request(method, url, timeout=timeout, stream=True, **kwargs)
+    ttfb = time.perf_counter() - start
+    # 讀取完整內容，之後 response.content / response.text 可直接使用
+    content = response.content
+    total = time.perf_counter() - start
+
+    timing = {
+        'connect': _timing.connect,
+        'tls': _timing.tls,
+        'ttfb': ttfb,
+        'body': total - ttfb,
+        'total': total,
+        'bytes': len(content),
+        'new_connection': _timing.connect > 0,
+    }
+    transport_stats.record(timing)
+    logger.debug(
+        f"{method} {url} {response.status_code} "
+        f"connect={timing['connect'] * 1000:.1f}ms tls={timing['tls'] * 1000:.1f}ms "
+        f"ttfb={ttfb * 1000:.1f}ms body={timing['body'] * 1000:.1f}ms "
+        f"bytes={timing['bytes']}"
+    )
+    return response
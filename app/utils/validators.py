@@ -0,0 +1,118 @@
+import os
+import json
+import logging
+import threading
+from typing import Optional, Dict, Any, Mapping
+
+from app.utils.helpers import normalize_url
+
+logger = logging.getLogger('validator_store')
+
+
+class ValidatorStore:
+    """各URL的HTTP快取驗證器（ETag / Last-Modified）及上次的解析結果
+
+    再次請求同一URL時送出 If-None-Match / If-Modified-Since；
+    伺服器回應 304 Not Modified 時沿用上次的解析結果，省下下載與解析。
+    以正規化URL為鍵，整個存放區保存為一個JSON文件。
+    """
+
+    def __init__(self, path: str):
+        """初始化驗證器存放區
+
+        Args:
+            path: JSON文件路徑
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.not_modified = 0
+        self.modified = 0
+
+    def load(self) -> int:
+        """讀取既有的驗證器，文件不存在或損毀時從空白開始
+
+        Returns:
+            int: 載入的URL數
+        """
+        self._entries = {}
+        if not os.path.exists(self.path):
+            return 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"無法讀取驗證器文件 {self.path}: {e}")
+            return 0
+        if isinstance(entries, dict):
+            self._entries = entries
+        logger.info(f"載入 {len(self._entries)} 個URL的驗證器: {self.path}")
+        return len(self._entries)
+
+    def save(self) -> None:
+        """將驗證器寫回磁碟（先寫暫存檔再替換）"""
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """返回URL的條件請求標頭，沒有驗證器時返回空字典"""
+        with self._lock:
+            entry = self._entries.get(normalize_url(url))
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def result(self, url: str) -> Optional[Any]:
+        """返回URL上次的解析結果，沒有時返回None"""
+        with self._lock:
+            entry = self._entries.get(normalize_url(url))
+        return entry.get('result') if entry is not None else None
+
+    def record(self, url: str, headers: Mapping[str, str], result: Optional[Any] = None) -> None:
+        """記錄 200 回應的驗證器與解析結果
+
+        回應沒有 ETag 也沒有 Last-Modified 時移除舊記錄（下次不送條件請求）。
+
+        Args:
+            url: 請求的URL
+            headers: 回應標頭（不分大小寫）
+            result: 可JSON序列化的解析結果，304 時原樣返回
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        key = normalize_url(url)
+        with self._lock:
+            self.modified += 1
+            if etag or last_modified:
+                self._entries[key] = {'etag': etag, 'last_modified': last_modified, 'result': result}
+                self._dirty = True
+            elif self._entries.pop(key, None) is not None:
+                self._dirty = True
+
+    def record_not_modified(self) -> None:
+        """記錄一次 304 回應"""
+        with self._lock:
+            self.not_modified += 1
+
+    def stats(self) -> Dict[str, int]:
+        """返回 304 與 200 的次數及記錄的URL數"""
+        with self._lock:
+            return {'not_modified': self.not_modified, 'modified': self.modified, 'urls': len(self._entries)}
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,409 @@
+"""
+進階分析的統計計算
+在 Python 端以 NumPy 向量化計算統計控制圖（控制限與判異規則）、各縣市的變化貢獻瀑布圖，
+以及以縣市鄰接矩陣計算的全域 Moran's I 與 Getis-Ord Gi* 熱點，
+結果隨彙總表輸出，public/js/advanced-analytics.js 直接使用，不需在瀏覽器中逐期計算
+"""
+
+import math
+import logging
+import warnings
+from typing import Optional, Dict, Any, List, Tuple, Sequence
+
+from app.models.columnar_data import ColumnarScrapedData, PERIOD
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 為選用依賴，未安裝時不輸出分析結果，由前端自行計算
+    np = None
+
+logger = logging.getLogger('analytics')
+
+# 相鄰（陸地接壤）的縣市；離島縣市沒有鄰居
+COUNTY_BORDERS = (
+    ('臺北市', '新北市'), ('基隆市', '臺北市'), ('基隆市', '新北市'),
+    ('新北市', '桃園市'), ('新北市', '宜蘭縣'),
+    ('桃園市', '新竹縣'), ('桃園市', '新竹市'), ('桃園市', '宜蘭縣'),
+    ('新竹市', '新竹縣'), ('新竹縣', '苗栗縣'), ('新竹縣', '臺中市'), ('新竹縣', '宜蘭縣'),
+    ('苗栗縣', '臺中市'),
+    ('臺中市', '彰化縣'), ('臺中市', '南投縣'), ('臺中市', '宜蘭縣'), ('臺中市', '花蓮縣'),
+    ('彰化縣', '南投縣'), ('彰化縣', '雲林縣'),
+    ('南投縣', '雲林縣'), ('南投縣', '嘉義縣'), ('南投縣', '高雄市'), ('南投縣', '花蓮縣'),
+    ('雲林縣', '嘉義縣'),
+    ('嘉義縣', '嘉義市'), ('嘉義縣', '臺南市'), ('嘉義縣', '高雄市'),
+    ('臺南市', '高雄市'),
+    ('高雄市', '屏東縣'), ('高雄市', '臺東縣'), ('高雄市', '花蓮縣'),
+    ('屏東縣', '臺東縣'),
+    ('宜蘭縣', '花蓮縣'), ('花蓮縣', '臺東縣'),
+)
+
+COUNTIES = (
+    '臺北市', '新北市', '基隆市', '桃園市', '新竹市', '新竹縣', '苗栗縣', '臺中市',
+    '彰化縣', '南投縣', '雲林縣', '嘉義市', '嘉義縣', '臺南市', '高雄市', '屏東縣',
+    '宜蘭縣', '花蓮縣', '臺東縣', '澎湖縣', '金門縣', '連江縣',
+)
+
+# 控制圖判異規則（與 public/js/advanced-charts.js 的 ControlChart.detectOutliers 相同）
+RULE_BEYOND_3_SIGMA = 'beyond3Sigma'
+RULE_RUN_OF_7 = 'runOf7'
+RULE_TWO_BEYOND_2_SIGMA = 'twoBeyond2Sigma'
+RULES = (RULE_BEYOND_3_SIGMA, RULE_RUN_OF_7, RULE_TWO_BEYOND_2_SIGMA)
+
+# 個體-移動全距（I-MR）控制圖中 n=2 時的 d2 常數
+_D2 = 1.128
+
+# 瀑布圖與空間分析的指標（鍵與前端的指標選單一致）
+WATERFALL_METRICS = ('registrations', 'neutering', 'rate')
+SPATIAL_METRICS = ('neuteringRate', 'registrations', 'neutering', 'units')
+
+
+def _county_weights() -> Optional['np.ndarray']:
+    """COUNTIES 順序的二元對稱鄰接矩陣（模組載入時計算一次）"""
+    if np is None:
+        return None
+    index = {county: i for i, county in enumerate(COUNTIES)}
+    weights = np.zeros((len(COUNTIES), len(COUNTIES)))
+    for a, b in COUNTY_BORDERS:
+        weights[index[a], index[b]] = weights[index[b], index[a]] = 1.0
+    return weights
+
+
+_COUNTY_WEIGHTS = _county_weights()
+_COUNTY_INDEX = {county: i for i, county in enumerate(COUNTIES)}
+
+
+def spatial_weights(cities: Sequence[str]) -> 'np.ndarray':
+    """依縣市順序取出預先計算的鄰接矩陣，不在 COUNTIES 中的縣市沒有鄰居"""
+    positions = np.array([_COUNTY_INDEX.get(city, -1) for city in cities])
+    known = positions >= 0
+    weights = np.zeros((len(cities), len(cities)))
+    weights[np.ix_(known, known)] = _COUNTY_WEIGHTS[np.ix_(positions[known], positions[known])]
+    return weights
+
+
+def _erfc(values: 'np.ndarray') -> 'np.ndarray':
+    return np.array([math.erfc(v) if math.isfinite(v) else math.nan for v in values.ravel()]).reshape(values.shape)
+
+
+def control_chart(values: 'np.ndarray') -> Dict[str, 'np.ndarray']:
+    """個體-移動全距（I-MR）控制圖，沿最後一軸計算，前面的軸為各自獨立的序列
+
+    σ 以平均移動全距 / d2 估計，控制限為中心線 ± 3σ。缺值（NaN）不參與計算，
+    也不會觸發任何規則。判異規則：超出 3σ 控制限；連續7點在中心線同一側（標記第7點起）；
+    連續2點在同一側超過 2σ。
+
+    Args:
+        values: 形狀為 (..., 期數) 的數值
+
+    Returns:
+        centerLine/sigma/upperControlLimit/lowerControlLimit（形狀為 (...)）
+        及各規則的布林陣列（形狀與 values 相同）
+    """
+    with np.errstate(invalid='ignore'), warnings.catch_warnings():
+        # 全為缺值的序列取平均時結果為NaN，不需要 RuntimeWarning
+        warnings.simplefilter('ignore', RuntimeWarning)
+        center = np.nanmean(values, axis=-1)
+        sigma = np.nanmean(np.abs(np.diff(values, axis=-1)), axis=-1) / _D2
+    deviation = (values - center[..., None]) / sigma[..., None]
+
+    with np.errstate(invalid='ignore'):
+        above = deviation > 0
+        below = deviation < 0
+        beyond = np.abs(deviation) > 3
+        high = deviation > 2
+        low = deviation < -2
+
+    run = np.zeros(values.shape, dtype=bool)
+    if values.shape[-1] >= 7:
+        for side in (above, below):
+            counts = np.cumsum(side, axis=-1)
+            window = counts[..., 6:] - np.concatenate(
+                [np.zeros(counts.shape[:-1] + (1,), dtype=counts.dtype), counts[..., :-7]], axis=-1)
+            run[..., 6:] |= window == 7
+
+    pair = np.zeros(values.shape, dtype=bool)
+    pair[..., 1:] = (high[..., 1:] & high[..., :-1]) | (low[..., 1:] & low[..., :-1])
+
+    return {
+        'centerLine': center,
+        'sigma': sigma,
+        'upperControlLimit': center + 3 * sigma,
+        'lowerControlLimit': center - 3 * sigma,
+        RULE_BEYOND_3_SIGMA: beyond,
+        RULE_RUN_OF_7: run,
+        RULE_TWO_BEYOND_2_SIGMA: pair,
+    }
+
+
+def count_contributions(values: 'np.ndarray') -> 'np.ndarray':
+    """各縣市對總數逐期變化的貢獻（本期 − 上期），缺值視為0
+
+    Args:
+        values: 形狀為 (期數, 縣市數) 的計數
+
+    Returns:
+        形狀為 (期數, 縣市數) 的貢獻，第一期沒有上期，全為NaN
+    """
+    filled = np.nan_to_num(values)
+    contributions = np.full(values.shape, np.nan)
+    contributions[1:] = filled[1:] - filled[:-1]
+    return contributions
+
+
+def rate_contributions(numerators: 'np.ndarray', bases: 'np.ndarray') -> 'np.ndarray':
+    """各縣市對全國比率逐期變化的貢獻（百分點）
+
+    全國比率為 ΣN/ΣB，可寫成各縣市權重 B_i/ΣB 乘以其比率 N_i/B_i 之和，
+    因此縣市 i 的貢獻 N_i/ΣB（本期）− N_i/ΣB（上期）加總後恰為全國比率的變化。
+
+    Args:
+        numerators: 形狀為 (期數, 縣市數) 的分子（絕育數 E−F）
+        bases: 形狀為 (期數, 縣市數) 的分母（登記數 A−B）
+
+    Returns:
+        形狀為 (期數, 縣市數) 的貢獻，第一期全為NaN
+    """
+    numerators = np.nan_to_num(numerators)
+    total = np.nan_to_num(bases).sum(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shares = np.where(total > 0, numerators / total * 100, np.nan)
+    contributions = np.full(numerators.shape, np.nan)
+    contributions[1:] = shares[1:] - shares[:-1]
+    return contributions
+
+
+def _masked_weights(values: 'np.ndarray', weights: 'np.ndarray'):
+    """去除缺值縣市後的中心化數值、有效個數與各期的權重矩陣"""
+    present = np.isfinite(values)
+    n = present.sum(axis=1).astype(np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(present, values, 0.0).sum(axis=1) / n
+    centered = np.where(present, values - mean[:, None], 0.0)
+    masked = weights[None, :, :] * present[:, :, None] * present[:, None, :]
+    return present, n, mean, centered, masked
+
+
+def morans_i(values: 'np.ndarray', weights: 'np.ndarray') -> Dict[str, 'np.ndarray']:
+    """全域 Moran's I，所有期數一次計算
+
+    期望值與變異數採常態假設：E[I] = −1/(n−1)，
+    Var[I] = (n²S1 − nS2 + 3S0²) / (S0²(n²−1)) − E[I]²；p 值為雙尾。
+    各期只納入有數值的縣市，有效縣市少於3個或沒有相鄰的縣市時結果為NaN。
+
+    Args:
+        values: 形狀為 (期數, 縣市數) 的數值
+        weights: 形狀為 (縣市數, 縣市數) 的空間權重
+
+    Returns:
+        moransI/expectedI/varianceI/zScore/pValue，形狀皆為 (期數,)
+    """
+    present, n, _, centered, masked = _masked_weights(values, weights)
+    s0 = masked.sum(axis=(1, 2))
+    s1 = 0.5 * ((masked + masked.transpose(0, 2, 1)) ** 2).sum(axis=(1, 2))
+    s2 = ((masked.sum(axis=1) + masked.sum(axis=2)) ** 2).sum(axis=1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        numerator = np.einsum('pi,pij,pj->p', centered, masked, centered)
+        denominator = (centered ** 2).sum(axis=1)
+        moran = n / s0 * numerator / denominator
+        expected = -1.0 / (n - 1)
+        variance = (n ** 2 * s1 - n * s2 + 3 * s0 ** 2) / (s0 ** 2 * (n ** 2 - 1)) - expected ** 2
+        z = (moran - expected) / np.sqrt(variance)
+    invalid = (n < 3) | (s0 <= 0)
+    for array in (moran, expected, variance, z):
+        array[invalid] = np.nan
+    return {
+        'moransI': moran,
+        'expectedI': expected,
+        'varianceI': variance,
+        'zScore': z,
+        'pValue': _erfc(np.abs(z) / math.sqrt(2)),
+    }
+
+
+def getis_ord_gi_star(values: 'np.ndarray', weights: 'np.ndarray') -> 'np.ndarray':
+    """Getis-Ord Gi* 統計量（z 分數），所有期數一次計算
+
+    鄰域包含縣市本身，z > 1.96 為 95% 信賴水準的熱點，z < −1.96 為冷點。
+
+    Args:
+        values: 形狀為 (期數, 縣市數) 的數值
+        weights: 形狀為 (縣市數, 縣市數) 的空間權重
+
+    Returns:
+        形狀為 (期數, 縣市數) 的 z 分數，缺值縣市為NaN
+    """
+    present, n, mean, _, masked = _masked_weights(values, weights)
+    masked = masked + np.eye(values.shape[1])[None, :, :] * present[:, :, None]
+    filled = np.where(present, values, 0.0)
+    local_sum = np.einsum('pij,pj->pi', masked, filled)
+    weight_sum = masked.sum(axis=2)
+    weight_squares = (masked ** 2).sum(axis=2)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        spread = np.sqrt((filled ** 2).sum(axis=1) / n - mean ** 2)
+        scale = np.sqrt((n[:, None] * weight_squares - weight_sum ** 2) / (n[:, None] - 1))
+        z = (local_sum - mean[:, None] * weight_sum) / (spread[:, None] * scale)
+    z[~present] = np.nan
+    return z
+
+
+def _round(values: 'np.ndarray', digits: int) -> List[Optional[float]]:
+    """轉換為可JSON序列化的列表，非有限值輸出為None"""
+    return [round(float(v), digits) if math.isfinite(v) else None for v in np.asarray(values, dtype=np.float64).ravel()]
+
+
+def _matrices(columnar: ColumnarScrapedData) -> Tuple[List[str], List[str], Dict[str, 'np.ndarray']]:
+    """以一次分組加總建立（期數 × 縣市數）的計數矩陣，沒有數據的格為NaN
+
+    期別按年份與期間分組：年度粒度的記錄以西元年為期別，季、月、日粒度的記錄以期間標籤
+    （例如 '2020-03'）為期別，因此月粒度的數據不會被合併為年度。期別按（年份, 期間）排序。
+    登記單位數跨動物類型合併時取最大值，與彙總表一致。「合計」列不計入。
+    """
+    group_keys, sums = columnar.group_by(('縣市', '年份', PERIOD, '動物類型'))
+    cities = sorted({city for city, _, _, _ in group_keys if city != '合計'},
+                    key=lambda city: (_COUNTY_INDEX.get(city, len(COUNTIES)), city))
+    periods = sorted({(int(year), period) for _, year, period, _ in group_keys})
+    city_index = {city: i for i, city in enumerate(cities)}
+    period_index = {period: i for i, period in enumerate(periods)}
+
+    keep = np.array([city != '合計' for city, _, _, _ in group_keys], dtype=bool)
+    rows = np.array([period_index[(int(year), period)] for _, year, period, _ in group_keys], dtype=np.intp)[keep]
+    columns = np.array([city_index.get(city, 0) for city, _, _, _ in group_keys], dtype=np.intp)[keep]
+    shape = (len(periods), len(cities))
+
+    present = np.zeros(shape, dtype=bool)
+    present[rows, columns] = True
+    matrices = {}
+    for name, source in (('registrations', '登記數(A)'), ('removals', '除戶數(B)'),
+                         ('neutering', '絕育數(E)'), ('neuteringRemovals', '絕育除戶數(F)')):
+        matrix = np.zeros(shape)
+        np.add.at(matrix, (rows, columns), np.asarray(sums[source], dtype=np.float64)[keep])
+        matrices[name] = np.where(present, matrix, np.nan)
+    units = np.zeros(shape)
+    np.maximum.at(units, (rows, columns), np.asarray(sums['登記單位數'], dtype=np.float64)[keep])
+    matrices['units'] = np.where(present, units, np.nan)
+    return cities, [period or str(year) for year, period in periods], _with_rates(matrices)
+
+
+def _with_rates(matrices: Dict[str, 'np.ndarray']) -> Dict[str, 'np.ndarray']:
+    """由計數矩陣加上絕育率的分母（A−B）、分子（E−F）與合併後的絕育率"""
+    matrices['base'] = matrices['registrations'] - matrices['removals']
+    matrices['neutered'] = matrices['neutering'] - matrices['neuteringRemovals']
+    with np.errstate(invalid='ignore', divide='ignore'):
+        matrices['neuteringRate'] = np.where(matrices['base'] > 0,
+                                             matrices['neutered'] / matrices['base'] * 100, np.nan)
+    return matrices
+
+
+def _by_year(periods: List[str], matrices: Dict[str, 'np.ndarray']) -> Tuple[List[str], Dict[str, 'np.ndarray']]:
+    """將各期的矩陣合併為（年數 × 縣市數）的年度矩陣
+
+    計數按年加總，登記單位數取年內最大值，絕育率由合併後的計數重新計算；
+    年度粒度的數據期別即為年份，結果與輸入相同。期別標籤的前4個字元為西元年。
+    """
+    years = sorted({period[:4] for period in periods})
+    if len(years) == len(periods):
+        return periods, matrices
+    year_index = {year: i for i, year in enumerate(years)}
+    rows = np.array([year_index[period[:4]] for period in periods], dtype=np.intp)
+
+    yearly = {}
+    for name in ('registrations', 'removals', 'neutering', 'neuteringRemovals', 'units'):
+        matrix = np.zeros((len(years), matrices[name].shape[1]))
+        values = np.nan_to_num(matrices[name])
+        if name == 'units':
+            np.maximum.at(matrix, rows, values)
+        else:
+            np.add.at(matrix, rows, values)
+        present = np.zeros(matrix.shape, dtype=bool)
+        np.logical_or.at(present, rows, np.isfinite(matrices[name]))
+        yearly[name] = np.where(present, matrix, np.nan)
+    return years, _with_rates(yearly)
+
+
+def _national_rate(matrices: Dict[str, 'np.ndarray']) -> 'np.ndarray':
+    """各期的全國絕育率 Σ(E−F)/Σ(A−B)"""
+    base = np.nansum(matrices['base'], axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(base > 0, np.nansum(matrices['neutered'], axis=1) / base * 100, np.nan)
+
+
+def _violations(flags: Dict[str, 'np.ndarray']) -> List[List[Any]]:
+    """將各規則的布林陣列轉換為 [索引..., 規則] 列表（按索引排序）"""
+    entries = []
+    for rule in RULES:
+        for position in np.argwhere(flags[rule]):
+            entries.append([*(int(i) for i in position), rule])
+    entries.sort(key=lambda entry: (entry[:-1], RULES.index(entry[-1])))
+    return entries
+
+
+def analyze(columnar: ColumnarScrapedData) -> Optional[Dict[str, Any]]:
+    """計算進階分析頁面使用的統計結果
+
+    Args:
+        columnar: 欄式寵物登記數據
+
+    Returns:
+        Optional[Dict[str, Any]]: 分析結果（縣市以 cities 的索引引用；控制圖以 periods 的索引引用，
+        瀑布圖與空間分析以 years 的索引引用），
+        未安裝 NumPy 或沒有數據時返回None
+    """
+    if np is None:
+        logger.warning("未安裝 NumPy，略過統計分析（進階分析頁面將在瀏覽器中計算）")
+        return None
+    if len(columnar) == 0:
+        return None
+
+    cities, periods, matrices = _matrices(columnar)
+    years, yearly = _by_year(periods, matrices)
+    weights = spatial_weights(cities)
+
+    national_rate = _national_rate(matrices)
+    national = control_chart(national_rate)
+    by_city = control_chart(matrices['neuteringRate'].T)
+
+    # 瀑布圖與空間分析以年度為單位（頁面按年份選擇），控制圖使用各期的序列
+    waterfall = {}
+    for metric, totals, contributions in (
+        ('registrations', np.nansum(yearly['registrations'], axis=1),
+         count_contributions(yearly['registrations'])),
+        ('neutering', np.nansum(yearly['neutering'], axis=1), count_contributions(yearly['neutering'])),
+        ('rate', _national_rate(yearly), rate_contributions(yearly['neutered'], yearly['base'])),
+    ):
+        digits = 4 if metric == 'rate' else 0
+        waterfall[metric] = {
+            'totals': _round(totals, digits),
+            'contributions': [None] + [_round(row, digits) for row in contributions[1:]],
+        }
+
+    spatial = {}
+    for metric in SPATIAL_METRICS:
+        moran = morans_i(yearly[metric], weights)
+        spatial[metric] = {
+            **{name: _round(values, 4) for name, values in moran.items()},
+            'giStar': [_round(row, 3) for row in getis_ord_gi_star(yearly[metric], weights)],
+        }
+
+    return {
+        'cities': cities,
+        'periods': periods,
+        'years': years,
+        'neighbors': [np.nonzero(row)[0].tolist() for row in weights],
+        'controlChart': {
+            'national': {
+                'values': _round(national_rate, 2),
+                **{name: _round(national[name], 4)[0]
+                   for name in ('centerLine', 'sigma', 'upperControlLimit', 'lowerControlLimit')},
+                'violations': _violations(national),
+            },
+            'cities': {
+                **{name: _round(by_city[name], 4)
+                   for name in ('centerLine', 'sigma', 'upperControlLimit', 'lowerControlLimit')},
+                'violations': _violations(by_city),
+            },
+        },
+        'waterfall': waterfall,
+        'spatial': spatial,
+    }
@@ -1,7 +1,72 @@
+import io
 import json
+import math
 import os
+import unicodedata
 from datetime import datetime
+from typing import Optional, TextIO, Any, Dict, List, Tuple, Union
 from app.models.data_model import ScrapedData
+from app.models.record_store import RecordQuery
+from app.models.columnar_data import ColumnarScrapedData, NEUTERING_RATE
+
+# 欄式輸出格式的標識與版本，格式變更時需遞增版本號
+COLUMNAR_FORMAT = 'pet-registration-columnar'
+COLUMNAR_VERSION = 1
+
+# 欄式輸出中以字典編碼儲存的欄位（值重複度高）
+COLUMNAR_DICTIONARY_FIELDS = ('縣市', '年份', '動物類型')
+
+# 欄式輸出中的整數與浮點數欄位
+COLUMNAR_INT_FIELDS = (
+    '登記單位數', '登記數(A)', '除戶數(B)', '轉讓數(C)', '變更數(D)',
+    '絕育數(E)', '絕育除戶數(F)', '免絕育數(G)', '免絕育除戶數(H)',
+)
+COLUMNAR_FLOAT_FIELDS = ('絕育率(E-F)/(A-B)', '繁殖管理率(E-F)+(G-H)/(A-B)')
+
+# 用於逐項編碼的JSON編碼器（與 json.dump(..., ensure_ascii=False, indent=2) 格式一致）
+_INDENTED_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _dumps(value: Any) -> str:
+    """編碼單一JSON值"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _dumps_nested(value: Any) -> str:
+    """編碼位於頂層對象內（縮排一層）的JSON值"""
+    return _INDENTED_ENCODER.encode(value).replace("\n", "\n  ")
+
+
+def _display_width(text: str) -> int:
+    """計算文字在等寬字型中的顯示寬度（全形字元佔兩格）"""
+    return sum(2 if unicodedata.east_asian_width(ch) in 'WF' else 1 for ch in text)
+
+
+def _pad(text: str, width: int, right: bool = False) -> str:
+    """依顯示寬度補齊空白，right 為真時靠右對齊"""
+    padding = ' ' * max(0, width - _display_width(text))
+    return padding + text if right else text + padding
+
+
+def _format_table(header: List[str], rows: List[List[str]], left_columns: int = 1) -> List[str]:
+    """將表格排版為對齊的文字行（前 left_columns 欄靠左，其餘靠右）"""
+    widths = [max(_display_width(row[i]) for row in [header] + rows) for i in range(len(header))]
+    return [
+        '  '.join(_pad(cell, widths[i], right=i >= left_columns) for i, cell in enumerate(row)).rstrip()
+        for row in [header] + rows
+    ]
+
+
+def _format_rate(value: float) -> str:
+    return f"{value:.2f}%" if not math.isnan(value) else '-'
+
+
+def _to_number(value: Any, number_type: type) -> Any:
+    """將字串數值轉換為數字，無法轉換時保留原值"""
+    try:
+        return number_type(value)
+    except (TypeError, ValueError):
+        return value
 
 
 class DataFormatter:
@@ -10,74 +75,344 @@ class DataFormatter:
     @staticmethod
     def format_as_json(data: ScrapedData, output_path: str) -> None:
         """將爬取的數據保存為JSON文件"""
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        DataFormatter.format_as_json_and_js(data, json_path=output_path)
+            
+    @staticmethod
+    def load_json(input_path: str) -> Optional[ScrapedData]:
+        """讀取先前由 format_as_json 輸出的JSON文件，文件不存在時返回None"""
+        if not os.path.exists(input_path):
+            return None
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data.to_dict(), f, ensure_ascii=False, indent=2)
+        with open(input_path, 'r', encoding='utf-8') as f:
+            return ScrapedData.from_dict(json.load(f))
             
     @staticmethod
     def format_as_js(data: ScrapedData, output_path: str, variable_name: str = 'scrapedData') -> None:
         """將爬取的數據保存為JavaScript變量聲明，適用於GitHub Pages"""
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        DataFormatter.format_as_json_and_js(data, js_path=output_path, variable_name=variable_name)
+    
+    @staticmethod
+    def format_as_json_and_js(data: Union[ScrapedData, RecordQuery], json_path: Optional[str] = None,
+                              js_path: Optional[str] = None, variable_name: str = 'scrapedData') -> None:
+        """以串流方式同時輸出JSON文件與JavaScript變量文件
         
-        # 處理資料以確保表格數據完整
-        processed_data = DataFormatter._process_data_for_js(data)
+        逐項編碼並寫入文件，不會先建立完整的字典列表或整份JSON字串；
+        JS文件所需的縣市、年份與動物類型索引也在同一次遍歷中收集。
+        輸出內容與 json.dump(..., ensure_ascii=False, indent=2) 一致。
+        傳入 RecordStore.query() 的結果時直接逐列讀取資料庫。
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(f"const {variable_name} = {json.dumps(processed_data, ensure_ascii=False, indent=2)};\n")
-            
-    @staticmethod
-    def format_report(data: ScrapedData) -> str:
-        """格式化為純文本報告"""
-        report = []
-        report.append(f"爬蟲報告 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"來源: {data.source_url}")
-        report.append(f"項目數量: {len(data.items)}")
-        report.append("-" * 50)
-        
-        for i, item in enumerate(data.items, 1):
-            report.append(f"{i}. {item.title}")
-            if item.date:
-                report.append(f"   日期: {item.date}")
-            if item.description:
-                report.append(f"   描述: {item.description}")
-            report.append(f"   連結: {item.link}")
-            report.append("")
-            
-        if data.error:
-            report.append(f"錯誤: {data.error}")
+        Args:
+            data: 爬取的數據，或 RecordStore 的查詢結果
+            json_path: JSON輸出路徑，None表示不輸出
+            js_path: JS輸出路徑，None表示不輸出
+            variable_name: JS變量名稱
+        """
+        files = []
+        try:
+            json_file = js_file = None
+            if json_path:
+                os.makedirs(os.path.dirname(json_path), exist_ok=True)
+                json_file = open(json_path, 'w', encoding='utf-8')
+                files.append(json_file)
+            if js_path:
+                os.makedirs(os.path.dirname(js_path), exist_ok=True)
+                js_file = open(js_path, 'w', encoding='utf-8')
+                files.append(js_file)
+                js_file.write(f"const {variable_name} = ")
             
-        return "\n".join(report)
-        
+            DataFormatter._write_streaming(data, json_file, js_file)
+        finally:
+            for f in files:
+                f.close()
+    
     @staticmethod
-    def _process_data_for_js(data: ScrapedData) -> dict:
-        """處理資料以確保表格數據完整
+    def _write_streaming(data: Union[ScrapedData, RecordQuery], json_file: Optional[TextIO], js_file: Optional[TextIO]) -> None:
+        """將數據逐項寫入JSON與JS文件句柄"""
+        outputs = [f for f in (json_file, js_file) if f is not None]
         
-        整理爬蟲獲取的數據，確保每個縣市每個年度的資料都被正確記錄
-        """
-        data_dict = data.to_dict()
+        header = (
+            "{\n"
+            f'  "last_updated": {_dumps(data.last_updated.isoformat())},\n'
+            f'  "source_url": {_dumps(data.source_url)},\n'
+            f'  "error": {_dumps(data.error)},\n'
+            '  "items": ['
+        )
+        for f in outputs:
+            f.write(header)
         
         # 收集所有縣市、年份和動物類型
         cities = set()
         years = set()
         animal_types = set()
         
-        for item in data_dict['items']:
-            if '縣市' in item:
-                city = item.get('縣市')
+        separator = "\n    "
+        count = 0
+        for row in data.iter_item_dicts():
+            if '縣市' in row:
+                city = row.get('縣市')
                 if city and city != '合計':
                     cities.add(city)
+            if '年份' in row:
+                years.add(row.get('年份'))
+            if '動物類型' in row:
+                animal_types.add(row.get('動物類型'))
+            
+            chunk = separator + _INDENTED_ENCODER.encode(row).replace("\n", "\n    ")
+            for f in outputs:
+                f.write(chunk)
+            separator = ",\n    "
+            count += 1
+        
+        closing = "\n  ]" if count else "]"
+        if json_file is not None:
+            json_file.write(closing + "\n}")
+        if js_file is not None:
+            js_file.write(
+                closing + ",\n"
+                f'  "cities": {_dumps_nested(sorted(cities))},\n'
+                f'  "years": {_dumps_nested(sorted(years, reverse=True))},\n'  # 年份降序排列
+                f'  "animalTypes": {_dumps_nested(sorted(animal_types))}\n'
+                "};\n"
+            )
+            
+    @staticmethod
+    def to_columnar(data: ScrapedData) -> Dict[str, Any]:
+        """將數據轉換為欄式結構
+        
+        縣市、年份、動物類型以字典編碼（dictionaries 保存取值，columns 保存索引），
+        數值欄位轉為整數或浮點數，title/description/date 可由其他欄位重建故不保存，
+        link 則只在表頭保存一次。缺少的值以 null 表示。
+        
+        Args:
+            data: 爬取的數據
+            
+        Returns:
+            Dict[str, Any]: 欄式結構
+        """
+        dictionaries: Dict[str, List[str]] = {}
+        dictionary_index: Dict[str, Dict[str, int]] = {}
+        columns: Dict[str, List[Any]] = {}
+        link = None
+        
+        def column(name: str, row_count: int) -> List[Any]:
+            # 首次出現的欄位需為之前的列補上 null
+            if name not in columns:
+                columns[name] = [None] * row_count
+            return columns[name]
+        
+        row_count = 0
+        for item in data.items:
+            if link is None:
+                link = item.link
+            for name, value in item.extra_data.items():
+                values = column(name, row_count)
+                if value is None or value == '':
+                    values.append(None)
+                elif name in COLUMNAR_INT_FIELDS:
+                    values.append(_to_number(value, int))
+                elif name in COLUMNAR_FLOAT_FIELDS:
+                    values.append(_to_number(value, float))
+                else:
+                    # 其他欄位一律以字典編碼
+                    index = dictionary_index.setdefault(name, {})
+                    code = index.get(value)
+                    if code is None:
+                        code = index[value] = len(index)
+                        dictionaries.setdefault(name, []).append(value)
+                    values.append(code)
+            row_count += 1
+            # 本列缺少的欄位補上 null
+            for values in columns.values():
+                if len(values) < row_count:
+                    values.append(None)
+        
+        cities = sorted(c for c in dictionaries.get('縣市', []) if c and c != '合計')
+        return {
+            'format': COLUMNAR_FORMAT,
+            'version': COLUMNAR_VERSION,
+            'last_updated': data.last_updated.isoformat(),
+            'source_url': data.source_url,
+            'error': data.error,
+            'link': link,
+            'rowCount': row_count,
+            'dictionaries': dictionaries,
+            'columns': columns,
+            'cities': cities,
+            'years': sorted(dictionaries.get('年份', []), reverse=True),
+            'animalTypes': sorted(dictionaries.get('動物類型', [])),
+        }
+    
+    @staticmethod
+    def format_as_columnar_js(data: ScrapedData, output_path: str, variable_name: str = 'scrapedData') -> None:
+        """將數據以欄式格式保存為JavaScript變量聲明
+        
+        生成的文件呼叫 public/js/columnar-data.js 中的 expandColumnarData()
+        還原為與 format_as_js 相同的結構，因此頁面需先載入該腳本。
+        """
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        
+        columnar = DataFormatter.to_columnar(data)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(f"const {variable_name} = expandColumnarData(")
+            json.dump(columnar, f, ensure_ascii=False, separators=(',', ':'))
+            f.write(");\n")
             
-            if '年份' in item:
-                years.add(item.get('年份'))
+    @staticmethod
+    def summarize_registrations(data: ScrapedData, top_n: int = 5) -> Optional[Dict[str, Any]]:
+        """計算報告使用的寵物登記樞紐摘要
+        
+        只對原始數據做一次分組加總（縣市×年份×動物類型），
+        其餘樞紐（縣市×年份、各動物類型的全國合計、絕育率排名）都由這些分組結果推導。
+        「合計」列不計入縣市加總，避免重複計算；非年度粒度的各期間會加總為年度數值。
+        
+        Args:
+            data: 爬取的數據
+            top_n: 絕育率排名列出的縣市數
             
-            if '動物類型' in item:
-                animal_types.add(item.get('動物類型'))
-                
-        # 添加縣市、年份和動物類型到處理後的數據中
-        result = data_dict.copy()
-        result['cities'] = sorted(list(cities))
-        result['years'] = sorted(list(years), reverse=True)  # 年份降序排列
-        result['animalTypes'] = sorted(list(animal_types))
-        
-        return result
+        Returns:
+            摘要字典；數據不是寵物登記數據（缺少年份或動物類型）時返回None
+        """
+        try:
+            columnar = ColumnarScrapedData.from_scraped_data(data)
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not len(columnar):
+            return None
+        
+        group_keys, sums = columnar.group_by()
+        registrations = list(sums['登記數(A)'])
+        removals = list(sums['除戶數(B)'])
+        neutered = [e - f for e, f in zip(sums['絕育數(E)'], sums['絕育除戶數(F)'])]
+        
+        city_year: Dict[Tuple[str, int], float] = {}
+        # 動物類型 -> 年份 -> [登記數, 除戶數, 絕育數-絕育除戶數]
+        national: Dict[str, Dict[int, List[float]]] = {}
+        # (縣市, 年份) -> [登記數-除戶數, 絕育數-絕育除戶數]
+        city_rates: Dict[Tuple[str, int], List[float]] = {}
+        for (city, year, animal), a, b, n in zip(group_keys, registrations, removals, neutered):
+            if city == '合計':
+                continue
+            year = int(year)
+            city_year[(city, year)] = city_year.get((city, year), 0) + a
+            totals = national.setdefault(animal, {}).setdefault(year, [0, 0, 0])
+            totals[0] += a
+            totals[1] += b
+            totals[2] += n
+            acc = city_rates.setdefault((city, year), [0, 0])
+            acc[0] += a - b
+            acc[1] += n
+        
+        years = sorted({year for _, year in city_year})
+        cities = sorted({city for city, _ in city_year})
+        latest = years[-1] if years else None
+        ranking = sorted(
+            ((city, n / base * 100) for (city, year), (base, n) in city_rates.items() if year == latest and base > 0),
+            key=lambda entry: entry[1], reverse=True
+        )
+        return {
+            'years': years,
+            'cities': cities,
+            'city_year_registrations': city_year,
+            'national': {
+                animal: {
+                    year: {
+                        'registrations': a,
+                        'removals': b,
+                        'neutered': n,
+                        'neutering_rate': n / (a - b) * 100 if a - b > 0 else float('nan'),
+                    }
+                    for year, (a, b, n) in sorted(by_year.items())
+                }
+                for animal, by_year in sorted(national.items())
+            },
+            'rate_year': latest,
+            'top_neutering': ranking[:top_n],
+            'bottom_neutering': list(reversed(ranking[-top_n:])) if ranking else [],
+        }
+    
+    @staticmethod
+    def _pivot_lines(summary: Dict[str, Any]):
+        """逐段產生樞紐摘要的文字行"""
+        years = summary['years']
+        city_year = summary['city_year_registrations']
+        
+        yield "【縣市 × 年份 登記數(A)】"
+        rows = [
+            [city] + [f"{int(city_year[(city, year)]):,}" if (city, year) in city_year else '-' for year in years]
+            for city in summary['cities']
+        ]
+        yield from _format_table(['縣市'] + [str(year) for year in years], rows)
+        yield ""
+        
+        yield "【各動物類型全國合計】"
+        rows = [
+            [animal, str(year), f"{int(totals['registrations']):,}", f"{int(totals['removals']):,}",
+             f"{int(totals['neutered']):,}", _format_rate(totals['neutering_rate'])]
+            for animal, by_year in summary['national'].items()
+            for year, totals in by_year.items()
+        ]
+        yield from _format_table(['動物類型', '年份', '登記數(A)', '除戶數(B)', '絕育數(E-F)', NEUTERING_RATE], rows,
+                                 left_columns=2)
+        yield ""
+        
+        for title, ranking in (('最高', summary['top_neutering']), ('最低', summary['bottom_neutering'])):
+            yield f"【{summary['rate_year']}年 絕育率{title}的縣市】"
+            yield from _format_table(
+                ['名次', '縣市', '絕育率'],
+                [[str(rank), city, _format_rate(rate)] for rank, (city, rate) in enumerate(ranking, 1)],
+                left_columns=2
+            )
+            yield ""
+    
+    @staticmethod
+    def write_report(data: ScrapedData, f: TextIO, details: bool = False, top_n: int = 5) -> None:
+        """將純文本報告逐段寫入文件句柄
+        
+        寵物登記數據會輸出樞紐摘要（縣市×年份登記數、各動物類型全國合計、絕育率排名），
+        其他數據只輸出標頭；details 為真時再逐項附上明細。
+        
+        Args:
+            data: 爬取的數據
+            f: 輸出的文件句柄
+            details: 是否附上逐項明細
+            top_n: 絕育率排名列出的縣市數
+        """
+        f.write(f"爬蟲報告 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"來源: {data.source_url}\n")
+        f.write(f"項目數量: {len(data.items)}\n")
+        f.write("-" * 50 + "\n")
+        
+        summary = DataFormatter.summarize_registrations(data, top_n)
+        if summary is not None:
+            for line in DataFormatter._pivot_lines(summary):
+                f.write(line + "\n")
+        
+        if details:
+            if summary is not None:
+                f.write("【明細】\n")
+            for i, item in enumerate(data.items, 1):
+                f.write(f"{i}. {item.title}\n")
+                if item.date:
+                    f.write(f"   日期: {item.date}\n")
+                if item.description:
+                    f.write(f"   描述: {item.description}\n")
+                f.write(f"   連結: {item.link}\n\n")
+        
+        if data.error:
+            f.write(f"錯誤: {data.error}\n")
+    
+    @staticmethod
+    def format_report_file(data: ScrapedData, output_path: str, details: bool = False, top_n: int = 5) -> None:
+        """將純文本報告直接寫入文件（不在記憶體中組成完整字串）"""
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            DataFormatter.write_report(data, f, details, top_n)
+    
+    @staticmethod
+    def format_report(data: ScrapedData, details: bool = True) -> str:
+        """格式化為純文本報告字串（大量數據請使用 format_report_file）"""
+        buffer = io.StringIO()
+        DataFormatter.write_report(data, buffer, details)
+        return buffer.getvalue()
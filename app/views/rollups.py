@@ -0,0 +1,148 @@
+"""
+儀表板的預先彙總表
+在 Python 端一次算好各縣市/年份/動物類型的加總與全國合計，
+輸出為 JS 變量，儀表板直接使用這些小表格，不需在瀏覽器中逐項重新計算
+"""
+
+import os
+import json
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+from app.models.data_model import ScrapedData
+from app.models.columnar_data import ColumnarScrapedData
+from app.views.analytics import analyze
+
+# 彙總輸出格式的標識與版本，格式變更時需遞增版本號
+ROLLUP_FORMAT = 'pet-registration-rollups'
+ROLLUP_VERSION = 3
+
+# 動物類型的輸出順序（與爬蟲抓取順序一致）
+ANIMAL_ORDER = ('狗', '貓')
+
+# 輸出欄位名稱到原始計數欄位的映射
+MEASURES = (
+    ('registrations', '登記數(A)'),
+    ('removals', '除戶數(B)'),
+    ('neutered', '絕育數(E)'),
+    ('neuteredRemovals', '絕育除戶數(F)'),
+    ('exempt', '免絕育數(G)'),
+    ('exemptRemovals', '免絕育除戶數(H)'),
+    ('registrationUnits', '登記單位數'),
+)
+
+_MEASURE_NAMES = tuple(name for name, _ in MEASURES)
+# 登記單位數是各縣市的單位數，跨動物類型或年份合併時取最大值而不是加總
+_MAX_MEASURES = frozenset(('registrationUnits',))
+
+
+def _rate(values: Dict[str, float]) -> Optional[float]:
+    """由加總值計算絕育率 (E-F)/(A-B)，分母不為正時返回None"""
+    base = values['registrations'] - values['removals']
+    if base <= 0:
+        return None
+    return round((values['neutered'] - values['neuteredRemovals']) / base * 100, 2)
+
+
+def _fold(cells: List[Tuple[Tuple[str, int, str], Dict[str, float]]],
+          key: Callable[[Tuple[str, int, str]], Any]) -> Dict[Any, Dict[str, float]]:
+    """將最細的（縣市, 年份, 動物類型）分組合併為較粗的分組"""
+    groups: Dict[Any, Dict[str, float]] = {}
+    for cell_key, values in cells:
+        group = groups.get(key(cell_key))
+        if group is None:
+            groups[key(cell_key)] = dict(values)
+            continue
+        for name in _MEASURE_NAMES:
+            if name in _MAX_MEASURES:
+                group[name] = max(group[name], values[name])
+            else:
+                group[name] += values[name]
+    return groups
+
+
+def _table(groups: Dict[Tuple, Dict[str, float]], dimensions: Tuple[str, ...],
+           index: Dict[str, Dict[Any, int]]) -> Dict[str, List[Any]]:
+    """將分組輸出為欄式表格：維度以取值表的索引表示，並附上絕育率"""
+    ordered = sorted(groups.items(), key=lambda entry: tuple(index[d][k] for d, k in zip(dimensions, entry[0])))
+    table: Dict[str, List[Any]] = {d: [index[d][key[i]] for key, _ in ordered] for i, d in enumerate(dimensions)}
+    for name in _MEASURE_NAMES:
+        table[name] = [int(values[name]) for _, values in ordered]
+    table['neuteringRate'] = [_rate(values) for _, values in ordered]
+    return table
+
+
+def build_rollups(data: ScrapedData) -> Dict[str, Any]:
+    """計算儀表板使用的彙總表
+
+    以 ColumnarScrapedData.group_by 對原始數據做一次向量化的分組加總（縣市×年份×動物類型），
+    其餘較粗的彙總（縣市×年份、縣市、縣市×動物類型、全國各年、全國各年×動物類型、總計）
+    都由這些分組合併而來，不再逐項掃描原始數據。「合計」列不計入，避免重複計算。
+    縣市×年份×動物類型的表格即儀表板的明細表格，前端不需要載入逐項數據。
+    同一個欄式容器也用於 app.views.analytics 的統計分析。
+
+    Args:
+        data: 寵物登記數據
+
+    Returns:
+        Dict[str, Any]: 彙總結構（cities/years/animalTypes 為取值表，各表格以索引引用）
+    """
+    columnar = ColumnarScrapedData.from_scraped_data(data)
+    group_keys, sums = columnar.group_by(('縣市', '年份', '動物類型'))
+    columns = {name: [float(value) for value in sums[source]] for name, source in MEASURES}
+
+    cells = []
+    for i, (city, year, animal) in enumerate(group_keys):
+        if city == '合計':
+            continue
+        cells.append(((city, int(year), animal), {name: columns[name][i] for name in _MEASURE_NAMES}))
+
+    cities = sorted({city for (city, _, _), _ in cells})
+    years = sorted({year for (_, year, _), _ in cells})
+    animals = sorted({animal for (_, _, animal), _ in cells},
+                     key=lambda a: (ANIMAL_ORDER.index(a) if a in ANIMAL_ORDER else len(ANIMAL_ORDER), a))
+    index = {
+        'city': {city: i for i, city in enumerate(cities)},
+        'year': {year: i for i, year in enumerate(years)},
+        'animal': {animal: i for i, animal in enumerate(animals)},
+    }
+
+    totals = {'all': _fold(cells, lambda k: 'all').get('all')}
+    totals.update(_fold(cells, lambda k: k[2]))
+
+    return {
+        'format': ROLLUP_FORMAT,
+        'version': ROLLUP_VERSION,
+        'last_updated': data.last_updated.isoformat(),
+        'source_url': data.source_url,
+        'cities': cities,
+        'years': [str(year) for year in years],
+        'animalTypes': animals,
+        'cityYearAnimal': _table(dict(cells), ('city', 'year', 'animal'), index),
+        'cityYear': _table(_fold(cells, lambda k: (k[0], k[1])), ('city', 'year'), index),
+        'city': _table(_fold(cells, lambda k: (k[0],)), ('city',), index),
+        'cityAnimal': _table(_fold(cells, lambda k: (k[0], k[2])), ('city', 'animal'), index),
+        'national': _table(_fold(cells, lambda k: (k[1],)), ('year',), index),
+        'nationalAnimal': _table(_fold(cells, lambda k: (k[1], k[2])), ('year', 'animal'), index),
+        'totals': {
+            name: {**{m: int(values[m]) for m in _MEASURE_NAMES}, 'neuteringRate': _rate(values)}
+            for name, values in totals.items() if values is not None
+        },
+        # 進階分析頁面的控制圖、瀑布圖與空間自相關（未安裝 NumPy 時為None）
+        'analytics': analyze(columnar),
+    }
+
+
+def format_rollups_js(data: ScrapedData, output_path: str, variable_name: str = 'petRegistrationRollups') -> None:
+    """將彙總表保存為JavaScript變量聲明（public/js/data-processor.js 的 processRollups 使用）
+
+    Args:
+        data: 寵物登記數據
+        output_path: 輸出路徑
+        variable_name: JS變量名稱
+    """
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    rollups = build_rollups(data)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(f"const {variable_name} = ")
+        json.dump(rollups, f, ensure_ascii=False, separators=(',', ':'), allow_nan=False)
+        f.write(";\n")
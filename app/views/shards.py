@@ -0,0 +1,140 @@
+"""
+按（年份, 動物類型）分片的數據輸出
+每個分區一個欄式JSON文件，另有一個小型清單記錄各分區的列數、內容雜湊與縣市/年份/動物類型索引，
+前端先讀取清單，再只下載目前篩選條件需要的分片（public/js/shard-loader.js）
+"""
+
+import os
+import json
+import hashlib
+import logging
+from typing import Optional, Dict, Any, List, Tuple
+
+from app.models.data_model import ScrapedData, ScrapedItem
+from app.views.data_formatter import DataFormatter
+
+logger = logging.getLogger('shards')
+
+# 分片清單的格式標識與版本，格式變更時需遞增版本號
+SHARD_FORMAT = 'pet-registration-shards'
+SHARD_VERSION = 1
+
+MANIFEST_NAME = 'manifest.json'
+
+# 分片文件名中動物類型的代號（避免在URL中使用中文）
+ANIMAL_SLUGS = {'狗': 'dog', '貓': 'cat'}
+
+# 分片內容不包含這些每次執行都會變動或已保存在清單中的欄位，使未變更的分區雜湊保持不變
+_VOLATILE_KEYS = ('last_updated', 'source_url', 'error', 'cities', 'years', 'animalTypes')
+
+
+def _shard_name(year: str, animal: str) -> str:
+    slug = ANIMAL_SLUGS.get(animal)
+    if slug is None:
+        slug = hashlib.blake2b(animal.encode('utf-8'), digest_size=4).hexdigest()
+    return f"{year}-{slug}.json"
+
+
+def _partition(data: ScrapedData) -> Dict[Tuple[str, str], List[ScrapedItem]]:
+    """按（年份, 動物類型）分組；分區內依期間與縣市排序，使內容與爬取順序無關"""
+    partitions: Dict[Tuple[str, str], List[ScrapedItem]] = {}
+    for item in data.items:
+        key = (str(item.extra_data['年份']), item.extra_data['動物類型'])
+        partitions.setdefault(key, []).append(item)
+    for items in partitions.values():
+        items.sort(key=lambda item: (item.extra_data.get('期間') or '', item.extra_data.get('縣市') or ''))
+    return partitions
+
+
+def _encode_shard(items: List[ScrapedItem]) -> bytes:
+    """將分區編碼為欄式JSON（不含時間戳等易變欄位）"""
+    columnar = DataFormatter.to_columnar(ScrapedData(items=items))
+    for key in _VOLATILE_KEYS:
+        columnar.pop(key, None)
+    return json.dumps(columnar, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_atomic(path: str, content: bytes) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def load_manifest(output_dir: str) -> Optional[Dict[str, Any]]:
+    """讀取既有的分片清單，不存在、損毀或格式不符時返回None"""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"無法讀取分片清單 {path}: {e}")
+        return None
+    if not isinstance(manifest, dict) or manifest.get('format') != SHARD_FORMAT \
+            or manifest.get('version') != SHARD_VERSION:
+        return None
+    return manifest
+
+
+def write_shards(data: ScrapedData, output_dir: str) -> Dict[str, int]:
+    """將數據輸出為分片與清單
+
+    分片的內容雜湊與上次清單中記錄的相同且文件仍存在時不重寫，
+    因此只有數據實際變更的分區會產生新文件（以及版本控制中的差異）。
+    上次清單中存在、這次已沒有數據的分片會被刪除。清單每次都會重寫（含更新時間）。
+
+    Args:
+        data: 寵物登記數據
+        output_dir: 分片與清單的輸出目錄
+
+    Returns:
+        {'written': 寫入的分片數, 'unchanged': 未變更的分片數, 'removed': 刪除的分片數}
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    previous = load_manifest(output_dir)
+    previous_hashes = {entry['file']: entry['hash'] for entry in (previous or {}).get('partitions', [])}
+
+    partitions = []
+    cities = set()
+    written = unchanged = 0
+    for (year, animal), items in sorted(_partition(data).items()):
+        content = _encode_shard(items)
+        digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+        name = _shard_name(year, animal)
+        path = os.path.join(output_dir, name)
+        if previous_hashes.get(name) == digest and os.path.exists(path):
+            unchanged += 1
+        else:
+            _write_atomic(path, content)
+            written += 1
+        cities.update(item.extra_data.get('縣市') for item in items)
+        partitions.append({'year': year, 'animalType': animal, 'file': name, 'rows': len(items),
+                           'bytes': len(content), 'hash': digest})
+
+    current = {entry['file'] for entry in partitions}
+    removed = 0
+    for name in previous_hashes:
+        if name not in current and os.path.exists(os.path.join(output_dir, name)):
+            os.remove(os.path.join(output_dir, name))
+            removed += 1
+
+    manifest = {
+        'format': SHARD_FORMAT,
+        'version': SHARD_VERSION,
+        'last_updated': data.last_updated.isoformat(),
+        'source_url': data.source_url,
+        'error': data.error,
+        'rowCount': len(data.items),
+        'cities': sorted(city for city in cities if city and city != '合計'),
+        'years': sorted({entry['year'] for entry in partitions}, reverse=True),  # 年份降序排列
+        'animalTypes': sorted({entry['animalType'] for entry in partitions}),
+        'partitions': partitions,
+    }
+    _write_atomic(os.path.join(output_dir, MANIFEST_NAME),
+                  json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    stats = {'written': written, 'unchanged': unchanged, 'removed': removed}
+    logger.info(f"輸出 {len(partitions)} 個分片: 寫入 {written}、未變更 {unchanged}、刪除 {removed}")
+    return stats
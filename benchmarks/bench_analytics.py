@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+統計分析（app.views.analytics）在月粒度數據上的耗時
+
+用法: python benchmarks/bench_analytics.py [--years 26,50,100] [--repeat 3]
+
+以22個縣市 × 年數 × 12個月 × 2種動物產生合成數據（與爬蟲的月粒度輸出相同：年份為西元年，期間為 'YYYY-MM'），
+量測 analyze() 的總耗時（含分組加總）與各項計算，並與逐期逐縣市的純Python迴圈
+（前端 advanced-analytics.js 的做法）計算 Moran's I 與 Gi* 的耗時比較。
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import columnar_data
+from app.models.columnar_data import ColumnarScrapedData, INT_FIELDS, FLOAT_FIELDS, PERIOD
+from app.views import analytics
+from app.views.analytics import COUNTIES
+
+ANIMALS = ["狗", "貓"]
+
+
+def synthetic_monthly(years: int, seed: int = 0) -> ColumnarScrapedData:
+    """產生每個縣市、月份、動物類型一列的合成數據"""
+    np = columnar_data.np
+    rng = np.random.default_rng(seed)
+    store = ColumnarScrapedData()
+    for city in COUNTIES:
+        store._encode('縣市', city)
+    for animal in ANIMALS:
+        store._encode('動物類型', animal)
+    months = [(2000 + y, m) for y in range(years) for m in range(1, 13)]
+    period_codes = np.array([store._encode(PERIOD, f"{year}-{month:02d}") for year, month in months], dtype=np.int32)
+    cities, periods, animals = np.meshgrid(np.arange(len(COUNTIES), dtype=np.int32), np.arange(len(months)),
+                                           np.arange(len(ANIMALS), dtype=np.int32), indexing='ij')
+    size = cities.size
+    month_years = np.array([year for year, _ in months], dtype=np.int32)
+
+    store.columns['縣市'].frombytes(cities.ravel().tobytes())
+    store.columns['年份'].frombytes(month_years[periods.ravel()].tobytes())
+    store.columns[PERIOD].frombytes(period_codes[periods.ravel()].tobytes())
+    store.columns['動物類型'].frombytes(animals.ravel().tobytes())
+
+    registrations = rng.integers(100, 5000, size)
+    values = {
+        '登記數(A)': registrations,
+        '除戶數(B)': registrations // rng.integers(5, 20, size),
+        '絕育數(E)': (registrations * rng.uniform(0.3, 0.6, size)).astype(np.int64),
+        '絕育除戶數(F)': rng.integers(0, 20, size),
+    }
+    for name in INT_FIELDS:
+        column = values.get(name)
+        if column is None:
+            column = rng.integers(0, 500, size)
+        store.columns[name].frombytes(column.astype(np.int64).tobytes())
+    for name in FLOAT_FIELDS:
+        store.columns[name].frombytes(np.full(size, np.nan).tobytes())
+    return store
+
+
+def python_spatial(matrix, neighbors):
+    """逐期逐縣市以Python迴圈計算 Moran's I 與 Gi*（二元鄰接權重）"""
+    results = []
+    for row in matrix:
+        n = len(row)
+        mean = sum(row) / n
+        deviations = [x - mean for x in row]
+        numerator = weight_total = 0.0
+        for i in range(n):
+            for j in neighbors[i]:
+                numerator += deviations[i] * deviations[j]
+                weight_total += 1
+        moran = n / weight_total * numerator / sum(d * d for d in deviations)
+
+        spread = math.sqrt(sum(x * x for x in row) / n - mean * mean)
+        gi = []
+        for i in range(n):
+            members = neighbors[i] + [i]
+            w = len(members)
+            local = sum(row[j] for j in members)
+            gi.append((local - mean * w) / (spread * math.sqrt((n * w - w * w) / (n - 1))))
+        results.append((moran, gi))
+    return results
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='月粒度統計分析基準測試')
+    parser.add_argument('--years', default='26,50,100', help='以逗號分隔的年數')
+    parser.add_argument('--repeat', type=int, default=3, help='每項量測的重複次數（取最佳值）')
+    args = parser.parse_args()
+
+    if analytics.np is None:
+        print("未安裝 NumPy，無法執行統計分析")
+        return
+    np = analytics.np
+
+    print(f"縣市數: {len(COUNTIES)}，動物類型: {len(ANIMALS)}，粒度: 月")
+    print(f"{'年數':>6}{'期數':>8}{'列數':>10}{'analyze(s)':>12}{'分組(s)':>10}{'控制圖(s)':>11}"
+          f"{'空間(s)':>10}{'Python空間(s)':>15}{'加速':>8}")
+
+    for years in (int(y) for y in args.years.split(',')):
+        store = synthetic_monthly(years)
+        total = best_of(args.repeat, analytics.analyze, store)
+
+        cities, periods, matrices = analytics._matrices(store)
+        grouping = best_of(args.repeat, analytics._matrices, store)
+        weights = analytics.spatial_weights(cities)
+        rates = matrices['neuteringRate']
+        control = best_of(args.repeat, analytics.control_chart, rates.T)
+
+        def spatial():
+            analytics.morans_i(rates, weights)
+            analytics.getis_ord_gi_star(rates, weights)
+
+        vectorized = best_of(args.repeat, spatial)
+        neighbors = [np.nonzero(row)[0].tolist() for row in weights]
+        baseline = best_of(args.repeat, python_spatial, rates.tolist(), neighbors)
+
+        # 以純Python迴圈驗證向量化結果
+        expected = python_spatial(rates[:1].tolist(), neighbors)[0]
+        assert math.isclose(expected[0], float(analytics.morans_i(rates[:1], weights)['moransI'][0]), rel_tol=1e-9)
+
+        print(f"{years:>6}{len(periods):>8}{len(store):>10}{total:>12.4f}{grouping:>10.4f}{control:>11.4f}"
+              f"{vectorized:>10.4f}{baseline:>15.4f}{baseline / vectorized:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
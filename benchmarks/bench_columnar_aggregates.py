@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+比較逐項 ScrapedItem 迴圈與 ColumnarScrapedData 分組加總（縣市×年份×動物類型）的耗時
+
+用法: python benchmarks/bench_columnar_aggregates.py [--sizes 1000,100000,10000000]
+
+逐項基準與純Python欄式版本只在列數不超過 --row-limit 時執行，避免建立上千萬個字典。
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import columnar_data
+from app.models.columnar_data import ColumnarScrapedData, DIMENSIONS, INT_FIELDS
+from app.models.data_model import ScrapedItem
+
+CITIES = ["臺北市", "新北市", "桃園市", "臺中市", "臺南市", "高雄市", "基隆市", "新竹市",
+          "新竹縣", "苗栗縣", "彰化縣", "南投縣", "雲林縣", "嘉義市", "嘉義縣", "屏東縣",
+          "宜蘭縣", "花蓮縣", "臺東縣", "澎湖縣", "金門縣", "連江縣"]
+ANIMALS = ["狗", "貓"]
+
+
+def synthetic_columns(size: int, seed: int = 0):
+    """產生合成的欄式數據"""
+    rng = random.Random(seed)
+    cities = [CITIES[rng.randrange(len(CITIES))] for _ in range(size)]
+    years = [2000 + rng.randrange(26) for _ in range(size)]
+    animals = [ANIMALS[rng.randrange(2)] for _ in range(size)]
+    values = {name: [rng.randrange(5000) for _ in range(size)] for name in INT_FIELDS}
+    return cities, years, animals, values
+
+
+def rows_baseline(items):
+    """現有做法：逐項解析字串並以字典累加"""
+    totals = {}
+    for item in items:
+        row = item.extra_data
+        key = (row['縣市'], row['年份'], row['動物類型'])
+        acc = totals.setdefault(key, dict.fromkeys(INT_FIELDS, 0))
+        for name in INT_FIELDS:
+            acc[name] += int(row[name])
+    for acc in totals.values():
+        base = acc['登記數(A)'] - acc['除戶數(B)']
+        if base > 0:
+            acc['rate'] = (acc['絕育數(E)'] - acc['絕育除戶數(F)']) / base * 100
+    return totals
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='欄式容器分組加總基準測試')
+    parser.add_argument('--sizes', default='1000,100000,10000000', help='以逗號分隔的列數')
+    parser.add_argument('--row-limit', type=int, default=1000000,
+                        help='逐項基準與純Python版本的最大列數')
+    args = parser.parse_args()
+
+    numpy_available = columnar_data.np is not None
+    print(f"NumPy: {'已安裝' if numpy_available else '未安裝'}")
+    print(f"{'列數':>10}{'逐項(s)':>12}{'欄式Python(s)':>16}{'欄式NumPy(s)':>16}")
+
+    for size in (int(s) for s in args.sizes.split(',')):
+        if numpy_available and size > args.row_limit:
+            # 大規模數據直接以 NumPy 產生，避免Python列表佔用過多記憶體
+            np = columnar_data.np
+            rng = np.random.default_rng(0)
+            store = ColumnarScrapedData()
+            for city in CITIES:
+                store._encode('縣市', city)
+            for animal in ANIMALS:
+                store._encode('動物類型', animal)
+            store.columns['縣市'].frombytes(rng.integers(0, len(CITIES), size, dtype=np.int32).tobytes())
+            store.columns['年份'].frombytes(rng.integers(2000, 2026, size, dtype=np.int32).tobytes())
+            store.columns['動物類型'].frombytes(rng.integers(0, 2, size, dtype=np.int32).tobytes())
+            store.columns[columnar_data.PERIOD].frombytes(np.zeros(size, dtype=np.int32).tobytes())
+            for name in INT_FIELDS:
+                store.columns[name].frombytes(rng.integers(0, 5000, size, dtype=np.int64).tobytes())
+            for name in columnar_data.FLOAT_FIELDS:
+                store.columns[name].frombytes(np.full(size, np.nan).tobytes())
+        else:
+            cities, years, animals, values = synthetic_columns(size)
+            store = ColumnarScrapedData()
+            store.extend_columns(cities, years, animals, values)
+
+        baseline = python_columnar = numpy_columnar = None
+        if size <= args.row_limit:
+            items = [
+                ScrapedItem(title='', link='', extra_data={
+                    '縣市': cities[i], '年份': str(years[i]), '動物類型': animals[i],
+                    **{name: str(values[name][i]) for name in INT_FIELDS}
+                })
+                for i in range(size)
+            ]
+            baseline = timed(rows_baseline, items)
+            del items
+
+            saved = columnar_data.np
+            columnar_data.np = None
+            python_columnar = timed(store.group_by, DIMENSIONS)
+            columnar_data.np = saved
+
+        if numpy_available:
+            numpy_columnar = timed(store.group_by, DIMENSIONS)
+
+        def fmt(value):
+            return f"{value:.4f}" if value is not None else '-'
+
+        print(f"{size:>10}{fmt(baseline):>12}{fmt(python_columnar):>16}{fmt(numpy_columnar):>16}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+比較逐項格式（format_as_js）與欄式格式（format_as_columnar_js）的檔案大小與解析時間
+
+用法: python benchmarks/bench_columnar_format.py [--input data/pet_registration_data.json]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.views.data_formatter import DataFormatter
+
+
+def _payload(path: str) -> str:
+    """取出JS文件中的JSON部分（去掉變量聲明與解碼函數呼叫）"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    start = text.index('{')
+    end = text.rindex('}') + 1
+    return text[start:end]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='欄式輸出格式基準測試')
+    parser.add_argument('--input', default='data/pet_registration_data.json',
+                        help='輸入的JSON數據文件')
+    parser.add_argument('--repeat', type=int, default=20, help='解析重複次數')
+    args = parser.parse_args()
+
+    data = DataFormatter.load_json(args.input)
+    if data is None:
+        print(f"找不到輸入文件: {args.input}")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rows_path = os.path.join(tmp, 'rows.js')
+        columnar_path = os.path.join(tmp, 'columnar.js')
+        DataFormatter.format_as_js(data, rows_path, 'petRegistrationData')
+        DataFormatter.format_as_columnar_js(data, columnar_path, 'petRegistrationData')
+
+        print(f"項目數量: {len(data.items)}")
+        print(f"{'格式':<10}{'大小(KB)':>12}{'gzip(KB)':>12}{'解析(ms)':>12}")
+        for name, path in (('逐項', rows_path), ('欄式', columnar_path)):
+            with open(path, 'rb') as f:
+                raw = f.read()
+            payload = _payload(path)
+            seconds = timeit.timeit(lambda: json.loads(payload), number=args.repeat) / args.repeat
+            print(f"{name:<10}{len(raw) / 1024:>12.1f}{len(gzip.compress(raw)) / 1024:>12.1f}"
+                  f"{seconds * 1000:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+比較舊版 ExampleNewsScraper.parse_data（每篇文章重新解析選擇器字串）與預先編譯的 ItemExtractor 的耗時
+
+用法: python benchmarks/bench_extraction.py [--articles 5000]
+
+只量測提取階段：頁面先以同一個解析器解析一次，兩種做法在同一棵樹上執行。
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import TARGET_SITES
+from app.models.data_model import ScrapedItem
+from app.utils.extraction import ItemExtractor
+from app.utils.html_parser import make_soup, resolve_parser
+
+
+def synthetic_page(articles: int) -> bytes:
+    """產生合成的新聞列表頁面（約一成文章缺少摘要或日期）"""
+    items = []
+    for i in range(articles):
+        description = '' if i % 10 == 3 else f'<p class="news-description">{"摘要 " * 20}</p>'
+        date = '' if i % 10 == 7 else f'<span class="news-date">2024-01-{i % 28 + 1:02d}</span>'
+        items.append(f'<div class="news-item"><a class="news-link" href="/news/{i}">'
+                     f'<h2 class="news-title">新聞標題 {i}</h2></a>{description}{date}</div>')
+    html = f'<html><body><div class="news-container">{"".join(items)}</div></body></html>'
+    return html.encode('utf-8')
+
+
+def legacy_parse(soup):
+    """舊做法：每篇文章以字串呼叫 select_one"""
+    result = []
+    for article in soup.select('.news-container .news-item'):
+        title_elem = article.select_one('.news-title')
+        link_elem = article.select_one('a.news-link')
+        desc_elem = article.select_one('.news-description')
+        date_elem = article.select_one('.news-date')
+        if title_elem and link_elem:
+            result.append(ScrapedItem(
+                title=title_elem.text.strip(),
+                link=link_elem['href'],
+                description=desc_elem.text.strip() if desc_elem else None,
+                date=date_elem.text.strip() if date_elem else None
+            ))
+    return result
+
+
+def best_of(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='項目提取基準測試')
+    parser.add_argument('--articles', type=int, default=5000, help='文章數')
+    parser.add_argument('--repeat', type=int, default=5, help='重複次數（取最佳值）')
+    args = parser.parse_args()
+
+    soup = make_soup(synthetic_page(args.articles), resolve_parser('auto'))
+    extractor = ItemExtractor(TARGET_SITES['example_news']['selector'])
+    assert legacy_parse(soup) == list(extractor.iter_items(soup))
+
+    legacy = best_of(lambda: legacy_parse(soup), args.repeat)
+    compiled = best_of(lambda: list(extractor.iter_items(soup)), args.repeat)
+    print(f"文章數: {args.articles}")
+    print(f"{'做法':<16}{'耗時(ms)':>12}{'倍數':>8}")
+    print(f"{'逐篇 select_one':<16}{legacy * 1000:>12.1f}{1:>8.2f}")
+    print(f"{'預編譯提取器':<16}{compiled * 1000:>12.1f}{legacy / compiled:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
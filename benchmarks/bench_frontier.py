@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+以大量URL測試 URLFrontier 的吞吐量與記憶體用量
+
+用法: python benchmarks/bench_frontier.py [--urls 1000000] [--duplicate-ratio 0.3]
+
+每個URL在加入前有 --duplicate-ratio 的機率換成先前出現過的URL（大小寫、片段與參數順序不同），
+用於驗證正規化去重。記憶體以程序的最大常駐集（ru_maxrss）量測。
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import resource
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.frontier import URLFrontier
+
+
+def url_for(i: int, variant: bool = False) -> str:
+    if variant:
+        return f"HTTPS://Example.com:443/articles/{i}?b=2&a=1#comments"
+    return f"https://example.com/articles/{i}?a=1&b=2"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='URL邊界基準測試')
+    parser.add_argument('--urls', type=int, default=1000000, help='加入的URL數量')
+    parser.add_argument('--duplicate-ratio', type=float, default=0.3, help='重複URL的比例')
+    parser.add_argument('--chunk-size', type=int, default=10000, help='每個優先順序在記憶體中保留的項目數')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    frontier = URLFrontier(expected_urls=args.urls, chunk_size=args.chunk_size)
+
+    start = time.perf_counter()
+    added = 0
+    for i in range(args.urls):
+        if i and rng.random() < args.duplicate_ratio:
+            url = url_for(rng.randrange(i), variant=True)
+        else:
+            url = url_for(i)
+        added += frontier.push(url, depth=rng.randrange(3))
+    push_seconds = time.perf_counter() - start
+    push_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    popped = 0
+    while frontier.pop() is not None:
+        popped += 1
+    pop_seconds = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    frontier.close()
+
+    stats = frontier.stats()
+    print(f"URL數量: {args.urls}，加入 {added}，重複 {stats['duplicates']}，去重索引: {stats['dedup']}")
+    print(f"加入: {push_seconds:.2f} 秒 ({args.urls / push_seconds:,.0f} 個/秒)")
+    print(f"取出: {pop_seconds:.2f} 秒 ({popped / pop_seconds:,.0f} 個/秒)，共 {popped} 個")
+    # Linux 上 ru_maxrss 的單位為 KB
+    print(f"常駐記憶體增加: 加入後 {(push_peak - baseline) / 1024:.1f} MB，全程 {(peak - baseline) / 1024:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+比較各HTML解析器後端（整頁解析與只解析文章元素的部分解析）的耗時，用於為每個網站選擇 parser
+
+用法: python benchmarks/bench_html_parsers.py [--html page1.html page2.html ...] [--article .news-item]
+
+未指定 --html 時使用合成頁面：大量導覽、腳本與側欄元素中夾雜 --articles 篇文章。
+各項報告多次執行的中位數：解析耗時與之後以文章選擇器 select 的耗時分開列出。
+部分解析仍需完整斷詞，省下的只有建樹與之後的查詢，因此兩者差距通常不大
+（合成頁面上 lxml 與 html.parser 都只快約5-10%）。
+selectolax 不產生 BeautifulSoup 物件，無法接上 parse_data，只列出作為參考。
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.html_parser import PARSER_BACKENDS, available_parsers, make_soup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+
+def synthetic_page(articles: int) -> bytes:
+    """產生合成的新聞列表頁面"""
+    chrome = ''.join(f'<li><a href="/nav/{i}">導覽 {i}</a></li>' for i in range(200))
+    sidebar = ''.join(f'<div class="widget"><h3>側欄 {i}</h3><p>{"內容 " * 40}</p></div>' for i in range(50))
+    items = ''.join(
+        f'<div class="news-item"><a class="news-link" href="/news/{i}">'
+        f'<h2 class="news-title">新聞標題 {i}</h2></a>'
+        f'<p class="news-description">{"摘要 " * 30}</p><span class="news-date">2024-01-{i % 28 + 1:02d}</span></div>'
+        for i in range(articles)
+    )
+    script = '<script>' + 'var x = 1;' * 2000 + '</script>'
+    html = (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>新聞</title>{script}</head><body>'
+            f'<nav><ul>{chrome}</ul></nav><div class="news-container">{items}</div>'
+            f'<aside>{sidebar}</aside></body></html>')
+    return html.encode('utf-8')
+
+
+def median_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML解析器後端基準測試')
+    parser.add_argument('--html', nargs='*', help='已保存的HTML文件')
+    parser.add_argument('--article', default='.news-item', help='文章選擇器（部分解析使用）')
+    parser.add_argument('--articles', type=int, default=500, help='合成頁面的文章數')
+    parser.add_argument('--repeat', type=int, default=9, help='重複次數（取中位數）')
+    args = parser.parse_args()
+
+    if args.html:
+        pages = []
+        for path in args.html:
+            with open(path, 'rb') as f:
+                pages.append((os.path.basename(path), f.read()))
+    else:
+        pages = [(f'合成頁面({args.articles}篇)', synthetic_page(args.articles))]
+
+    missing = [name for name in PARSER_BACKENDS if name not in available_parsers()]
+    if missing:
+        print(f"未安裝: {', '.join(missing)}")
+
+    for name, content in pages:
+        print(f"\n{name}: {len(content) / 1024:.1f} KB")
+        print(f"{'後端':<28}{'解析(ms)':>10}{'查詢(ms)':>10}{'文章數':>8}")
+        for backend in available_parsers():
+            modes = [('整頁', None)]
+            if backend != 'html5lib':
+                modes.append(('部分', args.article))
+            for label, parse_only in modes:
+                seconds = median_of(lambda: make_soup(content, backend, parse_only), args.repeat)
+                soup = make_soup(content, backend, parse_only)
+                select = median_of(lambda: soup.select(args.article), args.repeat)
+                found = len(soup.select(args.article))
+                print(f"{backend + ' ' + label:<28}{seconds * 1000:>10.1f}{select * 1000:>10.1f}{found:>8}")
+        if HTMLParser is not None:
+            seconds = median_of(lambda: HTMLParser(content).css(args.article), args.repeat)
+            found = len(HTMLParser(content).css(args.article))
+            print(f"{'selectolax（參考）':<28}{seconds * 1000:>10.1f}{'-':>10}{found:>8}")
+
+
+if __name__ == '__main__':
+    main()
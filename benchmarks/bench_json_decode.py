@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+比較 PostData.ashx 回應的舊解析路徑（response.text 解碼 + 全文子字串檢查 + json.loads）
+與單次解碼路徑（原始位元組 + json_codec）的耗時
+
+用法: python benchmarks/bench_json_decode.py [--cache-dir data/cache] [--repeat 2000]
+
+優先使用快取目錄中記錄的真實回應（ResponseCache 文件：第一行為中繼資料，其後為回應內容）；
+快取為空時改用合成的回應（22 個縣市，Message 為項目列表）。
+Message 為JSON字符串時舊路徑的子字串檢查會因引號被轉義而失敗，因此不列入比較。
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils import json_codec
+from app.controllers.pet_gov_tw_scraper import PetGovTwScraper
+
+CITIES = ["臺北市", "新北市", "桃園市", "臺中市", "臺南市", "高雄市", "基隆市", "新竹市",
+          "新竹縣", "苗栗縣", "彰化縣", "南投縣", "雲林縣", "嘉義市", "嘉義縣", "屏東縣",
+          "宜蘭縣", "花蓮縣", "臺東縣", "澎湖縣", "金門縣", "連江縣"]
+FIELDS = ("fld01", "fld02", "fld03", "fld04", "fld05", "fld06", "fld07", "fld08", "fld10")
+
+
+def recorded_fixtures(cache_dir: str):
+    """讀取快取目錄中記錄的回應內容"""
+    if not os.path.isdir(cache_dir):
+        return []
+    bodies = []
+    for name in sorted(os.listdir(cache_dir)):
+        if name.endswith('.cache'):
+            with open(os.path.join(cache_dir, name), 'rb') as f:
+                f.readline()
+                bodies.append(f.read())
+    return bodies
+
+
+def synthetic_fixtures(count: int, seed: int = 0):
+    """產生合成的回應內容"""
+    rng = random.Random(seed)
+    bodies = []
+    for _ in range(count):
+        items = [{"AreaName": city, **{field: rng.randrange(20000) for field in FIELDS}} for city in CITIES]
+        bodies.append(json.dumps({"Success": True, "Message": items}, ensure_ascii=False).encode('utf-8'))
+    return bodies
+
+
+def legacy_decode(body: bytes):
+    """舊做法：解碼為文字、解析JSON後再以子字串檢查格式"""
+    text = body.decode('utf-8')
+    json_data = json.loads(text)
+    if "\"fld01\":" in text or "\"fld02\":" in text:
+        message = json_data['Message']
+        return json.loads(message) if isinstance(message, str) else message
+    return None
+
+
+def single_pass_decode(body: bytes):
+    """新做法：直接解析位元組，並由解析後的物件檢查結構"""
+    return PetGovTwScraper._extract_items(json_codec.loads(body))
+
+
+def measure(func, bodies, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for body in bodies:
+            func(body)
+    return (time.perf_counter() - start) / (repeat * len(bodies))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PostData.ashx 回應解析基準測試')
+    parser.add_argument('--cache-dir', default='data/cache', help='記錄回應的快取目錄')
+    parser.add_argument('--fixtures', type=int, default=50, help='合成回應數量')
+    parser.add_argument('--repeat', type=int, default=200, help='重複次數')
+    args = parser.parse_args()
+
+    bodies = recorded_fixtures(args.cache_dir)
+    source = f"快取記錄 ({args.cache_dir})"
+    if not bodies:
+        bodies = synthetic_fixtures(args.fixtures)
+        source = "合成回應"
+
+    # 確認兩種做法得到相同的項目
+    for body in bodies:
+        assert legacy_decode(body) == single_pass_decode(body)
+
+    size = sum(len(body) for body in bodies) / len(bodies)
+    print(f"來源: {source}，{len(bodies)} 個回應，平均 {size / 1024:.1f} KB，JSON後端: {json_codec.JSON_BACKEND}")
+    legacy = measure(legacy_decode, bodies, args.repeat)
+    single = measure(single_pass_decode, bodies, args.repeat)
+    print(f"{'做法':<12}{'每個回應(µs)':>14}")
+    print(f"{'舊路徑':<12}{legacy * 1e6:>14.1f}")
+    print(f"{'單次解碼':<12}{single * 1e6:>14.1f}  ({legacy / single:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
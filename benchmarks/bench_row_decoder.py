@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+比較舊版 _parse_api_data（每個項目重建欄位映射）與表驅動 ApiRowDecoder 的耗時
+
+用法: python benchmarks/bench_row_decoder.py [--items 100000] [--repeat 11]
+
+輸入為合成的 Message 項目列表；約一成項目缺少絕育率欄位 j，需要由 (E-F)/(A-B) 補算。
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.controllers.pet_gov_tw_scraper import PetGovTwScraper
+
+CITIES = ["臺北市", "新北市", "桃園市", "臺中市", "臺南市", "高雄市", "基隆市", "新竹市",
+          "新竹縣", "苗栗縣", "彰化縣", "南投縣", "雲林縣", "嘉義市", "嘉義縣", "屏東縣",
+          "宜蘭縣", "花蓮縣", "臺東縣", "澎湖縣", "金門縣", "連江縣"]
+FIELDS = ("fld01", "fld02", "fld03", "fld04", "fld05", "fld06", "fld07", "fld08", "fld10")
+
+
+def synthetic_items(count: int, seed: int = 0):
+    """產生合成的 Message 項目"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        item = {"AreaName": CITIES[i % len(CITIES)]}
+        for field in FIELDS:
+            item[field] = rng.randrange(20000)
+        item["fld02"] += item["fld03"] + 1
+        if rng.random() >= 0.1:
+            item["j"] = round(rng.uniform(0, 100), 2)
+            item["k"] = round(rng.uniform(0, 100), 2)
+        items.append(item)
+    return items
+
+
+def legacy_parse(items):
+    """舊做法：每個項目重建映射、字串化所有數值，再由字串補算絕育率"""
+    table_data = []
+    for item in items:
+        row_data = {}
+        if "AreaName" in item:
+            row_data["縣市"] = item["AreaName"]
+        elif "areaName" in item:
+            row_data["縣市"] = item["areaName"]
+        field_mapping = {
+            "fld01": "登記單位數",
+            "fld02": "登記數(A)",
+            "fld03": "除戶數(B)",
+            "fld04": "絕育數(E)",
+            "fld05": "轉讓數(C)",
+            "fld06": "變更數(D)",
+            "fld07": "免絕育數(G)",
+            "fld08": "絕育除戶數(F)",
+            "fld10": "免絕育除戶數(H)",
+            "j": "絕育率(E-F)/(A-B)",
+            "k": "繁殖管理率(E-F)+(G-H)/(A-B)"
+        }
+        for api_field, standard_field in field_mapping.items():
+            if api_field in item:
+                row_data[standard_field] = str(item[api_field])
+        if "絕育率(E-F)/(A-B)" not in row_data and "登記數(A)" in row_data and "除戶數(B)" in row_data \
+                and "絕育數(E)" in row_data and "絕育除戶數(F)" in row_data:
+            try:
+                reg = int(row_data["登記數(A)"])
+                rem = int(row_data["除戶數(B)"])
+                neu = int(row_data["絕育數(E)"])
+                neu_rem = int(row_data["絕育除戶數(F)"])
+                if (reg - rem) > 0:
+                    rate = (neu - neu_rem) / (reg - rem) * 100
+                    row_data["絕育率(E-F)/(A-B)"] = f"{rate:.2f}"
+            except (ValueError, ZeroDivisionError):
+                pass
+        if row_data:
+            table_data.append(row_data)
+    return table_data
+
+
+def timings_of(func, repeat: int):
+    """返回每次執行的耗時（秒）；單次結果受GC與CPU頻率影響，報告時取中位數與範圍"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='API項目解碼基準測試')
+    parser.add_argument('--items', type=int, default=100000, help='項目數量')
+    parser.add_argument('--repeat', type=int, default=11, help='重複次數（報告中位數）')
+    args = parser.parse_args()
+
+    items = synthetic_items(args.items)
+    decoder = PetGovTwScraper.ROW_DECODER
+    assert legacy_parse(items) == decoder.decode_rows(items)
+
+    legacy = timings_of(lambda: legacy_parse(items), args.repeat)
+    rows = timings_of(lambda: decoder.decode_rows(items), args.repeat)
+    baseline = statistics.median(legacy)
+
+    print(f"項目數量: {args.items}，重複 {args.repeat} 次")
+    print(f"{'做法':<16}{'中位數(ms)':>12}{'最小(ms)':>10}{'最大(ms)':>10}{'倍數':>8}")
+    for label, timings in (('舊版解析', legacy), ('表驅動解碼', rows)):
+        median = statistics.median(timings)
+        print(f"{label:<16}{median * 1000:>12.1f}{min(timings) * 1000:>10.1f}"
+              f"{max(timings) * 1000:>10.1f}{baseline / median:>8.2f}")
+
+if __name__ == '__main__':
+    main()
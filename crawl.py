@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import argparse
+from app import logger
+from app.config import TARGET_SITES, CRAWL_CONFIG
+from app.controllers.crawl_scheduler import CrawlScheduler
+from app.utils.validators import ValidatorStore
+from app.views.data_formatter import DataFormatter
+
+def main():
+    """多站爬取入口：依 TARGET_SITES 爬取所有（或指定的）網站並分別輸出"""
+    # 解析命令行參數
+    parser = argparse.ArgumentParser(description='多站爬取排程器')
+    parser.add_argument('--sites', type=str, nargs='*',
+                        help=f"要爬取的網站 (默認: 全部，可選: {', '.join(TARGET_SITES)})")
+    parser.add_argument('--workers', type=int, default=CRAWL_CONFIG['max_workers'],
+                        help=f"全域工作執行緒數 (默認: {CRAWL_CONFIG['max_workers']})")
+    parser.add_argument('--report-interval', type=float, default=CRAWL_CONFIG['report_interval'],
+                        help=f"進度報告間隔秒數，0表示只在結束時報告 (默認: {CRAWL_CONFIG['report_interval']})")
+    parser.add_argument('--follow-links', action=argparse.BooleanOptionalAction, default=CRAWL_CONFIG['follow_links'],
+                        help="跟隨項目連結爬取，--no-follow-links 停用（分頁連結只要網站配置了 pagination 就會跟隨）"
+                             f" (默認: {CRAWL_CONFIG['follow_links']})")
+    parser.add_argument('--max-depth', type=int, default=CRAWL_CONFIG['max_depth'],
+                        help=f"跟隨連結的最大深度 (默認: {CRAWL_CONFIG['max_depth']})")
+    parser.add_argument('--max-pages', type=int, default=CRAWL_CONFIG['max_pages'],
+                        help=f"每個網站最多爬取的頁數 (默認: {CRAWL_CONFIG['max_pages']})")
+    parser.add_argument('--output-dir', type=str, default=CRAWL_CONFIG['output_dir'],
+                        help='各網站的輸出目錄 (默認: data/sites)')
+    parser.add_argument('--no-conditional', action='store_true',
+                        help='不使用條件請求（ETag / Last-Modified），每次都下載並解析完整頁面')
+    args = parser.parse_args()
+    
+    sites = TARGET_SITES
+    if args.sites:
+        unknown = [name for name in args.sites if name not in TARGET_SITES]
+        if unknown:
+            parser.error(f"未配置的網站: {', '.join(unknown)}")
+        sites = {name: TARGET_SITES[name] for name in args.sites}
+    
+    os.makedirs(args.output_dir, exist_ok=True)
+    
+    # 條件請求：未變更的頁面沿用上次的解析結果
+    validators = None
+    if not args.no_conditional:
+        validators = ValidatorStore(CRAWL_CONFIG['validators_path'])
+        validators.load()
+    
+    # 執行爬取
+    scheduler = CrawlScheduler(sites, max_workers=args.workers, report_interval=args.report_interval,
+                               follow_links=args.follow_links, max_depth=args.max_depth, max_pages=args.max_pages,
+                               validators=validators)
+    results = scheduler.run()
+    if validators is not None:
+        validators.save()
+        stats = validators.stats()
+        logger.info(f"條件請求: {stats['not_modified']} 頁未變更，{stats['modified']} 頁重新下載")
+    
+    # 各網站分別輸出
+    for site_type, data in results.items():
+        output_path = os.path.join(args.output_dir, f"{site_type}.json")
+        DataFormatter.format_as_json(data, output_path)
+        logger.info(f"[{site_type}] {len(data.items)} 個項目已保存: {output_path}")
+    
+    # 吞吐量報告
+    report_path = os.path.join(args.output_dir, 'crawl_report.json')
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(scheduler.report(), f, ensure_ascii=False, indent=2)
+    logger.info(f"爬取報告已保存: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
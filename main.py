@@ -1,14 +1,21 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import logging
 import os
 import datetime
 import argparse
+import sys
 from app import logger
-from app.config import OUTPUT_FILES
+from app.config import PET_SCRAPER_CONFIG
 from app.controllers.pet_gov_tw_scraper import PetGovTwScraper, ANIMAL_TYPE
+from app.utils.cache import ResponseCache
+from app.utils.checkpoint import CheckpointJournal
+from app.models.record_store import RecordStore
+from app.utils.retry import CircuitOpenError
+from app.utils.helpers import GRANULARITIES
 from app.views.data_formatter import DataFormatter
+from app.views.rollups import format_rollups_js
+from app.views.shards import write_shards
 
 def main():
     """主函數：運行爬蟲並輸出結果"""
@@ -22,6 +29,33 @@ def main():
                         help='輸出目錄 (默認: data)')
     parser.add_argument('--animal-type', type=str, choices=['dog', 'cat', 'all'], default='all',
                         help='動物類型: dog-狗, cat-貓, all-全部 (默認: all)')
+    parser.add_argument('--granularity', type=str, choices=GRANULARITIES,
+                        default=PET_SCRAPER_CONFIG['granularity'],
+                        help=f"時間粒度 (默認: {PET_SCRAPER_CONFIG['granularity']})")
+    parser.add_argument('--workers', type=int, default=PET_SCRAPER_CONFIG['max_workers'],
+                        help=f"並行抓取的工作執行緒數 (默認: {PET_SCRAPER_CONFIG['max_workers']})")
+    parser.add_argument('--rps', type=float, default=PET_SCRAPER_CONFIG['requests_per_second'],
+                        help=f"全域每秒請求數上限，0表示不限速 (默認: {PET_SCRAPER_CONFIG['requests_per_second']})")
+    parser.add_argument('--cache-dir', type=str, default=PET_SCRAPER_CONFIG['cache_dir'],
+                        help='API回應快取目錄 (默認: data/cache)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='停用API回應快取，所有數據重新下載')
+    parser.add_argument('--incremental', action='store_true',
+                        help='增量模式：沿用既有輸出，只抓取缺少或可能過期的分區')
+    parser.add_argument('--stale-months', type=int, default=3,
+                        help='增量模式下，結束於最近幾個月內的分區會重新抓取 (默認: 3)')
+    parser.add_argument('--resume', action='store_true',
+                        help='從檢查點日誌恢復，略過上次中斷前已完成的分區')
+    parser.add_argument('--checkpoint', type=str, default=PET_SCRAPER_CONFIG['checkpoint_path'],
+                        help='分區檢查點日誌路徑 (默認: data/checkpoint.jsonl)')
+    parser.add_argument('--report-details', action='store_true',
+                        help='在文字報告的樞紐摘要之後附上逐項明細')
+    parser.add_argument('--db', type=str, nargs='?', const=PET_SCRAPER_CONFIG['db_path'],
+                        help='同時寫入 SQLite 資料庫（只更新有變更的記錄）；增量模式優先從資料庫讀取既有數據 '
+                             '(未指定路徑時: data/pet_registration.db)')
+    parser.add_argument('--shards', type=str, nargs='?', const=PET_SCRAPER_CONFIG['shards_dir'],
+                        help='另外按年份×動物類型輸出分片與清單，供前端按需載入；內容未變更的分片不會重寫 '
+                             '(未指定路徑時: public/data/shards)')
     args = parser.parse_args()
     
     # 確保輸出目錄存在
@@ -30,6 +64,8 @@ def main():
     # 設定輸出檔案路徑
     json_path = os.path.join(args.output_dir, 'pet_registration_data.json')
     js_path = os.path.join('public/js', 'pet_registration_data.js')
+    columnar_js_path = os.path.join('public/js', 'pet_registration_columnar.js')
+    rollups_js_path = os.path.join('public/js', 'pet_registration_rollups.js')
     report_path = os.path.join(args.output_dir, 'pet_registration_report.txt')
     
     # 獲取當前年份（如果未指定結束年份）
@@ -49,36 +85,99 @@ def main():
         animal_type_str = "狗和貓"
     
     logger.info(f"開始執行{animal_type_str}寵物登記資料爬蟲...")
-    logger.info(f"爬取範圍: {args.start_year} 年 至 {end_year} 年")
+    logger.info(f"爬取範圍: {args.start_year} 年 至 {end_year} 年（粒度: {args.granularity}）")
     
     # 初始化寵物登記網站爬蟲
-    scraper = PetGovTwScraper()
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(args.cache_dir, PET_SCRAPER_CONFIG['cache_max_bytes'])
+    checkpoint = CheckpointJournal(args.checkpoint)
+    if args.resume:
+        checkpoint.load()
+    else:
+        # 全新執行時清除上次遺留的檢查點
+        checkpoint.clear()
+    scraper = PetGovTwScraper(max_workers=args.workers, requests_per_second=args.rps,
+                              cache=cache, checkpoint=checkpoint)
+    
+    store = RecordStore(args.db) if args.db else None
     
     # 執行爬蟲
-    data = scraper.run(args.start_year, end_year, animal_types)
+    try:
+        existing = None
+        if args.incremental:
+            if store is not None and store.count():
+                # 以資料庫逐分區計數規劃抓取，抓取完成後才載入既有記錄
+                existing = store
+                logger.info(f"從資料庫規劃增量抓取（既有 {store.count()} 條數據）: {args.db}")
+            else:
+                existing = DataFormatter.load_json(json_path)
+                if existing is not None and PetGovTwScraper.is_mock_data(existing):
+                    logger.warning(f"既有輸出為模擬數據，不予沿用: {json_path}")
+                    existing = None
+        if existing is not None:
+            data = scraper.run_incremental(existing, args.start_year, end_year, animal_types,
+                                           args.stale_months, args.granularity)
+            stats = scraper.incremental_stats
+            logger.info(f"增量模式: 沿用 {stats['reused_partitions']} 個分區，"
+                        f"重新抓取 {stats['refetched_partitions']} 個分區，"
+                        f"失敗 {stats['failed_partitions']} 個分區")
+        else:
+            if args.incremental:
+                logger.info(f"找不到既有輸出 {json_path}，改為完整爬取")
+            data = scraper.run(args.start_year, end_year, animal_types, args.granularity)
+    except CircuitOpenError as e:
+        # 斷路器開啟代表網站持續無法連線：保留檢查點供 --resume 使用，並以非零狀態結束
+        logger.error(f"爬蟲中止: {e}")
+        logger.info(f"已完成的分區保留在檢查點日誌: {args.checkpoint}")
+        sys.exit(1)
     
     # 輸出結果
     if data.items:
-        logger.info(f"成功爬取 {len(data.items)} 條數據")
+        logger.info(f"成功爬取 {len(data.items)} 條數據（會話預熱 {scraper.warmup_count} 次）")
         
-        # 保存為JSON
-        DataFormatter.format_as_json(data, json_path)
+        # 保存為JSON及JS變量（用於GitHub Pages），單次遍歷同時寫入
+        DataFormatter.format_as_json_and_js(data, json_path, js_path, 'petRegistrationData')
         logger.info(f"數據已保存為JSON: {json_path}")
-        
-        # 保存為JS變量（用於GitHub Pages）
-        DataFormatter.format_as_js(data, js_path, 'petRegistrationData')
         logger.info(f"數據已保存為JS變量: {js_path}")
         
+        # 保存為欄式JS變量（儀表板使用的精簡格式）
+        DataFormatter.format_as_columnar_js(data, columnar_js_path, 'petRegistrationData')
+        logger.info(f"數據已保存為欄式JS變量: {columnar_js_path}")
+        
+        # 保存儀表板使用的預先彙總表
+        format_rollups_js(data, rollups_js_path)
+        logger.info(f"彙總表已保存為JS變量: {rollups_js_path}")
+        
+        # 保存按需載入的分片（只重寫內容有變更的分片）
+        if args.shards:
+            write_shards(data, args.shards)
+            logger.info(f"分片已保存: {args.shards}")
+        
         # 生成報告
-        report = DataFormatter.format_report(data)
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report)
+        DataFormatter.format_report_file(data, report_path, details=args.report_details)
         logger.info(f"報告已生成: {report_path}")
+        
+        # 寫入資料庫（未變更的記錄不會被改寫）；模擬數據不寫入，以免覆蓋真實的歷史記錄
+        if store is not None and PetGovTwScraper.is_mock_data(data):
+            logger.warning(f"模擬數據不寫入資料庫: {args.db}")
+        elif store is not None:
+            # 改變粒度的年份先刪除舊粒度的記錄，資料庫中每個年份只保留單一粒度
+            for year, animal in scraper.incremental_stats.get('regranulated', []):
+                store.delete(year=int(year), animal=animal)
+            store.upsert_data(data)
+            logger.info(f"數據已寫入資料庫: {args.db}")
+        
+        # 所有分區都成功時檢查點已無用途；仍有失敗分區時保留，供 --resume 只補抓失敗的部分
+        if scraper.failed_partitions == 0:
+            checkpoint.clear()
     else:
         logger.warning("未爬取到任何數據")
         if data.error:
             logger.error(f"錯誤信息: {data.error}")
     
+    if store is not None:
+        store.close()
     logger.info("爬蟲執行完成")
 
 
@@ -10,6 +10,26 @@ let waterfallChart = null;
 let animatedMap = null;
 let taiwanMap = null;
 
+// 控制圖判異規則代碼（app/views/analytics.py）對應的說明與嚴重程度
+const CONTROL_RULES = {
+    beyond3Sigma: { rule: '超出控制限', severity: 'high' },
+    runOf7: { rule: '連續7點在中心線同一側', severity: 'medium' },
+    twoBeyond2Sigma: { rule: '連續2點超過2σ線', severity: 'medium' }
+};
+
+/**
+ * 取得 Python 端預先計算的統計分析結果
+ * 彙總表與原始數據來自同一次爬取時才使用，否則返回null，由瀏覽器自行計算
+ */
+function getPrecomputedAnalytics() {
+    if (typeof petRegistrationRollups === 'undefined' || !petRegistrationRollups ||
+        !petRegistrationRollups.analytics ||
+        petRegistrationRollups.last_updated !== petRegistrationData.last_updated) {
+        return null;
+    }
+    return petRegistrationRollups.analytics;
+}
+
 /**
  * 等待所有資源載入完成
  */
@@ -130,15 +150,19 @@ function updateOverviewStats() {
  * 初始化控制圖
  */
 function initControlChart() {
-    // 準備全國年度絕育率數據
-    const yearlyNeuteringRates = prepareYearlyNeuteringRates();
+    // 準備全國年度絕育率數據（有預先計算的結果時直接使用其控制限與異常點）
+    const analytics = getPrecomputedAnalytics();
+    const yearlyNeuteringRates = analytics ?
+        { labels: analytics.periods, values: analytics.controlChart.national.values } :
+        prepareYearlyNeuteringRates();
     
     controlChart = new ControlChart('control-chart-canvas');
     const stats = controlChart.createChart(
         yearlyNeuteringRates.values,
         yearlyNeuteringRates.labels,
         '全國寵物絕育率統計控制圖',
-        '絕育率 (%)'
+        '絕育率 (%)',
+        analytics ? precomputedControlChart(analytics.controlChart.national) : null
     );
     
     // 更新統計參數顯示
@@ -169,6 +193,30 @@ function prepareYearlyNeuteringRates() {
     return { labels: years, values: values };
 }
 
+/**
+ * 將預先計算的控制限與判異結果轉換為 ControlChart 使用的格式
+ */
+function precomputedControlChart(national) {
+    const sigma = national.sigma;
+    return {
+        limits: {
+            centerLine: national.centerLine,
+            upperControlLimit: national.upperControlLimit,
+            lowerControlLimit: national.lowerControlLimit,
+            meanMovingRange: sigma * 1.128,
+            upperRangeLimit: 3.267 * sigma * 1.128,
+            lowerRangeLimit: 0,
+            sigma: sigma
+        },
+        outliers: national.violations.map(([index, code]) => ({
+            index: index,
+            value: national.values[index],
+            rule: CONTROL_RULES[code].rule,
+            severity: CONTROL_RULES[code].severity
+        }))
+    };
+}
+
 /**
  * 更新控制圖統計顯示
  */
@@ -233,7 +281,11 @@ function initWaterfallChart() {
  * 準備瀑布圖數據
  */
 function prepareWaterfallData(year) {
-    // 這裡使用示例數據，實際應該根據真實數據計算
+    const precomputed = preparePrecomputedWaterfall(year, 'registrations');
+    if (precomputed) {
+        return precomputed;
+    }
+    // 沒有預先計算的結果時使用示例數據
     return [
         { label: `${year-1}年基準`, value: 50000, type: 'start' },
         { label: '新北市', value: 3245, type: 'change' },
@@ -258,7 +310,10 @@ function updateWaterfallInsights(changes) {
     const topContributor = positiveChanges.reduce((max, current) => 
         current.value > max.value ? current : max, positiveChanges[0]);
     
-    const insights = `2023年全國寵物登記數量較前年增加${changePercent}%，主要由${topContributor.label}(+${topContributor.value.toLocaleString()})等都會區推動。`;
+    const year = parseInt(changes.find(c => c.type === 'end').label);
+    const insights = topContributor ?
+        `${year}年全國寵物登記數量較前年${totalChange >= 0 ? '增加' : '減少'}${Math.abs(changePercent)}%，主要由${topContributor.label}(+${topContributor.value.toLocaleString()})等縣市推動。` :
+        `${year}年全國寵物登記數量較前年${totalChange >= 0 ? '增加' : '減少'}${Math.abs(changePercent)}%，各縣市均未增加。`;
     
     document.getElementById('waterfall-insights').textContent = insights;
 }
@@ -470,7 +525,11 @@ function bindEventListeners() {
  * 準備絕育數量瀑布圖數據
  */
 function prepareNeuteringWaterfallData(year) {
-    // 示例數據，實際應根據真實數據計算
+    const precomputed = preparePrecomputedWaterfall(year, 'neutering');
+    if (precomputed) {
+        return precomputed;
+    }
+    // 沒有預先計算的結果時使用示例數據
     return [
         { label: `${year-1}年基準`, value: 25000, type: 'start' },
         { label: '新北市', value: 1523, type: 'change' },
@@ -488,7 +547,11 @@ function prepareNeuteringWaterfallData(year) {
  * 準備絕育率瀑布圖數據
  */
 function prepareRateWaterfallData(year) {
-    // 示例數據，實際應根據真實數據計算
+    const precomputed = preparePrecomputedWaterfall(year, 'rate');
+    if (precomputed) {
+        return precomputed;
+    }
+    // 沒有預先計算的結果時使用示例數據
     return [
         { label: `${year-1}年基準`, value: 65.2, type: 'start' },
         { label: '台北市', value: 2.3, type: 'change' },
@@ -501,6 +564,39 @@ function prepareRateWaterfallData(year) {
     ];
 }
 
+/**
+ * 由預先計算的各縣市貢獻建立瀑布圖數據
+ * 列出貢獻絕對值最大的5個縣市，其餘合併為「其他縣市」
+ * @param {Number} year - 分析年份
+ * @param {String} metric - 'registrations'、'neutering' 或 'rate'
+ * @returns {Array|null} 沒有預先計算的結果或該年份沒有上一年時返回null
+ */
+function preparePrecomputedWaterfall(year, metric) {
+    const analytics = getPrecomputedAnalytics();
+    if (!analytics) {
+        return null;
+    }
+    const index = analytics.years.indexOf(String(year));
+    const waterfall = analytics.waterfall[metric];
+    if (index < 1 || !waterfall.contributions[index]) {
+        return null;
+    }
+
+    const digits = metric === 'rate' ? 2 : 0;
+    const round = value => Number(value.toFixed(digits));
+    const contributions = waterfall.contributions[index]
+        .map((value, i) => ({ label: analytics.cities[i], value: value || 0 }))
+        .sort((a, b) => Math.abs(b.value) - Math.abs(a.value));
+    const others = contributions.slice(5).reduce((sum, c) => sum + c.value, 0);
+
+    return [
+        { label: `${year - 1}年基準`, value: round(waterfall.totals[index - 1]), type: 'start' },
+        ...contributions.slice(0, 5).map(c => ({ label: c.label, value: round(c.value), type: 'change' })),
+        { label: '其他縣市', value: round(others), type: 'change' },
+        { label: `${year}年總計`, value: round(waterfall.totals[index]), type: 'end' }
+    ];
+}
+
 /**
  * 獲取指標名稱
  */
@@ -634,25 +730,9 @@ function analyzeHotspots() {
         return;
     }
 
-    // 計算Z-score進行熱點檢測
-    const values = Object.values(yearData).map(d => d[metric]).filter(v => v > 0);
-    const mean = values.reduce((sum, val) => sum + val, 0) / values.length;
-    const variance = values.reduce((sum, val) => sum + Math.pow(val - mean, 2), 0) / values.length;
-    const stdDev = Math.sqrt(variance);
-
-    const hotspots = [];
-    const coldspots = [];
-
-    Object.keys(yearData).forEach(city => {
-        const value = yearData[city][metric];
-        const zscore = (value - mean) / stdDev;
-        
-        if (zscore > 1.96) { // 95% 信賴水準
-            hotspots.push({ city, value, zscore });
-        } else if (zscore < -1.96) {
-            coldspots.push({ city, value, zscore });
-        }
-    });
+    // 優先使用預先計算的 Getis-Ord Gi*，否則以Z-score進行熱點檢測
+    const { hotspots, coldspots } = precomputedHotspots(currentYear, metric, yearData) ||
+        zScoreHotspots(yearData, metric);
 
     // 排序
     hotspots.sort((a, b) => b.zscore - a.zscore);
@@ -686,8 +766,27 @@ function analyzeHotspotsInline() {
         return;
     }
 
-    // 計算Z-score進行熱點檢測
-    const values = Object.values(yearData).map(d => d[selectedMetric]).filter(v => v > 0);
+    // 優先使用預先計算的 Getis-Ord Gi*，否則以Z-score進行熱點檢測
+    const { hotspots, coldspots } = precomputedHotspots(selectedYear, selectedMetric, yearData) ||
+        zScoreHotspots(yearData, selectedMetric);
+
+    // 排序
+    hotspots.sort((a, b) => b.zscore - a.zscore);
+    coldspots.sort((a, b) => a.zscore - b.zscore);
+
+    // 在頁面內顯示結果
+    const report = generateHotspotReportInline(hotspots, coldspots, selectedMetric, selectedYear);
+    showInlineAnalysisResults('熱點檢測分析', report);
+    
+    // 在地圖上高亮顯示熱點
+    highlightHotspotsOnMap(hotspots, coldspots);
+}
+
+/**
+ * 以各縣市數值的Z-score檢測熱點與冷點
+ */
+function zScoreHotspots(yearData, metric) {
+    const values = Object.values(yearData).map(d => d[metric]).filter(v => v > 0);
     const mean = values.reduce((sum, val) => sum + val, 0) / values.length;
     const variance = values.reduce((sum, val) => sum + Math.pow(val - mean, 2), 0) / values.length;
     const stdDev = Math.sqrt(variance);
@@ -696,7 +795,7 @@ function analyzeHotspotsInline() {
     const coldspots = [];
 
     Object.keys(yearData).forEach(city => {
-        const value = yearData[city][selectedMetric];
+        const value = yearData[city][metric];
         const zscore = (value - mean) / stdDev;
         
         if (zscore > 1.96) { // 95% 信賴水準
@@ -706,16 +805,35 @@ function analyzeHotspotsInline() {
         }
     });
 
-    // 排序
-    hotspots.sort((a, b) => b.zscore - a.zscore);
-    coldspots.sort((a, b) => a.zscore - b.zscore);
+    return { hotspots, coldspots };
+}
 
-    // 在頁面內顯示結果
-    const report = generateHotspotReportInline(hotspots, coldspots, selectedMetric, selectedYear);
-    showInlineAnalysisResults('熱點檢測分析', report);
-    
-    // 在地圖上高亮顯示熱點
-    highlightHotspotsOnMap(hotspots, coldspots);
+/**
+ * 以預先計算的 Getis-Ord Gi* z 分數檢測熱點與冷點（鄰域包含縣市本身）
+ * @returns {Object|null} 沒有預先計算的結果時返回null
+ */
+function precomputedHotspots(year, metric, yearData) {
+    const analytics = getPrecomputedAnalytics();
+    const index = analytics ? analytics.years.indexOf(String(year)) : -1;
+    if (index < 0 || !analytics.spatial[metric]) {
+        return null;
+    }
+
+    const hotspots = [];
+    const coldspots = [];
+    analytics.spatial[metric].giStar[index].forEach((zscore, i) => {
+        const city = analytics.cities[i];
+        if (zscore === null || !yearData[city]) {
+            return;
+        }
+        const value = yearData[city][metric];
+        if (zscore > 1.96) {
+            hotspots.push({ city, value, zscore });
+        } else if (zscore < -1.96) {
+            coldspots.push({ city, value, zscore });
+        }
+    });
+    return { hotspots, coldspots };
 }
 
 /**
@@ -808,7 +926,7 @@ function calculateSpatialAutocorrelation() {
     }
 
     // 計算全域Moran's I
-    const moransI = calculateMoransI(yearData, metric);
+    const moransI = precomputedMoransI(currentYear, metric) || calculateMoransI(yearData, metric);
     
     // 計算局域指標(LISA)
     const lisaResults = calculateLISA(yearData, metric);
@@ -877,48 +995,70 @@ function calculateMoransI(yearData, metric) {
 }
 
 /**
- * 建立空間權重矩陣 (簡化版本)
+ * 取得預先計算的全域Moran's I（鄰接矩陣與常態假設下的變異數見 app/views/analytics.py）
+ * @returns {Object|null} 沒有預先計算的結果時返回null
+ */
+function precomputedMoransI(year, metric) {
+    const analytics = getPrecomputedAnalytics();
+    const index = analytics ? analytics.years.indexOf(String(year)) : -1;
+    if (index < 0 || !analytics.spatial[metric] || analytics.spatial[metric].moransI[index] === null) {
+        return null;
+    }
+    const spatial = analytics.spatial[metric];
+    return {
+        moransI: spatial.moransI[index],
+        expectedI: spatial.expectedI[index],
+        varianceI: spatial.varianceI[index],
+        zScore: spatial.zScore[index],
+        pValue: spatial.pValue[index],
+        interpretation: interpretMoransI(spatial.moransI[index], spatial.pValue[index])
+    };
+}
+
+/**
+ * 相鄰（陸地接壤）的縣市，與 app/views/analytics.py 的 COUNTY_BORDERS 相同；離島縣市沒有鄰居
+ */
+const COUNTY_BORDERS = [
+    ['臺北市', '新北市'], ['基隆市', '臺北市'], ['基隆市', '新北市'],
+    ['新北市', '桃園市'], ['新北市', '宜蘭縣'],
+    ['桃園市', '新竹縣'], ['桃園市', '新竹市'], ['桃園市', '宜蘭縣'],
+    ['新竹市', '新竹縣'], ['新竹縣', '苗栗縣'], ['新竹縣', '臺中市'], ['新竹縣', '宜蘭縣'],
+    ['苗栗縣', '臺中市'],
+    ['臺中市', '彰化縣'], ['臺中市', '南投縣'], ['臺中市', '宜蘭縣'], ['臺中市', '花蓮縣'],
+    ['彰化縣', '南投縣'], ['彰化縣', '雲林縣'],
+    ['南投縣', '雲林縣'], ['南投縣', '嘉義縣'], ['南投縣', '高雄市'], ['南投縣', '花蓮縣'],
+    ['雲林縣', '嘉義縣'],
+    ['嘉義縣', '嘉義市'], ['嘉義縣', '臺南市'], ['嘉義縣', '高雄市'],
+    ['臺南市', '高雄市'],
+    ['高雄市', '屏東縣'], ['高雄市', '臺東縣'], ['高雄市', '花蓮縣'],
+    ['屏東縣', '臺東縣'],
+    ['宜蘭縣', '花蓮縣'], ['花蓮縣', '臺東縣']
+];
+
+/**
+ * 建立二元對稱的空間權重矩陣
+ * 有預先計算的結果時使用其鄰接表（analytics.neighbors），使 LISA、鄰近效應與預先計算的
+ * 全域 Moran's I 使用同一個權重矩陣；否則使用 COUNTY_BORDERS
+ * @param {Array} cities - 縣市名稱，決定矩陣的列與欄順序
+ * @returns {Array} n×n 權重矩陣
  */
 function createSpatialWeights(cities) {
     const n = cities.length;
     const weights = Array(n).fill().map(() => Array(n).fill(0));
-    
-    // 簡化的鄰近關係 (基於縣市名稱相似性和地理常識)
-    const adjacencyMap = {
-        '臺北市': ['新北市', '基隆市'],
-        '新北市': ['臺北市', '基隆市', '桃園市', '宜蘭縣'],
-        '桃園市': ['新北市', '新竹縣', '新竹市'],
-        '臺中市': ['苗栗縣', '彰化縣', '南投縣'],
-        '臺南市': ['嘉義縣', '高雄市'],
-        '高雄市': ['臺南市', '屏東縣'],
-        '基隆市': ['臺北市', '新北市'],
-        '新竹市': ['桃園市', '新竹縣'],
-        '新竹縣': ['桃園市', '新竹市', '苗栗縣'],
-        '苗栗縣': ['新竹縣', '臺中市'],
-        '彰化縣': ['臺中市', '南投縣', '雲林縣'],
-        '南投縣': ['臺中市', '彰化縣', '雲林縣'],
-        '雲林縣': ['彰化縣', '南投縣', '嘉義縣'],
-        '嘉義縣': ['雲林縣', '臺南市'],
-        '嘉義市': ['嘉義縣'],
-        '屏東縣': ['高雄市'],
-        '宜蘭縣': ['新北市'],
-        '花蓮縣': ['宜蘭縣', '臺東縣'],
-        '臺東縣': ['花蓮縣'],
-        '澎湖縣': [],
-        '金門縣': [],
-        '連江縣': []
-    };
-    
-    cities.forEach((city, i) => {
-        const neighbors = adjacencyMap[city] || [];
-        neighbors.forEach(neighbor => {
-            const j = cities.indexOf(neighbor);
-            if (j !== -1) {
-                weights[i][j] = 1;
-            }
-        });
+
+    const analytics = getPrecomputedAnalytics();
+    const borders = analytics && analytics.neighbors ?
+        analytics.neighbors.flatMap((neighbors, i) => neighbors.map(j => [analytics.cities[i], analytics.cities[j]])) :
+        COUNTY_BORDERS;
+
+    borders.forEach(([a, b]) => {
+        const i = cities.indexOf(a);
+        const j = cities.indexOf(b);
+        if (i !== -1 && j !== -1 && i !== j) {
+            weights[i][j] = weights[j][i] = 1;
+        }
     });
-    
+
     return weights;
 }
 
@@ -1650,7 +1790,7 @@ function calculateSpatialAutocorrelationInline() {
     }
 
     // 計算全域Moran's I
-    const moransI = calculateMoransI(yearData, selectedMetric);
+    const moransI = precomputedMoransI(selectedYear, selectedMetric) || calculateMoransI(yearData, selectedMetric);
     
     // 計算局域指標(LISA)
     const lisaResults = calculateLISA(yearData, selectedMetric);
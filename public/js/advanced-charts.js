@@ -107,10 +107,11 @@ class ControlChart {
      * @param {Array} labels - 時間標籤
      * @param {String} title - 圖表標題
      * @param {String} metric - 指標名稱
+     * @param {Object} precomputed - 預先計算的 { limits, outliers }，為null時在此計算
      */
-    createChart(data, labels, title = '控制圖', metric = '絕育率') {
-        const limits = this.calculateControlLimits(data);
-        const outliers = this.detectOutliers(data, limits);
+    createChart(data, labels, title = '控制圖', metric = '絕育率', precomputed = null) {
+        const limits = precomputed ? precomputed.limits : this.calculateControlLimits(data);
+        const outliers = precomputed ? precomputed.outliers : this.detectOutliers(data, limits);
         
         // 標記異常點
         const pointColors = data.map((_, index) => {
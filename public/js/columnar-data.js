@@ -0,0 +1,65 @@
+/**
+ * 寵物登記統計儀表板 - 欄式數據解碼模組
+ * 將 Python 端輸出的欄式數據（DataFormatter.format_as_columnar_js）還原為逐項格式
+ */
+
+/**
+ * 欄式格式中的浮點數欄位，還原時固定保留兩位小數
+ */
+const COLUMNAR_FLOAT_FIELDS = ['絕育率(E-F)/(A-B)', '繁殖管理率(E-F)+(G-H)/(A-B)'];
+
+/**
+ * 將欄式數據還原為 { items: [...], cities, years, animalTypes } 結構
+ * @param {Object} columnar - 欄式數據
+ * @returns {Object} 與原逐項格式相同的數據
+ */
+function expandColumnarData(columnar) {
+    if (columnar.format !== 'pet-registration-columnar' || columnar.version !== 1) {
+        console.error('不支援的欄式數據格式:', columnar.format, columnar.version);
+        return { items: [], cities: [], years: [], animalTypes: [] };
+    }
+
+    const dictionaries = columnar.dictionaries || {};
+    const columnNames = Object.keys(columnar.columns);
+    const items = new Array(columnar.rowCount);
+
+    for (let i = 0; i < columnar.rowCount; i++) {
+        const row = {};
+
+        columnNames.forEach(name => {
+            const value = columnar.columns[name][i];
+            if (value === null || value === undefined) return;
+
+            if (dictionaries[name]) {
+                row[name] = dictionaries[name][value];
+            } else if (COLUMNAR_FLOAT_FIELDS.includes(name) && typeof value === 'number') {
+                row[name] = value.toFixed(2);
+            } else {
+                row[name] = String(value);
+            }
+        });
+
+        // 重建逐項格式中的標題、描述等衍生欄位（非年度粒度的數據以期間標籤為標題與日期）
+        const year = row.年份 || '';
+        const period = row.期間;
+        const city = row.縣市 || '全國';
+        const animalType = row.動物類型 || '未知';
+        items[i] = {
+            title: `${period || year + '年'} ${city}${animalType}寵物登記數據`,
+            link: columnar.link,
+            description: `登記數: ${row['登記數(A)'] || '0'}, 絕育率: ${row['絕育率(E-F)/(A-B)'] || '0'}%`,
+            date: period || year,
+            ...row
+        };
+    }
+
+    return {
+        last_updated: columnar.last_updated,
+        source_url: columnar.source_url,
+        error: columnar.error,
+        items: items,
+        cities: columnar.cities,
+        years: columnar.years,
+        animalTypes: columnar.animalTypes
+    };
+}
@@ -3,17 +3,7 @@
  * 處理數據可視化和互動功能
  */
 
-// 確保數據已載入
-document.addEventListener('DOMContentLoaded', function() {
-    // 檢查數據是否存在
-    if (typeof petRegistrationData === 'undefined') {
-        showError('數據載入失敗', '無法載入寵物登記數據，請確認爬蟲已正確執行。');
-        return;
-    }
-    
-    // 初始化儀表板
-    initDashboard();
-});
+// 儀表板的數據載入與初始化由 main.js 負責（彙總表或分片，頁面不再載入逐項數據）
 
 /**
  * 初始化儀表板
@@ -9,6 +9,13 @@
  * @returns {Object} 處理後的數據
  */
 function processData(rawData) {
+    // Python 端已輸出同一份數據的彙總表時，直接使用預先計算的結果；
+    // 只載入部分分片的數據（shard-loader.js）與全量彙總表不一致，需自行計算
+    if (typeof petRegistrationRollups !== 'undefined' && petRegistrationRollups && !rawData.partial &&
+        petRegistrationRollups.last_updated === rawData.last_updated) {
+        return processRollups(petRegistrationRollups);
+    }
+    
     // 獲取所有項目
     const items = rawData.items || [];
     
@@ -49,6 +56,8 @@ function processData(rawData) {
     const years = new Set();
     const cities = new Set();
     const animalTypes = new Set();
+    // 各分組的計數加總，絕育率最後由加總計算（與彙總表相同）
+    const sums = new Map();
     
     // 處理每個數據項
     items.forEach(item => {
@@ -56,10 +65,11 @@ function processData(rawData) {
         const year = item.年份 || '';
         const city = item.縣市 || '';
         const animalType = item.動物類型 || '狗'; // 默認為狗
-        const registrations = parseInt(item['登記數(A)'] || 0, 10);
-        const neuteringCount = parseInt(item['絕育數(E)'] || 0, 10);
-        const neuteringRate = parseFloat(item['絕育率(E-F)/(A-B)'] || 0);
-        const registrationUnits = parseInt(item['登記單位數'] || 0, 10);
+        // 「合計」列與各縣市重複，不計入（與彙總表相同）
+        if (city === '合計') return;
+        const counts = parseCounts(item);
+        const registrations = counts.registrations;
+        const registrationUnits = counts.registrationUnits;
         
         // 添加到集合
         if (year) years.add(year);
@@ -68,6 +78,18 @@ function processData(rawData) {
         
         // 更新總數據
         result.totalRegistrations += registrations;
+        addCounts(sums, 'all', counts);
+        addCounts(sums, `a|${animalType}`, counts);
+        if (year) {
+            addCounts(sums, `y|${year}`, counts);
+            addCounts(sums, `y|${year}|${animalType}`, counts);
+        }
+        if (year && city) {
+            addCounts(sums, `c|${city}`, counts);
+            addCounts(sums, `c|${city}|${animalType}`, counts);
+            addCounts(sums, `yc|${year}|${city}`, counts);
+            addCounts(sums, `yc|${year}|${city}|${animalType}`, counts);
+        }
         
         // 更新動物類型數據
         if (animalType === '狗' || animalType === '貓') {
@@ -147,10 +169,8 @@ function processData(rawData) {
             
             if (animalType === '狗') {
                 result.yearlyData[year].cityData[city].dogRegistrations += registrations;
-                result.yearlyData[year].cityData[city].dogNeuteringRate = neuteringRate;
             } else if (animalType === '貓') {
                 result.yearlyData[year].cityData[city].catRegistrations += registrations;
-                result.yearlyData[year].cityData[city].catNeuteringRate = neuteringRate;
             }
             
             result.yearlyData[year].cityData[city].registrations += registrations;
@@ -181,10 +201,8 @@ function processData(rawData) {
             
             if (animalType === '狗') {
                 result.cityData[city].yearlyData[year].dogRegistrations += registrations;
-                result.cityData[city].yearlyData[year].dogNeuteringRate = neuteringRate;
             } else if (animalType === '貓') {
                 result.cityData[city].yearlyData[year].catRegistrations += registrations;
-                result.cityData[city].yearlyData[year].catNeuteringRate = neuteringRate;
             }
             
             result.cityData[city].yearlyData[year].registrations += registrations;
@@ -201,7 +219,6 @@ function processData(rawData) {
                 }
                 
                 result.animalTypeData[animalType].yearlyData[year].cityData[city].registrations += registrations;
-                result.animalTypeData[animalType].yearlyData[year].cityData[city].neuteringRate = neuteringRate;
             }
             
             if (result.animalTypeData[animalType].cityData[city]) {
@@ -215,24 +232,15 @@ function processData(rawData) {
                 }
                 
                 result.animalTypeData[animalType].cityData[city].yearlyData[year].registrations += registrations;
-                result.animalTypeData[animalType].cityData[city].yearlyData[year].neuteringRate = neuteringRate;
             }
             
             // 添加到表格數據
-            result.tableData.push({
-                city: city,
-                year: year,
-                animalType: animalType,
-                registrations: registrations,
-                neuteringCount: neuteringCount,
-                neuteringRate: neuteringRate,
-                registrationUnits: registrationUnits
-            });
+            result.tableData.push(tableRow(city, year, animalType, counts));
         }
     });
     
-    // 計算平均絕育率等統計數據
-    calculateStatistics(result);
+    // 由計數加總計算各層級的絕育率
+    applyPooledRates(result, sums);
     
     // 將Set轉換為陣列
     result.years = Array.from(years).sort();
@@ -243,130 +251,283 @@ function processData(rawData) {
 }
 
 /**
- * 計算統計數據（平均絕育率等）
- * @param {Object} data - 數據對象
+ * 由 Python 端預先計算的彙總表（app/views/rollups.py）建立與 processData 相同的結構
+ * 
+ * 各層級（全國、縣市、縣市×年份、縣市×年份×動物類型）的登記數與絕育率都已在 Python 端算好
+ * （絕育率由加總後的數值計算），直接放進對應的物件；表格數據即縣市×年份×動物類型表，
+ * 不需要逐項數據。
+ * @param {Object} rollups - 彙總表
+ * @returns {Object} 處理後的數據
  */
-function calculateStatistics(data) {
-    // 針對每個縣市
-    Object.values(data.cityData).forEach(cityData => {
-        let dogNeuteringRateSum = 0;
-        let dogYearsCount = 0;
-        let catNeuteringRateSum = 0;
-        let catYearsCount = 0;
-        
-        Object.values(cityData.yearlyData).forEach(yearData => {
-            if (yearData.dogNeuteringRate > 0) {
-                dogNeuteringRateSum += yearData.dogNeuteringRate;
-                dogYearsCount += 1;
-            }
-            
-            if (yearData.catNeuteringRate > 0) {
-                catNeuteringRateSum += yearData.catNeuteringRate;
-                catYearsCount += 1;
-            }
-        });
-        
-        if (dogYearsCount > 0) {
-            cityData.dogNeuteringRate = dogNeuteringRateSum / dogYearsCount;
-        }
-        
-        if (catYearsCount > 0) {
-            cityData.catNeuteringRate = catNeuteringRateSum / catYearsCount;
-        }
-        
-        // 計算總平均絕育率
-        if (dogYearsCount > 0 && catYearsCount > 0) {
-            cityData.avgNeuteringRate = (cityData.dogNeuteringRate + cityData.catNeuteringRate) / 2;
-        } else if (dogYearsCount > 0) {
-            cityData.avgNeuteringRate = cityData.dogNeuteringRate;
-        } else if (catYearsCount > 0) {
-            cityData.avgNeuteringRate = cityData.catNeuteringRate;
-        }
+function processRollups(rollups) {
+    if (rollups.format !== 'pet-registration-rollups' || rollups.version !== 3) {
+        console.error('不支援的彙總表格式:', rollups.format, rollups.version);
+        return processData({ items: [] });
+    }
+    
+    const cities = rollups.cities;
+    const years = rollups.years;
+    const animalTypes = rollups.animalTypes;
+    const rate = value => value === null || value === undefined ? 0 : value;
+    const animalKey = animalType => animalType === '狗' ? 'dog' : (animalType === '貓' ? 'cat' : null);
+    
+    const totals = rollups.totals.all || { registrations: 0, neuteringRate: null };
+    const result = {
+        totalRegistrations: totals.registrations,
+        avgNeuteringRate: rate(totals.neuteringRate),
+        registrationUnits: rollups.city.registrationUnits.reduce((sum, units) => sum + units, 0),
+        lastUpdated: rollups.last_updated || new Date().toISOString(),
+        yearlyData: {},
+        cityData: {},
+        animalTypeData: {},
+        tableData: [],
+        years: years.slice(),
+        cities: cities.slice(),
+        animalTypes: animalTypes.slice().sort()
+    };
+    
+    ['狗', '貓'].concat(animalTypes).forEach(animalType => {
+        if (result.animalTypeData[animalType]) return;
+        const animalTotals = rollups.totals[animalType] || { registrations: 0, neuteringRate: null };
+        result.animalTypeData[animalType] = {
+            totalRegistrations: animalTotals.registrations,
+            avgNeuteringRate: rate(animalTotals.neuteringRate),
+            yearlyData: {},
+            cityData: {}
+        };
     });
     
-    // 針對每個年份
-    Object.values(data.yearlyData).forEach(yearData => {
-        let cityNeuteringRateSum = 0;
-        let cityCount = 0;
-        let dogCityNeuteringRateSum = 0;
-        let dogCityCount = 0;
-        let catCityNeuteringRateSum = 0;
-        let catCityCount = 0;
-        
-        Object.values(yearData.cityData).forEach(cityData => {
-            if (cityData.neuteringRate > 0) {
-                cityNeuteringRateSum += cityData.neuteringRate;
-                cityCount += 1;
-            }
-            
-            if (cityData.dogNeuteringRate > 0) {
-                dogCityNeuteringRateSum += cityData.dogNeuteringRate;
-                dogCityCount += 1;
-            }
-            
-            if (cityData.catNeuteringRate > 0) {
-                catCityNeuteringRateSum += cityData.catNeuteringRate;
-                catCityCount += 1;
-            }
-        });
-        
-        if (cityCount > 0) {
-            yearData.avgNeuteringRate = cityNeuteringRateSum / cityCount;
-        }
-        
-        if (dogCityCount > 0) {
-            yearData.dogNeuteringRate = dogCityNeuteringRateSum / dogCityCount;
-        }
-        
-        if (catCityCount > 0) {
-            yearData.catNeuteringRate = catCityNeuteringRateSum / catCityCount;
+    // 全國各年
+    const national = rollups.national;
+    national.year.forEach((y, i) => {
+        result.yearlyData[years[y]] = {
+            totalRegistrations: national.registrations[i],
+            dogRegistrations: 0,
+            catRegistrations: 0,
+            avgNeuteringRate: rate(national.neuteringRate[i]),
+            dogNeuteringRate: 0,
+            catNeuteringRate: 0,
+            citiesCount: 0,
+            cityData: {}
+        };
+    });
+    
+    // 全國各年×動物類型
+    const nationalAnimal = rollups.nationalAnimal;
+    nationalAnimal.year.forEach((y, i) => {
+        const year = years[y];
+        const animalType = animalTypes[nationalAnimal.animal[i]];
+        const key = animalKey(animalType);
+        if (key) {
+            result.yearlyData[year][`${key}Registrations`] = nationalAnimal.registrations[i];
+            result.yearlyData[year][`${key}NeuteringRate`] = rate(nationalAnimal.neuteringRate[i]);
         }
+        result.animalTypeData[animalType].yearlyData[year] = {
+            registrations: nationalAnimal.registrations[i],
+            neuteringRate: rate(nationalAnimal.neuteringRate[i]),
+            cityData: {}
+        };
     });
     
-    // 針對每個動物類型
-    Object.keys(data.animalTypeData).forEach(animalType => {
-        let cityNeuteringRateSum = 0;
-        let cityCount = 0;
-        
-        Object.values(data.animalTypeData[animalType].cityData).forEach(cityData => {
-            let cityYearNeuteringRateSum = 0;
-            let cityYearCount = 0;
-            
-            Object.values(cityData.yearlyData).forEach(yearData => {
-                if (yearData.neuteringRate > 0) {
-                    cityYearNeuteringRateSum += yearData.neuteringRate;
-                    cityYearCount += 1;
-                }
-            });
-            
-            if (cityYearCount > 0) {
-                cityData.avgNeuteringRate = cityYearNeuteringRateSum / cityYearCount;
-                cityNeuteringRateSum += cityData.avgNeuteringRate;
-                cityCount += 1;
-            }
-        });
-        
-        if (cityCount > 0) {
-            data.animalTypeData[animalType].avgNeuteringRate = cityNeuteringRateSum / cityCount;
+    // 各縣市
+    const cityTable = rollups.city;
+    cityTable.city.forEach((c, i) => {
+        result.cityData[cities[c]] = {
+            totalRegistrations: cityTable.registrations[i],
+            dogRegistrations: 0,
+            catRegistrations: 0,
+            avgNeuteringRate: rate(cityTable.neuteringRate[i]),
+            dogNeuteringRate: 0,
+            catNeuteringRate: 0,
+            registrationUnits: cityTable.registrationUnits[i],
+            yearlyData: {}
+        };
+    });
+    
+    // 各縣市×動物類型
+    const cityAnimal = rollups.cityAnimal;
+    cityAnimal.city.forEach((c, i) => {
+        const city = cities[c];
+        const animalType = animalTypes[cityAnimal.animal[i]];
+        const key = animalKey(animalType);
+        if (key) {
+            result.cityData[city][`${key}Registrations`] = cityAnimal.registrations[i];
+            result.cityData[city][`${key}NeuteringRate`] = rate(cityAnimal.neuteringRate[i]);
         }
+        result.animalTypeData[animalType].cityData[city] = {
+            totalRegistrations: cityAnimal.registrations[i],
+            avgNeuteringRate: rate(cityAnimal.neuteringRate[i]),
+            yearlyData: {}
+        };
     });
     
-    // 計算總平均絕育率
-    let totalCityNeuteringRateSum = 0;
-    let totalCityCount = 0;
+    // 各縣市×年份
+    const cityYear = rollups.cityYear;
+    cityYear.city.forEach((c, i) => {
+        const city = cities[c];
+        const year = years[cityYear.year[i]];
+        const entry = {
+            registrations: cityYear.registrations[i],
+            dogRegistrations: 0,
+            catRegistrations: 0,
+            neuteringRate: rate(cityYear.neuteringRate[i]),
+            dogNeuteringRate: 0,
+            catNeuteringRate: 0
+        };
+        result.yearlyData[year].cityData[city] = { ...entry, registrationUnits: cityYear.registrationUnits[i] };
+        result.cityData[city].yearlyData[year] = entry;
+    });
     
-    Object.values(data.cityData).forEach(cityData => {
-        if (cityData.avgNeuteringRate > 0) {
-            totalCityNeuteringRateSum += cityData.avgNeuteringRate;
-            totalCityCount += 1;
+    // 各縣市×年份×動物類型（同時作為表格數據）
+    const cityYearAnimal = rollups.cityYearAnimal;
+    cityYearAnimal.city.forEach((c, i) => {
+        const city = cities[c];
+        const year = years[cityYearAnimal.year[i]];
+        const animalType = animalTypes[cityYearAnimal.animal[i]];
+        const registrations = cityYearAnimal.registrations[i];
+        const neuteringRate = rate(cityYearAnimal.neuteringRate[i]);
+        const key = animalKey(animalType);
+        if (key) {
+            [result.yearlyData[year].cityData[city], result.cityData[city].yearlyData[year]].forEach(entry => {
+                entry[`${key}Registrations`] = registrations;
+                entry[`${key}NeuteringRate`] = neuteringRate;
+            });
         }
+        result.animalTypeData[animalType].yearlyData[year].cityData[city] = { registrations, neuteringRate };
+        result.animalTypeData[animalType].cityData[city].yearlyData[year] = { registrations, neuteringRate };
+        result.yearlyData[year].citiesCount += 1;
+        result.tableData.push({
+            city: city,
+            year: year,
+            animalType: animalType,
+            registrations: registrations,
+            removals: cityYearAnimal.removals[i],
+            neuteringCount: cityYearAnimal.neutered[i],
+            neuteredRemovals: cityYearAnimal.neuteredRemovals[i],
+            neuteringRate: neuteringRate,
+            registrationUnits: cityYearAnimal.registrationUnits[i]
+        });
     });
     
-    if (totalCityCount > 0) {
-        data.avgNeuteringRate = totalCityNeuteringRateSum / totalCityCount;
+    return result;
+}
+
+/**
+ * 解析數據項的計數欄位
+ * @param {Object} item - 逐項格式的數據項
+ * @returns {Object} 登記數、除戶數、絕育數、絕育除戶數與登記單位數
+ */
+function parseCounts(item) {
+    return {
+        registrations: parseInt(item['登記數(A)'] || 0, 10),
+        removals: parseInt(item['除戶數(B)'] || 0, 10),
+        neutered: parseInt(item['絕育數(E)'] || 0, 10),
+        neuteredRemovals: parseInt(item['絕育除戶數(F)'] || 0, 10),
+        registrationUnits: parseInt(item['登記單位數'] || 0, 10)
+    };
+}
+
+/**
+ * 將計數累加到分組的加總
+ * @param {Map} sums - 分組鍵到加總的映射
+ * @param {String} key - 分組鍵
+ * @param {Object} counts - parseCounts 的結果
+ */
+function addCounts(sums, key, counts) {
+    let entry = sums.get(key);
+    if (!entry) {
+        entry = { registrations: 0, removals: 0, neutered: 0, neuteredRemovals: 0 };
+        sums.set(key, entry);
     }
+    entry.registrations += counts.registrations;
+    entry.removals += counts.removals;
+    entry.neutered += counts.neutered;
+    entry.neuteredRemovals += counts.neuteredRemovals;
+}
+
+/**
+ * 由計數加總計算絕育率 (E-F)/(A-B)，與彙總表（app/views/rollups.py 的 _rate）相同
+ * @param {Object} sums - 分組的加總，可為undefined
+ * @returns {Number} 絕育率（%，小數2位）；沒有數據或分母不為正時為0
+ */
+function pooledNeuteringRate(sums) {
+    if (!sums) return 0;
+    const base = sums.registrations - sums.removals;
+    return base > 0 ? Math.round((sums.neutered - sums.neuteredRemovals) / base * 10000) / 100 : 0;
+}
+
+/**
+ * 建立表格數據列
+ * @param {String} city - 縣市
+ * @param {String} year - 年份
+ * @param {String} animalType - 動物類型
+ * @param {Object} counts - parseCounts 的結果
+ * @returns {Object} 表格數據列
+ */
+function tableRow(city, year, animalType, counts) {
+    return {
+        city: city,
+        year: year,
+        animalType: animalType,
+        registrations: counts.registrations,
+        removals: counts.removals,
+        neuteringCount: counts.neutered,
+        neuteredRemovals: counts.neuteredRemovals,
+        neuteringRate: pooledNeuteringRate(counts),
+        registrationUnits: counts.registrationUnits
+    };
+}
+
+/**
+ * 由各分組的計數加總填入絕育率，並計算登記單位數
+ * 
+ * 各層級的絕育率都由加總後的計數計算，與使用彙總表時的數值相同。
+ * @param {Object} data - 數據對象
+ * @param {Map} sums - processData 累加的分組加總
+ */
+function applyPooledRates(data, sums) {
+    const rate = key => pooledNeuteringRate(sums.get(key));
+    data.avgNeuteringRate = rate('all');
+    
+    Object.entries(data.yearlyData).forEach(([year, yearData]) => {
+        yearData.avgNeuteringRate = rate(`y|${year}`);
+        yearData.dogNeuteringRate = rate(`y|${year}|狗`);
+        yearData.catNeuteringRate = rate(`y|${year}|貓`);
+        Object.entries(yearData.cityData).forEach(([city, cityData]) => {
+            cityData.neuteringRate = rate(`yc|${year}|${city}`);
+            cityData.dogNeuteringRate = rate(`yc|${year}|${city}|狗`);
+            cityData.catNeuteringRate = rate(`yc|${year}|${city}|貓`);
+        });
+    });
     
-    // 計算登記單位數（取最大值）
+    Object.entries(data.cityData).forEach(([city, cityData]) => {
+        cityData.avgNeuteringRate = rate(`c|${city}`);
+        cityData.dogNeuteringRate = rate(`c|${city}|狗`);
+        cityData.catNeuteringRate = rate(`c|${city}|貓`);
+        Object.entries(cityData.yearlyData).forEach(([year, yearData]) => {
+            yearData.neuteringRate = rate(`yc|${year}|${city}`);
+            yearData.dogNeuteringRate = rate(`yc|${year}|${city}|狗`);
+            yearData.catNeuteringRate = rate(`yc|${year}|${city}|貓`);
+        });
+    });
+    
+    Object.entries(data.animalTypeData).forEach(([animalType, animalData]) => {
+        animalData.avgNeuteringRate = rate(`a|${animalType}`);
+        Object.entries(animalData.yearlyData).forEach(([year, yearData]) => {
+            yearData.neuteringRate = rate(`y|${year}|${animalType}`);
+            Object.entries(yearData.cityData).forEach(([city, cityData]) => {
+                cityData.neuteringRate = rate(`yc|${year}|${city}|${animalType}`);
+            });
+        });
+        Object.entries(animalData.cityData).forEach(([city, cityData]) => {
+            cityData.avgNeuteringRate = rate(`c|${city}|${animalType}`);
+            Object.entries(cityData.yearlyData).forEach(([year, yearData]) => {
+                yearData.neuteringRate = rate(`yc|${year}|${city}|${animalType}`);
+            });
+        });
+    });
+    
+    // 登記單位數：各縣市取最大值後加總
     data.registrationUnits = Object.values(data.cityData).reduce(
         (sum, cityData) => sum + cityData.registrationUnits, 0
     );
@@ -406,16 +567,15 @@ function filterData(data, filters) {
     // 重新計算總數據
     result.totalRegistrations = result.tableData.reduce((sum, item) => sum + item.registrations, 0);
     
-    // 重新計算平均絕育率
-    const validNeuteringRates = result.tableData
-        .filter(item => item.neuteringRate > 0)
-        .map(item => item.neuteringRate);
-    
-    if (validNeuteringRates.length > 0) {
-        result.avgNeuteringRate = validNeuteringRates.reduce((sum, rate) => sum + rate, 0) / validNeuteringRates.length;
-    } else {
-        result.avgNeuteringRate = 0;
-    }
+    // 重新計算絕育率（由篩選後的計數加總計算）
+    const sums = new Map();
+    result.tableData.forEach(item => addCounts(sums, 'all', {
+        registrations: item.registrations,
+        removals: item.removals,
+        neutered: item.neuteringCount,
+        neuteredRemovals: item.neuteredRemovals
+    }));
+    result.avgNeuteringRate = pooledNeuteringRate(sums.get('all'));
     
     // 重新計算登記單位數
     const uniqueUnits = new Set();
@@ -88,7 +88,7 @@ function initFilters() {
 /**
  * 套用過濾條件
  */
-function applyFilters() {
+async function applyFilters() {
     // 顯示載入中
     const loadingOverlay = showLoading(document.body);
     
@@ -104,6 +104,18 @@ function applyFilters() {
         city
     };
     
+    // 數據來自分片時，先下載新篩選條件需要的分片（已下載的分片會重複使用）
+    if (window.processedData.fromShards) {
+        try {
+            window.processedData = await loadDashboardData(activeFilters);
+        } catch (error) {
+            console.error('載入分片時出錯:', error);
+            hideLoading(loadingOverlay);
+            showError('數據載入失敗', '無法載入篩選條件需要的數據: ' + error.message);
+            return;
+        }
+    }
+    
     // 過濾數據
     // 使用全局變量processedData
     window.filteredData = filterData(window.processedData, activeFilters);
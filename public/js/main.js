@@ -7,25 +7,58 @@
 let processedData = null;
 let filteredData = null;
 
+// 分片清單（沒有彙總表時才載入）
+let shardManifest = null;
+
 // 確保數據已載入
 document.addEventListener('DOMContentLoaded', function() {
-    // 檢查數據是否存在
-    if (typeof petRegistrationData === 'undefined') {
-        showError('數據載入失敗', '無法載入寵物登記數據，請確認爬蟲已正確執行。');
-        return;
-    }
-    
     // 初始化儀表板
     initDashboard();
 });
 
+/**
+ * 取得儀表板數據
+ * 有彙總表（pet_registration_rollups.js）時直接使用，頁面不需要逐項數據，篩選也不需要再下載；
+ * 否則讀取分片清單（shard-loader.js），只下載篩選條件需要的（年份, 動物類型）分片，
+ * 結果帶有 fromShards 標記，篩選條件變更時需重新載入
+ * @param {Object} filters - 過濾條件（animalType/year，'all' 表示不篩選）
+ * @returns {Promise<Object>} 處理後的數據
+ */
+async function loadDashboardData(filters = {}) {
+    if (typeof petRegistrationRollups !== 'undefined' && petRegistrationRollups) {
+        return processRollups(petRegistrationRollups);
+    }
+    if (typeof petRegistrationData !== 'undefined') {
+        return processData(petRegistrationData);
+    }
+    
+    if (!shardManifest) {
+        shardManifest = await loadShardManifest();
+    }
+    const shardFilters = {};
+    if (filters.year && filters.year !== 'all') {
+        shardFilters.years = [filters.year];
+    }
+    if (filters.animalType && filters.animalType !== 'all') {
+        shardFilters.animalTypes = [filters.animalType === 'dog' ? '狗' : '貓'];
+    }
+    const data = processData(await loadShards(shardManifest, shardFilters));
+    data.fromShards = true;
+    return data;
+}
+
 /**
  * 初始化儀表板
  */
-function initDashboard() {
+async function initDashboard() {
     try {
-        // 處理原始數據
-        processedData = processData(petRegistrationData);
+        try {
+            processedData = await loadDashboardData();
+        } catch (error) {
+            console.error('載入數據時出錯:', error);
+            showError('數據載入失敗', '無法載入寵物登記數據，請確認爬蟲已正確執行。');
+            return;
+        }
         filteredData = processedData;
         
         // 將處理後的數據設為全局變量，便於其他模塊使用
@@ -0,0 +1 @@
+const petRegistrationData = expandColumnarData({"format":"pet-registration-columnar","version":1,"last_updated":"2025-10-06T01:20:49.673603","source_url":"https://www.pet.gov.tw/Web/O302.aspx","error":null,"link":"https://www.pet.gov.tw/Web/O302.aspx","rowCount":1144,"dictionaries":{"縣市":["臺北市","新北市","桃園市","臺中市","臺南市","高雄市","基隆市","新竹市","新竹縣","苗栗縣","彰化縣","南投縣","雲林縣","嘉義市","嘉義縣","屏東縣","宜蘭縣","花蓮縣","臺東縣","澎湖縣","金門縣","連江縣"],"年份":["2000","2001","2002","2003","2004","2005","2006","2007","2008","2009","2010","2011","2012","2013","2014","2015","2016","2017","2018","2019","2020","2021","2022","2023","2024","2025"],"動物類型":["狗","貓"]},"columns":{"縣市":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21],"年份":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25],"動物類型":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],"登記單位數":[118,169,272,354,108,268,164,128,111,280,345,80,154,279,57,81,138,289,230,139,182,193,364,232,342,445,94,133,336,228,221,249,264,171,185,248,167,139,215,276,175,185,280,250,88,145,357,231,450,321,145,264,126,242,163,97,103,295,196,136,149,236,252,85,51,94,121,222,318,279,357,75,322,352,56,66,120,150,229,133,155,176,85,201,208,222,288,176,360,280,116,396,319,171,102,303,180,115,62,56,190,52,105,259,169,251,87,50,230,279,435,238,307,232,270,282,163,267,53,256,292,199,256,231,223,281,239,256,226,152,254,149,265,352,64,147,141,348,350,302,107,50,284,225,95,291,185,96,205,100,76,300,262,254,283,100,301,276,450,87,153,274,287,298,312,115,154,207,129,217,108,203,85,276,259,95,442,165,283,204,172,336,290,291,293,194,146,56,101,223,115,184,136,129,75,101,82,88,207,150,216,274,177,147,348,223,125,203,86,159,97,236,234,162,103,175,215,130,279,80,187,265,337,252,148,414,187,255,193,240,248,196,141,297,158,91,72,152,287,217,293,89,406,255,230,430,220,397,156,354,107,144,313,178,266,176,116,225,227,230,72,231,269,297,168,186,118,375,196,343,88,328,267,209,104,265,213,228,247,96,277,286,189,286,135,122,171,396,192,282,247,385,272,315,295,269,63,278,282,79,206,96,242,194,293,121,132,233,121,282,337,336,339,76,134,261,227,215,309,204,85,250,257,56,244,244,154,66,83,255,199,120,241,133,138,232,147,67,162,283,259,84,180,71,229,195,219,89,196,142,291,193,379,366,86,210,342,232,194,330,69,241,98,152,258,77,207,231,96,182,173,251,56,92,168,298,270,234,313,226,152,223,187,74,354,107,51,190,250,92,65,291,129,159,88,67,159,423,284,358,138,397,216,175,176,227,330,287,99,163,215,86,281,153,238,119,249,77,192,243,140,286,145,118,60,199,128,160,259,60,164,87,193,263,107,264,297,56,53,135,144,153,313,264,415,378,146,340,79,243,207,150,288,285,244,252,136,146,251,127,140,274,420,265,292,88,381,117,190,274,179,199,128,213,79,105,212,268,297,76,203,73,285,264,91,234,354,324,396,223,206,66,165,149,168,141,296,75,105,190,73,228,195,259,283,231,412,172,72,181,321,366,235,285,267,211,132,234,287,119,289,152,189,236,152,294,146,56,411,318,99,265,202,130,144,69,92,234,237,297,274,56,118,269,114,160,298,86,268,300,271,223,327,196,220,417,297,196,186,210,295,120,105,85,180,256,139,167,137,147,150,62,258,450,306,276,91,99,220,339,144,290,126,297,298,207,69,72,237,76,180,226,167,300,285,270,320,441,265,78,94,82,233,142,310,146,113,133,53,202,157,151,82,252,245,291,265,244,97,444,301,399,110,280,122,205,121,129,291,100,172,256,243,146,299,268,81,88,135,147,110,345,384,394,243,265,62,218,207,172,71,293,219,146,229,131,52,59,105,286,183,373,84,232,181,162,322,100,277,207,350,284,253,73,83,189,108,79,117,291,190,195,405,117,121,364,322,441,256,315,269,257,240,101,160,275,260,239,194,256,146,192,83,259,279,138,301,372,132,139,98,229,115,58,340,289,220,154,113,53,129,173,197,267,50,132,319,150,253,166,325,397,69,102,94,266,62,276,293,85,165,67,99,300,98,263,263,85,195,82,210,283,127,175,249,165,211,141,169,212,69,152,80,196,169,237,91,50,296,83,120,75,256,150,351,301,252,88,259,142,72,267,178,61,86,226,64,191,285,136,249,80,349,78,80,262,394,75,270,345,279,174,336,62,72,287,189,291,136,276,236,173,297,66,348,322,109,369,301,145,258,81,92,117,272,291,271,275,263,73,165,102,216,96,55,149,328,136,68,102,439,145,212,338,279,204,328,74,62,165,212,194,221,259,240,65,116,243,433,133,210,306,430,319,318,206,190,165,290,82,131,251,130,255,209,74,239,261,178,121,144,189,158,268,222,214,204,138,187,200,219,82,112,63,111,273,236,135,114,146,262,172,168,96,321,141,328,333,84,292,130,289,90,215,158,60,287,289,225,279,93,281,67,259,334,189,300,274,238,420,243,240,204,51,344,137,128,81,287,129,118,200,177,121,225,98,322,298,224,243,409,388,331,272,192,84,288,271,122,174,267,172,197,113,177,286,160,204,378,315,75,315,120,226,274,253,262,194,262,80,107,94,201,69,162,237,251,241,217,93,172,237,333,303,403,358,237,231,126,293,190,79,71,155,96,163,89,76,231,192,126,266,187,313,142,324,426,402,304,297,115,64,67,230,288,171,282,207,231,70,265,262,225,247,322,88,63,334,424,393,348,87,97,51,320,230,265,102,176,68,53,78,257,133,127,76,303,186,250,330,360,214,283,127,224,182,358,224,231,53,122,236,66,130,223,220,69,289,142,210,199,400,393,97,247,307,69,257,184,86,201,104,106,286,115,147,70,138,94,242,102,153,147,285,361,180,330,316,59,271,80,185,143,66,64,216,227,211,290,205,296,179,382,111,324,406,334,109,96,298,87,277,316,121,108,115,206,141,79,169,79,231,235,50],"登記數(A)":[782,556,1457,1449,498,536,1766,837,896,700,754,1116,377,475,1491,518,906,554,657,422,352,675,1269,1371,452,939,926,928,1095,404,848,1024,1057,611,712,896,714,744,1013,888,562,305,355,230,843,1252,1067,1916,1121,718,551,1000,1193,1431,1345,1502,1479,404,1563,1474,1323,491,1561,1443,435,334,1643,1555,561,877,1204,622,835,951,550,870,515,334,674,237,340,460,503,575,856,433,1047,514,2082,2413,1924,2652,1777,716,1161,1552,783,1246,1627,620,929,481,440,1111,1028,1374,1457,401,569,1246,1845,546,714,732,754,1569,1054,466,693,758,897,354,356,1069,279,437,659,842,347,1047,317,494,2332,789,2034,2367,2259,2323,2276,1187,1565,1761,1265,744,883,1572,1580,1673,798,1506,885,951,1844,671,640,1073,1155,413,1346,1774,399,541,922,1010,1491,776,935,1123,795,1092,1036,1169,987,1302,1100,672,2481,1842,1414,2924,1299,2111,1170,2081,1273,606,1108,1904,1435,1922,617,860,1981,1686,1500,465,412,1414,560,2060,539,2076,984,1181,1388,1555,984,1267,832,852,1331,1315,826,833,818,819,1096,1045,818,702,1789,2104,2137,1767,926,2968,2092,1160,1240,1254,1456,1531,1117,1055,816,1907,1671,632,796,2160,853,586,1956,1896,1099,2219,1465,1491,869,527,877,1180,1559,1234,827,504,438,500,389,869,1372,1297,446,595,3206,1621,1051,2113,3413,3261,2228,2746,1432,1042,600,717,2047,1591,2227,1581,2060,1058,1337,2304,1992,2010,1993,1610,1591,2390,1169,814,478,804,854,763,1757,1072,1430,833,871,1201,734,1341,1197,1452,1283,1565,1353,1939,2715,1782,2741,1967,2901,2475,796,1407,1598,1446,1027,647,1211,1327,999,1276,1792,677,1266,625,1877,2491,2022,1179,1952,581,447,1269,557,704,1398,1066,972,788,704,1583,1629,950,1570,368,1122,548,3406,3221,1770,2750,1068,3280,1334,2299,1328,650,1156,2154,2569,1264,913,2535,1135,586,2206,2561,1759,2083,1087,1208,680,1248,1514,2107,503,1342,1505,1442,702,1453,1822,374,921,1402,840,636,591,617,1378,1295,1824,2503,810,2747,991,3215,3180,1255,2456,1430,3043,1949,1414,2036,763,2495,830,1297,1896,951,858,949,2080,1227,2244,1867,2142,990,1136,869,527,386,1906,1057,789,1567,576,577,1408,608,1741,943,1864,415,1677,2245,3459,1483,2533,1140,1140,1737,2034,1712,2570,2226,1376,1042,1192,2601,1959,932,2654,622,1916,2002,2169,2347,927,847,2377,1054,1180,751,591,1974,1430,1150,499,1631,845,1625,1473,1698,1906,1252,415,1717,1936,3659,2803,1137,4000,1535,3130,1251,2254,2363,3370,2240,2931,1665,1630,818,3015,2165,1558,1287,1256,2537,1917,1252,707,1302,1134,1632,756,1860,1746,1070,982,1173,1732,1617,1640,551,1232,1054,1996,693,1628,1477,1688,4707,2482,2225,2064,4733,1401,1690,1357,2438,2997,2022,1425,1834,3020,2554,1444,2787,1613,1463,2264,2148,2323,3140,2510,1200,2236,732,2379,2606,1485,1014,2113,1691,1826,1126,1712,1554,1579,2154,579,586,690,1952,1495,3275,960,2988,2570,4554,1236,3890,1287,3230,2617,2850,1768,2244,3140,2950,3046,2023,2489,1898,1809,1954,2946,2114,1435,1691,1407,1917,1287,912,1213,799,2000,482,904,723,1169,1309,1622,1687,778,1272,956,756,1233,4738,1265,3175,4441,4848,2382,3365,1799,1071,2294,1467,1475,1196,948,1304,1080,1377,2354,1536,3249,1850,1502,2883,2231,1598,1342,2436,2480,2515,1884,820,1411,1303,2027,1252,1271,1013,2000,1372,912,2076,792,615,3391,3432,1649,5330,4850,4473,3564,1826,1987,996,3309,2388,2715,1197,1959,1524,2681,951,2716,1268,1387,2886,2949,2716,1275,2145,3446,844,1425,2980,1923,883,1962,2064,1869,1011,1160,1776,2006,599,2152,2048,1624,1335,4421,5497,1069,1266,5342,1165,3003,1862,1739,2585,3406,3412,1712,1801,947,3057,2223,3478,3495,1456,2181,1003,3866,2979,1832,1986,1998,1077,2777,704,1185,840,1087,1689,1174,1943,2305,958,2311,1650,1641,1255,2159,2025,4914,1692,1330,4539,3920,1991,3628,4359,915,2100,1138,3673,3273,2426,2976,2056,1881,3678,2560,1689,3173,1114,1332,3857,1430,2648,939,2465,1112,2097,2347,2473,1431,2455,1640,1077,2173,1917,630,984,1694,2603,1629,1491,3281,2485,1495,2995,5196,2257,1443,3754,1311,1192,3992,3445,2481,4019,3358,2723,3979,3634,2547,894,1858,1400,3198,1641,1186,2792,4137,1902,2971,1785,2776,2653,3319,2607,1758,1191,1354,1597,2394,2195,1759,2080,2457,795,1874,3224,1317,4275,3815,4336,4778,2130,1013,4030,2726,3411,1812,2399,3535,4084,4136,2490,2167,3004,3243,3455,933,3682,2534,3630,1547,3665,2486,2589,2464,1410,3075,2494,2125,2377,618,2696,1887,2438,828,999,2090,1358,5971,3052,1590,4730,6201,6299,3633,1704,3538,948,4340,3666,3248,1329,2183,978,3963,1126,3089,2946,2707,4198,2735,986,1034,3479,4015,3461,1920,1075,2240,2992,2721,1621,2491,1383,2589,2837,1368,1193,998,2334,952,800,2646,2252,1256,6241,3120,4266,3906,1821,2054,1102,2464,3965,2060,3532,3129,2425,1707,3123,3417,1680,2244,927,3750,2676,3623,984,955,2244,1062,1655,1533,2638,2921,2813,2665,2157,1590,2994,2357,834,2649,2516,1453,786,1526,6312,4093,5133,6332,6834,3703,2166,3918,3543,3331,3014,1389,926,2945,4517,4543,3569,2276,2457,4182,2463,1989,2148,791,4490,1320,2307,2882,3119,777,2747,2361,2504,688,2097,3172,3146,2879,2807,1336,2412,1583,1779,3479,4722,2000,1850,5498,5208,2609,1180,3152,3131,3336,1173,4374,2548,3995,3645,4188,2333,4443,2266,2339,1112,3436,4089,1395,2672,3903,2898,3108,2905,2414,2428,1320,2195,2591,848,1864,2464,985,1808,1873,800,2704,1821,4150,1694,3774,5145,1570,3535,3086,4798,1657,3644,3705,4447,2600,1284,2814,1261,4280,3967,3230,3084,3019,4627,1268,3735,861,4991,2641,1315,4046,2093,2867,2448,2299,1919,2557,725,1857,2067,2440,2715,697,1295,2679,1745,2403,4675,4174,6100,6286,7213,1215,1537,3972,1941,2840,3131,3612,4551,3363,1579,1764,1526,2530,3207,1356,4884,2123,3208,2356,1825,3748,1292,3786,1429,1488,3457,1390,3076,1502,2863,1225,926,2655,1367,2224,3192,2860,2430],"除戶數(B)":[45,17,44,40,27,33,77,47,60,20,21,70,12,25,100,33,20,21,40,23,7,46,63,93,9,50,33,20,48,24,50,46,55,12,39,41,45,22,48,50,29,12,17,13,28,66,60,48,48,26,34,26,82,84,42,59,44,8,78,41,52,16,57,73,21,8,37,80,17,19,57,14,22,54,21,36,16,19,28,9,16,18,30,36,26,24,22,30,63,67,114,118,115,26,34,56,36,52,63,28,41,22,12,31,67,68,92,18,36,53,39,35,42,44,20,89,27,15,25,50,26,20,17,41,13,16,40,47,19,24,12,27,60,17,67,93,84,51,152,71,72,110,26,26,61,98,53,115,50,95,55,50,128,39,38,26,26,25,80,37,21,14,42,24,98,17,36,58,21,48,72,33,22,61,34,40,59,94,36,146,32,104,37,141,36,36,32,40,60,79,32,39,120,104,63,22,21,63,14,45,28,92,60,51,86,103,59,60,32,28,33,63,57,52,20,24,26,27,54,27,121,106,119,50,28,190,130,36,61,48,76,51,73,34,31,63,35,26,23,79,59,24,90,92,50,81,71,50,27,15,35,57,64,52,18,24,28,27,24,44,76,28,21,17,119,78,23,121,164,100,87,111,85,66,38,25,49,67,97,58,88,58,39,93,93,69,50,87,37,74,26,56,17,55,47,28,91,31,60,33,50,44,16,28,25,57,76,80,28,78,182,47,109,62,188,140,54,31,56,82,68,35,60,74,46,85,41,36,80,29,86,60,90,51,117,38,21,75,35,47,29,71,27,28,14,40,90,21,101,23,58,11,203,117,78,164,22,159,29,63,92,43,48,101,91,50,21,153,57,27,140,155,68,46,39,52,42,74,70,103,20,77,83,56,22,64,107,25,64,60,50,15,30,20,38,71,51,152,52,160,22,142,217,28,64,92,210,90,82,114,39,139,56,31,47,33,21,53,79,37,103,60,146,34,66,21,33,10,78,49,37,60,30,22,64,33,44,19,45,21,83,57,202,50,143,25,33,95,101,119,62,124,32,40,28,72,84,53,110,26,91,122,63,74,56,19,119,34,63,43,34,46,59,79,34,39,34,64,42,37,47,30,21,48,69,107,56,28,265,75,120,60,53,108,94,134,116,46,68,39,123,62,65,89,74,75,83,73,48,57,58,106,50,59,94,63,38,39,109,84,84,37,81,38,79,17,46,71,75,299,108,101,75,278,69,66,85,102,127,95,57,120,157,84,75,69,109,75,129,122,138,68,80,45,91,32,72,64,51,62,138,58,70,74,115,58,103,71,11,22,47,57,31,199,37,67,118,171,80,86,34,219,88,126,111,87,119,135,66,139,132,67,55,100,183,71,43,98,46,48,79,46,60,28,56,28,52,48,78,74,32,94,38,60,62,39,32,329,87,188,277,131,54,152,112,72,93,34,54,44,36,87,32,64,120,38,156,92,80,144,49,78,84,131,122,114,41,24,97,46,64,41,42,67,102,84,51,129,51,14,85,88,54,254,293,131,164,47,74,50,106,134,180,38,63,85,62,55,65,67,52,117,148,146,34,68,137,43,56,127,66,49,72,106,70,42,64,107,45,21,148,78,104,54,95,350,58,67,350,33,83,63,80,179,133,228,82,103,57,77,95,209,214,57,57,23,179,161,117,71,118,47,73,47,48,27,24,43,81,77,119,41,88,45,106,37,88,89,195,102,77,125,260,107,225,154,63,60,29,109,192,138,125,125,126,185,145,113,193,53,80,225,70,118,32,60,40,98,58,101,52,138,76,29,112,110,28,47,69,122,109,78,166,93,104,125,192,154,95,123,44,82,139,105,50,206,89,152,195,140,94,54,127,93,174,76,37,139,147,56,112,105,163,151,88,124,118,41,29,81,120,123,49,130,163,52,58,188,65,218,173,208,131,134,44,102,149,101,92,84,102,148,151,89,120,116,142,116,57,164,151,99,61,184,147,131,115,33,150,70,143,86,26,122,68,65,31,32,64,31,340,196,110,126,283,412,158,55,185,38,216,246,82,77,118,48,90,55,212,144,67,168,79,51,29,109,206,150,46,64,119,167,108,91,60,37,85,137,39,62,37,61,65,17,137,137,59,228,193,194,156,45,67,76,124,197,70,221,138,102,57,213,111,39,56,61,232,54,230,46,19,121,40,72,34,70,123,149,162,51,102,83,151,21,171,127,66,21,94,231,161,212,303,473,91,86,145,97,140,183,41,64,157,135,285,243,81,99,176,70,106,81,25,218,87,144,121,211,17,74,59,100,31,43,169,194,64,138,41,89,97,118,217,301,91,77,183,272,176,30,179,168,161,60,116,175,98,248,112,113,120,66,71,71,147,262,84,180,245,161,117,165,74,56,52,129,75,55,105,121,47,96,41,24,142,78,204,90,233,169,103,213,120,129,33,118,89,143,174,31,127,43,262,265,136,107,83,254,34,162,49,296,156,85,151,57,154,52,104,51,135,36,47,66,98,103,36,81,79,37,142,204,267,296,400,308,36,90,219,83,155,66,80,202,141,56,106,89,142,112,74,170,45,143,137,88,75,78,241,68,45,227,29,68,54,166,74,39,133,65,45,132,141,54],"轉讓數(C)":[802,580,1492,1501,536,636,1499,995,877,778,869,1172,309,382,1624,529,1007,478,602,497,418,703,1517,1323,397,1017,762,990,1069,445,714,1152,962,657,762,947,718,848,849,873,557,356,288,185,687,1060,1003,2180,1187,779,657,1172,1188,1586,1553,1782,1615,386,1381,1337,1069,415,1609,1249,431,272,1381,1616,524,932,1394,673,983,995,568,880,457,376,693,270,379,420,466,509,774,355,960,475,1789,1954,1937,2655,1865,651,1140,1462,664,1474,1808,603,1009,411,389,1318,1015,1475,1451,385,565,1482,1629,464,832,667,628,1789,1227,542,789,611,739,397,363,1070,283,353,589,785,309,1232,301,462,2657,729,2319,2827,2370,1980,2624,997,1810,1644,1265,882,882,1493,1320,1567,691,1561,833,874,1637,554,571,885,967,352,1572,1817,425,525,1003,1193,1478,639,770,1010,776,939,1221,1306,1120,1184,1163,561,2352,2027,1460,3386,1359,1731,1322,2109,1348,492,1003,1918,1469,2115,738,769,2238,1886,1334,494,474,1258,462,2276,537,2424,1118,1281,1468,1678,905,1496,849,708,1337,1413,708,968,738,932,1164,1001,829,746,1725,2241,2383,1836,1061,3253,1679,936,1439,1227,1489,1446,1278,1210,762,2220,1666,566,825,1986,956,698,2092,2055,1019,2139,1240,1408,883,608,792,965,1352,1244,771,515,389,470,319,969,1384,1074,441,572,2872,1682,1175,1736,3872,2954,2131,2826,1493,1048,653,782,2070,1398,2118,1451,1703,1214,1135,2589,1974,2272,2108,1327,1632,2842,1159,948,448,877,833,895,2104,1074,1692,972,748,1317,760,1586,1041,1435,1378,1684,1612,2286,2940,2014,2841,2289,2818,2678,941,1570,1338,1259,1147,729,1285,1150,1192,1409,1736,649,1392,699,1699,2759,2279,1081,1621,509,459,1213,598,679,1142,888,917,814,676,1687,1579,826,1337,353,1322,580,3064,3669,1429,2806,914,3773,1267,1992,1226,657,1285,2143,2571,1194,1047,3029,1169,494,2555,2535,1835,1911,1066,1188,806,1179,1346,1879,594,1424,1554,1434,652,1641,1960,422,917,1200,983,551,627,657,1243,1175,1797,2887,717,2670,874,3296,2665,1046,2436,1168,3440,2188,1415,1937,914,2032,736,1464,2044,967,799,1066,1732,1060,1987,1656,1761,867,1152,887,564,339,2042,939,859,1331,478,635,1160,616,1535,1113,2188,404,1524,2626,3910,1679,2714,1358,1297,1664,2421,1389,2833,2524,1138,1044,1045,2082,2244,827,2681,498,2076,2075,2601,2739,845,840,2841,877,1221,680,664,2114,1264,1100,535,1392,864,1737,1671,1890,1933,1227,451,1426,1700,3948,2486,946,4429,1394,3558,1115,2510,2662,3794,1899,2833,1437,1871,844,3219,2286,1840,1521,1107,2664,1738,1459,769,1412,1200,1648,802,1582,1661,953,1012,1021,1700,1850,1556,630,993,1188,2110,561,1402,1345,1394,3872,2146,2241,1768,4270,1446,1664,1192,2860,2483,1649,1404,2135,2688,2648,1460,2610,1652,1269,2199,2495,2650,3352,2994,1419,2414,588,2369,2271,1539,1060,1817,1965,1720,1262,1722,1268,1450,1869,527,601,587,1953,1266,2799,783,3190,2239,3860,1412,4215,1472,3345,3109,3211,1858,1904,2837,3214,2443,2089,2162,1826,1630,2219,2493,2218,1192,1848,1140,1823,1084,790,1163,905,1918,465,950,740,938,1215,1805,1785,878,1199,1025,878,1352,4673,1467,3782,3807,5134,2166,3508,1714,1078,1836,1661,1762,1304,830,1252,1023,1403,2579,1668,2999,1702,1556,3448,2438,1893,1074,2401,2865,2643,1991,907,1155,1206,2059,1133,1433,846,1711,1201,977,2134,702,563,3240,3568,1538,4708,5691,4719,3004,1577,1758,871,3217,2234,2486,1262,2113,1452,2732,1100,2331,1080,1434,3025,3469,2958,1159,1721,3554,694,1570,3257,1758,749,1961,2134,1947,859,979,1721,1730,705,1762,2279,1306,1225,4770,5990,1157,1213,5643,1376,3538,1575,2083,2423,3564,3122,1447,1932,882,2783,2641,2852,3462,1319,2554,877,4378,3081,2058,2309,2192,1165,2609,789,1361,676,989,1701,959,1837,1968,845,2547,1741,1809,1291,1861,2042,5573,1716,1204,5140,4074,1856,3789,3588,1007,2105,1159,4092,3838,2799,2849,1750,2174,4383,2605,1725,3772,1130,1239,3101,1320,2127,899,2856,1102,2024,2439,2711,1396,2429,1666,971,1979,1559,657,822,1579,2264,1867,1738,3360,2802,1601,3242,6189,2707,1548,3439,1068,1218,4083,3683,2105,4633,2884,2601,4328,3300,2810,757,2117,1555,2944,1739,1087,2528,3801,1997,2573,2016,3160,2163,2867,3055,2006,1014,1275,1753,2666,1903,1554,2260,2051,736,2070,3181,1232,4316,3485,4368,4858,2392,877,3942,3098,3310,1630,2373,3684,4714,4901,2460,2230,3306,2925,3212,1071,3796,2680,3673,1339,3446,2758,2836,2694,1296,3063,2150,2487,2198,736,2773,1927,2787,854,1100,1970,1251,4848,3401,1690,4052,6684,5323,3511,1839,4031,841,4558,3630,2601,1581,2264,904,3712,1247,3298,2658,2506,4454,2777,858,874,4148,3601,4139,1578,1138,1978,2759,3261,1617,2234,1589,2408,3122,1189,1126,1057,1913,854,867,2613,2409,1248,5748,3079,4401,4491,1859,2249,1026,2661,3611,1739,3252,2806,2787,1414,2783,2825,1363,2096,772,3470,2493,4223,991,897,2248,993,1378,1417,2638,2665,3344,2913,2246,1773,2410,2667,884,2744,2895,1650,826,1486,5627,3503,6124,6613,5747,3352,1743,3845,3610,3264,2921,1379,1093,2603,4547,3809,3161,2509,2701,4062,1972,1797,2465,693,3744,1546,2108,3019,3246,738,3099,2659,2196,805,1772,3393,3011,3193,3150,1130,2044,1660,1833,3848,4766,1819,2030,4953,5204,3046,1067,2615,3587,3576,961,5126,3039,4447,3691,4919,2468,4703,2495,2549,1057,3300,4161,1301,3009,3935,3416,2989,2977,2836,2882,1386,2146,2731,749,2228,2063,1075,1715,2078,910,2621,1755,3698,1846,4314,4652,1318,3590,3040,4644,1430,4243,3303,3957,3031,1425,2888,1493,3673,4723,3092,3287,3228,5262,1032,3267,725,4321,2927,1365,4638,2368,3078,2778,1944,2126,2440,743,1560,2050,2609,3119,678,1044,3203,1937,2027,4966,4817,5822,7309,6870,1126,1780,3858,2029,3085,2799,3875,4264,3300,1535,2043,1617,2190,3008,1124,4010,2523,2904,1993,1948,3843,1468,3045,1685,1635,3284,1621,3263,1252,2759,1050,773,3073,1420,2226,2742,2407,2137],"變更數(D)":[389,150,403,411,139,163,457,251,211,215,176,464,153,218,328,144,248,264,145,143,111,312,390,572,90,196,199,454,360,195,418,223,420,228,348,351,243,296,250,307,139,115,121,107,221,498,234,442,449,179,220,282,535,559,375,415,596,148,368,439,427,170,748,586,192,98,791,378,273,318,551,169,408,394,236,334,128,147,324,107,120,186,102,160,315,118,444,135,953,940,592,611,841,317,421,658,234,317,679,139,281,137,107,439,243,679,350,85,213,553,741,265,242,204,366,321,407,184,222,356,405,84,177,307,91,162,141,268,148,460,70,195,495,212,665,796,1028,962,1049,331,681,548,403,371,256,713,386,777,271,574,343,434,427,146,285,333,345,150,462,657,149,262,247,334,585,170,187,429,168,218,321,475,438,393,408,304,970,462,452,1325,638,674,433,906,410,199,478,684,662,930,129,426,828,383,310,117,180,646,245,412,230,718,213,528,411,743,325,345,227,266,522,333,179,212,401,384,271,209,196,291,703,692,680,614,284,1034,537,255,591,587,390,705,407,515,236,665,740,170,334,759,247,216,575,719,244,661,400,581,354,255,344,580,493,543,177,239,163,238,115,405,337,294,140,214,804,400,476,813,742,676,779,808,297,474,214,242,526,629,484,638,757,393,617,939,484,685,992,464,610,1146,517,180,210,401,195,333,807,352,520,344,253,310,156,480,531,723,376,595,656,784,597,401,1271,549,796,519,245,324,634,425,441,320,265,323,256,530,538,178,449,129,693,944,485,376,648,191,101,276,252,279,492,288,281,280,216,381,426,377,351,81,460,179,845,684,576,1049,260,1595,326,700,429,277,249,1033,576,509,185,709,489,227,486,551,604,881,379,502,316,372,344,739,141,621,632,387,164,573,641,182,197,466,197,164,156,219,452,312,648,1189,184,1367,432,1066,960,318,1101,510,1485,475,549,740,343,1207,333,544,660,209,271,356,1035,299,789,714,909,494,331,411,210,129,449,313,331,605,172,235,416,296,825,249,838,161,791,1114,1182,630,542,468,276,684,569,420,1071,933,565,499,372,1063,905,462,632,139,882,826,741,850,453,281,644,485,305,363,125,924,598,504,103,412,418,413,584,507,823,459,91,391,751,766,1240,375,928,408,1345,483,724,577,996,666,1371,759,785,276,920,525,752,372,552,888,423,325,178,432,373,471,312,593,599,231,411,313,368,686,607,237,300,401,671,214,560,649,441,1065,1188,842,672,1408,677,420,292,504,1218,669,472,732,883,987,495,1277,616,634,550,501,847,973,1015,281,611,271,979,932,610,393,623,544,520,234,399,682,706,967,196,137,170,933,310,1526,299,624,901,2099,340,1065,385,1331,1032,1147,751,661,861,904,848,995,735,477,627,963,1206,524,714,558,591,399,551,343,320,252,495,202,381,355,315,626,513,395,204,416,393,182,399,2211,453,1041,1210,2328,895,1182,795,328,798,685,485,541,362,544,378,530,727,345,1175,613,582,1121,538,770,634,1180,557,790,611,209,550,315,797,334,485,465,817,331,198,740,395,125,1494,1483,623,1164,1959,1590,1033,578,421,428,844,1001,1126,430,512,580,740,214,1217,573,383,691,1078,582,562,896,1561,371,586,613,431,370,641,892,551,351,502,773,763,203,508,662,611,285,1902,1872,347,606,2385,461,891,840,684,1043,712,1147,521,854,363,1093,941,1681,1080,419,911,328,1484,1231,838,599,594,248,1239,318,417,298,371,686,362,862,1108,328,633,654,458,506,455,523,1840,720,569,1421,1458,512,1185,1262,224,1042,427,973,1580,625,613,674,664,1266,1063,394,1252,314,480,1523,628,887,205,842,413,959,941,507,334,516,445,316,716,866,197,276,468,888,387,476,943,1126,310,1289,2467,837,301,1033,332,568,1747,972,633,1460,811,636,971,1345,1166,179,374,673,1553,394,376,1198,896,623,768,742,1214,891,1498,1175,490,335,446,542,942,971,768,965,866,198,914,1290,544,1078,1827,1023,1451,888,436,940,1310,1012,745,722,1169,1624,1623,880,835,1429,690,846,379,1420,960,1488,367,993,834,793,515,381,1272,1009,440,678,244,1038,389,1070,209,272,909,596,2540,1285,740,1998,1586,2045,1131,466,736,313,915,1829,1302,431,704,303,1595,333,1114,999,999,1014,1185,228,419,1122,1843,1175,392,246,843,676,652,356,766,359,1017,767,312,566,228,898,415,276,918,936,489,2075,1194,1952,1294,676,485,352,776,887,809,1186,687,622,567,730,1228,789,953,408,1092,943,1641,382,414,1002,340,339,695,1136,856,1019,1293,890,463,1326,727,262,1071,1136,542,182,639,2870,1976,2413,2539,2742,1796,464,1762,868,1061,860,591,433,771,1301,1074,792,1058,1168,933,839,879,692,227,1093,651,1044,1029,1493,189,1029,597,908,322,625,1040,1343,1400,812,655,841,371,357,958,1333,664,625,1682,1149,1167,431,1443,765,1125,534,1568,951,1906,1356,1984,649,1261,616,491,503,1265,1282,339,865,1473,677,870,698,1076,559,579,522,920,298,604,774,393,777,622,218,988,536,1495,387,1564,1101,700,888,878,2314,459,1060,1841,1710,1187,502,1354,615,1982,899,1063,755,832,1491,307,1641,425,2163,685,581,1377,786,1400,857,668,618,1231,290,473,653,1168,555,344,453,1085,729,979,1931,1146,2806,1554,2341,302,585,950,504,1182,1237,808,1054,707,501,604,317,990,1255,362,1547,557,987,1096,743,790,482,883,497,709,1416,621,1184,356,1267,327,222,597,309,538,984,572,855],"絕育數(E)":[255,288,868,516,249,229,665,330,442,414,321,536,208,260,661,206,345,256,284,247,180,208,606,591,229,290,375,410,633,170,469,572,370,323,255,275,360,281,410,495,328,168,180,134,448,750,543,761,371,309,305,415,536,566,683,815,588,136,757,780,411,265,931,486,245,121,589,781,220,492,483,340,306,530,308,364,234,105,224,106,183,139,301,286,474,243,383,293,712,944,600,1487,663,295,538,865,447,725,909,320,473,287,150,637,422,772,873,143,251,579,999,231,364,436,425,643,623,190,413,265,453,197,211,532,148,142,210,407,133,490,186,260,1378,383,1053,1206,741,1039,1112,545,726,805,578,329,449,815,558,838,360,665,287,418,566,363,208,558,483,240,580,816,213,208,482,540,581,326,496,538,286,387,357,388,588,569,656,250,985,657,728,1484,504,1047,567,689,453,272,426,823,858,701,369,388,1027,577,637,220,225,583,306,709,320,1028,491,698,711,922,495,693,255,295,455,647,295,416,388,441,498,561,300,269,806,867,778,855,373,1043,705,564,404,469,795,888,473,402,349,775,901,327,415,1202,480,300,599,658,381,1190,505,507,384,253,369,395,618,416,257,277,162,241,182,293,567,497,238,341,1304,895,616,908,1701,1954,1047,925,531,388,345,233,1148,479,789,921,678,486,461,799,862,673,762,846,927,1119,450,330,178,245,289,370,848,615,549,468,305,480,309,533,517,705,718,899,687,813,1557,734,1571,605,1137,1479,336,486,658,861,570,278,595,409,303,712,673,276,460,289,1049,924,837,532,735,178,200,740,231,395,685,633,308,306,370,617,654,312,817,111,412,325,1067,1453,720,1427,328,1044,658,1051,511,369,483,918,1314,449,457,864,412,242,1167,1134,683,643,372,523,394,509,496,1135,213,541,713,652,317,634,593,223,380,725,283,336,308,226,552,547,781,1491,463,907,566,1196,1281,419,1268,717,1149,1145,715,842,275,788,315,609,866,538,341,525,1047,631,778,1031,1104,590,645,379,278,206,749,360,301,882,325,201,481,207,854,343,1043,248,839,938,1337,659,862,638,471,898,1150,518,1389,1142,630,477,656,955,774,365,1384,219,1005,620,763,992,467,329,1372,338,579,442,222,835,487,489,153,721,463,772,847,849,997,636,226,837,1054,1429,1416,441,2249,650,1866,466,1124,1197,1510,1287,937,944,849,353,1359,1181,548,396,531,1056,1051,566,240,695,678,694,451,619,809,533,321,668,858,713,820,220,629,476,1119,262,957,857,589,2140,1025,688,1231,2369,504,853,559,751,1566,759,837,628,990,1408,680,1260,667,835,884,1101,1370,1269,1306,559,1213,259,1267,905,704,324,868,582,946,389,1014,542,795,1010,217,187,340,654,813,1299,487,919,1163,2672,531,1628,510,1105,1325,1525,964,844,1289,1174,1496,821,783,1031,976,879,1061,727,591,880,514,968,648,505,377,451,862,277,334,370,681,458,794,620,297,392,330,289,511,1984,620,1616,1564,2478,1062,1771,969,433,847,496,849,583,492,543,616,671,774,614,1834,581,873,1073,692,728,630,862,931,756,593,384,842,568,865,590,572,530,611,555,490,693,372,206,1895,2055,572,2432,1561,2459,1992,590,997,564,1374,926,1228,703,897,564,1256,437,1224,486,704,1581,1502,1604,664,844,2032,493,687,1297,710,389,899,922,592,421,659,967,674,251,1138,797,501,677,2392,2273,440,557,1914,382,1699,936,537,1329,1197,1195,623,1016,490,1825,913,1557,1763,695,946,601,1822,1234,796,596,632,354,1568,273,707,415,350,934,407,937,1018,518,1195,957,532,421,1127,802,2269,624,697,1525,1905,1047,1293,1330,419,831,559,1712,1914,1100,976,740,1011,2056,1201,872,1149,620,611,1613,660,1414,493,768,614,914,926,1014,466,1137,757,375,849,696,191,391,846,839,613,551,1278,785,699,1213,2040,729,865,2113,657,657,1593,1724,907,1254,1973,1146,1782,2062,1360,372,1063,622,1053,777,549,956,1592,838,1154,645,1163,947,1262,1161,965,709,637,952,845,912,813,780,1140,419,766,1604,473,1459,1770,2094,1443,854,304,2269,1553,1456,968,1101,1955,1512,2138,1383,1185,997,1362,1335,325,1434,1327,1158,760,1927,1371,1004,1175,569,1834,765,937,1069,249,1588,970,1256,403,482,1059,783,1849,1767,697,2609,3464,2595,1792,626,1480,297,1889,1309,1660,603,789,577,1845,409,1759,1316,999,1361,1086,472,619,1951,1804,1461,790,366,1260,990,1522,953,1019,617,926,1135,758,699,555,1202,361,472,1063,1270,428,3362,1273,1379,1723,878,1056,528,952,2070,762,1661,1775,1410,615,949,2036,593,848,297,1375,1384,1951,400,350,1162,513,923,476,1209,1663,1233,1568,738,824,1381,1102,433,920,1464,488,251,637,2039,1543,2825,3017,3252,1992,1158,1720,1544,1449,1231,756,279,990,2203,2368,1407,1234,1314,1630,1328,986,765,417,2506,405,884,1613,1684,262,1247,946,1037,375,1152,1834,1654,1351,947,790,818,600,1043,1951,2641,893,629,2878,2557,997,686,1492,1257,1935,553,1802,839,1610,2065,1879,1136,2055,1098,1066,577,1313,2416,691,951,2118,1399,1378,1096,1036,729,552,1047,968,435,745,1398,325,652,748,334,1611,555,1426,536,1658,1992,717,1210,1004,2185,850,1963,2026,2363,1034,509,1098,388,2499,1371,1088,1518,1652,2413,606,2072,400,1975,1114,503,2375,788,1315,1376,952,992,1092,416,628,972,1043,1451,221,773,959,906,1310,1762,2394,2074,3119,2821,429,499,1420,953,1220,1034,1382,1483,1052,587,987,682,1263,1562,425,2394,806,1892,1392,1092,1499,506,2083,544,491,1250,438,1514,649,1498,610,329,1033,422,704,1019,1271,969],"絕育除戶數(F)":[3,4,20,15,6,5,9,4,12,12,5,9,5,6,15,2,8,3,5,3,3,2,10,13,4,5,6,10,10,3,6,16,5,8,3,6,10,5,4,5,5,4,4,2,4,17,14,18,8,3,6,4,15,6,15,21,14,2,8,13,8,7,19,13,2,1,11,8,3,6,6,4,3,13,3,5,5,1,3,2,3,3,8,5,8,4,5,3,8,23,8,27,12,3,10,19,12,15,23,6,5,6,3,15,10,22,16,3,3,13,13,5,9,8,4,9,18,3,6,7,11,3,2,9,3,3,5,11,1,11,3,2,38,9,17,12,21,10,32,15,17,21,6,7,12,14,12,10,5,14,4,9,8,8,5,15,12,5,12,19,2,3,13,13,8,8,13,6,2,6,7,7,15,15,7,3,20,19,16,25,13,17,16,10,8,4,8,8,10,12,5,7,24,15,8,5,3,5,5,20,4,28,5,17,8,26,9,10,2,5,7,12,3,4,9,4,13,14,5,3,20,10,14,12,6,20,9,10,7,9,18,20,13,10,6,9,18,4,7,27,8,5,7,9,5,20,6,12,3,4,8,11,14,9,6,6,4,5,2,4,13,14,2,10,33,19,14,18,45,58,29,12,13,9,5,4,24,6,9,18,19,9,10,15,9,7,13,18,16,25,12,9,4,2,3,5,11,15,10,13,7,12,4,12,9,8,20,9,13,12,36,16,36,13,20,18,5,14,7,8,15,3,13,4,5,20,13,7,5,6,15,20,17,7,19,4,3,7,6,7,7,14,9,6,4,17,18,4,18,3,5,7,18,41,21,38,6,17,15,11,7,3,7,11,17,9,10,16,8,6,18,21,7,8,4,6,5,8,13,16,3,10,14,9,6,13,8,6,11,10,3,7,5,6,7,15,17,37,12,26,7,22,35,12,22,10,23,32,14,18,6,17,7,10,25,14,3,13,18,16,19,27,16,16,17,9,5,2,13,5,7,26,6,2,11,5,22,5,13,5,13,26,30,12,20,10,5,10,25,14,20,14,10,7,18,22,9,5,29,4,28,8,17,10,8,8,37,8,5,4,3,21,8,13,3,9,6,14,23,14,24,15,6,11,27,27,22,13,51,12,46,12,20,21,34,19,12,18,12,6,31,14,6,5,14,14,16,10,5,7,7,11,13,11,20,11,7,11,8,18,21,3,13,6,11,4,22,18,17,33,19,8,27,44,8,13,12,20,42,11,16,17,19,35,18,28,9,9,24,15,37,37,33,11,14,6,31,18,12,9,14,14,16,6,27,7,8,15,4,5,3,18,17,24,8,12,22,50,10,32,13,22,33,27,21,13,22,32,39,19,8,18,13,19,24,14,7,19,5,27,16,11,7,10,9,7,6,5,11,13,23,6,8,11,9,6,12,26,8,37,26,62,31,27,21,7,8,5,13,14,11,6,17,12,19,17,41,9,22,20,18,18,16,15,18,10,7,7,22,12,8,8,9,8,17,12,8,8,6,4,26,52,6,57,18,57,35,7,21,9,27,18,23,14,22,9,31,7,21,8,11,44,44,32,14,17,54,5,19,37,19,8,11,27,14,6,13,16,12,4,17,14,7,19,58,28,12,7,41,10,22,21,10,23,26,23,9,10,8,35,18,33,40,9,23,11,37,15,18,11,18,6,46,8,16,10,5,23,4,23,29,10,23,18,12,11,28,16,59,14,14,21,29,24,15,24,5,16,8,22,25,29,17,14,20,60,18,21,24,14,13,28,14,29,13,13,10,21,10,23,8,26,12,7,18,16,5,8,12,16,9,13,12,17,17,31,49,13,23,21,15,16,20,34,21,37,33,16,43,26,38,9,12,13,18,15,16,27,32,9,19,17,26,14,17,18,24,19,8,10,18,10,9,10,26,5,9,16,8,32,44,43,39,19,4,34,21,19,14,19,27,41,38,18,19,10,30,28,7,27,34,22,18,26,29,19,35,8,43,20,15,21,6,29,25,21,10,9,24,21,33,45,20,49,96,32,45,10,33,5,45,14,18,14,15,10,20,4,39,17,28,32,16,6,6,40,22,23,15,7,26,27,28,21,25,14,17,18,11,12,10,28,7,11,11,34,5,56,24,22,24,11,12,6,24,37,16,21,42,41,18,9,20,14,18,7,36,17,52,8,8,25,15,14,7,28,45,25,27,11,12,18,32,8,23,37,9,5,16,41,25,58,52,67,30,33,19,15,38,18,8,5,18,49,61,20,31,31,21,37,10,20,8,54,10,8,46,32,5,29,17,27,7,20,45,48,20,15,21,15,17,16,58,45,18,12,38,70,12,20,22,27,42,7,32,17,32,54,32,22,47,16,14,6,21,68,16,13,32,21,33,29,22,16,9,27,20,5,10,21,6,11,8,8,25,8,39,15,18,56,7,18,23,44,11,31,40,39,13,8,24,11,30,18,18,27,26,25,15,33,11,30,25,14,44,9,38,24,14,21,18,6,15,10,28,37,6,22,27,20,34,27,68,29,64,63,4,14,31,10,24,16,29,35,21,8,10,20,37,44,9,66,8,33,15,26,29,9,55,13,8,12,10,33,17,38,7,4,16,5,10,10,23,27],"免絕育數(G)":[7,27,63,50,10,7,23,29,19,10,15,37,15,17,30,15,37,15,20,9,9,7,23,57,19,26,17,9,44,12,32,37,16,24,21,18,30,34,18,16,6,15,6,4,24,38,39,51,26,7,18,24,40,71,53,42,50,13,56,57,65,8,16,70,11,12,44,17,15,25,24,8,20,43,14,24,18,16,30,3,16,21,5,9,14,12,19,14,89,83,30,108,27,15,35,75,11,45,76,11,29,22,10,11,38,25,53,18,12,58,76,9,33,18,12,50,27,6,12,30,34,16,15,20,2,10,19,36,10,29,14,5,87,16,24,68,47,28,73,30,32,28,58,24,21,39,62,59,39,47,14,25,35,15,7,51,31,15,48,85,17,14,35,50,66,14,41,25,19,16,13,24,42,21,54,29,85,51,62,108,29,101,56,57,51,18,25,32,61,59,13,32,58,61,40,9,19,51,14,79,7,81,43,14,34,68,21,35,8,29,38,18,9,36,11,14,21,23,39,23,30,25,46,75,19,116,52,18,33,53,69,29,24,37,10,54,62,25,26,59,21,8,72,89,24,77,50,66,38,17,29,47,74,20,40,13,11,12,15,14,53,57,8,11,150,36,22,102,107,48,81,54,26,13,12,29,21,16,40,55,58,19,35,63,77,67,62,27,79,40,40,12,9,14,17,21,46,27,31,41,32,34,22,44,27,26,47,25,20,66,114,62,47,55,43,44,12,26,45,58,20,9,59,50,40,56,85,14,32,19,43,113,20,47,81,19,12,34,22,14,55,33,29,32,8,69,37,37,24,11,53,11,111,74,86,87,17,162,27,94,62,25,48,95,127,13,29,117,32,23,65,91,59,50,29,20,14,19,37,81,22,43,39,49,11,71,47,7,32,59,39,6,14,27,61,20,41,92,16,120,16,116,111,43,64,18,138,43,27,35,34,120,22,59,90,10,19,12,95,60,78,41,74,28,14,26,25,14,47,39,9,54,8,16,41,23,49,24,54,6,75,94,88,42,68,11,42,66,36,58,123,32,40,16,23,81,81,40,76,7,62,29,74,104,30,24,56,37,51,21,8,54,42,19,20,19,16,58,46,57,78,30,4,56,43,39,135,21,65,36,119,62,59,85,57,106,54,47,70,23,62,36,52,41,57,37,21,22,16,23,23,18,17,59,60,50,10,44,25,41,33,9,17,46,64,15,66,60,32,158,59,97,99,148,18,72,20,38,109,58,25,53,120,125,40,94,74,49,37,24,66,53,118,35,83,19,43,32,18,31,62,26,62,20,37,72,16,73,25,7,34,82,74,82,44,83,106,189,19,168,26,92,93,130,46,49,79,83,66,26,114,92,87,77,41,26,24,48,33,64,58,14,30,16,57,11,15,30,46,57,37,35,12,35,15,15,57,194,62,152,78,189,87,44,73,40,42,41,22,22,28,49,22,22,116,53,50,52,17,52,108,34,58,101,114,99,79,32,58,42,20,33,32,16,66,50,27,99,32,13,168,104,25,95,102,132,118,41,36,10,35,54,83,57,82,70,50,39,84,56,32,119,113,93,19,36,112,23,65,129,76,36,53,50,54,23,34,71,37,15,82,89,48,55,48,201,24,58,92,22,74,75,81,102,164,143,47,52,40,83,27,130,67,59,79,11,111,48,72,65,71,46,68,18,30,20,22,68,55,49,104,47,49,16,71,35,92,73,207,62,21,55,133,65,101,168,34,63,40,132,40,28,97,51,82,104,86,39,145,51,23,156,44,37,42,61,20,37,61,35,29,37,79,25,64,74,12,16,79,56,54,27,119,96,73,74,130,30,30,60,39,54,171,37,63,118,35,36,176,172,114,19,87,35,42,59,20,28,186,41,78,74,85,83,78,61,71,52,37,58,35,43,78,77,96,34,22,139,27,120,59,164,51,102,37,182,89,77,39,55,59,140,59,111,56,48,132,131,46,65,45,60,27,58,55,65,52,34,142,97,32,26,27,107,61,69,19,23,33,60,271,37,60,165,178,107,180,56,122,16,154,133,58,46,36,41,111,42,89,79,134,190,120,13,41,34,115,68,44,51,52,104,133,47,60,65,48,114,36,14,16,93,36,35,112,73,45,198,36,199,152,27,76,28,40,137,52,53,104,54,31,147,61,36,25,23,156,86,134,14,13,102,13,69,20,83,70,74,88,24,41,148,82,18,127,43,69,23,27,242,66,150,170,293,150,65,130,133,96,70,59,29,119,217,95,150,62,114,170,81,40,51,38,74,32,65,78,139,32,29,60,70,9,43,71,119,83,44,42,74,17,66,90,125,47,27,144,229,69,15,87,144,138,12,58,35,85,126,131,94,189,44,95,32,82,200,68,121,47,69,77,100,106,25,55,25,43,27,85,116,33,74,67,13,48,35,144,83,38,83,77,111,42,76,33,52,46,142,49,47,67,30,108,104,75,54,79,93,33,83,31,125,38,36,143,43,100,60,30,75,44,25,31,66,70,86,21,22,83,74,92,171,113,190,271,204,35,41,60,39,74,53,119,148,89,35,68,48,36,66,45,165,56,47,104,41,71,21,100,55,17,73,49,49,58,130,57,37,71,43,100,61,74,73],"免絕育除戶數(H)":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,2,0,0,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,2,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"絕育率(E-F)/(A-B)":[34.19,52.69,60.01,35.56,51.59,44.53,38.84,41.27,51.44,59.12,43.11,50.38,55.62,56.44,46.44,42.06,38.04,47.47,45.22,61.15,51.3,32.75,49.42,45.23,50.79,32.06,41.32,44.05,59.5,43.95,58.02,56.85,36.43,52.59,37.44,31.46,52.32,38.23,42.07,58.47,60.6,55.97,52.07,60.83,54.48,61.8,52.53,39.78,33.83,44.22,57.83,42.2,46.89,41.57,51.27,55.02,40.0,33.84,50.44,53.52,31.71,54.32,60.64,34.53,58.7,36.81,35.99,52.41,39.89,56.64,41.59,55.26,37.27,57.64,57.66,43.05,45.89,33.02,34.21,45.61,55.56,30.77,61.95,52.13,56.14,58.44,36.88,59.92,34.87,39.26,32.71,57.62,39.17,42.32,46.85,56.55,58.23,59.46,56.65,53.04,52.7,61.22,34.35,57.59,42.87,57.43,62.78,36.55,46.53,47.44,54.6,44.23,52.83,62.21,57.36,42.84,58.91,41.46,60.93,36.44,50.75,58.08,61.65,50.88,54.51,33.02,33.12,49.81,40.24,46.82,60.0,55.25,58.98,48.45,52.67,52.51,33.1,45.29,50.85,47.49,47.49,47.49,46.17,44.85,53.16,54.34,35.76,53.15,47.46,46.14,34.1,45.39,32.52,56.17,33.72,51.86,41.72,60.57,44.87,45.88,55.82,38.9,53.3,53.45,41.13,41.9,53.73,49.95,36.69,36.49,36.31,33.54,59.38,44.64,60.88,39.08,39.84,36.5,51.67,52.52,38.75,51.32,48.63,35.0,35.97,47.02,38.85,43.72,61.67,37.38,62.22,46.41,53.9,35.52,43.77,48.53,56.78,42.78,55.13,34.19,61.84,50.4,52.6,60.27,53.99,61.71,52.54,56.59,31.62,35.19,34.51,50.72,37.97,52.75,47.49,54.97,45.33,53.73,38.61,39.41,47.12,42.89,37.86,49.1,40.87,36.83,35.47,49.29,33.67,38.14,56.3,58.65,44.06,38.39,43.69,41.54,53.97,53.3,52.78,56.46,59.45,52.49,31.73,35.98,35.84,54.72,35.8,34.35,45.25,48.63,42.87,34.19,40.4,34.43,31.03,56.46,38.54,49.89,49.32,35.03,42.75,38.06,55.53,57.27,41.17,56.77,58.56,44.68,50.97,59.98,47.55,34.65,38.46,38.83,60.5,33.09,56.26,31.04,36.62,59.29,33.42,47.7,34.75,35.46,44.92,34.31,38.55,54.37,58.62,47.24,38.32,42.35,37.74,32.44,35.44,49.66,50.24,57.64,39.34,56.88,36.3,40.45,42.48,39.68,43.34,49.96,57.83,59.93,50.87,43.04,60.05,41.38,58.32,31.08,41.17,62.57,44.61,34.3,42.22,62.54,57.87,44.93,50.56,32.32,31.27,58.1,37.69,41.97,38.36,47.48,57.73,37.19,42.44,46.54,39.02,32.04,46.24,61.39,43.1,59.06,49.53,62.21,31.64,39.47,53.04,38.89,41.33,33.15,54.39,31.3,38.25,59.22,32.75,45.49,41.31,53.71,30.78,32.91,49.27,46.51,40.78,60.3,42.96,44.18,52.34,36.24,50.11,35.6,37.48,42.22,55.61,46.26,39.98,31.17,35.11,44.72,60.97,42.67,33.45,55.84,43.48,41.98,49.16,46.39,45.74,44.71,34.11,62.18,43.06,53.28,35.44,52.98,54.01,36.85,40.67,43.46,43.09,61.85,59.5,34.05,57.69,38.2,42.05,33.17,52.09,52.84,39.75,59.87,52.63,42.87,37.15,32.72,39.79,47.31,45.48,57.08,40.38,57.14,51.42,51.68,35.45,55.56,54.51,60.04,58.69,43.63,55.26,54.26,40.26,35.22,39.1,56.8,58.42,35.86,34.97,35.13,49.03,36.58,56.62,61.68,51.82,41.68,40.13,45.15,35.23,56.32,42.1,54.08,58.2,31.64,54.59,53.66,46.13,46.91,54.81,36.89,40.8,40.96,53.26,36.07,53.53,32.55,35.42,43.2,52.7,38.77,59.12,32.35,51.39,61.86,39.32,42.22,34.94,44.44,32.26,44.72,56.35,48.56,57.58,50.27,52.34,50.82,55.84,49.49,55.01,39.47,50.75,38.59,58.85,43.7,60.47,38.12,50.16,52.15,45.05,60.21,32.86,57.2,53.59,44.54,45.92,55.49,36.3,32.64,43.74,42.32,56.43,47.16,35.66,55.26,62.36,44.76,62.04,33.76,47.76,51.84,33.26,57.94,52.37,45.34,51.35,42.22,53.52,46.26,57.8,38.17,59.1,59.67,35.46,47.8,42.38,32.02,60.53,52.19,37.24,51.72,43.0,31.29,53.1,38.82,60.01,35.65,33.92,55.59,48.36,45.33,43.75,59.51,40.28,53.6,61.01,40.1,52.39,47.45,55.9,36.14,53.58,34.89,48.26,33.09,43.24,34.78,52.96,36.41,61.8,35.76,53.32,47.77,37.5,32.27,52.41,33.56,54.37,41.45,51.9,31.05,46.53,59.82,45.07,41.96,39.66,35.97,51.09,54.99,56.91,38.53,41.94,40.57,48.89,42.57,32.88,55.32,54.9,46.39,37.53,34.9,41.95,54.05,37.4,50.35,52.32,57.04,32.09,57.2,43.88,59.47,38.5,54.07,61.41,36.03,48.49,38.54,39.05,31.44,35.91,39.47,41.55,44.41,51.95,52.86,36.94,51.22,44.29,54.28,56.19,42.64,38.12,34.26,58.83,49.39,52.74,44.12,57.16,50.19,33.8,39.85,57.97,32.54,59.85,38.44,30.89,46.71,48.81,36.75,38.72,31.07,31.8,47.36,62.4,44.23,43.66,48.06,45.81,55.18,31.3,42.16,55.98,35.18,49.39,33.61,56.53,59.9,35.49,46.79,33.86,55.32,57.56,32.77,51.02,58.67,42.05,40.28,47.53,59.45,46.15,38.57,46.77,47.99,45.38,39.8,51.91,55.51,52.05,61.17,52.38,39.82,59.78,60.92,48.79,44.16,37.21,45.68,46.98,45.71,32.13,42.83,58.94,56.98,33.76,42.73,55.94,39.75,32.5,51.37,53.95,43.62,42.33,45.87,37.52,32.86,57.43,50.86,31.77,54.28,35.78,36.81,37.67,59.25,54.16,60.07,42.06,46.62,52.51,49.04,43.46,60.2,48.41,43.26,45.36,30.55,32.66,33.79,56.29,40.33,60.77,49.82,32.46,55.35,36.87,48.98,45.24,55.4,52.72,58.5,33.88,33.66,53.07,40.6,46.83,38.36,54.51,34.07,51.26,54.3,37.56,31.06,48.59,39.95,49.68,47.42,61.31,46.81,33.64,37.6,56.47,57.14,48.99,54.0,37.75,57.12,47.76,43.64,47.5,54.74,52.92,31.39,56.34,44.67,40.02,41.78,33.21,47.95,47.63,35.11,40.32,37.63,30.9,40.88,51.32,33.17,39.74,38.08,40.64,32.11,49.03,41.18,39.79,34.05,62.46,57.61,50.67,57.75,40.83,50.6,36.45,31.92,59.35,43.95,45.96,58.27,53.89,43.21,60.72,46.6,34.23,48.69,46.39,35.02,39.1,44.91,39.7,37.38,43.51,37.29,38.53,46.03,57.38,60.0,47.47,62.14,36.37,43.53,47.02,39.49,48.56,55.72,41.69,52.31,37.14,35.17,47.39,49.69,30.21,41.83,30.96,56.9,59.45,43.41,55.47,46.74,56.16,37.37,52.7,56.85,56.96,34.18,42.95,39.14,36.3,39.99,54.26,32.17,49.93,54.61,57.37,40.07,48.53,40.74,61.23,30.73,46.52,45.74,41.05,60.57,51.95,52.04,49.31,48.91,51.09,57.42,32.25,60.29,45.74,55.6,56.91,43.54,50.27,37.36,43.16,32.09,44.71,37.87,51.86,47.04,37.48,60.97,47.12,37.82,59.78,46.36,36.78,32.98,40.29,49.84,61.0,56.71,46.78,43.43,41.36,35.51,58.18,34.09,57.18,60.92,40.89,44.8,36.3,41.37,56.21,60.74,56.71,51.65,39.91,58.88,41.93,58.44,35.34,54.98,42.67,33.33,45.31,48.82,52.54,50.88,39.66,53.95,37.49,49.53,57.94,58.93,36.18,32.3,60.98,35.28,37.93,33.49,38.06,52.14,55.97,41.79,36.54,53.56,48.73,57.42,31.29,45.99,57.83,45.35,61.57,34.52,54.57,46.82,48.5,52.28,36.2,59.73,34.53,32.16,43.37,32.86,38.61,56.23,49.18,50.07,54.32,54.09,45.08,44.37,44.22,42.85,55.49,31.79,34.86,49.16,54.18,41.7,54.81,54.41,40.16,53.95,51.83,36.04,53.39,57.4,32.04,40.5,56.75,56.81,33.82,45.57,40.36,42.01,56.01,55.11,59.57,54.4,47.28,34.92,59.38,34.57,39.23,61.83,58.03,58.72,45.84,34.8,53.43,50.38,40.48,57.91,49.45,41.51,59.62,49.06,41.57,34.64,40.49,59.2,45.31,50.18,46.45,49.18,46.38,54.85,39.28,61.35,51.49,37.64,57.03,50.35,44.97,38.94,43.33,30.06,42.82,49.37,37.68,54.22,41.79,58.77,34.01,37.44,40.39,42.01,61.9,31.38,35.15,32.48,46.31,38.91,48.4,35.88,33.07,45.86,51.66,54.79,54.92,54.0,42.09,39.98,39.97,30.95,61.45,36.55,34.58,50.08,55.38,54.61,47.89,57.07,47.91,41.43,43.82,39.76,59.85,38.26,47.07,56.43,42.73,51.98,44.34,59.51,33.87,48.08,43.34,54.13,32.53,61.86,35.85,51.87,56.44,38.81,59.53,35.23,51.9,39.94,36.05,33.52,37.01,50.75,44.54,33.21,38.31,33.3,32.0,38.02,58.93,46.07,51.34,49.05,32.45,49.38,38.4,60.65,62.05,61.37,40.02,40.94,57.21,39.02,33.47,38.33,31.45,49.24,43.65,54.13,52.39,36.64,40.33,32.03,31.85,32.97,45.9,39.65],"繁殖管理率(E-F)+(G-H)/(A-B)":[35.14,57.7,64.47,39.11,53.72,45.92,40.2,44.94,53.71,60.59,45.16,53.92,59.73,60.22,48.6,45.15,42.21,50.28,48.46,63.41,53.91,33.86,51.33,49.69,55.08,34.98,43.23,45.04,63.71,47.11,62.03,60.63,38.02,56.59,40.56,33.57,56.8,42.94,43.94,60.38,61.73,61.09,53.85,62.67,57.42,65.01,56.41,42.51,36.25,45.23,61.32,44.66,50.5,46.84,55.33,57.93,43.48,37.12,54.21,57.5,36.82,56.0,61.7,39.64,61.35,40.49,38.73,53.56,42.65,59.56,43.68,56.58,39.73,62.43,60.3,45.92,49.5,38.1,38.85,46.93,60.49,35.52,63.0,53.8,57.83,61.37,38.73,62.81,39.28,42.8,34.36,61.88,40.79,44.49,49.96,61.56,59.71,63.23,61.51,54.9,55.97,66.01,36.68,58.61,46.83,59.34,66.67,41.25,48.78,52.31,58.8,45.99,57.74,64.83,58.99,46.22,61.54,42.79,62.72,40.68,54.65,62.87,66.08,52.82,55.26,35.39,36.19,54.34,43.29,49.66,64.59,56.32,62.81,50.52,53.89,55.5,35.26,46.52,54.28,50.18,49.63,49.18,50.85,48.19,55.72,56.99,39.82,56.93,52.67,49.47,35.78,48.17,34.56,58.54,34.88,56.73,44.46,64.43,48.66,50.78,60.32,41.56,57.27,58.52,45.87,43.74,58.29,52.3,39.15,38.03,37.66,35.65,63.73,46.33,65.95,43.67,43.35,39.42,56.17,56.41,41.04,56.35,53.57,37.94,40.1,50.18,41.17,45.44,66.11,40.59,64.44,50.3,57.01,39.38,46.56,50.56,61.64,46.56,57.69,38.11,63.21,54.49,57.25,61.5,56.61,66.39,54.81,59.49,32.62,38.71,37.44,52.16,39.14,57.36,48.87,56.73,47.29,55.99,43.72,42.81,48.92,44.14,40.14,53.47,42.98,41.0,38.12,50.89,36.47,42.54,61.3,60.61,46.36,42.02,44.97,44.47,57.76,57.43,56.14,59.3,62.09,53.91,35.58,40.91,38.13,58.33,39.38,38.93,49.76,51.95,46.32,38.38,45.35,36.13,35.97,59.17,41.22,52.43,53.42,36.73,46.84,42.55,57.41,59.17,46.0,59.11,60.7,49.8,54.26,61.5,51.33,36.7,40.39,40.16,62.63,37.28,57.31,32.09,38.5,62.9,36.36,49.6,37.44,38.31,48.97,37.76,41.74,56.14,63.71,48.96,41.82,43.93,39.7,34.31,37.55,52.52,53.0,60.23,41.61,62.0,40.19,43.39,45.54,43.03,45.65,51.83,61.72,61.62,52.38,46.59,64.55,44.96,60.11,33.96,42.76,64.45,46.23,36.19,45.14,66.79,59.96,46.41,55.69,36.31,35.47,62.8,42.55,44.15,41.06,50.67,60.13,41.83,43.48,50.71,43.43,35.54,49.06,64.24,47.32,61.19,53.54,65.53,34.71,43.68,54.2,43.36,43.73,37.14,56.02,34.49,43.23,61.27,36.22,47.87,46.39,57.08,32.41,38.1,51.34,50.72,45.79,64.42,47.29,48.81,57.43,37.31,53.36,40.51,40.45,46.33,58.76,50.04,43.47,33.63,37.88,46.45,63.17,44.29,36.01,59.88,48.03,45.38,51.9,49.93,47.35,49.82,36.85,64.18,46.79,57.68,40.38,53.95,56.51,41.37,45.22,45.1,45.4,65.76,61.61,38.69,59.34,41.98,45.8,36.67,54.77,54.19,44.58,62.18,54.65,44.69,41.85,37.82,42.64,51.97,50.35,58.17,42.65,58.48,56.17,56.72,39.09,57.83,58.22,62.97,60.0,46.7,60.32,57.98,42.83,39.09,40.29,60.38,59.89,38.74,38.02,39.13,51.92,39.18,59.59,63.2,56.52,45.98,42.83,48.08,38.08,57.31,45.89,58.1,60.06,35.28,59.49,55.19,49.11,48.5,56.79,40.09,45.12,45.51,56.25,37.25,56.93,34.1,38.94,47.78,56.14,41.67,61.6,35.98,55.95,64.83,40.75,45.02,38.0,46.22,36.56,45.92,58.32,52.27,60.8,53.7,56.54,53.27,56.85,52.85,57.31,40.57,55.66,40.49,60.59,46.16,64.42,43.32,52.84,55.92,46.79,65.24,34.78,60.1,58.07,47.5,48.06,57.2,39.79,36.06,48.56,43.83,57.58,49.02,38.09,57.11,64.5,45.94,64.45,37.03,51.39,56.8,34.32,61.82,53.91,48.01,53.47,43.97,55.0,50.79,61.14,40.38,63.27,63.94,37.45,51.38,44.86,36.58,65.51,55.51,38.59,56.16,44.58,32.92,56.9,41.83,61.84,38.74,38.11,60.65,51.28,48.79,48.67,63.04,42.01,54.79,64.03,41.83,57.24,50.48,59.77,38.86,55.44,36.15,49.51,36.34,46.38,36.37,56.49,38.31,64.12,40.57,54.4,51.27,41.9,33.51,57.7,37.89,59.43,44.12,56.66,33.89,50.86,64.11,46.71,46.35,41.74,39.02,54.76,59.77,59.69,40.8,44.55,43.52,51.11,43.95,37.72,60.35,59.86,50.54,39.02,36.17,43.68,57.06,39.82,53.77,57.12,58.66,34.69,59.27,46.81,61.89,40.26,58.52,65.63,40.65,50.82,40.74,40.68,34.32,37.58,41.56,46.29,48.81,57.22,57.95,38.81,55.2,48.02,55.65,60.52,46.65,40.03,37.12,60.38,51.3,55.81,48.15,59.26,51.87,38.99,43.39,59.59,35.49,61.04,40.34,35.84,48.95,53.42,41.13,43.55,35.19,36.08,51.38,66.82,47.57,44.68,50.78,48.41,56.87,34.77,46.04,59.12,40.27,53.71,35.77,61.62,63.01,37.05,48.66,36.1,58.34,61.03,35.08,52.9,59.73,43.15,42.68,50.81,64.37,50.47,43.43,48.68,52.34,48.55,44.46,54.31,59.8,56.09,64.79,53.91,41.55,63.13,63.8,53.54,48.65,41.3,50.0,49.79,48.26,35.13,45.2,62.04,61.23,35.65,45.33,60.03,44.26,35.66,55.66,55.06,47.52,44.71,50.71,39.36,34.81,59.97,55.03,36.65,58.52,40.76,41.27,40.55,62.31,58.65,62.85,43.33,50.6,54.56,53.25,47.18,61.33,51.42,44.96,49.56,33.94,36.44,38.25,58.8,43.07,63.41,52.28,34.52,59.48,41.9,51.61,50.0,60.52,54.93,59.5,38.5,36.54,57.51,44.37,51.22,42.26,56.19,35.32,54.89,57.75,40.52,35.03,52.58,43.04,53.29,51.09,62.61,48.03,37.04,40.24,61.14,60.12,52.55,56.47,42.62,61.92,49.6,47.94,50.74,56.21,57.55,33.93,58.21,46.52,42.68,43.25,35.32,49.55,52.69,37.5,43.43,41.73,32.89,42.58,56.18,35.43,43.29,39.99,44.46,36.12,54.28,43.76,42.39,35.47,64.69,59.27,53.75,62.61,45.26,51.71,39.04,35.01,60.42,45.35,50.58,63.17,58.54,45.48,65.74,49.27,35.62,52.46,48.13,36.07,43.73,47.13,42.43,41.79,46.77,40.61,40.95,48.49,61.71,64.52,50.26,65.96,37.91,45.61,51.58,43.44,52.75,60.3,42.9,56.88,39.3,38.13,49.01,53.63,31.31,46.94,34.78,61.53,62.9,45.74,57.73,49.11,57.88,40.9,54.18,61.47,59.7,35.84,47.21,43.07,41.55,41.84,56.15,33.87,51.75,56.28,59.73,42.72,50.74,43.21,66.09,34.74,48.13,46.88,45.61,64.72,55.31,54.95,51.69,51.29,52.71,61.94,37.04,61.59,49.8,59.17,59.9,45.35,55.45,40.75,46.79,33.85,48.45,41.75,53.7,50.72,39.23,65.38,49.99,41.74,62.88,49.18,41.86,37.69,44.8,51.23,65.07,57.72,49.8,45.48,43.7,40.55,60.63,37.77,62.27,63.99,43.36,49.63,38.22,45.59,58.92,61.98,58.38,55.74,43.97,63.35,46.39,61.89,39.1,58.27,43.9,38.19,49.33,50.34,56.37,53.61,41.37,57.59,40.1,51.13,61.42,61.26,38.06,37.35,62.83,37.48,39.08,36.14,42.5,55.42,59.92,43.28,37.93,58.36,50.0,61.78,32.62,49.22,60.33,48.12,65.08,35.66,57.33,51.91,52.22,54.49,41.32,61.53,39.51,35.16,45.25,36.82,40.28,59.26,52.0,54.65,58.47,57.21,48.5,48.23,47.23,45.32,59.87,35.15,39.13,54.08,56.41,46.21,57.63,59.25,44.41,57.33,53.96,38.51,58.36,59.13,34.63,43.5,59.58,61.59,38.03,46.65,42.96,44.93,57.38,57.21,61.94,58.4,50.23,36.57,62.63,37.75,40.38,65.8,60.79,61.55,48.3,36.32,56.14,55.02,43.32,59.22,52.37,46.37,63.97,50.13,42.93,36.11,42.67,62.91,48.5,54.41,50.8,51.18,50.57,57.93,41.78,66.55,56.67,42.46,58.31,52.87,47.54,42.59,47.86,31.11,47.16,50.58,39.39,57.63,46.62,63.72,37.53,41.76,44.05,43.69,63.78,33.39,38.8,37.66,47.39,40.57,53.65,39.22,34.49,47.48,53.69,56.27,56.19,57.3,44.11,43.74,42.46,33.42,64.14,39.36,37.01,51.9,58.07,56.73,50.57,59.39,51.72,44.09,45.35,42.68,63.49,40.37,50.76,58.93,44.1,56.0,46.16,63.13,35.58,51.37,46.33,57.43,35.7,63.67,39.04,56.21,60.5,42.61,62.43,38.49,56.47,42.88,39.02,36.35,38.61,52.85,47.3,34.94,41.68,36.7,34.76,40.32,63.03,49.41,52.85,51.18,35.96,52.89,41.1,62.19,66.74,63.73,41.95,42.67,60.03,43.06,34.65,40.59,35.05,50.86,47.65,58.95,57.34,40.81,43.14,35.33,36.44,34.97,48.62,42.72]},"cities":["南投縣","嘉義市","嘉義縣","基隆市","宜蘭縣","屏東縣","彰化縣","新北市","新竹市","新竹縣","桃園市","澎湖縣","臺中市","臺北市","臺南市","臺東縣","花蓮縣","苗栗縣","連江縣","金門縣","雲林縣","高雄市"],"years":["2025","2024","2023","2022","2021","2020","2019","2018","2017","2016","2015","2014","2013","2012","2011","2010","2009","2008","2007","2006","2005","2004","2003","2002","2001","2000"],"animalTypes":["狗","貓"]});
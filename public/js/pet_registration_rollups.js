@@ -0,0 +1 @@
+const petRegistrationRollups = {"format":"pet-registration-rollups","version":3,"last_updated":"2025-10-06T01:20:49.673603","source_url":"https://www.pet.gov.tw/Web/O302.aspx","cities":["南投縣","嘉義市","嘉義縣","基隆市","宜蘭縣","屏東縣","彰化縣","新北市","新竹市","新竹縣","桃園市","澎湖縣","臺中市","臺北市","臺南市","臺東縣","花蓮縣","苗栗縣","連江縣","金門縣","雲林縣","高雄市"],"years":["2000","2001","2002","2003","2004","2005","2006","2007","2008","2009","2010","2011","2012","2013","2014","2015","2016","2017","2018","2019","2020","2021","2022","2023","2024","2025"],"animalTypes":["狗","貓"],"cityYearAnimal":{"city":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21],"year":[0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25,0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25],"animal":[0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1],"registrations":[1116,611,1502,334,620,354,744,776,1904,852,1531,1234,717,1072,1446,1066,2154,1453,1949,1057,2226,1150,2240,1173,2022,1691,2850,482,1467,1303,2388,2064,3412,1689,3673,2455,3445,2607,3411,2494,3666,1621,3965,2813,3014,2504,1173,2195,4447,1919,3131,3076,475,896,404,237,481,1069,1572,1123,1922,1315,1055,504,1591,833,647,788,1264,374,2036,1567,1042,1631,1665,1617,1834,1126,2244,723,1196,1252,1197,1011,1801,1943,2426,1077,4019,1191,2399,2377,1329,1383,3532,2157,926,2097,2548,848,1284,725,4551,2863,1491,714,1563,340,440,279,1580,795,617,826,816,438,2227,871,1211,704,913,921,763,576,1192,845,1630,1640,3020,1712,3140,1169,948,1271,1959,1160,947,2305,2976,2173,3358,1354,3535,618,2183,2589,3129,1590,2945,3172,3995,1864,2814,1857,3363,1225,1766,1095,551,835,1161,1054,2276,399,1170,1388,2092,869,2228,478,2901,447,1334,503,3180,1136,1140,1180,3130,756,1401,2379,1236,1287,2382,2480,3564,1425,3003,2777,3628,1112,1443,2971,4778,2486,3633,1920,3906,1062,3703,2882,2609,3108,3086,4046,1215,3786,906,1013,1323,503,1028,659,798,1036,1981,818,1671,389,2060,734,999,1629,1135,840,830,1408,1959,1473,3015,1232,1444,1579,3046,1622,1080,2000,2681,2006,2223,2311,1881,630,3979,2394,4136,1887,3963,1368,1707,2357,4543,2879,4188,985,4280,2440,1764,2655,518,744,1474,460,1111,437,1673,1092,860,833,1907,500,1581,1201,1327,1583,2535,1402,2495,577,2601,1625,818,551,2554,1554,2950,1309,1304,1013,1524,1776,3057,958,2056,1917,2723,1597,4084,2696,978,2837,2425,2994,4517,3146,3645,2464,1261,2067,1579,926,754,1057,1345,515,1627,897,1265,1491,1108,832,1456,1559,600,1757,1598,1398,1156,702,3043,1906,2570,1430,3370,982,2997,2113,2617,2000,2294,1411,3309,1962,3406,1087,1138,1431,3992,3319,2726,3075,4340,2721,2464,2921,3331,2361,3336,1320,3705,2299,2840,1390,556,1371,1252,1555,2413,546,789,1073,1842,2060,2104,1896,1621,1610,1939,2491,3221,1208,2503,1227,2245,2347,3659,1252,4707,3140,3275,2114,4738,2883,3432,2716,5497,2979,1692,3857,2485,1641,3224,3682,3052,986,2252,2676,6312,2148,4722,4089,1694,3735,4675,3208,837,404,1000,951,1552,466,1187,541,2081,1555,1160,527,2746,804,2475,1269,2299,1342,1255,869,1737,751,1251,1860,1690,2606,3890,912,3365,2515,1826,2980,1862,704,4359,2097,3754,1785,2130,2589,1704,1075,1821,1655,2166,3119,1180,2905,4798,2093,1537,1429,896,848,1193,550,783,693,1565,922,1273,984,1240,877,1432,854,796,557,1328,1505,2456,527,2034,591,2254,1746,1357,1485,1287,1213,1799,1884,1987,1923,1739,1185,915,2347,1311,2776,1013,2464,3538,2240,2054,1533,3918,777,3152,2414,1657,2867,3972,1488,1457,452,1067,561,1924,714,2034,1155,1414,539,2137,1099,1051,1591,2715,2022,1770,680,810,2244,3459,927,2803,707,2482,2510,960,1435,1265,2231,1649,1275,1069,1832,1330,1430,1495,1186,1317,2534,1590,1034,1256,3623,4093,791,2000,1395,3774,861,4174,2356,422,305,1443,433,401,1047,951,1302,465,1045,2160,1297,2304,1452,677,368,2561,617,951,943,622,1252,1287,693,1463,586,1898,1272,1536,2076,1268,2048,1456,1255,1689,2603,894,2080,3004,999,2946,2334,1680,2516,2457,2412,2266,800,3084,1295,3207,3192,1449,939,1916,877,2652,732,2367,413,2924,2076,1767,2219,2113,2390,1782,1179,2750,1248,2747,1867,1483,847,1137,1302,2225,1200,2988,1691,3175,1598,5330,2145,1266,1986,4539,2648,2995,2792,4275,3630,4730,3479,6241,984,5133,4490,1850,2672,5145,4991,6100,1825,782,1269,843,1643,2082,1845,2332,640,2481,560,1789,1956,3206,1993,1353,1877,3406,1087,1824,2080,1677,2169,1936,1917,1688,2323,1495,2946,1233,1502,3391,2949,4421,3866,4914,1332,3281,3198,1874,933,5971,2735,2646,3750,1526,1989,3479,3436,4150,1268,2403,2123,498,926,1121,1204,1777,754,2259,1346,1299,984,926,1465,3413,1169,2741,1952,1068,1514,991,2142,2533,2377,4000,1134,2064,2236,2570,1407,4441,1342,4850,3446,5342,1998,3920,939,5196,4137,3815,1547,6201,4015,3120,955,6332,1320,5498,3903,1570,2641,6286,3748,657,562,1561,856,1457,347,885,987,1500,1096,796,1372,1337,1197,1792,1570,2206,591,1896,1741,2654,1906,1558,1996,1613,579,2489,778,2354,912,2716,2152,3495,1641,2560,1694,2547,1759,2167,828,3089,998,3417,2649,2276,1336,4443,1873,3230,697,2530,2224,554,888,491,575,1374,842,1506,1169,1686,819,632,869,1058,1341,1276,950,586,636,1297,608,932,1698,2165,1054,2787,2154,2023,1687,1377,1372,951,599,3478,1650,3678,984,3634,2195,2490,2438,1126,1193,3123,834,3569,2807,2333,1808,3967,2715,1526,1367,700,1024,1431,870,1246,758,1761,1010,606,1267,1254,1180,1042,763,1407,704,650,1442,1430,386,1712,1974,2363,1070,2438,1014,3230,799,1071,820,996,883,2585,840,2100,2473,1192,2653,4030,1410,948,2992,1102,2638,3543,2747,3131,2428,3644,2448,1941,3457,675,230,334,514,1246,494,671,672,1414,702,586,595,2010,1565,625,548,2083,1295,949,415,2002,1717,2537,1477,2148,1952,1954,756,1850,615,2886,1335,1003,2025,1114,1491,1400,795,3455,1358,4198,800,927,786,2463,1779,1112,1821,4627,1745,4884,2430,352,355,435,1047,569,317,1844,1100,412,818,853,446,1992,1283,1266,1122,1759,1378,858,1864,1916,415,1256,1628,2264,690,1809,956,3249,792,1387,1624,2181,2159,3173,1629,1858,2457,3243,2090,2707,952,2244,1453,4182,1583,2339,2704,3019,2679,1356,2860,377,712,1479,674,929,356,883,935,1435,1331,1117,827,2047,1430,1027,972,2569,1822,1414,789,1376,499,2931,1732,1425,1826,1768,904,1475,2027,2715,1869,1712,1174,3273,1640,2481,1758,1812,2125,3248,2491,2060,2665,1389,688,4374,2591,2600,2557,3612,1502,536,928,718,622,716,1569,2323,1774,2111,1181,2968,1491,3261,814,1967,581,3280,2107,3215,990,1140,1054,1535,1632,4733,732,4554,1917,4848,2436,4473,844,1165,1077,1991,2465,2257,1902,4336,3665,6299,3461,4266,2244,6834,2307,5208,2898,3535,1315,7213,1292],"removals":[70,12,59,19,28,20,26,17,40,28,51,52,25,31,82,71,101,64,90,49,124,79,134,39,95,58,126,28,34,46,134,106,228,43,109,138,105,124,101,70,246,91,197,149,183,100,60,129,143,51,66,68,25,41,8,9,22,41,98,58,79,63,34,24,67,33,35,28,50,25,114,60,40,39,46,84,120,74,87,48,44,41,38,42,103,77,138,29,206,41,84,86,77,37,221,51,64,43,175,55,31,36,202,166,100,45,78,16,12,13,53,21,32,57,31,28,97,50,60,14,21,64,39,30,28,34,68,84,157,115,119,78,36,42,63,64,57,119,125,112,89,29,102,26,118,85,138,102,157,169,98,105,127,47,141,74,77,48,34,22,34,27,152,21,37,86,130,27,87,17,188,21,29,20,217,66,33,63,120,50,69,72,80,79,54,122,164,56,83,73,225,40,95,112,131,147,158,46,156,40,91,121,176,117,120,151,36,241,20,48,52,30,67,40,50,72,120,20,35,24,88,16,46,90,57,50,56,64,84,42,123,81,75,103,66,32,32,102,62,45,95,88,126,28,195,120,151,68,90,39,57,151,285,64,112,47,262,98,106,133,33,22,41,18,31,16,115,48,39,52,63,27,58,44,74,40,153,60,139,22,72,64,39,37,84,58,135,74,87,67,85,107,77,41,125,110,152,81,148,122,48,137,102,83,135,194,248,121,43,66,56,39,21,55,42,16,63,26,26,98,32,32,76,64,38,91,56,29,48,22,210,78,62,59,94,38,127,138,88,56,93,97,106,72,133,24,29,52,139,88,149,150,216,108,124,123,140,59,161,52,89,104,155,29,17,93,66,80,67,35,17,26,94,45,106,92,78,87,78,60,117,52,152,37,57,74,107,73,299,68,199,71,329,144,88,146,350,161,102,225,93,76,188,164,196,51,137,54,231,81,301,262,90,162,204,143,47,24,26,54,56,15,71,14,141,103,36,15,111,55,140,75,63,77,28,21,95,43,60,59,66,64,86,46,152,114,47,127,63,47,154,98,123,105,134,131,55,64,45,72,86,211,30,165,129,57,90,68,60,50,82,21,36,25,72,42,36,59,61,35,85,47,54,35,92,83,64,33,101,34,53,94,85,51,34,60,112,41,74,66,80,48,63,58,44,163,44,115,185,119,67,34,145,17,179,74,33,154,219,45,44,9,60,17,114,42,67,26,36,28,119,50,23,37,182,90,78,42,52,103,202,56,56,48,108,80,37,43,87,49,54,34,58,117,77,70,104,37,65,151,110,29,59,230,161,25,91,84,233,49,267,137,23,12,73,24,18,24,50,61,22,27,79,28,93,57,36,23,155,20,33,19,26,30,89,17,75,22,67,60,38,129,67,78,57,37,113,122,54,130,116,32,144,61,39,127,99,89,66,24,107,81,112,132,40,50,48,19,118,44,93,25,146,92,50,81,121,74,47,51,164,74,160,60,50,19,28,57,101,45,67,98,188,78,254,68,67,71,125,118,125,139,218,99,126,109,228,46,212,218,77,180,169,296,296,88,45,63,28,37,63,39,60,38,59,14,121,90,119,50,28,86,203,39,51,79,83,63,69,83,75,138,31,183,32,80,85,148,95,179,195,80,166,174,58,57,340,79,137,232,94,106,217,147,204,34,142,45,27,33,48,57,115,20,84,80,32,60,28,71,164,26,109,117,22,70,22,146,143,119,265,58,75,91,118,46,277,84,293,137,350,118,260,32,192,147,173,61,283,206,193,19,303,87,183,245,103,156,400,75,40,29,57,26,92,19,55,22,63,26,23,76,39,25,41,101,140,30,47,44,110,47,65,79,109,11,132,38,120,51,65,148,214,106,145,69,94,49,120,31,212,37,111,171,81,41,120,41,136,36,142,45,21,50,16,36,68,47,95,33,104,24,26,44,58,28,85,21,27,15,31,33,53,37,62,38,69,71,139,94,64,84,55,21,209,45,185,47,140,123,89,65,55,62,213,21,243,138,113,96,265,103,89,65,20,46,84,36,52,50,110,24,36,60,48,57,66,28,31,47,43,56,92,10,119,46,108,63,102,62,219,28,72,24,50,49,179,27,60,101,82,151,102,33,38,167,76,70,97,74,168,56,118,52,83,227,46,13,8,30,53,27,39,40,63,27,24,17,69,80,29,11,46,71,53,21,122,48,75,71,122,57,100,39,92,14,117,54,23,89,53,78,93,52,116,31,168,17,61,21,70,118,71,78,254,37,170,54,7,17,21,22,36,12,128,34,21,54,59,21,93,76,80,58,68,38,21,45,91,21,74,46,129,47,55,62,156,51,52,104,57,88,193,109,127,163,142,64,67,65,56,66,176,97,71,142,83,79,74,141,12,39,44,28,41,17,61,36,60,33,73,18,49,60,68,27,91,107,82,37,32,34,116,109,57,70,111,52,54,64,180,70,82,81,192,76,50,118,92,143,82,60,70,162,41,31,116,75,174,135,80,54,33,20,26,14,26,89,51,37,104,51,190,50,100,56,62,38,159,103,142,34,25,34,75,106,278,32,171,48,131,131,131,43,33,47,107,60,154,56,208,184,412,150,194,121,473,144,272,161,213,85,308,78],"neutered":[536,323,815,105,320,197,329,326,823,295,888,416,233,615,861,633,918,634,1145,360,1142,489,1287,668,759,582,1525,277,496,568,926,922,1195,934,1712,1137,1724,1161,1456,765,1309,953,2070,1233,1231,1037,553,1047,2363,992,1034,1514,260,275,136,106,287,532,815,538,701,647,402,277,479,468,278,306,449,223,842,882,477,721,944,713,628,389,844,370,583,590,703,421,1016,937,1100,375,1254,709,1101,1069,603,617,1661,738,279,1152,839,435,509,416,1483,1498,661,360,757,183,150,148,558,286,369,295,349,162,789,305,595,370,457,380,275,325,656,463,849,820,990,1014,1289,681,492,572,897,659,490,1018,976,849,1973,637,1955,249,789,926,1775,824,990,1834,1610,745,1098,628,1052,610,665,633,305,306,538,623,1112,213,567,711,705,384,1047,178,1137,200,658,213,1281,645,471,579,1866,451,504,1267,531,648,1062,931,1992,687,1699,1568,1293,614,865,1154,1443,1371,1792,790,1723,513,1992,1613,997,1378,1004,2375,429,2083,345,410,411,301,422,210,360,357,1027,388,901,182,678,309,303,654,412,283,315,481,774,847,1359,629,680,795,1496,794,616,611,1256,674,913,1195,1011,191,1782,845,2138,970,1845,758,615,1102,2368,1351,1879,325,2499,1043,987,1033,206,281,780,139,637,142,838,387,388,416,775,241,921,480,409,617,864,725,788,201,955,772,353,220,1408,542,1174,458,543,530,564,967,1825,518,740,696,1146,952,1512,1588,577,1135,1410,1381,2203,1654,2065,1398,388,972,587,329,321,370,683,234,909,453,578,581,426,255,795,618,345,848,658,685,483,317,1149,749,1389,487,1510,321,1566,868,1325,862,847,842,1374,899,1197,350,559,466,1593,1262,1553,1834,1889,1522,952,1663,1449,946,1935,552,2026,952,1220,438,288,591,750,781,944,231,383,558,657,709,867,658,895,846,813,924,1453,523,1491,631,938,992,1429,566,2140,1269,1299,727,1984,1073,2055,1604,2273,1234,624,1613,785,777,1604,1434,1767,472,1270,1384,2039,765,2641,2416,536,2072,1762,1892,330,170,415,530,865,190,545,208,689,922,564,253,925,245,1479,740,1051,541,419,379,898,442,466,619,853,905,1628,505,1771,756,590,1297,936,273,1330,914,2113,645,854,1004,626,366,878,923,1158,1684,686,1096,2185,788,499,544,442,469,536,308,447,413,726,482,453,495,404,369,531,289,336,231,511,713,1268,278,1150,222,1124,809,559,704,510,377,969,593,997,710,537,707,419,926,657,1163,304,1175,1480,1260,1056,476,1720,262,1492,1036,850,1315,1420,491,868,229,543,220,600,364,1053,483,728,320,778,381,616,927,1557,837,720,394,463,778,1337,467,1416,240,1025,1306,487,591,620,692,572,664,440,796,697,660,699,549,473,1327,697,619,428,1951,1543,417,893,691,1658,400,2394,1392,247,168,486,243,143,490,418,569,220,561,1202,497,799,705,276,111,1134,226,538,343,219,636,396,262,835,187,1031,392,614,693,486,797,695,421,872,839,372,780,997,482,1316,1202,593,1464,1314,818,1098,334,1518,773,1562,1019,516,290,761,492,1487,436,1206,240,1484,1028,855,1190,908,1119,734,532,1427,509,907,1031,659,329,441,695,688,559,919,880,1616,728,2432,844,557,596,1525,1414,1213,956,1459,1158,2609,1951,3362,400,2825,2506,629,951,1992,1975,2074,1092,255,606,448,589,712,999,1378,208,985,306,806,599,1304,762,687,1049,1067,372,781,1047,839,763,1054,1051,589,1370,813,1061,511,873,1895,1502,2392,1822,2269,611,1278,1053,766,325,1849,1086,1063,1375,637,986,1951,1313,1426,606,1310,806,249,375,371,483,663,425,741,580,504,491,373,505,1701,450,1571,735,328,496,566,1104,862,1372,2249,678,1231,1213,1163,514,1564,630,1561,2032,1914,632,1905,493,2040,1592,1770,760,3464,1804,1273,350,3017,405,2878,2118,717,1114,3119,1499,284,328,931,474,873,133,287,588,637,498,415,567,461,517,673,817,1167,308,866,854,1384,997,548,1119,667,217,783,297,774,490,1224,1138,1763,532,1201,846,1360,813,1185,403,1759,555,2036,920,1234,790,2055,748,1088,221,1263,704,256,495,265,286,772,407,665,388,577,441,327,293,486,533,712,312,242,336,609,207,365,849,1181,476,1260,1010,821,620,671,555,437,251,1557,957,2056,391,2062,912,1383,1256,409,699,949,433,1407,947,1136,652,1371,1451,682,422,414,572,566,364,725,265,805,540,272,693,469,395,388,370,486,395,369,652,717,206,518,835,1197,533,751,324,1105,451,433,384,564,389,1329,415,831,1014,657,947,2269,569,297,990,528,1209,1544,1247,1257,729,1963,1376,953,1250,208,134,121,293,579,260,363,250,583,269,300,341,673,899,289,325,643,547,525,248,620,837,1056,857,1101,654,879,289,581,206,1581,677,601,802,620,551,622,419,1335,783,1361,472,297,251,1328,1043,577,555,2413,906,2394,969,180,180,245,383,251,186,566,656,225,300,480,238,862,718,460,412,683,552,341,1043,1005,226,531,957,884,340,976,330,1834,372,704,501,946,1127,1149,613,1063,1140,1362,1059,999,361,848,488,1630,600,1066,1611,1652,959,425,1271,208,255,588,224,473,211,449,496,858,455,473,257,1148,549,570,308,1314,593,715,301,630,153,937,858,837,946,964,334,849,865,1228,592,623,407,1914,757,907,965,968,937,1660,1019,762,1568,756,375,1802,968,1034,1092,1382,649,229,410,309,340,295,643,1039,816,1047,698,1043,507,1954,330,605,178,1044,1135,1196,590,638,338,650,694,2369,259,2672,968,2478,862,2459,493,382,354,1047,768,729,838,2094,1927,2595,1461,1379,1162,3252,884,2557,1399,1210,503,2821,506],"neuteredRemovals":[9,8,21,1,6,3,7,8,8,5,20,9,4,15,8,14,11,13,32,5,14,13,19,11,11,14,27,7,5,12,18,27,23,23,22,26,34,18,19,20,14,21,37,25,18,27,7,27,39,21,16,33,6,6,2,2,6,9,14,6,12,12,10,6,6,13,3,6,9,6,18,26,7,9,18,18,17,6,13,5,14,8,14,6,10,23,29,7,37,19,19,21,14,14,21,11,5,20,17,5,8,6,35,38,15,10,8,3,3,3,12,2,5,3,6,4,9,7,13,4,10,11,6,6,18,6,12,21,19,27,22,11,11,9,22,13,8,29,17,18,33,8,27,6,15,17,42,12,18,45,32,10,24,15,21,7,9,10,6,3,10,18,32,2,16,8,9,3,29,4,20,3,15,3,35,17,5,5,46,13,8,31,10,16,31,18,35,19,22,46,15,10,23,19,39,29,45,15,24,15,30,46,12,33,23,44,4,55,8,4,8,8,10,5,5,7,24,9,18,2,19,4,5,18,8,3,7,11,9,23,31,13,18,8,39,23,17,17,31,12,18,23,20,5,43,18,38,25,20,11,18,32,61,20,32,6,30,28,10,16,2,5,13,3,15,3,10,6,7,4,9,5,18,12,4,17,16,10,17,2,22,14,6,3,35,7,32,13,6,8,9,16,35,10,14,16,16,10,41,29,10,18,41,18,49,48,54,21,11,10,8,4,5,5,15,5,23,11,6,8,8,2,18,14,5,11,7,7,7,6,23,13,20,8,34,7,42,14,33,9,8,22,27,11,26,5,8,8,20,17,21,43,45,28,24,45,38,17,42,9,40,14,24,10,4,13,17,8,23,5,9,15,19,20,10,9,19,18,12,20,41,6,37,16,26,10,27,10,33,37,24,14,26,20,52,32,28,15,14,28,17,15,16,27,45,6,34,17,41,20,45,68,15,33,27,33,4,3,4,13,19,3,15,3,10,26,10,4,12,2,18,7,11,10,12,9,10,4,12,11,13,18,32,11,27,10,7,37,21,8,24,21,21,17,19,19,10,7,11,14,33,32,20,29,44,9,14,13,12,6,15,3,12,6,17,13,8,9,7,8,13,3,5,6,7,14,22,5,25,3,20,20,12,12,13,7,21,7,21,19,10,16,5,10,15,26,4,35,33,26,12,7,19,5,22,22,11,38,31,8,20,4,14,3,8,9,17,12,16,4,14,5,14,16,36,17,21,5,12,19,30,8,22,5,19,33,8,7,8,18,6,14,12,18,14,14,17,16,8,34,20,6,5,52,25,8,18,16,18,11,68,15,3,4,13,4,3,11,9,15,5,14,27,14,15,8,7,3,21,6,14,5,4,15,5,4,9,5,18,11,17,8,8,14,9,11,21,16,9,10,10,9,17,28,14,37,31,15,16,8,27,22,44,10,15,5,18,6,27,8,12,5,25,28,12,20,18,25,16,7,38,8,26,27,12,8,13,7,8,11,12,19,37,18,57,17,7,11,21,29,31,27,32,22,49,40,56,8,58,54,12,13,56,30,29,26,3,10,4,11,8,13,38,5,20,5,20,7,33,13,13,15,18,4,17,18,13,17,27,16,17,37,17,24,12,22,26,44,58,37,59,13,12,18,9,7,33,16,11,36,16,10,58,21,39,15,34,8,6,6,8,6,12,4,21,12,13,5,6,6,45,12,36,19,6,13,7,16,20,37,51,7,27,14,22,5,26,16,18,54,41,18,29,13,49,32,44,18,96,22,24,8,52,10,38,32,7,25,64,29,5,5,19,8,16,1,4,15,8,13,7,13,10,9,13,18,18,5,25,22,29,24,6,11,9,4,8,8,19,8,21,17,40,12,18,12,38,9,19,10,39,10,20,23,31,21,47,8,18,6,37,10,3,5,7,5,22,11,14,7,15,4,4,4,9,12,20,4,6,7,10,5,5,14,14,6,28,15,19,6,12,12,7,4,33,18,60,8,26,10,18,21,4,12,9,8,20,15,22,11,18,37,20,5,12,16,6,5,15,7,21,13,4,10,9,11,9,5,14,7,3,9,10,2,14,21,21,11,20,9,22,10,7,7,9,8,23,10,16,23,16,14,34,8,5,27,6,28,15,29,27,16,31,24,10,12,2,2,1,3,13,2,8,3,5,3,5,10,7,9,6,7,8,15,13,5,8,11,14,18,15,18,19,6,9,4,44,19,11,16,14,13,13,5,28,21,32,11,7,5,37,16,6,8,25,20,66,27,3,4,2,5,3,3,8,7,3,5,8,2,9,20,5,5,7,7,3,13,28,6,14,22,24,3,13,9,41,6,11,7,23,28,24,9,12,26,30,24,28,7,18,9,21,17,14,25,26,27,9,23,5,3,14,3,5,2,12,13,10,7,13,6,24,10,15,9,17,8,14,7,10,3,12,8,16,16,21,6,13,8,23,14,9,4,25,12,21,24,14,15,18,25,16,27,8,7,32,20,13,18,29,17,5,10,3,4,3,9,10,19,17,17,20,12,58,9,13,4,17,16,22,16,10,8,12,11,44,6,50,27,62,15,57,5,10,6,24,13,13,9,43,26,32,23,22,25,67,8,70,21,18,14,63,9],"exempt":[37,24,42,16,11,16,24,14,32,29,29,20,29,27,58,33,95,71,43,39,32,19,106,44,58,26,130,11,41,42,54,50,143,68,132,37,37,61,77,97,133,47,137,74,70,70,12,25,142,75,53,49,17,18,13,3,22,20,39,25,59,18,37,13,16,41,9,32,13,7,35,54,16,19,47,41,53,20,49,30,22,33,57,23,52,49,28,25,118,52,55,26,46,65,53,24,29,43,35,27,47,25,148,130,30,30,56,16,10,2,62,19,13,9,10,11,40,32,59,8,29,32,34,8,23,16,70,33,120,37,79,46,28,32,82,34,40,104,97,64,35,37,59,27,36,48,104,41,119,71,85,85,67,31,89,57,23,44,18,20,35,27,73,17,56,34,52,38,81,9,43,12,27,22,111,14,42,51,119,17,18,43,19,58,87,114,118,65,74,68,101,20,30,78,51,55,180,44,152,13,150,78,69,77,42,143,35,100,37,18,65,5,38,19,39,13,58,11,62,15,58,22,40,37,32,39,22,41,81,46,62,17,40,16,66,37,22,66,50,37,27,49,82,12,176,35,59,61,111,36,31,82,95,83,131,33,108,70,68,71,15,34,57,21,11,10,59,16,32,36,54,12,55,34,50,69,117,59,120,16,81,58,23,9,125,72,83,57,49,16,70,71,83,47,51,74,36,58,140,107,41,114,54,148,217,119,126,116,30,66,35,37,15,16,53,18,76,34,58,66,25,8,69,74,12,46,45,55,48,11,138,47,123,42,57,10,109,62,93,57,42,58,35,53,164,22,40,29,171,78,89,142,154,133,40,70,96,60,138,55,46,30,74,49,27,57,38,17,83,9,16,51,51,79,25,89,36,27,66,113,74,20,92,60,94,104,39,22,158,53,82,26,194,52,104,93,201,48,62,156,96,59,139,65,37,13,73,86,242,51,125,200,83,83,171,47,29,12,24,43,75,6,30,14,57,68,18,17,54,14,44,34,94,43,43,26,66,21,62,59,72,32,168,14,44,99,41,129,75,18,168,37,60,74,102,65,56,51,27,69,65,139,15,100,76,43,41,55,19,32,40,14,11,12,32,35,51,21,33,29,26,17,12,22,62,39,64,25,36,8,59,60,20,18,26,30,73,79,36,76,81,30,34,61,39,85,37,52,122,52,76,20,130,32,87,106,33,100,60,17,63,19,39,15,30,33,24,31,62,7,46,24,22,79,114,20,86,14,16,78,88,30,135,16,59,118,44,24,62,108,25,19,24,72,21,44,73,20,27,45,60,41,45,134,66,38,47,68,38,31,113,104,9,15,70,12,18,29,25,21,9,23,59,57,63,26,14,11,91,27,10,24,7,30,41,15,49,7,92,35,53,99,56,89,59,35,39,56,19,77,48,23,79,93,36,43,114,74,44,13,54,22,66,61,50,26,51,25,108,18,68,15,108,81,75,77,102,40,62,47,87,19,120,41,42,24,21,23,97,35,83,48,152,34,95,36,58,65,55,37,74,28,120,60,165,34,198,14,150,74,27,121,83,125,190,41,7,23,24,44,89,76,87,7,85,14,30,72,150,62,20,43,111,29,41,95,75,74,43,21,32,66,74,41,57,17,168,113,48,111,207,23,119,42,22,46,271,120,112,156,27,40,90,82,144,33,92,56,10,17,26,24,27,12,47,48,29,43,19,50,107,40,47,81,17,37,16,74,68,56,65,23,99,83,106,33,78,58,102,112,92,71,133,42,130,186,59,27,178,115,36,13,170,32,144,47,77,38,271,71,20,6,16,14,53,10,14,42,40,21,26,53,35,27,85,24,65,14,90,49,76,78,52,64,74,25,114,12,116,27,84,82,67,71,86,79,114,78,56,19,89,16,61,127,62,42,189,67,75,21,36,100,15,16,8,9,25,36,47,24,61,14,25,14,19,44,56,37,23,6,59,23,40,57,36,46,94,73,26,35,22,50,39,15,130,16,104,16,172,43,111,69,42,14,147,18,150,44,94,74,104,86,48,43,10,37,71,24,45,30,28,50,18,35,53,47,13,21,26,14,25,49,18,14,58,54,85,50,38,31,92,16,40,32,10,36,102,20,63,35,54,83,182,34,16,104,28,83,133,29,144,25,52,60,39,73,7,4,12,14,58,5,15,29,51,23,8,11,67,25,19,11,50,20,12,6,29,56,37,60,24,82,77,15,52,13,119,55,11,73,51,27,35,34,131,60,190,35,23,23,81,66,32,35,93,74,165,73,9,6,11,19,12,14,35,54,19,39,21,8,77,47,32,53,59,61,19,54,62,4,57,66,37,34,87,15,50,32,32,48,79,92,145,54,87,96,132,33,134,36,25,69,170,17,95,48,79,83,45,74,15,21,50,30,29,15,21,41,61,38,24,40,21,31,20,29,127,47,27,9,40,20,54,25,25,62,46,15,22,20,83,54,47,55,40,79,63,71,39,32,58,60,52,88,59,9,58,43,49,44,119,58,7,9,7,8,15,50,28,85,101,14,116,66,48,12,55,19,162,81,116,28,11,37,36,18,148,19,189,64,189,101,132,23,22,46,65,61,30,41,164,58,107,68,199,102,293,65,229,69,111,36,204,21],"exemptRemovals":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,1,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,1,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,0,1,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,1,0,0,1,0,0,0,0,0,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,1,0,0,0,0,0,0,0,1,0,0,0,1,0,2,0,0,0,0,0,1,0],"registrationUnits":[80,171,97,150,56,199,225,115,56,159,196,178,265,278,204,84,152,107,287,60,150,213,141,234,297,120,297,146,129,172,284,101,289,276,212,267,62,291,74,82,82,215,137,271,80,79,230,230,224,86,185,121,279,248,295,133,52,231,291,207,223,236,297,176,228,79,250,71,77,190,163,87,285,105,75,119,56,85,207,133,100,293,73,275,154,85,152,61,287,275,165,251,63,60,81,174,94,155,171,102,53,104,66,115,57,167,196,155,105,223,185,129,115,234,158,116,247,206,257,229,207,250,215,193,244,212,105,289,118,180,69,53,172,219,83,260,113,165,80,86,189,263,212,130,111,287,287,267,201,96,282,176,122,106,64,206,164,336,145,322,102,163,350,153,290,348,187,156,88,272,134,147,194,152,216,60,146,190,206,235,144,297,220,94,110,243,322,256,98,69,249,252,270,258,212,318,204,84,243,331,274,237,304,348,283,247,330,96,138,215,149,85,169,239,205,108,136,103,72,227,277,242,244,219,96,65,281,107,136,297,73,189,114,139,237,157,243,229,108,194,129,99,169,64,136,165,221,209,236,225,118,197,162,89,231,53,66,115,227,79,81,139,136,176,259,281,96,217,184,162,91,225,96,96,56,195,231,92,86,263,252,268,190,152,269,256,72,202,256,146,189,239,53,67,196,226,291,73,194,255,273,289,129,172,69,163,207,68,236,286,216,141,345,264,163,120,62,292,284,312,146,86,248,313,104,63,309,259,98,354,330,259,207,128,168,132,237,295,126,310,121,207,350,240,340,62,169,72,336,272,328,290,219,90,344,288,262,190,67,320,358,184,80,316,169,232,145,222,280,238,352,100,165,150,265,255,186,396,282,120,366,298,423,243,153,265,234,172,318,223,450,270,244,147,373,117,138,150,82,75,78,322,136,133,189,96,189,298,315,237,313,88,186,210,153,111,128,228,264,352,303,267,302,274,291,223,255,354,328,315,261,67,330,223,175,199,340,274,66,285,69,196,339,82,280,265,100,315,229,102,165,88,345,81,338,206,138,292,240,272,253,231,297,87,127,307,316,298,111,221,126,56,180,53,107,287,293,125,193,107,267,295,227,162,69,187,176,128,79,179,165,267,92,186,144,233,122,62,277,269,115,94,211,259,279,92,279,190,187,130,204,192,262,126,115,97,224,69,59,87,272,342,357,318,116,307,64,301,283,216,337,230,118,192,337,241,86,270,284,140,313,292,354,72,99,327,306,320,97,110,84,121,301,253,210,256,80,109,68,210,158,321,300,224,75,333,142,63,250,199,147,324,139,185,85,222,50,152,300,276,101,130,217,231,286,121,66,142,251,159,119,56,127,73,259,294,86,147,226,252,268,59,291,192,267,263,50,136,173,96,65,261,146,281,121,286,241,192,262,133,220,138,205,231,354,445,231,279,396,232,147,276,204,274,252,430,375,282,336,133,210,234,358,286,264,88,324,181,265,196,276,441,444,345,232,364,372,166,283,150,262,369,102,306,268,141,274,243,315,303,324,334,330,400,285,406,118,364,88,121,360,435,265,283,442,207,187,406,168,171,121,199,379,168,159,192,144,420,91,412,411,271,258,285,265,135,183,405,279,319,195,120,349,348,328,433,144,168,334,322,378,172,187,322,303,142,102,382,108,94,450,357,319,270,141,450,172,177,148,220,196,247,339,138,342,313,138,145,415,381,396,321,202,220,91,265,301,384,181,322,132,325,127,351,394,301,439,430,222,328,238,409,120,403,426,424,360,393,361,334,230,175,252,208,87,226,76,85,75,215,287,72,189,293,154,196,173,129,238,297,251,203,195,152,298,137,180,82,299,52,117,146,197,98,91,285,236,216,240,239,114,93,177,177,251,231,265,257,223,70,290,79,289,276,236,201,251,256,100,203,129,175,152,230,286,194,244,89,182,291,153,264,146,76,228,236,160,167,76,151,146,131,79,256,173,300,237,191,276,102,259,74,135,279,200,113,237,76,70,78,130,147,211,169,280,249,242,66,115,256,50,298,194,203,240,144,209,269,215,283,241,74,227,160,243,199,149,211,234,210,290,142,205,218,207,257,58,266,141,142,174,117,204,165,200,289,51,84,194,293,64,51,182,257,271,277,193,250,94,176,279,149,254,95,88,80,89,297,122,233,255,193,92,67,77,135,274,264,231,56,300,62,300,291,88,286,195,259,132,85,83,80,66,149,243,121,172,259,98,204,93,266,247,76,289,242,179,50,182,280,51,288,230,254,262,259,82,279,293,269,135,132,83,291,56,88,249,53,140,285,283,146,268,150,167,245,81,105,190,83,50,263,296,249,297,55,116,178,262,67,225,160,217,126,225,127,69,94,296,235,154,185,103,229,190,256,95,154,101,97,141,266,213,282,85,180,258,51,99,164,288,79,296,287,274,105,298,113,291,71,253,160,220,293,69,178,72,271,62,131,112,158,128,122,107,71,288,265,231,201,143,108,268,133,321,75,171,282,348,87,336,147,414,397,343,385,76,232,232,226,397,118,378,117,223,366,130,417,99,78,399,394,162,441,139,397,175,301,75,145,145,319,214,333,420,388,226,358,402,393,214,97,180,109],"neuteringRate":[50.38,52.59,55.02,33.02,53.04,58.08,44.85,41.9,43.72,35.19,58.65,34.43,33.09,57.64,62.54,62.21,44.18,44.71,59.87,35.22,53.66,44.44,60.21,57.94,38.82,34.78,54.99,59.47,34.26,44.23,40.28,45.71,36.81,55.35,47.42,47.95,50.6,46.03,43.41,30.73,37.87,60.92,53.95,45.35,42.85,42.01,49.06,49.37,54.0,51.98,33.21,49.24,56.44,31.46,33.84,45.61,61.22,50.88,54.34,49.95,37.38,50.72,38.39,56.46,31.04,56.88,44.93,39.47,36.24,62.18,42.87,56.8,46.91,44.72,57.2,45.34,35.65,36.41,38.53,54.07,49.39,48.06,59.45,42.83,59.25,48.98,46.81,35.11,31.92,60.0,46.74,45.74,47.04,44.8,49.53,34.52,31.79,55.11,34.64,54.22,39.98,59.51,33.3,54.13,46.44,52.32,50.44,55.56,34.35,54.51,35.76,36.69,62.22,37.97,43.69,38.54,36.62,36.3,50.56,53.04,50.11,43.06,37.15,58.42,54.81,56.35,53.59,51.35,33.92,61.8,41.94,61.41,52.74,45.81,46.15,58.94,54.16,45.24,33.64,40.32,59.35,47.47,56.16,41.05,37.48,36.3,57.94,54.57,34.86,59.57,40.49,41.79,39.97,33.87,32.0,52.39,38.84,59.5,57.83,37.27,46.85,58.91,50.85,55.82,48.63,53.99,35.47,45.25,47.55,37.74,41.17,46.24,49.27,43.48,42.05,58.69,42.1,51.39,60.47,62.04,37.24,53.58,45.07,52.32,44.29,38.72,57.56,48.79,57.43,56.29,37.56,56.34,62.46,39.7,30.21,57.37,50.27,41.36,45.31,48.73,54.32,56.75,40.48,44.97,33.07,59.85,36.05,57.21,38.04,42.07,31.71,61.95,42.87,33.12,47.46,36.31,53.9,47.49,53.97,49.32,33.42,42.48,31.27,41.33,37.48,35.44,39.79,34.97,40.8,57.58,45.92,53.52,48.36,53.32,48.89,48.49,57.16,31.3,46.77,33.76,42.06,52.72,56.47,30.9,45.96,36.37,52.7,51.95,47.12,56.21,36.18,48.5,54.18,47.28,45.31,34.01,61.45,43.34,58.93,40.33,42.06,38.23,53.52,30.77,57.59,33.02,53.15,36.49,46.41,52.75,41.54,49.89,59.29,40.45,32.32,38.89,35.6,53.28,32.72,35.86,36.89,48.56,44.54,42.22,55.59,35.76,40.57,36.03,44.12,55.18,38.57,56.98,60.07,55.4,37.6,37.63,43.95,62.14,37.37,60.57,60.97,41.37,58.93,46.82,49.16,54.4,59.2,58.77,30.95,48.08,38.02,36.64,43.11,36.43,51.27,45.89,56.65,50.75,46.17,41.13,38.85,31.62,56.3,40.4,60.5,50.24,42.22,49.53,42.96,45.74,39.75,40.26,54.59,34.94,45.05,33.26,53.1,43.24,51.09,43.88,38.12,62.4,42.05,46.98,35.78,32.46,49.68,33.21,40.83,38.53,59.45,61.23,44.71,57.18,39.66,57.83,44.22,40.36,59.62,42.82,54.92,42.73,44.54,31.45,52.69,45.23,61.8,52.41,39.26,44.23,48.45,51.86,36.5,34.19,42.89,35.98,56.77,54.37,43.04,37.19,45.49,44.72,61.85,51.68,41.68,43.2,39.47,47.16,47.8,40.1,41.45,34.9,44.41,38.44,59.9,61.17,43.62,43.26,38.36,43.64,32.11,48.69,52.31,39.99,60.29,49.84,58.44,52.14,32.86,36.04,58.72,61.35,32.48,57.07,38.81,60.65,41.27,43.95,42.2,57.64,56.55,41.46,47.49,38.9,35.0,61.71,49.29,48.63,34.65,32.44,62.57,61.39,46.51,41.98,33.17,43.63,54.08,61.86,38.12,33.76,51.72,34.89,41.96,57.04,54.28,31.07,32.77,44.16,50.86,40.33,31.06,44.67,57.61,37.38,41.83,40.07,37.36,35.51,48.82,57.42,54.09,56.81,57.91,38.94,45.86,38.26,33.52,39.02,51.44,58.02,46.89,57.66,58.23,60.93,47.49,53.3,35.97,52.54,33.67,42.87,38.46,35.44,44.61,43.1,40.78,49.16,52.09,55.26,58.2,39.32,50.16,47.76,43.0,48.26,39.66,32.09,56.19,31.8,51.02,37.21,31.77,60.77,48.59,40.02,50.67,43.51,30.96,48.53,43.16,58.18,52.54,31.29,45.08,33.82,49.45,43.33,51.66,47.07,37.01,33.47,60.01,50.79,52.53,39.89,32.71,52.83,52.67,41.72,51.67,61.84,37.86,35.84,58.56,58.62,60.05,42.44,41.31,60.97,59.5,35.45,40.13,52.7,50.75,35.66,42.38,52.39,51.9,41.95,51.95,30.89,35.49,52.38,42.33,45.36,54.51,47.5,49.03,46.39,37.14,54.26,45.74,61.0,35.34,55.97,38.61,53.39,45.84,51.49,46.31,47.91,59.53,62.05,61.15,55.97,34.53,58.44,36.55,46.82,45.39,44.64,48.53,53.73,56.46,38.06,35.46,49.96,41.97,31.3,46.26,36.85,57.08,36.58,36.07,50.82,32.64,38.17,59.51,32.27,55.32,31.44,39.85,35.18,39.8,39.75,49.04,33.66,54.0,33.17,43.21,39.49,34.18,48.91,46.36,51.65,35.28,59.73,54.41,34.57,49.18,42.01,50.08,61.86,49.05,32.97,35.56,32.06,39.78,56.64,57.62,62.21,52.51,60.57,52.52,50.4,49.1,54.72,44.68,47.24,41.38,46.54,53.71,42.67,34.05,55.56,45.15,38.77,38.59,55.26,32.02,47.45,31.05,54.05,52.86,46.71,46.79,39.82,45.87,30.55,34.07,54.74,41.18,35.02,35.17,32.17,55.6,56.71,54.98,41.79,56.23,57.4,34.8,37.64,38.91,41.43,35.23,61.37,34.19,49.42,54.48,35.99,34.87,54.6,58.98,33.72,39.84,55.13,47.12,31.73,41.17,38.55,50.87,57.73,32.75,35.11,43.09,51.42,51.82,35.42,55.01,56.43,35.46,61.01,54.37,37.53,41.55,59.85,56.53,52.05,53.95,48.41,46.83,47.76,40.64,34.23,41.69,36.3,32.25,40.29,41.93,38.06,43.37,51.83,58.03,39.28,35.15,47.89,56.44,38.4,51.59,41.32,33.83,41.59,39.17,57.36,33.1,44.87,38.75,52.6,40.87,35.8,50.97,38.32,58.32,39.02,30.78,33.45,57.69,54.51,35.23,59.12,58.85,62.36,60.53,55.9,46.53,37.4,36.94,48.81,33.86,59.78,37.52,32.66,51.26,52.92,39.79,39.1,47.39,49.93,56.91,46.78,42.67,36.54,49.18,32.04,53.43,57.03,48.4,43.82,51.9,40.02,45.22,60.6,60.64,56.14,62.78,40.24,34.1,59.38,43.77,45.33,52.78,42.75,34.75,43.34,37.69,54.39,55.61,54.01,45.48,49.03,53.26,52.34,36.3,57.8,43.75,37.5,32.88,39.05,33.8,55.98,45.38,55.94,52.51,33.88,48.99,51.32,53.89,47.02,56.96,49.31,59.78,56.71,60.98,36.2,54.81,59.38,46.45,40.39,34.58,32.53,51.34,31.85,47.47,58.47,54.32,52.13,57.43,49.81,46.14,33.54,35.52,54.97,53.3,35.03,47.7,39.68,58.1,33.15,42.22,52.98,47.31,35.13,40.96,50.27,55.49,46.26,45.33,47.77,42.57,38.54,50.19,42.16,47.99,42.73,46.62,58.5,57.14,40.88,58.27,43.53,56.85,52.04,37.82,60.74,32.3,52.28,41.7,34.92,50.18,37.44,36.55,54.13,46.07,32.03,59.12,56.85,41.57,43.05,59.46,36.44,47.49,53.45,47.02,56.59,38.14,34.19,38.83,49.66,34.3,59.06,60.3,46.39,52.84,54.26,31.64,42.22,52.15,51.84,31.29,33.09,35.97,57.2,42.64,47.36,58.67,45.68,54.28,49.82,39.95,41.78,57.75,37.29,56.9,40.74,32.09,34.09,50.88,45.99,44.37,45.57,41.51,30.06,54.79,56.43,50.75,38.33,32.75,60.83,36.81,59.92,47.44,55.25,56.17,39.08,42.78,39.41,52.49,57.27,34.31,59.93,47.48,59.22,31.17,43.46,57.14,61.68,32.55,49.49,42.32,59.67,53.6,33.56,46.39,39.47,32.54,33.61,55.51,51.37,60.2,40.6,57.12,38.08,46.6,55.72,39.14,57.42,32.98,58.88,33.49,32.16,53.95,61.83,54.85,31.38,54.61,51.87,49.38,39.65,51.3,52.07,58.7,36.88,46.53,60.0,32.52,60.88,56.78,38.61,59.45,55.53,44.92,57.83,38.36,38.25,39.98,40.67,40.38,56.62,53.53,55.84,43.74,59.1,40.28,52.41,54.9,35.91,57.97,49.39,51.91,32.5,43.46,53.07,37.75,39.74,60.72,48.56,42.95,51.09,36.78,39.91,37.93,34.53,40.16,39.23,46.38,61.9,55.38,35.85,32.45,45.9,55.62,37.44,40.0,34.21,52.7,61.65,53.16,53.73,61.67,34.51,44.06,31.03,56.26,39.34,57.87,31.64,52.34,34.11,52.63,39.1,46.13,32.26,32.86,52.37,60.01,52.96,56.91,38.5,58.83,43.66,47.53,32.13,37.67,36.87,61.31,47.63,36.45,57.38,55.47,46.52,51.86,40.89,37.49,61.57,55.49,56.01,41.57,37.68,42.09,44.34,38.31,43.65,44.53,44.05,44.22,55.26,42.32,42.84,45.29,45.88,51.32,60.27,36.83,34.35,59.98,42.35,31.08,32.04,32.91,55.84,38.2,60.04,56.32,32.35,43.7,44.76,52.19,36.14,59.82,50.35,51.22,36.75,55.32,60.92,32.86,33.79,54.3,31.39,34.05,44.91,49.69,54.61,43.54,43.43,33.33,53.56,50.07,40.5,50.38,50.35,35.88,39.76,39.94,40.94]},"cityYear":{"city":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21],"year":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25],"registrations":[1727,1836,974,1520,2756,2765,1789,2512,3607,3006,3376,3413,3713,3332,2770,4452,5101,6128,6052,5905,5287,6778,5518,3368,6366,6207,1371,641,1550,2695,3237,1559,2424,1435,1638,3603,2673,3282,2960,2967,2448,2208,3744,3503,5210,4776,2712,5689,3023,3396,2009,7414,2205,1903,719,2375,1443,1254,3098,1915,1834,1339,2037,3270,4732,4309,2219,3119,3252,5149,4712,4153,4772,4719,6117,5859,4671,4588,2861,1386,2215,2675,2558,2961,2706,3348,1837,4316,2320,3886,3780,2523,4862,4989,5780,4740,4414,7264,5553,4968,6585,5717,7132,5001,1919,1826,1687,1834,2799,2060,2794,2628,1975,2238,3432,4247,3023,4668,3080,4687,4534,2511,6373,6023,5331,4064,7422,5173,6720,4419,1262,1934,1548,2765,1693,2407,2782,2910,3937,3072,4226,1369,4108,4259,2317,3300,4015,3973,4320,6780,3815,5419,7663,6109,3328,2505,1811,1860,2524,2756,1940,3015,2357,2996,1858,4949,4000,4352,5110,4617,3705,5271,4493,2569,7311,5801,7061,5385,5692,4656,6004,4230,1927,2807,2959,1862,3902,4000,3231,4430,4429,3730,4592,4911,7847,5389,7621,6148,8476,5549,4126,6906,4038,4928,8460,8811,5429,7883,1241,1951,2018,1728,3636,1687,3550,3744,3641,2124,2488,3111,4296,4802,5880,4806,2566,6456,5539,4719,2779,3476,5285,4085,6891,2966,1744,1743,1476,2487,2257,2117,2286,1353,2833,2983,2625,4000,2842,2500,3683,3910,2924,3262,4087,3477,5778,3587,4695,5566,4524,5460,1909,1628,2638,3189,1953,3236,2642,4737,2450,3054,4386,3510,4992,2395,3496,2924,2901,2760,2681,3851,2624,4879,4884,3395,4635,6530,727,1876,1448,2253,1510,3457,3756,1045,3178,1894,1874,1980,2049,3170,3612,3316,2711,4292,2974,4003,5280,4196,4869,3066,4379,6399,2388,2793,3384,2780,5000,3986,4503,2961,3998,4614,2330,2439,3425,4679,4773,7475,3252,7187,5787,7905,8209,7225,9623,4522,10136,7925,2051,2486,3927,2972,3041,3745,5199,3230,4493,3904,3846,3853,4011,4441,2735,6340,8287,6246,6479,2807,8706,6396,3515,6915,5418,4526,1424,2325,2531,3605,2283,2391,4582,4693,2582,3133,4910,5134,4300,3977,5783,8296,7340,4859,9333,5362,10216,4075,7652,9401,4211,10034,1219,2417,1804,1872,2596,2168,2534,3362,2797,3637,4560,3554,2192,3267,3266,4868,5136,4254,4306,2995,4087,6066,3612,6316,3927,4754,1442,1066,2216,2675,2505,1501,2399,2226,1222,1905,2630,3219,4941,3710,2749,1550,5128,4662,5829,4928,2319,3957,6376,4141,6682,2893,1724,2301,2004,2771,1873,2434,1805,2111,2092,1816,3686,3433,3452,4029,1891,1879,3425,4573,3845,5440,3940,3740,6290,5559,6092,5398,905,848,1740,1343,2116,1181,3575,1173,3378,1364,3719,4014,4100,2710,2465,4221,3028,2605,2195,4813,4998,1713,4242,2933,6372,7314,707,1482,886,2944,1230,1299,3275,2388,3137,2722,2331,2884,2954,2765,4041,3011,4340,4802,4315,5333,3659,3697,5765,5043,5698,4216,1089,2153,1285,1818,2766,1944,3477,1999,4391,2203,1875,4663,3251,2672,3502,4584,2886,4913,4239,3937,5739,4725,2077,6965,5157,5114,1464,1340,2285,4097,3292,4459,4075,2548,5387,4205,2194,3167,5465,6471,7284,5317,2242,4456,4159,8001,9760,6510,9141,8106,4850,8505],"removals":[82,78,48,43,68,103,56,153,165,139,203,173,153,154,80,240,271,247,229,171,337,346,283,189,194,134,66,17,63,156,142,58,100,63,75,174,79,130,194,135,85,80,180,167,247,170,114,272,107,230,67,368,145,94,25,74,89,59,147,74,85,69,62,152,272,197,78,127,176,237,118,128,203,240,326,203,174,215,125,56,61,173,123,157,104,209,49,283,96,170,141,159,176,220,156,265,207,278,204,196,212,293,271,277,68,82,107,122,140,59,104,136,107,120,126,204,178,98,134,107,183,154,315,219,129,208,349,159,360,239,55,59,47,163,91,90,102,114,213,161,136,76,142,209,154,192,118,235,233,270,185,185,329,369,109,95,76,58,89,124,64,140,129,85,70,288,121,132,265,144,190,178,157,81,227,299,324,247,199,213,193,184,110,146,102,43,139,198,165,138,169,189,131,180,367,270,473,234,511,327,169,352,247,191,312,563,252,347,71,80,71,85,244,51,166,215,140,49,138,119,130,132,266,174,110,252,228,265,119,117,297,195,186,158,110,103,61,114,95,96,132,89,175,97,135,147,136,94,153,140,128,121,207,159,304,101,162,253,187,264,53,77,156,93,64,169,60,272,120,155,258,104,188,80,136,88,175,147,141,216,139,289,186,175,282,404,35,97,42,111,49,107,150,59,175,52,56,106,97,127,167,145,94,235,184,148,205,166,188,90,188,244,90,67,162,118,238,131,195,98,238,220,69,85,146,165,266,322,138,243,264,317,235,274,430,257,465,384,108,65,102,98,73,211,169,114,242,130,146,152,213,214,112,233,274,275,340,115,419,369,200,364,238,187,60,105,135,164,92,99,190,226,92,168,262,323,166,164,361,430,468,292,339,234,489,212,390,428,259,475,69,83,111,77,89,99,64,142,170,91,157,144,120,170,171,213,320,214,143,151,249,282,122,161,172,187,71,52,115,128,128,70,86,106,42,64,90,100,140,233,148,76,254,232,263,154,117,234,381,209,368,154,66,120,102,134,96,105,94,78,99,102,165,171,164,247,96,99,206,161,233,135,205,146,171,224,170,310,59,38,80,79,90,41,149,40,117,74,170,146,179,139,106,171,112,131,145,147,185,82,188,149,291,224,24,43,48,162,75,80,169,138,106,66,112,120,176,117,207,156,145,302,290,206,132,122,273,213,162,215,51,72,58,97,93,91,109,95,198,119,66,225,127,163,118,250,163,268,168,235,142,232,72,191,309,134,53,40,115,88,155,240,156,100,262,176,59,181,310,219,262,174,80,167,210,392,562,315,617,433,298,386],"neutered":[859,920,517,655,1118,1304,848,1494,1552,1505,1631,1955,1341,1802,1064,1848,2129,2849,2885,2221,2262,3303,2268,1600,3355,2548,535,242,819,1353,1348,679,947,584,672,1724,1198,1657,1017,1214,1173,1124,1953,1475,1963,2170,1220,2399,1431,1274,925,2981,1021,940,298,844,664,511,1094,965,837,600,1119,1669,2004,1970,1064,1556,1508,1825,2610,2204,1715,2599,2824,2355,1726,1662,1298,611,1161,1325,1278,1089,1225,1337,871,1926,1050,2317,1771,1179,1993,2679,3267,1907,2019,2814,2582,2236,3605,2375,3379,2512,755,712,632,717,1415,1083,987,957,695,796,1621,1988,1475,2290,1227,1930,2108,1202,2627,3108,2603,1717,3719,2204,3542,2020,487,919,779,1225,804,1016,1401,1026,1589,989,1727,573,1950,1632,1073,1531,2343,1436,2098,3100,1712,2791,3857,3463,1360,916,691,917,1362,1159,681,1413,1193,1343,800,1898,1876,1831,2434,2187,1689,2273,1547,1025,2855,3387,3411,2615,2395,2487,2978,1658,879,1531,1175,941,1366,1525,1741,1737,1976,2122,1930,1995,3409,2026,3057,3659,3507,2237,1562,3038,2239,2654,2804,5057,2608,3654,500,945,1055,753,1611,817,1170,2219,1592,798,1340,1085,1758,2133,2527,1887,1209,2244,2758,1858,992,1801,2842,1782,2973,1043,911,844,860,1208,948,773,820,567,1224,1546,1372,1933,1263,887,1562,1707,1244,1345,1820,1479,2740,1532,1982,2528,2165,1911,1097,763,964,1536,1048,1159,1543,2394,1114,1241,1804,1656,2331,1078,1312,1236,1236,1357,1248,1800,1316,2379,1960,1584,2058,3786,415,729,633,987,781,1699,1504,387,1360,881,855,658,1022,1423,1307,1283,1116,1711,1152,1479,2518,2057,2132,1432,2291,2581,806,1253,1923,1446,2512,2045,2027,1266,1936,1938,988,1136,1247,1799,2344,3276,1153,2939,2169,2617,4560,3762,5331,1580,3967,3166,861,1037,1711,1586,1291,1405,2066,1736,1439,1828,1602,2105,1959,1874,1384,3397,4214,2880,2331,1091,2935,2438,1623,3264,2032,2116,624,854,1088,1321,995,878,2151,2306,824,1670,2234,2927,2444,1677,2194,3593,2546,2398,3632,2530,5268,1623,3422,4996,1831,4618,612,1405,1006,875,1135,982,978,1490,1475,1720,2381,1667,884,1080,1264,2362,2295,2047,2173,1588,2314,2956,2024,2803,1309,1967,751,551,1179,1053,1018,620,1019,1024,578,816,1214,1657,2270,1441,1226,688,2514,2447,2974,2639,1108,1382,2354,1788,2822,1104,986,930,990,1345,965,864,758,881,1021,923,1353,1730,1075,1556,817,953,1744,1845,1604,2838,1287,1737,2791,1986,3339,2203,342,414,839,613,852,641,1572,614,1190,773,1457,1913,1755,1168,787,2258,1403,1171,1041,2118,1833,548,2371,1132,3319,3363,360,628,437,1222,525,718,1580,872,1235,1384,1231,1488,1224,1306,2206,1205,2073,1762,2203,2421,1360,1336,2230,2677,2611,1696,463,812,684,945,1313,730,1697,878,1907,1016,783,1795,1783,1298,1714,1820,1030,2671,1872,1905,2679,2330,1131,2770,2126,2031,639,649,938,1855,1745,1550,2284,783,2179,1786,976,1344,2628,3640,3340,2952,736,1815,1567,4021,4056,2541,4136,3956,1713,3327],"neuteredRemovals":[17,22,9,15,13,29,19,22,24,37,27,30,25,34,17,45,46,48,52,39,35,62,45,34,60,49,12,4,15,20,24,16,19,9,15,44,16,36,23,18,22,20,33,36,56,40,28,32,25,22,14,73,25,11,6,14,8,10,16,17,21,12,24,33,46,33,20,35,37,35,41,33,32,54,63,42,39,28,19,9,28,34,24,12,33,23,18,52,10,59,39,26,49,54,68,25,42,68,60,39,76,45,67,59,12,16,15,12,33,20,23,23,11,18,32,44,26,62,34,43,41,25,61,63,31,50,81,38,58,26,7,16,18,16,11,14,30,21,26,19,36,9,42,45,14,25,45,30,26,70,28,59,97,75,21,12,10,20,34,14,10,32,16,14,13,36,28,41,56,42,30,38,31,16,37,64,73,69,55,51,54,34,17,25,28,24,39,19,37,32,47,53,36,37,70,38,46,84,43,42,32,43,51,51,61,113,48,60,7,17,22,18,36,14,14,25,21,21,14,23,31,43,37,44,29,45,38,38,17,25,65,49,53,27,18,18,18,30,17,15,16,11,21,27,28,40,24,20,28,40,26,15,41,39,59,19,24,44,49,39,24,17,17,29,20,19,30,53,26,31,38,27,52,15,26,20,30,28,33,42,26,57,33,34,29,83,7,17,14,24,19,41,23,10,27,19,19,9,14,29,25,22,20,37,19,19,45,51,46,24,49,54,20,24,35,17,53,32,43,23,46,53,20,20,19,31,55,74,18,50,58,54,89,64,112,25,86,55,13,15,21,43,25,27,46,28,22,35,30,43,54,41,34,70,95,72,30,16,49,47,26,79,54,42,12,14,16,33,18,12,57,55,19,23,57,58,41,27,42,72,59,42,81,62,118,32,62,70,32,93,10,27,17,19,21,20,19,31,23,47,53,17,13,16,27,38,52,30,47,29,49,43,52,55,24,47,8,12,33,21,19,8,21,24,13,15,19,20,43,25,24,11,51,68,36,39,16,17,35,33,55,25,28,11,22,34,14,20,14,21,12,12,35,32,29,32,14,17,33,39,30,42,32,34,44,43,55,22,4,4,15,11,8,15,16,13,23,18,19,32,33,25,13,63,27,27,18,49,43,12,53,14,45,93,7,7,6,15,8,10,29,10,14,16,34,36,27,22,47,18,51,33,38,54,35,27,38,39,53,32,8,17,7,25,17,19,34,24,25,21,13,20,32,27,21,37,13,37,45,29,43,43,15,52,31,46,15,7,12,29,34,32,67,17,33,38,18,23,50,77,77,62,16,37,22,69,55,47,75,91,32,72],"exempt":[61,58,27,38,61,49,56,91,166,82,51,150,84,141,83,104,211,169,98,174,180,211,140,37,217,102,35,16,42,64,77,50,57,41,20,89,35,88,73,79,55,80,101,53,170,81,111,77,72,62,72,278,60,72,12,81,22,21,72,67,61,42,39,103,157,125,60,116,144,161,72,86,84,145,190,170,98,146,67,38,62,90,90,90,90,55,49,125,93,136,61,77,201,183,142,121,108,106,224,165,228,146,185,135,55,70,57,52,69,77,80,77,71,63,127,79,56,103,88,87,76,94,211,120,147,113,178,164,178,139,49,78,21,75,68,66,89,119,176,136,139,32,197,140,65,141,130,125,94,247,155,202,336,242,96,72,31,71,110,124,33,143,58,100,59,185,165,67,171,150,100,88,186,69,249,231,287,110,156,193,76,123,84,55,92,67,130,114,63,179,94,152,198,61,211,108,246,197,249,218,155,204,50,159,293,325,166,218,41,67,81,44,125,35,68,78,137,69,87,121,104,182,143,170,93,205,134,167,107,96,204,115,119,96,51,54,23,67,72,62,43,34,101,89,44,119,38,56,152,112,111,95,124,89,174,96,162,193,133,77,82,54,63,55,69,70,101,134,100,94,118,151,177,68,170,44,96,65,93,72,101,179,104,115,69,217,24,82,47,46,32,116,89,25,118,34,37,56,56,127,152,145,94,95,96,71,172,79,188,57,76,127,76,76,126,83,189,152,142,109,106,161,66,44,132,131,186,131,123,92,102,180,199,212,224,148,208,231,30,68,165,94,99,102,212,63,140,136,149,64,98,115,74,281,159,230,161,68,391,268,67,172,177,148,27,50,39,95,72,69,147,128,54,90,124,88,182,139,136,214,163,175,316,86,293,49,202,191,115,342,26,30,63,56,61,79,62,109,79,139,154,116,99,126,143,166,138,165,192,75,105,188,104,256,96,136,31,17,61,71,75,39,63,93,29,82,97,82,167,61,72,54,146,120,215,180,56,165,194,168,190,91,47,95,75,78,53,100,34,40,74,32,112,135,69,108,72,46,122,98,137,216,120,111,162,169,112,112,11,26,63,44,74,19,92,30,70,18,85,97,106,92,65,174,84,78,69,191,225,46,147,67,167,238,15,30,26,89,58,29,124,85,120,73,66,123,71,102,82,80,171,199,183,165,170,94,187,143,162,119,36,80,44,62,99,64,52,49,174,36,60,79,87,61,42,137,102,119,134,71,118,140,68,101,93,177,16,15,65,113,115,182,60,74,243,144,48,54,167,253,290,155,68,126,71,222,175,301,358,298,147,225],"exemptRemovals":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,1,0,1,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,1,0,1,0,0,0,0,2,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,1,0,1,2,0,0,1],"registrationUnits":[171,150,199,225,159,196,278,204,152,287,213,234,297,297,172,284,289,267,291,82,215,271,80,230,224,185,279,295,231,291,236,297,228,250,190,163,285,119,85,207,293,275,154,152,287,251,63,174,155,171,104,115,167,196,223,185,234,158,247,257,250,215,244,289,180,69,219,260,165,86,263,212,287,287,201,282,122,206,336,322,163,350,348,187,272,147,194,216,190,235,297,220,243,322,98,252,270,318,204,331,274,348,283,330,215,149,239,205,136,227,277,244,96,281,297,189,139,237,243,194,129,169,165,221,236,197,162,231,115,227,139,176,281,217,184,225,96,195,231,263,268,190,269,202,256,239,67,226,291,255,289,172,163,207,286,216,345,163,292,312,146,313,104,309,354,330,207,168,295,310,207,350,340,169,336,328,219,344,262,320,358,316,232,222,280,352,165,265,396,282,366,423,265,234,318,450,244,373,150,82,322,136,189,298,315,313,210,153,228,352,303,302,291,354,328,261,330,199,340,285,196,339,280,315,229,165,345,338,292,272,253,297,307,316,221,126,180,287,293,193,295,227,187,176,179,267,186,233,122,277,115,259,279,279,187,204,262,115,224,87,342,357,307,301,283,337,192,337,270,284,313,354,327,320,110,121,301,256,109,210,321,300,333,142,250,324,185,222,152,300,130,231,286,142,251,119,127,294,147,252,268,291,267,136,173,261,281,286,241,262,220,231,445,279,396,276,274,430,375,336,234,358,264,324,265,441,444,364,372,283,369,306,268,274,315,334,400,406,364,121,435,283,442,406,171,199,379,192,420,412,411,285,265,405,319,195,349,433,168,334,378,322,303,382,108,450,319,450,177,220,247,339,342,145,415,396,220,265,384,322,325,351,394,439,328,409,403,426,393,361,230,252,226,85,215,287,293,196,173,297,251,195,298,180,299,146,197,285,236,240,114,177,251,265,223,290,289,236,256,203,175,230,286,244,291,264,146,236,167,151,146,256,300,237,276,259,279,200,237,78,147,211,280,242,256,298,203,240,269,283,241,227,243,211,234,290,218,257,266,142,174,204,289,84,293,64,257,277,250,176,279,254,88,297,233,255,92,135,274,231,300,300,286,259,132,83,149,243,259,204,266,247,289,179,280,288,254,262,279,293,135,291,88,249,285,283,268,245,105,190,263,296,297,178,262,225,217,225,94,296,185,229,256,154,101,266,282,180,258,164,288,296,274,298,291,253,293,178,271,131,158,128,107,288,231,143,268,321,282,348,336,414,385,232,232,397,378,366,417,99,399,441,397,301,145,319,333,420,358,402,214,180],"neuteringRate":[51.19,51.08,54.86,43.33,41.11,47.9,47.84,62.4,44.39,51.2,50.55,59.41,36.97,55.63,38.92,42.81,43.13,47.63,48.65,38.05,44.99,50.39,42.46,49.26,53.39,41.15,40.08,38.14,54.07,52.5,42.78,44.17,39.93,41.91,42.03,48.99,45.57,51.43,35.94,42.23,48.71,51.88,53.87,43.14,38.42,46.24,45.88,43.7,48.22,39.55,46.91,41.27,48.35,51.35,42.07,36.07,48.45,41.92,36.53,51.49,46.66,46.3,55.44,52.47,43.9,47.11,48.76,50.84,47.82,36.44,55.92,53.94,36.84,56.82,47.68,40.89,37.51,37.37,46.75,45.26,52.6,51.6,51.5,38.41,45.81,41.86,47.71,46.47,46.76,60.76,47.6,48.77,41.49,55.04,56.88,42.06,46.99,39.31,47.15,46.04,55.37,42.96,48.27,51.93,40.14,39.91,39.05,41.18,51.97,53.12,35.84,37.48,36.62,36.73,48.06,48.08,50.93,48.75,40.5,41.2,47.51,49.94,42.36,52.46,49.44,43.23,51.44,43.2,54.78,47.7,39.77,48.16,50.7,46.46,49.5,43.25,51.16,35.94,41.97,33.32,41.34,43.62,48.11,39.19,48.96,48.46,58.97,37.61,50.7,46.54,46.39,52.2,51.27,59.02,41.6,37.51,39.25,49.78,54.54,43.5,35.77,48.03,52.83,45.65,44.02,39.95,47.64,42.42,49.08,47.95,47.2,43.88,34.96,40.55,39.78,60.4,49.55,49.55,42.6,54.83,50.32,40.14,47.44,56.6,40.15,50.41,35.26,39.61,55.58,39.73,45.28,58.43,42.46,41.39,44.64,38.84,42.12,60.45,43.49,42.03,38.67,45.7,57.72,54.95,33.66,59.94,49.45,47.69,42.14,49.6,53.06,44.74,46.43,49.08,34.16,62.17,44.87,37.45,56.43,35.49,41.45,44.75,44.35,39.79,48.05,35.44,51.21,40.86,36.65,52.87,55.67,44.55,43.55,36.18,54.65,50.37,59.51,49.64,43.06,37.51,37.33,43.99,45.26,52.63,53.98,49.13,45.79,36.03,43.46,44.22,43.56,42.34,45.85,43.4,48.98,43.4,43.19,46.75,48.79,36.03,57.81,48.1,38.15,48.68,54.42,37.17,58.6,52.43,46.7,41.74,42.78,47.83,47.44,45.92,38.27,42.88,44.24,50.86,47.83,48.36,51.91,50.59,41.02,48.14,46.61,60.45,58.96,40.02,44.03,44.96,52.16,49.49,41.07,38.24,44.39,46.8,45.98,34.63,51.64,45.81,37.21,39.77,41.88,41.26,40.61,37.87,48.73,49.78,44.56,47.31,53.5,41.06,34.2,45.08,58.6,53.68,51.64,52.22,46.05,43.42,50.27,42.9,42.81,47.41,37.45,39.17,50.79,44.76,36.45,41.6,38.22,33.78,56.07,53.2,56.77,36.46,40.13,41.25,43.64,42.21,44.18,53.69,42.65,38.99,40.16,54.81,33.33,47.51,42.49,55.71,50.16,43.36,51.47,54.48,51.4,47.03,37.48,39.93,34.83,39.67,48.17,48.62,38.19,47.8,44.87,37.84,44.74,37.43,44.59,37.78,47.68,50.39,32.33,55.55,46.84,59.63,58.13,43.27,39.69,44.76,36.19,51.59,39.48,48.13,52.95,41.19,46.27,54.9,45.52,47.34,52.35,59.04,58.42,47.69,44.44,46.5,38.83,45.31,55.27,47.18,52.87,48.39,42.04,34.36,39.97,49.92,46.57,49.93,51.07,54.82,59.02,50.36,56.5,44.65,34.22,42.04,54.19,53.16,54.55,40.52,42.03,42.77,43.15,47.17,47.88,43.51,47.05,52.48,46.39,40.72,46.21,45.93,50.53,53.7,52.78,54.46,49.59,36.66,38.68,44.63,43.82,39.39,57.78,42.14,50.89,49.72,53.52,36.24,43.48,42.3,50.63,53.15,37.43,52.05,31.81,40.3,44.74,52.58,53.15,40.93,43.58,52.7,33.6,47.38,44.89,36.42,55.45,42.87,39.95,50.62,49.64,47.63,41.66,54.91,45.42,53.05,35.79,58.53,40.52,48.63,43.92,44.46,32.81,54.2,47.19,46.24,49.9,44.34,37.19,32.86,57.18,40.16,53.84,46.12,51.68,43.15,51.43,43.39,44.76,58.08,49.94,38.31,40.28,51.51,53.94,52.53,43.09,48.49,56.31,41.58,48.2,38.42,53.79,46.17,37.57,36.62,39.91,54.62,46.21,41.59,43.83,38.2,55.18,53.46,48.48,38.37,49.38,44.85,44.88,47.74,42.56,40.0,56.05,50.66,50.03,41.14,37.35,56.71,44.88,50.68,47.1,50.9,55.66,40.12,43.21,39.86,44.22,49.38,42.67,45.55,54.54,35.98,56.57,31.29,41.87,43.39,44.87,44.24,50.01,56.99,46.47,56.19,33.3,41.45,39.12,51.94,43.5,40.26,47.64,50.37,36.93,40.09]},"city":{"city":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21],"registrations":[100258,78167,85763,106377,97467,91816,106323,134391,95465,84199,88279,79314,133299,119569,134432,91566,84871,87603,79065,84924,89424,128780],"removals":[4339,3539,3769,4661,4207,4132,4277,6325,4058,3763,4227,3317,5617,5163,6623,3971,4015,3899,3332,3859,3846,6050],"neutered":[45833,34077,38184,49806,44130,41797,48105,60429,41692,37171,41000,34393,59186,52205,60644,42792,38237,38521,35487,37990,40183,57156],"neuteredRemovals":[855,672,735,1038,898,812,918,1176,773,726,839,683,1176,1057,1207,826,691,721,693,706,701,1107],"exempt":[2841,1978,2406,3067,2631,3290,3335,4088,2888,2371,2661,2241,3629,3731,3586,2963,2619,2529,2378,2766,2285,3985],"exemptRemovals":[2,0,0,2,2,3,2,3,3,1,0,0,4,2,5,1,1,0,0,0,1,8],"registrationUnits":[297,297,289,350,297,291,358,450,354,295,357,300,445,442,450,299,300,298,300,297,298,441],"neuteringRate":[46.89,44.76,45.67,47.95,46.36,46.74,46.24,46.27,44.77,45.31,47.78,44.36,45.43,44.71,46.5,47.91,46.44,45.16,45.94,45.99,46.14,45.67]},"cityAnimal":{"city":[0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21],"animal":[0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1],"registrations":[60213,40045,45440,32727,52755,33008,62516,43861,58620,38847,53557,38259,62387,43936,75901,58490,55662,39803,46949,37250,51095,37184,43092,36222,81079,52220,66183,53386,83831,50601,57225,34341,49619,35252,47553,40050,49153,29912,48523,36401,51528,37896,85482,43298],"removals":[2657,1682,2208,1331,2146,1623,2776,1885,2512,1695,2382,1750,2517,1760,3763,2562,2134,1924,2160,1603,2544,1683,1851,1466,3318,2299,2800,2363,4262,2361,2573,1398,2574,1441,2255,1644,2137,1195,2137,1722,2110,1736,4078,1972],"neutered":[27650,18183,18673,15404,22841,15343,27678,22128,27392,16738,24056,17741,28731,19374,33687,26742,24753,16939,20898,16273,23305,17695,19381,15012,35285,23901,29065,23140,37794,22850,26918,15874,22658,15579,21407,17114,21650,13837,21367,16623,24049,16134,38093,19063],"neuteredRemovals":[449,406,364,308,428,307,553,485,547,351,500,312,569,349,661,515,433,340,392,334,470,369,376,307,697,479,615,442,768,439,524,302,425,266,379,342,416,277,387,319,409,292,765,342],"exempt":[1757,1084,1115,863,1476,930,1806,1261,1660,971,1814,1476,2010,1325,2408,1680,1606,1282,1299,1072,1429,1232,1224,1017,2441,1188,2225,1506,2153,1433,1795,1168,1697,922,1443,1086,1449,929,1610,1156,1249,1036,2784,1201],"exemptRemovals":[2,0,0,0,0,0,1,1,2,0,2,1,2,0,2,1,2,1,1,0,0,0,0,0,3,1,2,0,3,2,1,0,1,0,0,0,0,0,0,0,1,0,8,0],"registrationUnits":[297,291,297,293,287,289,350,348,281,297,291,289,358,354,450,396,345,354,293,295,357,342,300,294,444,445,442,435,450,450,299,297,289,300,290,298,300,297,297,291,298,293,420,441],"neuteringRate":[47.26,46.34,42.35,48.08,44.29,47.91,45.41,51.56,47.85,44.11,46.03,47.74,47.04,45.11,45.78,46.89,45.43,43.82,45.78,44.71,47.03,48.8,46.08,42.31,44.48,46.92,44.89,44.49,46.53,46.46,48.29,47.27,47.26,45.29,46.42,43.67,45.16,47.22,45.23,47.01,47.84,43.81,45.86,45.3]},"national":{"year":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25],"registrations":[35117,40602,43818,55016,56386,55626,68839,59744,66694,65811,70110,77691,87543,83652,84182,96671,95561,99449,108286,115179,116663,106192,128506,119102,120631,124281],"removals":[1647,1632,1900,2446,2437,2454,2796,2744,3109,2986,2837,3340,4004,3630,3939,4049,4419,4753,4900,4761,5245,4826,5794,5561,5195,5585],"neutered":[15892,18606,21050,24964,25413,23501,30605,26860,28066,29880,31742,37079,39044,36660,36324,45217,42875,42588,47163,52426,52710,48736,59232,55093,54429,52863],"neuteredRemovals":[300,330,408,497,471,436,622,506,500,647,606,689,789,728,702,932,864,817,883,1001,1014,934,1183,1072,1008,1071],"exempt":[955,1202,1364,1588,1743,1728,1854,1780,2241,2071,2094,2045,2563,2544,2677,2905,2909,2872,3184,3102,3644,3206,3964,3532,2952,3549],"exemptRemovals":[0,0,0,0,0,0,1,0,1,1,0,0,0,2,1,3,2,2,3,2,3,2,7,4,1,5],"registrationUnits":[445,450,435,450,442,430,396,339,379,423,420,412,417,450,444,441,397,351,394,439,333,420,403,426,400,406],"neuteringRate":[46.59,46.9,49.24,46.54,46.23,43.38,45.4,46.24,43.35,46.53,46.28,48.94,45.79,44.9,44.39,47.81,46.09,44.11,44.76,46.57,46.4,47.16,47.31,47.58,46.28,43.63]},"nationalAnimal":{"year":[0,0,1,1,2,2,3,3,4,4,5,5,6,6,7,7,8,8,9,9,10,10,11,11,12,12,13,13,14,14,15,15,16,16,17,17,18,18,19,19,20,20,21,21,22,22,23,23,24,24,25,25],"animal":[0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1],"registrations":[17774,17343,24446,16156,27589,16229,33265,21751,32505,23881,32017,23609,41637,27202,33967,25777,42027,24667,38892,26919,40252,29858,48540,29151,50356,37187,54273,29379,48447,35735,56479,40192,56120,39441,59025,40424,59739,48547,67254,47925,71439,45224,59337,46855,79172,49334,68581,50521,71371,49260,73859,50422],"removals":[828,819,1001,631,1212,688,1573,873,1396,1041,1463,991,1728,1068,1611,1133,1927,1182,1895,1091,1752,1085,1926,1414,2477,1527,2267,1363,2284,1655,2264,1785,2693,1726,2901,1852,2622,2278,2731,2030,3426,1819,2681,2145,3567,2227,3105,2456,3126,2069,3438,2147],"neutered":[7968,7924,11222,7384,13092,7958,15214,9750,14220,11193,14171,9330,18143,12462,15489,11371,17394,10672,17197,12683,17926,13816,22843,14236,22324,16720,24234,12426,21908,14416,26497,18720,25280,17595,25850,16738,26894,20269,29981,22445,31692,21018,26928,21808,35916,23316,32596,22497,31500,22929,30852,22011],"neuteredRemovals":[156,144,218,112,262,146,301,196,258,213,262,174,385,237,289,217,315,185,382,265,339,267,436,253,444,345,474,254,429,273,523,409,477,387,493,324,516,367,532,469,624,390,472,462,693,490,643,429,541,467,663,408],"exempt":[471,484,791,411,881,483,871,717,1078,665,891,837,1131,723,976,804,1494,747,1246,825,1190,904,1306,739,1549,1014,1825,719,1495,1182,1592,1313,1679,1230,1804,1068,1768,1416,1899,1203,2305,1339,1709,1497,2688,1276,2016,1516,1633,1319,2162,1387],"exemptRemovals":[0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,1,0,0,0,0,0,0,0,2,0,1,0,1,2,2,0,2,0,2,1,2,0,3,0,2,0,6,1,2,2,0,1,5,0],"registrationUnits":[354,445,450,357,396,435,352,450,442,348,414,430,375,396,339,291,379,354,423,297,415,420,396,412,411,417,450,441,444,394,373,441,372,397,296,351,394,369,439,433,273,333,420,409,378,403,426,424,360,400,361,406],"neuteringRate":[46.1,47.08,46.94,46.84,48.64,50.27,47.06,45.76,44.88,48.07,45.52,40.48,44.5,46.78,46.98,45.26,42.59,44.65,45.45,48.08,45.68,47.09,48.07,50.41,45.7,45.92,45.69,43.45,46.53,41.5,47.91,47.68,46.42,45.63,45.18,42.55,46.18,43.01,45.64,47.88,45.68,47.52,46.7,47.74,46.59,48.46,48.8,45.91,45.36,47.6,42.87,44.75]},"totals":{"all":{"registrations":2181352,"removals":96989,"neutered":979018,"neuteredRemovals":19010,"exempt":64268,"exemptRemovals":40,"registrationUnits":450,"neuteringRate":46.06},"狗":{"registrations":1288363,"removals":57894,"neutered":577331,"neuteredRemovals":11127,"exempt":38450,"exemptRemovals":33,"registrationUnits":450,"neuteringRate":46.02},"貓":{"registrations":892989,"removals":39095,"neutered":401687,"neuteredRemovals":7883,"exempt":25818,"exemptRemovals":7,"registrationUnits":450,"neuteringRate":46.12}},"analytics":{"cities":["臺北市","新北市","基隆市","桃園市","新竹市","新竹縣","苗栗縣","臺中市","彰化縣","南投縣","雲林縣","嘉義市","嘉義縣","臺南市","高雄市","屏東縣","宜蘭縣","花蓮縣","臺東縣","澎湖縣","金門縣","連江縣"],"periods":["2000","2001","2002","2003","2004","2005","2006","2007","2008","2009","2010","2011","2012","2013","2014","2015","2016","2017","2018","2019","2020","2021","2022","2023","2024","2025"],"years":["2000","2001","2002","2003","2004","2005","2006","2007","2008","2009","2010","2011","2012","2013","2014","2015","2016","2017","2018","2019","2020","2021","2022","2023","2024","2025"],"neighbors":[[1,2],[0,2,3,16],[0,1],[1,4,5,16],[3,5],[3,4,6,7,16],[5,7],[5,6,8,9,16,17],[7,9,10],[7,8,10,12,14,17],[8,9,12],[12],[9,10,11,13,14],[12,14],[9,12,13,15,17,18],[14,18],[1,3,5,7,17],[7,9,14,16,18],[14,15,17],[],[],[]],"controlChart":{"national":{"values":[46.59,46.9,49.24,46.54,46.23,43.38,45.4,46.24,43.35,46.53,46.28,48.94,45.79,44.9,44.39,47.81,46.09,44.11,44.76,46.57,46.4,47.16,47.31,47.58,46.28,43.63],"centerLine":46.093,"sigma":1.4108,"upperControlLimit":50.3253,"lowerControlLimit":41.8606,"violations":[]},"cities":{"centerLine":[45.0763,46.6029,47.8978,47.6508,45.039,45.7246,45.7595,45.1687,45.9297,47.6417,46.5879,44.9059,46.1134,45.7334,44.9559,45.8353,45.0625,46.6143,48.1437,44.6811,46.5986,46.0284],"sigma":[6.3542,9.1139,5.6702,5.6797,8.3361,4.1109,8.4156,5.8188,6.0072,6.913,6.0795,4.914,6.4809,7.8663,7.8003,6.4365,4.6512,3.4068,5.5331,5.1175,6.8699,8.7162],"upperControlLimit":[64.1389,73.9446,64.9083,64.69,70.0473,58.0573,71.0064,62.6251,63.9513,68.3808,64.8263,59.6479,65.5562,69.3322,68.3569,65.1448,59.016,56.8348,64.743,60.0337,67.2085,72.1771],"lowerControlLimit":[26.0136,19.2613,30.8873,30.6117,20.0306,33.392,20.5127,27.7123,27.908,26.9027,28.3494,30.164,26.6706,22.1346,21.5549,26.5257,31.109,36.3939,31.5443,29.3284,25.9888,19.8797],"violations":[[5,2,"beyond3Sigma"],[17,22,"twoBeyond2Sigma"]]}},"waterfall":{"registrations":{"totals":[35117.0,40602.0,43818.0,55016.0,56386.0,55626.0,68839.0,59744.0,66694.0,65811.0,70110.0,77691.0,87543.0,83652.0,84182.0,96671.0,95561.0,99449.0,108286.0,115179.0,116663.0,106192.0,128506.0,119102.0,120631.0,124281.0],"contributions":[null,[435.0,880.0,-1475.0,-281.0,710.0,-1.0,577.0,405.0,49.0,109.0,1064.0,-730.0,-302.0,901.0,-124.0,672.0,-93.0,-376.0,1198.0,1149.0,775.0,-57.0],[1441.0,152.0,829.0,1010.0,67.0,-267.0,-297.0,591.0,664.0,-862.0,-868.0,909.0,-1184.0,206.0,945.0,-386.0,-139.0,1150.0,-613.0,-428.0,-596.0,892.0],[-955.0,-1097.0,460.0,551.0,-290.0,1011.0,767.0,-604.0,232.0,546.0,533.0,1145.0,1656.0,1074.0,1812.0,1217.0,147.0,459.0,68.0,805.0,2058.0,-397.0],[69.0,2040.0,-117.0,-1236.0,1908.0,-230.0,-898.0,2220.0,-816.0,1236.0,948.0,542.0,-932.0,-1322.0,-805.0,-1072.0,965.0,-170.0,724.0,-743.0,-1714.0,773.0],[704.0,98.0,403.0,1283.0,-1949.0,-140.0,561.0,-1014.0,1075.0,9.0,-822.0,-1678.0,-189.0,108.0,1167.0,714.0,-739.0,-1004.0,-428.0,1947.0,69.0,-935.0],[1454.0,-769.0,-255.0,-594.0,1863.0,169.0,-629.0,517.0,-658.0,-976.0,1533.0,865.0,1844.0,2191.0,-384.0,375.0,734.0,898.0,366.0,299.0,1976.0,2394.0],[-1969.0,1199.0,642.0,2095.0,194.0,-933.0,306.0,-1542.0,639.0,723.0,-1478.0,-989.0,-1183.0,111.0,-1527.0,128.0,-166.0,-173.0,828.0,-2711.0,-887.0,-2402.0],[1263.0,-1.0,-1511.0,-2287.0,-103.0,1480.0,-19.0,1037.0,-1138.0,1095.0,2392.0,203.0,-81.0,-2111.0,2839.0,1027.0,-653.0,-1004.0,-565.0,2133.0,749.0,2205.0],[-589.0,-699.0,2479.0,604.0,-1517.0,150.0,-276.0,616.0,3091.0,-601.0,-2188.0,1965.0,-495.0,551.0,-1182.0,-865.0,263.0,683.0,840.0,-1284.0,-415.0,-2014.0],[-58.0,862.0,-1996.0,1332.0,364.0,-358.0,1870.0,-2284.0,-949.0,370.0,-328.0,-930.0,698.0,1777.0,-2011.0,1154.0,1194.0,725.0,923.0,-20.0,-391.0,2355.0],[7.0,319.0,1566.0,-876.0,623.0,1375.0,-253.0,109.0,352.0,37.0,2788.0,609.0,1233.0,224.0,973.0,-2857.0,815.0,589.0,-1006.0,106.0,553.0,295.0],[158.0,2936.0,-106.0,1482.0,1185.0,-1158.0,19.0,986.0,758.0,300.0,-1412.0,-322.0,1462.0,-834.0,2298.0,2739.0,-1224.0,1722.0,-1362.0,69.0,70.0,86.0],[430.0,-2458.0,-1257.0,-2597.0,506.0,-342.0,577.0,1254.0,-493.0,-381.0,-579.0,7.0,-423.0,-323.0,1006.0,151.0,1645.0,-1231.0,1075.0,1121.0,-189.0,-1390.0],[-1706.0,2232.0,2339.0,1101.0,1078.0,1183.0,-2138.0,94.0,-912.0,-562.0,830.0,-519.0,-2090.0,1806.0,813.0,-1942.0,-1588.0,-961.0,-1.0,442.0,1276.0,-245.0],[3605.0,-1473.0,127.0,-572.0,-1074.0,227.0,-12.0,2702.0,1566.0,1682.0,1082.0,-240.0,900.0,2513.0,-1967.0,983.0,1607.0,-1199.0,1602.0,-296.0,-1030.0,1756.0],[1947.0,2328.0,791.0,-23.0,-2240.0,-986.0,1546.0,-4223.0,-778.0,649.0,-1698.0,1536.0,133.0,-956.0,-3075.0,715.0,-153.0,3578.0,268.0,-605.0,1329.0,-1193.0],[-2041.0,-2927.0,-1040.0,-141.0,3890.0,338.0,1148.0,3935.0,-1924.0,1027.0,2027.0,-241.0,1897.0,-2481.0,2214.0,-42.0,-2023.0,-466.0,-882.0,1581.0,462.0,-423.0],[233.0,-1423.0,-326.0,-79.0,-917.0,825.0,-728.0,-1400.0,4742.0,-76.0,-674.0,1707.0,-437.0,4474.0,-297.0,347.0,3862.0,1167.0,52.0,-1318.0,-487.0,-410.0],[-3672.0,2780.0,2850.0,1170.0,-820.0,-610.0,1595.0,2118.0,-1510.0,-147.0,-302.0,-434.0,-559.0,-3971.0,3842.0,2460.0,-350.0,-901.0,-1311.0,1029.0,1018.0,2618.0],[5899.0,-2868.0,-1711.0,-1227.0,-1940.0,2301.0,-1500.0,304.0,1260.0,-618.0,1802.0,-2064.0,619.0,4854.0,1759.0,-2965.0,-692.0,-2609.0,1092.0,1277.0,-1674.0,185.0],[-2310.0,890.0,-585.0,2255.0,697.0,-2191.0,-200.0,-984.0,-1676.0,1491.0,-1014.0,2977.0,-53.0,-6141.0,-3250.0,1604.0,-1267.0,1638.0,1979.0,-1084.0,38.0,-3285.0],[-2881.0,3532.0,1617.0,5.0,1809.0,1108.0,2550.0,2398.0,307.0,-1260.0,-2648.0,-2666.0,1398.0,3577.0,2631.0,2244.0,3358.0,2419.0,-2454.0,673.0,2068.0,2529.0],[3400.0,351.0,-868.0,-1489.0,-1200.0,871.0,-731.0,-5101.0,-1036.0,-2150.0,4888.0,373.0,-258.0,1749.0,-1035.0,-1554.0,-2249.0,-2235.0,2704.0,-1803.0,-722.0,-1309.0],[-1497.0,-3382.0,1415.0,1240.0,2806.0,-1042.0,533.0,5614.0,1348.0,2998.0,-1808.0,-1387.0,-1188.0,-5190.0,-3256.0,-2781.0,1547.0,2541.0,-2389.0,1313.0,655.0,3439.0],[-892.0,2454.0,-2131.0,1895.0,-3925.0,936.0,-694.0,-2211.0,-1774.0,-159.0,-43.0,5405.0,-83.0,5823.0,3655.0,-823.0,-2301.0,-3789.0,827.0,2020.0,-1482.0,942.0]]},"neutering":{"totals":[15892.0,18606.0,21050.0,24964.0,25413.0,23501.0,30605.0,26860.0,28066.0,29880.0,31742.0,37079.0,39044.0,36660.0,36324.0,45217.0,42875.0,42588.0,47163.0,52426.0,52710.0,48736.0,59232.0,55093.0,54429.0,52863.0],"contributions":[null,[176.0,652.0,-687.0,-334.0,445.0,-67.0,-56.0,447.0,226.0,61.0,349.0,-293.0,-81.0,230.0,10.0,432.0,-43.0,-200.0,793.0,314.0,268.0,72.0],[674.0,-356.0,550.0,201.0,110.0,16.0,60.0,670.0,445.0,-403.0,-128.0,577.0,-642.0,234.0,289.0,-140.0,-80.0,628.0,-399.0,-96.0,-191.0,425.0],[-125.0,-234.0,164.0,572.0,-302.0,348.0,355.0,-477.0,-203.0,138.0,261.0,534.0,546.0,233.0,917.0,446.0,85.0,-126.0,-131.0,354.0,785.0,-226.0],[-295.0,425.0,-47.0,-488.0,858.0,-260.0,-380.0,1066.0,-478.0,463.0,368.0,-5.0,-180.0,-326.0,-110.0,-421.0,698.0,-35.0,260.0,-206.0,-697.0,239.0],[114.0,159.0,-189.0,111.0,-794.0,-175.0,-101.0,-467.0,732.0,186.0,-583.0,-669.0,-153.0,-117.0,-195.0,212.0,-332.0,-398.0,-153.0,918.0,193.0,-211.0],[661.0,216.0,136.0,384.0,353.0,47.0,-106.0,-18.0,-220.0,-456.0,967.0,268.0,583.0,1273.0,734.0,385.0,-96.0,399.0,-4.0,-195.0,862.0,931.0],[-330.0,-4.0,112.0,851.0,1049.0,-253.0,123.0,-761.0,150.0,646.0,-819.0,-363.0,-129.0,155.0,-1501.0,-375.0,-30.0,5.0,512.0,-1117.0,-708.0,-958.0],[-297.0,239.0,-466.0,-1280.0,-627.0,657.0,140.0,670.0,-543.0,58.0,1029.0,88.0,-128.0,-1482.0,1396.0,563.0,-262.0,-446.0,-15.0,973.0,363.0,576.0],[389.0,146.0,1055.0,127.0,-794.0,322.0,-98.0,2.0,1098.0,-47.0,-891.0,1052.0,-237.0,846.0,-393.0,-600.0,101.0,238.0,245.0,-479.0,149.0,-417.0],[-226.0,-192.0,-876.0,563.0,542.0,-174.0,430.0,-950.0,-22.0,126.0,-233.0,-526.0,519.0,564.0,-810.0,738.0,825.0,398.0,661.0,-26.0,-153.0,684.0],[503.0,65.0,1267.0,-148.0,-255.0,561.0,377.0,148.0,-45.0,324.0,1012.0,459.0,550.0,693.0,368.0,-1154.0,367.0,443.0,-714.0,-197.0,257.0,456.0],[-146.0,1414.0,-546.0,675.0,673.0,-670.0,-655.0,111.0,603.0,-614.0,-12.0,-640.0,335.0,-483.0,1284.0,1377.0,-513.0,613.0,-783.0,364.0,-264.0,-158.0],[-85.0,-1383.0,-592.0,-1253.0,375.0,-376.0,481.0,552.0,-247.0,461.0,-485.0,197.0,-34.0,-767.0,1012.0,-318.0,815.0,-829.0,196.0,401.0,82.0,-587.0],[-490.0,1031.0,814.0,234.0,394.0,675.0,-739.0,545.0,-498.0,-738.0,416.0,-41.0,-906.0,517.0,-300.0,-559.0,-1063.0,-215.0,184.0,-116.0,900.0,-381.0],[2013.0,602.0,686.0,-76.0,-640.0,145.0,136.0,932.0,584.0,784.0,106.0,-49.0,492.0,1399.0,-388.0,458.0,703.0,-538.0,1098.0,-24.0,-1001.0,1471.0],[817.0,-152.0,588.0,0.0,-678.0,-463.0,791.0,-2123.0,-726.0,281.0,-790.0,829.0,-48.0,-1047.0,-2216.0,812.0,178.0,1826.0,-67.0,-167.0,868.0,-855.0],[-1334.0,-1270.0,-1360.0,121.0,1035.0,101.0,101.0,1786.0,-522.0,720.0,1641.0,-478.0,317.0,-148.0,1079.0,-907.0,-906.0,-67.0,-248.0,595.0,-311.0,-232.0],[-549.0,-675.0,112.0,-109.0,514.0,475.0,-241.0,-770.0,1830.0,36.0,-799.0,488.0,785.0,1234.0,-248.0,662.0,1425.0,527.0,126.0,-559.0,441.0,-130.0],[-1240.0,1476.0,795.0,552.0,-900.0,-341.0,1234.0,448.0,532.0,-664.0,33.0,207.0,-406.0,-1102.0,2454.0,1002.0,481.0,-335.0,-585.0,327.0,218.0,1077.0],[1844.0,-799.0,-232.0,-484.0,-866.0,1261.0,-1551.0,1943.0,24.0,41.0,774.0,-950.0,-489.0,2738.0,35.0,-1388.0,-505.0,-1531.0,726.0,1039.0,-1061.0,-285.0],[-497.0,415.0,-346.0,1063.0,809.0,-1208.0,450.0,-798.0,-796.0,1041.0,-349.0,1179.0,884.0,-3645.0,-1515.0,1079.0,-886.0,274.0,642.0,-461.0,-24.0,-1285.0],[-815.0,150.0,1369.0,-419.0,1041.0,450.0,1054.0,1569.0,-220.0,-1035.0,-1199.0,-968.0,225.0,1799.0,1595.0,1066.0,2002.0,972.0,-932.0,75.0,894.0,1823.0],[1641.0,2253.0,-1230.0,-376.0,-1060.0,546.0,-805.0,-3751.0,92.0,-668.0,1639.0,-157.0,-469.0,1574.0,-180.0,-394.0,-1515.0,-566.0,779.0,-700.0,447.0,-1239.0],[-1232.0,-2449.0,1004.0,474.0,1191.0,-363.0,1353.0,2387.0,491.0,1755.0,-644.0,-349.0,-629.0,-3165.0,-2243.0,-2103.0,1338.0,1034.0,-1494.0,859.0,-66.0,2187.0],[84.0,1046.0,-867.0,1728.0,-1930.0,-254.0,-1136.0,-801.0,-1320.0,-807.0,-95.0,2056.0,-64.0,2787.0,1614.0,-444.0,-1522.0,-1718.0,658.0,290.0,-915.0,44.0]]},"rate":{"totals":[46.585,46.8976,49.2438,46.5418,46.2326,43.3781,45.3992,46.2351,43.353,46.5308,46.2831,48.9435,45.793,44.9027,44.3927,47.8126,46.094,44.1106,44.7643,46.573,46.3982,47.1578,47.3051,47.5784,46.2776,43.6342],"contributions":[null,[0.0889,1.2891,-2.2766,-1.2916,0.9084,-0.5485,-0.504,0.8053,0.2671,-0.2113,0.6806,-0.9519,-0.5919,0.327,-0.2169,0.883,-0.4339,-0.8368,1.7374,0.608,0.5389,0.0422],[1.4092,-1.1282,1.1581,0.3449,0.083,-0.1109,-0.049,1.3503,0.8663,-1.0924,-0.425,1.3073,-1.6873,0.4019,0.5617,-0.5017,-0.3141,1.3508,-1.1767,-0.3504,-0.5653,0.9137],[-1.0965,-0.992,-0.2471,0.6075,-1.0662,0.2321,0.1845,-1.7858,-0.99,0.0055,0.135,0.6176,0.8822,-0.1073,1.2644,0.4843,-0.1309,-0.7708,-0.7311,0.3552,1.2678,-0.8206],[-0.5885,0.7154,-0.1314,-0.9612,1.5213,-0.5151,-0.731,1.8397,-0.9343,0.8308,0.6522,-0.0815,-0.3629,-0.6391,-0.302,-0.8299,1.2206,-0.1113,0.4366,-0.4194,-1.3377,0.4193],[0.2449,0.3726,-0.2989,0.2385,-1.4092,-0.3001,-0.1755,-0.7722,1.3535,0.3496,-1.0651,-1.2073,-0.2737,-0.1823,-0.3166,0.4145,-0.5625,-0.7008,-0.2557,1.7057,0.3732,-0.3871],[0.467,-0.2522,-0.2206,0.1469,0.2402,-0.2082,-0.4608,-0.7817,-0.8151,-1.1426,1.1809,0.1582,0.69,1.542,0.502,0.1915,-0.5395,0.3602,-0.3571,-0.8757,1.0169,1.1787],[-0.0621,0.4111,0.5004,1.8161,2.0987,-0.242,0.3822,-0.8234,0.5494,1.3272,-1.0198,-0.3964,0.0309,0.7785,-2.013,-0.3128,0.1789,0.2432,1.1076,-1.5811,-0.8362,-1.3017],[-0.768,0.0425,-0.9638,-2.3959,-1.3784,0.9165,0.0781,0.7917,-1.0939,-0.1794,1.4616,0.0245,-0.3798,-2.6831,2.0312,0.695,-0.5629,-0.8658,-0.2761,1.435,0.408,0.781],[0.6254,0.2595,1.6414,0.2149,-1.2339,0.5259,-0.1368,0.028,1.7261,-0.0664,-1.3761,1.6408,-0.3474,1.3555,-0.5927,-0.9142,0.1626,0.3864,0.3794,-0.7243,0.2572,-0.6336],[-0.5172,-0.4779,-1.4369,0.6991,0.7343,-0.42,0.5091,-1.5615,-0.2168,0.0477,-0.4392,-0.9171,0.6918,0.6145,-1.3583,0.9697,1.1237,0.5014,0.7976,-0.1294,-0.3982,0.9358],[0.4366,-0.1819,1.491,-0.4342,-0.5427,0.5482,0.3246,0.0621,-0.3395,0.2048,1.2427,0.4232,0.5727,0.6227,0.3527,-1.7551,0.2526,0.4254,-1.2413,-0.3698,0.1736,0.3923],[-0.493,1.3635,-0.9637,0.5371,0.6389,-1.0629,-1.0317,-0.031,0.4391,-1.0138,-0.2913,-0.9903,0.1434,-0.9822,1.3093,1.5254,-0.8801,0.4641,-1.1766,0.3337,-0.52,-0.4686],[0.0102,-1.5126,-0.6324,-1.3997,0.5445,-0.3997,0.6524,0.7394,-0.1661,0.6341,-0.5077,0.3047,0.0768,-0.8146,1.3665,-0.3008,1.0497,-0.8963,0.287,0.5354,0.1717,-0.633],[-0.6082,1.268,0.9818,0.2742,0.4913,0.8282,-0.9038,0.6432,-0.613,-0.9046,0.5215,-0.0602,-1.1195,0.6199,-0.3861,-0.6635,-1.2975,-0.2716,0.2119,-0.1444,1.086,-0.4638],[1.9096,0.1074,0.4115,-0.2898,-1.1133,-0.1119,0.0098,0.6045,0.3456,0.6418,-0.1848,-0.2425,0.3411,1.1196,-0.9462,0.3062,0.5506,-0.767,0.9676,-0.2362,-1.409,1.4053],[0.9273,-0.0591,0.6758,0.0103,-0.6951,-0.4634,0.8667,-2.2118,-0.7497,0.3388,-0.8092,0.9147,-0.0282,-1.0728,-2.3302,0.8954,0.2306,1.9714,-0.0481,-0.1589,0.937,-0.8601],[-1.554,-1.4827,-1.5225,0.0802,1.0275,0.0681,0.0299,1.8055,-0.5978,0.6724,1.6657,-0.587,0.2763,-0.2407,1.0876,-1.0366,-1.025,-0.1901,-0.331,0.5652,-0.3927,-0.3017],[-0.7396,-0.8381,-0.0752,-0.2282,0.3087,0.3162,-0.3847,-1.009,1.6602,-0.2177,-1.0144,0.3249,0.5946,0.9467,-0.3832,0.5194,1.239,0.3295,-0.0736,-0.6719,0.2683,-0.2186],[-1.2521,1.2325,0.5747,0.4169,-0.9826,-0.4166,1.0097,0.2793,0.2838,-0.7641,-0.0682,0.0845,-0.5187,-1.1996,2.0847,0.74,0.2757,-0.4871,-0.6445,0.2264,0.0496,0.8843],[1.6167,-0.7486,-0.2234,-0.4343,-0.7732,1.1021,-1.4058,1.6916,-0.0135,0.0227,0.6669,-0.8592,-0.4556,2.3871,0.0119,-1.2327,-0.4493,-1.3746,0.621,0.8973,-0.9545,-0.2672],[-0.2315,0.6041,-0.0962,1.1329,0.877,-0.9136,0.5537,-0.3647,-0.4842,1.1985,-0.1097,1.2653,1.0002,-3.0527,-1.1306,1.1838,-0.6639,0.3665,0.8409,-0.2406,0.1021,-1.0778],[-1.0574,-0.3326,0.7084,-0.7204,0.511,0.103,0.5585,0.6049,-0.6048,-1.3858,-1.3467,-1.1893,-0.2607,1.1686,0.849,0.3689,1.3201,0.5432,-1.2667,-0.2791,0.4949,1.3602],[1.5037,2.1191,-0.8237,-0.2052,-0.7367,0.5921,-0.5273,-2.8835,0.2386,-0.4323,1.4844,-0.0431,-0.2128,1.6004,0.0947,-0.0801,-1.057,-0.3441,0.8133,-0.4598,0.5371,-0.9043],[-1.0917,-2.1367,0.817,0.3925,1.0032,-0.3547,1.1336,1.9925,0.3875,1.4752,-0.579,-0.3135,-0.5757,-2.7801,-1.9478,-1.824,1.1104,0.8513,-1.3071,0.7021,-0.1074,1.8515],[0.0338,0.8102,-0.8025,1.3621,-1.6736,-0.2559,-1.0074,-0.7411,-1.1648,-0.749,-0.1425,1.6608,-0.0848,2.2538,1.2861,-0.3983,-1.3382,-1.488,0.5044,0.1868,-0.814,-0.0813]]}},"spatial":{"neuteringRate":{"moransI":[-0.2007,-0.1424,0.1699,0.0046,-0.3158,-0.0064,-0.1742,-0.0959,-0.0701,-0.1201,-0.1483,-0.0967,0.0006,0.0294,-0.0917,0.2353,0.0124,-0.1892,-0.1601,-0.1704,-0.0828,-0.1074,-0.3144,-0.0122,0.0368,0.1478],"expectedI":[-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476],"varianceI":[0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219],"zScore":[-1.034,-0.6403,1.4696,0.3525,-1.812,0.2783,-0.8553,-0.3265,-0.152,-0.4899,-0.6804,-0.3319,0.3257,0.5204,-0.2976,1.9113,0.4054,-0.9567,-0.7598,-0.8292,-0.2378,-0.4041,-1.8021,0.239,0.5705,1.3199],"pValue":[0.3011,0.522,0.1417,0.7244,0.07,0.7808,0.3924,0.744,0.8792,0.6242,0.4963,0.74,0.7446,0.6028,0.766,0.056,0.6852,0.3387,0.4474,0.407,0.812,0.6862,0.0715,0.8111,0.5683,0.1869],"giStar":[[-0.271,0.069,-0.271,0.533,1.213,0.336,0.508,0.172,-1.527,-0.882,-0.413,-0.582,-0.631,-0.306,0.403,-0.403,0.453,-0.375,0.21,1.749,0.688,-1.023],[0.384,-0.154,0.384,0.899,0.795,-0.436,-0.284,0.307,-0.273,0.802,0.302,-0.5,-1.166,-0.182,1.711,1.673,0.994,1.347,2.073,-1.147,-0.616,0.651],[-1.131,-2.619,-1.131,-1.414,0.155,0.082,1.86,1.663,2.027,1.008,0.656,-0.359,-0.325,-1.825,0.015,0.255,-0.583,0.721,0.63,-0.87,0.268,-0.007],[1.926,1.238,1.926,0.15,0.386,0.738,1.602,-0.433,0.809,-0.923,-1.1,-0.681,-1.072,-2.537,-2.633,-0.022,0.408,-0.734,-0.682,-0.335,-0.65,0.2],[-1.073,0.344,-1.073,-0.075,0.519,1.918,0.992,-0.46,-0.839,-0.223,-1.151,-0.205,0.133,0.922,-0.01,1.02,0.001,0.622,0.481,1.042,-0.296,-0.857],[-1.446,-1.033,-1.446,-0.33,-0.815,0.028,-0.609,0.597,0.822,-0.133,-0.034,-0.248,-1.357,-1.57,-0.897,-0.632,-0.185,0.974,-0.678,0.822,2.145,1.657],[0.493,0.678,0.493,-0.375,-0.525,-1.131,-0.811,-0.707,1.166,0.982,0.414,-1.505,0.406,0.424,0.289,0.937,0.311,-0.255,0.661,-0.623,0.673,0.012],[-0.041,-0.121,-0.041,0.479,1.674,0.471,-0.559,0.165,0.945,0.385,1.501,0.195,0.504,-0.291,0.255,-1.886,-0.576,-0.405,-1.573,-0.944,-0.934,0.942],[-0.547,-0.829,-0.547,-0.001,0.621,1.016,1.658,1.051,0.848,1.126,0.491,0.159,-0.884,-1.155,0.34,0.876,0.816,1.184,1.189,0.118,-0.635,-1.459],[1.09,-0.259,1.09,-0.554,-0.809,-1.178,0.747,-0.541,-0.464,-0.887,-0.185,0.173,0.853,0.429,-0.516,-1.54,-0.372,-1.156,-1.646,-0.01,0.706,1.773],[-1.014,-1.088,-1.014,0.972,1.539,0.094,-0.715,0.027,-0.361,0.326,0.975,1.067,0.492,0.822,1.03,-0.136,-0.305,0.527,-0.089,-0.149,1.41,-1.22],[1.062,0.788,1.062,-1.472,-1.139,-0.748,0.259,0.718,-0.378,-0.084,0.012,0.706,1.066,0.93,1.309,-0.81,-0.326,0.588,-0.417,-1.984,0.571,0.014],[0.55,1.024,0.55,0.191,-0.196,-1.383,-2.096,-1.467,-0.235,0.062,0.321,-1.306,0.565,1.484,0.467,0.334,-0.058,-0.719,0.367,0.968,-0.396,-0.263],[-0.328,0.202,-0.328,-0.801,-0.789,-1.09,-1.999,-0.329,1.415,2.031,2.178,-0.001,2.318,1.442,0.364,-0.376,-1.547,0.632,-0.714,0.203,0.679,-0.038],[0.183,-0.772,0.183,-1.237,-0.811,-0.404,0.614,0.04,0.889,1.39,0.69,1.125,0.489,0.166,-0.19,0.218,-0.468,-0.34,0.365,-1.322,2.156,-2.124],[2.784,1.352,2.784,-0.784,-1.621,-1.579,-0.12,-1.331,-1.612,-0.565,-1.06,0.922,0.168,0.925,0.44,1.21,-0.476,-0.367,0.926,-1.316,-1.011,1.114],[1.298,1.093,1.298,-0.108,-0.102,-0.071,-0.338,-0.672,-2.407,-2.34,-1.518,1.087,-1.513,-1.731,-0.205,0.162,-0.557,-1.119,0.524,-0.549,0.367,0.22],[-0.224,0.866,-0.224,-0.123,-0.488,-0.437,-0.891,0.462,0.844,0.572,0.353,-1.179,0.867,-0.399,0.592,-0.451,1.158,1.468,0.483,-0.554,-1.054,0.323],[-1.365,-1.159,-1.365,-0.064,0.945,-0.24,-0.886,-0.477,-0.925,0.159,0.746,0.466,-0.451,-0.156,1.596,0.52,-0.514,0.018,1.166,-0.826,1.479,0.799],[-1.43,-0.63,-1.43,-0.251,-0.722,-0.664,-0.975,0.509,-0.359,1.051,1.293,0.719,0.571,1.247,1.366,1.182,-0.197,0.325,1.678,-1.358,-0.099,-0.376],[0.1,0.702,0.1,0.953,-0.08,-0.022,0.013,0.56,0.973,0.276,-0.462,-0.962,-0.371,-0.437,0.625,0.873,2.372,1.655,1.032,0.354,-1.188,-1.24],[0.115,0.16,0.115,0.979,0.702,0.859,0.429,-0.108,1.525,0.865,1.829,0.853,0.317,-0.112,0.174,0.319,0.229,-0.349,-0.543,0.513,-1.538,-2.123],[-0.54,-0.662,-0.54,-1.018,-0.291,0.497,0.17,-0.936,0.562,-0.152,-0.19,0.06,0.135,-0.133,-0.22,1.151,-1.523,0.533,0.281,-0.476,-1.188,1.454],[1.044,0.701,1.044,0.681,-0.06,-1.737,-1.87,-1.032,-0.498,-0.694,-0.137,-1.414,-0.359,0.555,1.134,1.275,-0.075,-0.818,0.967,0.092,1.193,-0.985],[-0.212,0.594,-0.212,1.076,0.092,1.022,0.635,1.814,0.268,-1.234,0.035,-0.907,-0.97,-1.807,-2.143,-2.529,0.58,-0.985,-2.444,1.234,0.033,1.29],[1.98,3.578,1.98,1.14,0.384,0.522,-0.97,-1.015,-0.938,-1.754,-1.313,-0.961,-0.93,-0.467,-1.305,-1.025,1.192,-0.55,-1.262,-0.353,-0.258,0.55]]},"registrations":{"moransI":[0.1688,-0.1346,0.0957,-0.1446,-0.2471,-0.071,-0.2306,0.0945,-0.3257,-0.0849,-0.1285,0.0289,-0.1083,-0.2192,-0.2261,-0.1679,0.2009,-0.1935,-0.0432,-0.1654,-0.0251,0.0605,-0.0012,0.1174,0.244,-0.2197],"expectedI":[-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476],"varianceI":[0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219],"zScore":[1.4619,-0.5877,0.9679,-0.6553,-1.3475,-0.1579,-1.2362,0.9604,-1.8789,-0.252,-0.5463,0.5167,-0.4102,-1.1594,-1.2061,-0.8124,1.6792,-0.9856,0.0297,-0.7959,0.1519,0.7306,0.3133,1.1147,1.9701,-1.1623],"pValue":[0.1438,0.5567,0.3331,0.5123,0.1778,0.8745,0.2164,0.3369,0.0603,0.801,0.5849,0.6054,0.6816,0.2463,0.2278,0.4166,0.0931,0.3243,0.9763,0.4261,0.8793,0.465,0.7541,0.265,0.0488,0.2451],"giStar":[[2.383,2.556,2.383,0.722,0.122,1.207,1.241,1.354,0.652,0.816,0.462,0.532,-0.266,0.354,-0.369,-0.981,1.569,0.521,-1.032,-1.664,-1.703,-1.324],[1.245,0.808,1.245,0.649,-0.234,0.981,1.417,0.406,1.222,0.026,0.359,-1.492,-0.735,0.034,-0.079,0.168,0.663,0.172,-0.606,0.055,-0.653,-1.791],[2.438,2.215,2.438,0.523,0.122,0.755,0.693,0.186,0.139,-0.319,-1.711,-1.596,-1.567,-0.343,-1.072,-0.264,1.448,0.24,-0.079,-0.699,-1.421,-0.324],[0.006,0.021,0.006,-1.049,-0.09,-0.151,0.489,-0.459,-0.917,0.347,-1.245,0.075,0.777,2.349,0.944,1.124,-0.125,-0.159,1.142,-0.372,0.666,-1.74],[1.261,0.819,1.261,0.987,0.109,1.147,1.003,0.61,1.368,0.903,-0.834,-0.37,0.214,-0.467,-0.704,-0.075,1.629,1.914,-0.103,-1.207,-1.528,-0.512],[1.992,1.756,1.992,0.239,-0.348,0.172,0.607,0.084,0.906,0.576,-0.645,-1.71,-0.393,0.331,-0.355,0.925,0.85,0.87,0.239,0.976,-1.293,-1.417],[1.208,0.524,1.208,-0.646,-0.628,-0.636,-0.548,-2.02,-0.24,-0.104,-1.103,-0.607,0.357,1.635,-0.328,0.003,-0.489,-0.362,-0.446,0.713,0.166,0.507],[1.667,2.288,1.667,1.582,0.983,0.557,-1.004,-0.954,-0.205,-0.795,-0.747,-1.448,-0.535,0.588,0.497,0.392,0.917,-0.026,0.095,-1.604,-0.315,-1.481],[0.926,0.012,0.926,0.078,-0.095,-0.515,-0.095,-1.49,0.855,0.441,-0.216,-1.721,0.536,0.394,0.06,1.684,-0.55,0.342,0.602,0.134,0.097,0.318],[1.765,1.11,1.765,-0.402,-0.482,-0.511,0.26,0.25,1.481,0.56,-0.247,-0.737,-0.21,-0.176,-0.281,1.15,0.263,0.757,0.45,-1.072,-0.263,-1.59],[0.754,1.363,0.754,0.82,-0.039,-0.084,-0.579,-0.106,-0.654,-1.794,-0.818,-1.251,-0.998,-0.264,0.754,0.894,0.424,-0.291,0.484,-1.363,-0.888,0.552],[1.425,1.561,1.425,1.204,0.019,-0.239,-0.501,0.196,0.457,-0.101,0.97,-0.423,0.929,0.677,-0.814,-1.735,0.607,-0.614,-1.737,-1.771,-0.739,0.551],[1.816,1.51,1.816,1.248,0.094,-0.698,-1.089,-0.488,-0.183,1.006,0.388,-0.156,0.206,1.256,0.577,-0.085,1.208,-0.422,0.345,-1.561,-0.829,0.098],[0.547,0.191,0.547,0.351,-0.989,0.115,-0.115,0.391,0.047,1.352,-0.144,-0.227,0.407,1.937,1.154,1.497,0.235,1.476,1.285,-0.602,-0.988,-1.04],[1.456,0.849,1.456,1.476,0.615,-0.047,-0.441,-1.187,-0.193,0.062,-1.078,-1.389,0.314,1.483,-0.114,0.541,0.733,0.289,0.108,-0.138,0.138,-0.874],[1.558,0.926,1.558,0.15,-0.56,-0.191,0.03,-0.41,1.357,0.27,-0.049,-1.499,0.45,1.288,0.038,0.11,0.092,0.555,-0.82,-0.644,-0.827,-0.103],[3.298,2.345,3.298,-0.09,-1.609,-1.726,-1.189,-0.396,-0.507,-1.035,-0.507,-0.7,-0.4,-0.068,0.462,-0.568,0.308,-0.179,-0.263,-0.933,-0.002,-0.751],[1.412,-0.31,1.412,-0.803,-0.514,-0.137,0.694,-0.263,1.147,1.197,0.286,-0.22,0.69,0.429,0.643,-0.417,-0.436,0.759,-0.311,-0.179,0.22,-1.498],[0.098,-0.17,0.098,-0.571,-0.951,-0.364,-0.405,1.376,1.273,1.035,0.903,0.036,1.243,1.329,1.213,-0.766,-0.194,0.886,-0.37,-1.241,-0.387,-1.737],[0.53,0.23,0.53,-0.41,-1.526,0.001,0.465,0.87,0.967,1.224,-0.425,-0.768,0.232,0.755,0.454,0.863,0.539,1.397,0.654,-0.847,0.067,-0.29],[0.657,-0.059,0.657,-1.344,-1.301,-0.669,0.556,0.163,1.245,1.222,0.403,-1.026,1.414,2.433,0.636,0.483,-0.746,0.674,-0.301,-0.01,-0.745,-0.138],[0.863,0.43,0.863,-1.249,-1.21,-0.731,0.034,0.333,2.038,1.936,0.975,0.429,1.298,0.392,1.312,1.675,-0.118,2.071,1.122,-0.496,-0.887,-2.446],[0.328,0.43,0.328,0.399,-0.842,0.769,0.976,1.102,-0.128,0.852,-1.115,-0.96,-0.37,1.705,1.21,0.915,1.564,1.62,0.965,-0.507,-0.04,-0.834],[1.771,0.82,1.771,-0.011,-1.088,-1.097,-0.202,-1.232,-0.649,-0.07,-0.244,-0.639,1.21,2.426,1.356,1.46,-0.229,-0.225,0.914,-1.317,-0.208,-1.391],[0.58,0.596,0.58,0.243,-0.152,1.782,1.632,2.275,1.933,1.532,0.089,-1.94,-1.647,-1.031,-1.215,-1.648,1.527,1.689,-1.061,-0.69,0.134,0.555],[0.148,0.03,0.148,-0.259,-0.636,-0.295,0.587,-0.709,0.25,-0.019,-0.699,0.268,1.962,1.975,-0.014,-0.378,0.299,0.199,-1.12,0.395,-0.755,0.877]]},"neutering":{"moransI":[0.093,-0.1968,0.0565,-0.2764,-0.3254,-0.0716,-0.2356,-0.0086,-0.3732,-0.1348,-0.2087,0.0027,0.0028,-0.1989,-0.3223,-0.0406,0.3283,-0.1125,-0.048,-0.1204,-0.0694,-0.0136,-0.0908,0.1297,0.3684,-0.1724],"expectedI":[-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476],"varianceI":[0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219],"zScore":[0.9498,-1.0078,0.7033,-1.5458,-1.8767,-0.1618,-1.2699,0.2636,-2.1996,-0.5893,-1.0884,0.3398,0.3404,-1.0222,-1.8557,0.0474,2.5395,-0.4387,-0.0025,-0.492,-0.1474,0.2297,-0.2919,1.1977,2.8108,-0.843],"pValue":[0.3422,0.3135,0.4819,0.1222,0.0606,0.8714,0.2041,0.7921,0.0278,0.5557,0.2764,0.734,0.7336,0.3067,0.0635,0.9622,0.0111,0.6609,0.998,0.6227,0.8828,0.8183,0.7704,0.231,0.0049,0.3993],"giStar":[[2.138,2.57,2.138,1.066,0.837,1.364,1.316,1.271,-0.154,0.314,0.316,0.326,-0.365,0.287,-0.115,-1.053,1.636,0.166,-0.875,-1.243,-1.466,-1.538],[1.345,0.73,1.345,0.972,0.031,0.602,1.027,0.32,0.968,0.188,0.384,-1.275,-1.062,-0.197,0.491,0.913,0.936,0.671,0.263,-0.403,-0.752,-1.491],[1.905,1.139,1.905,-0.13,0.014,0.852,1.461,0.913,0.949,0.242,-1.392,-1.54,-1.743,-0.885,-1.065,-0.239,1.238,0.566,0.108,-0.864,-1.387,-0.314],[0.852,0.672,0.852,-0.808,0.177,0.288,1.131,-0.505,-0.565,0.019,-1.584,-0.164,0.241,1.171,-0.161,1.047,0.136,-0.304,0.794,-0.463,0.273,-1.635],[0.672,0.729,0.672,0.717,0.203,1.729,1.373,0.602,1.277,1.017,-1.075,-0.509,0.278,-0.088,-0.64,0.313,1.517,2.218,0.104,-0.882,-1.485,-0.715],[1.255,1.161,1.255,0.02,-0.703,0.394,0.736,0.709,1.672,0.79,-0.432,-1.742,-0.9,-0.41,-0.7,0.529,0.945,1.395,-0.144,1.602,-0.89,-1.085],[1.159,0.67,1.159,-0.768,-0.864,-1.083,-0.767,-2.074,0.241,0.422,-0.88,-1.194,0.701,1.829,0.037,0.661,-0.218,-0.212,0.141,0.251,0.42,0.402],[1.242,1.823,1.242,1.569,1.643,0.8,-1.027,-0.809,0.094,-0.633,-0.196,-1.154,-0.263,0.424,0.432,-0.394,0.517,-0.26,-0.54,-1.487,-0.622,-1.083],[0.611,-0.309,0.611,0.243,0.137,-0.074,0.471,-1.103,1.295,0.843,-0.008,-1.658,0.325,0.017,0.102,1.886,-0.135,0.781,0.851,0.185,-0.089,-0.188],[2.321,1.184,2.321,-0.304,-0.631,-0.901,0.428,-0.081,1.06,0.049,-0.474,-0.604,0.151,-0.024,-0.4,0.542,0.308,0.409,-0.14,-1.013,0.055,-1.242],[0.366,0.938,0.366,1.009,0.271,-0.199,-0.889,-0.048,-0.634,-1.611,-0.466,-0.981,-0.797,0.001,1.259,1.092,0.303,0.172,0.677,-1.4,-0.504,0.034],[1.631,1.604,1.631,0.226,-0.458,-0.54,-0.308,0.382,-0.026,-0.363,0.542,-0.064,1.141,1.06,-0.005,-1.765,0.233,-0.338,-1.601,-2.029,-0.39,0.45],[1.772,1.656,1.772,1.089,0.027,-1.128,-1.698,-0.948,-0.255,0.924,0.402,-0.616,0.428,1.711,0.79,0.135,1.013,-0.605,0.55,-1.211,-0.886,-0.032],[0.083,0.098,0.083,0.07,-0.94,-0.205,-0.79,0.229,0.39,1.9,0.549,-0.185,1.288,2.386,1.212,1.411,-0.384,1.651,1.046,-0.418,-0.619,-0.856],[1.312,0.521,1.312,1.038,0.397,-0.08,-0.204,-1.063,0.163,0.577,-0.846,-1.127,0.439,1.458,-0.217,0.641,0.561,0.381,0.235,-0.502,0.81,-1.262],[2.514,1.514,2.514,0.082,-0.941,-0.729,-0.162,-0.889,0.624,0.013,-0.454,-1.203,0.305,1.363,0.074,0.478,0.089,0.393,-0.431,-0.896,-0.987,0.235],[3.635,2.656,3.635,-0.255,-1.526,-1.634,-1.206,-0.627,-1.218,-1.576,-0.995,-0.369,-0.976,-0.747,0.223,-0.334,0.037,-0.413,0.058,-0.97,0.145,-0.636],[1.294,-0.084,1.294,-1.127,-0.916,-0.56,0.342,0.079,1.648,1.584,0.593,-0.726,1.163,0.245,0.993,-0.542,-0.072,1.381,0.002,-0.394,-0.305,-1.341],[-0.492,-0.723,-0.492,-0.546,-0.574,-0.465,-0.795,1.346,1.017,1.345,1.389,0.323,1.217,1.306,2.048,-0.562,-0.338,1.119,0.2,-1.549,0.092,-1.722],[-0.18,-0.046,-0.18,-0.452,-1.755,-0.402,-0.188,1.034,0.464,1.487,0.144,-0.408,0.506,1.401,1.043,1.361,0.257,1.275,1.41,-1.299,0.055,-0.381],[0.311,-0.136,0.311,-0.936,-1.171,-0.37,0.766,0.484,1.62,1.217,0.235,-1.213,1.191,2.107,0.671,0.489,0.08,1.066,-0.192,0.11,-0.934,-0.507],[0.588,0.245,0.588,-0.701,-0.804,-0.241,0.332,0.343,2.413,1.92,1.522,0.583,0.998,0.101,1.071,1.415,0.089,1.573,0.62,-0.225,-1.248,-2.366],[-0.028,0.128,-0.028,-0.08,-0.812,1.195,1.273,0.922,0.199,0.737,-1.202,-0.847,-0.456,1.447,0.943,1.218,0.966,1.779,0.895,-0.58,-0.478,-0.332],[1.812,0.915,1.812,0.295,-0.921,-1.474,-0.808,-1.408,-0.8,-0.417,-0.408,-0.937,0.845,2.16,1.439,1.542,-0.125,-0.48,1.009,-1.005,0.162,-1.287],[0.45,0.771,0.45,0.603,-0.171,1.859,1.545,2.694,1.697,0.76,0.194,-2.068,-1.841,-1.623,-1.779,-2.292,1.347,1.083,-1.806,-0.227,0.17,1.05],[0.695,1.1,0.695,0.212,-0.303,-0.144,0.046,-1.054,-0.12,-0.632,-0.987,-0.126,1.372,1.553,-0.323,-0.647,0.611,-0.142,-1.324,0.19,-0.754,1.024]]},"units":{"moransI":[0.017,-0.1441,-0.2838,0.0485,0.0146,-0.4503,-0.2321,0.0325,-0.135,0.0618,-0.1152,-0.1418,0.0521,0.2563,-0.2555,-0.092,-0.0304,-0.045,-0.1767,-0.0692,-0.0726,0.0526,0.05,0.0308,-0.0101,-0.2399],"expectedI":[-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476,-0.0476],"varianceI":[0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219,0.0219],"zScore":[0.4368,-0.6516,-1.5954,0.6492,0.4204,-2.7207,-1.2466,0.5411,-0.5904,0.7394,-0.4568,-0.636,0.6737,2.0533,-1.4045,-0.2997,0.1163,0.0176,-0.872,-0.1455,-0.1687,0.677,0.6597,0.5296,0.2532,-1.2988],"pValue":[0.6623,0.5146,0.1106,0.5162,0.6742,0.0065,0.2125,0.5885,0.5549,0.4597,0.6478,0.5248,0.5005,0.04,0.1602,0.7644,0.9074,0.986,0.3832,0.8843,0.866,0.4984,0.5095,0.5964,0.8001,0.194],"giStar":[[1.335,1.418,1.335,-0.16,0.253,1.271,1.443,1.115,0.924,0.572,-0.975,-0.544,-2.0,-1.651,-2.244,-0.929,1.348,0.603,-0.579,-0.856,0.345,-0.034],[-0.447,-0.234,-0.447,-0.024,0.799,0.299,-0.579,-1.884,-0.959,-0.648,-1.5,0.061,1.067,1.766,0.47,0.169,-0.469,-0.367,0.111,-0.241,0.555,-0.797],[0.797,0.789,0.797,-0.085,-0.02,0.692,0.37,-0.207,0.717,0.381,-0.712,-0.821,-0.531,0.296,-0.426,-0.029,0.527,0.098,-0.092,-1.713,-0.154,0.229],[1.399,0.923,1.399,0.635,0.64,0.302,0.408,-0.495,-0.804,-1.102,-1.451,-0.611,0.203,1.383,-1.043,-1.279,0.025,-1.713,-1.615,0.395,-0.105,-0.211],[2.017,1.503,2.017,0.319,1.4,0.784,0.719,-0.887,-1.311,-0.685,-1.561,0.209,-0.497,0.558,-0.401,0.474,-0.049,-0.216,0.125,-1.069,0.653,-1.555],[0.252,0.291,0.252,-0.018,0.465,0.798,0.293,-0.609,0.743,0.464,-1.237,-0.942,-0.652,-0.288,-1.206,0.809,0.174,0.817,0.387,-0.603,0.233,0.287],[0.499,0.114,0.499,1.242,0.315,1.11,1.264,0.442,0.049,0.853,-0.823,-0.374,0.703,0.805,0.148,0.001,1.612,2.042,0.192,0.354,-1.55,-0.315],[-1.191,-0.183,-1.191,1.08,0.948,1.778,1.176,1.005,0.438,0.325,-0.325,0.197,-0.113,0.98,-0.435,-1.246,1.628,-0.163,-1.127,-1.859,0.807,0.163],[1.656,0.726,1.656,0.395,0.561,-0.336,-0.34,-0.53,0.336,0.617,0.438,-0.282,0.031,0.827,0.086,-0.528,0.142,-1.335,-0.12,0.173,-1.762,-1.715],[0.722,1.052,0.722,0.851,-0.561,0.325,0.2,1.153,1.062,1.659,0.113,-0.992,-0.559,0.17,0.851,1.661,1.825,2.388,1.606,-1.545,0.052,-1.348],[0.581,0.97,0.581,0.365,0.232,0.182,-0.954,-1.949,-0.717,-0.806,-0.862,-0.064,1.352,1.897,0.241,0.76,-0.894,-0.362,-0.204,-1.884,0.23,0.083],[0.737,0.705,0.737,0.061,0.944,0.293,0.083,-1.336,-0.25,0.397,-0.508,-1.186,0.74,2.145,0.354,-0.339,0.128,-0.255,-0.508,0.409,0.259,-0.45],[1.959,1.348,1.959,-0.636,-0.396,-1.016,-0.574,-1.071,0.758,0.637,0.196,-2.157,-0.295,0.407,0.38,1.647,-0.702,0.335,0.89,-1.311,0.17,0.562],[1.211,1.212,1.211,1.583,0.785,1.606,1.272,0.74,1.875,-0.725,-0.364,-1.948,-1.651,-2.32,-2.729,-1.995,1.46,-0.765,-2.423,-0.074,-0.152,0.461],[0.02,-0.826,0.02,-1.435,-1.665,-0.44,0.244,-1.015,0.719,0.672,-0.687,0.105,1.405,1.775,0.657,1.438,-1.025,1.107,0.632,0.211,-1.674,0.42],[2.016,0.047,2.016,-0.826,-1.039,-0.981,0.421,0.065,0.877,1.379,0.146,-0.265,0.886,1.408,-0.133,-0.147,-0.634,-0.026,-0.31,0.123,-1.19,-0.293],[-0.894,-0.944,-0.894,-1.332,-0.388,0.013,0.313,0.797,2.047,2.448,0.851,-1.169,1.068,1.184,0.458,-0.284,-0.212,1.374,0.123,0.343,0.301,-1.101],[-0.759,-0.558,-0.759,-0.71,0.458,0.172,0.49,0.427,0.474,0.397,-0.938,-1.706,0.55,0.925,1.774,1.521,0.246,1.835,1.563,-0.952,1.172,-1.655],[1.185,-0.649,1.185,-0.617,-0.444,-0.835,0.253,0.274,1.492,0.626,0.753,0.22,0.432,0.096,0.308,-0.922,-0.358,-0.588,-0.731,-1.164,0.436,-1.474],[0.83,0.205,0.83,-0.57,0.406,0.103,0.138,-0.606,-1.125,-0.825,-1.716,-0.422,-0.572,1.416,0.055,0.314,-0.697,-0.61,0.295,0.052,-0.914,-0.157],[-1.355,-0.528,-1.355,0.244,0.752,1.111,0.258,0.165,-0.729,0.594,-0.58,-1.331,-0.308,2.056,1.152,0.188,0.344,0.106,0.487,0.621,0.345,0.302],[1.45,1.121,1.45,0.002,0.098,-1.08,-1.449,-1.092,0.003,0.773,0.087,-0.408,0.915,2.557,0.837,0.048,-0.289,0.079,-0.306,0.38,-0.347,-0.597],[1.584,1.252,1.584,0.42,0.701,0.634,0.864,-0.805,-1.59,-1.084,-2.342,-1.297,-1.161,1.547,-0.357,0.137,0.669,-0.595,0.028,-0.124,-0.418,0.181],[1.448,0.479,1.448,-0.889,-1.331,-1.676,-1.596,-1.909,0.919,0.773,0.619,-0.412,1.398,2.271,0.563,0.742,-1.526,0.106,-0.349,0.095,-0.3,-0.065],[0.568,-0.193,0.568,-0.515,0.461,0.661,1.175,0.28,1.637,0.128,-0.129,-2.145,-0.797,0.09,-0.33,0.047,-0.478,-0.605,-0.542,-0.221,-1.704,0.59],[0.874,1.045,0.874,-0.732,-0.095,0.844,0.207,-0.099,0.391,-0.42,-0.859,-1.449,-1.576,0.045,-0.409,-0.384,-0.396,0.096,-0.565,-0.184,0.569,-0.785]]}}}};
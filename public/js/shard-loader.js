@@ -0,0 +1,89 @@
+/**
+ * 寵物登記統計儀表板 - 分片數據載入模組
+ * 讀取 Python 端輸出的分片清單（app/views/shards.py），只下載篩選條件需要的（年份, 動物類型）分片，
+ * 並以 expandColumnarData()（columnar-data.js）還原為逐項格式
+ */
+
+/**
+ * 已下載分片的還原結果（以內容雜湊為鍵，內容未變更的分片不會重複下載）
+ */
+const shardCache = new Map();
+
+/**
+ * 讀取分片清單
+ * @param {String} baseUrl - 分片目錄的URL（以 / 結尾）
+ * @returns {Promise<Object>} 分片清單（附上 baseUrl）
+ */
+async function loadShardManifest(baseUrl = 'data/shards/') {
+    const response = await fetch(`${baseUrl}manifest.json`, { cache: 'no-cache' });
+    if (!response.ok) {
+        throw new Error(`無法載入分片清單: HTTP ${response.status}`);
+    }
+    const manifest = await response.json();
+    if (manifest.format !== 'pet-registration-shards' || manifest.version !== 1) {
+        throw new Error(`不支援的分片清單格式: ${manifest.format} ${manifest.version}`);
+    }
+    manifest.baseUrl = baseUrl;
+    return manifest;
+}
+
+/**
+ * 下載並還原單一分片
+ * @param {Object} manifest - 分片清單
+ * @param {Object} partition - 清單中的分區項目
+ * @returns {Promise<Array>} 分區的逐項數據
+ */
+async function loadShard(manifest, partition) {
+    const cached = shardCache.get(partition.hash);
+    if (cached) {
+        return cached;
+    }
+
+    // 以內容雜湊作為查詢參數，內容變更時瀏覽器快取自然失效
+    const response = await fetch(`${manifest.baseUrl}${partition.file}?v=${partition.hash}`);
+    if (!response.ok) {
+        throw new Error(`無法載入分片 ${partition.file}: HTTP ${response.status}`);
+    }
+    const shard = await response.json();
+    const items = expandColumnarData({
+        ...shard,
+        last_updated: manifest.last_updated,
+        source_url: manifest.source_url,
+        error: manifest.error,
+        cities: manifest.cities,
+        years: manifest.years,
+        animalTypes: manifest.animalTypes
+    }).items;
+
+    shardCache.set(partition.hash, items);
+    return items;
+}
+
+/**
+ * 載入符合篩選條件的分片，返回與 petRegistrationData 相同的結構
+ * cities/years/animalTypes 取自清單，因此篩選選單不受已下載分片的影響。
+ * 只載入部分分片時 partial 為 true，processData() 不會以全量彙總表取代這份數據
+ * @param {Object} manifest - 分片清單
+ * @param {Object} filters - { years: [...], animalTypes: [...] }，省略的條件表示不篩選
+ * @returns {Promise<Object>} { last_updated, source_url, error, partial, items, cities, years, animalTypes }
+ */
+async function loadShards(manifest, filters = {}) {
+    const years = filters.years ? new Set(filters.years.map(String)) : null;
+    const animalTypes = filters.animalTypes ? new Set(filters.animalTypes) : null;
+    const partitions = manifest.partitions.filter(partition =>
+        (!years || years.has(partition.year)) &&
+        (!animalTypes || animalTypes.has(partition.animalType))
+    );
+
+    const shards = await Promise.all(partitions.map(partition => loadShard(manifest, partition)));
+    return {
+        last_updated: manifest.last_updated,
+        source_url: manifest.source_url,
+        error: manifest.error,
+        partial: partitions.length < manifest.partitions.length,
+        items: [].concat(...shards),
+        cities: manifest.cities,
+        years: manifest.years,
+        animalTypes: manifest.animalTypes
+    };
+}
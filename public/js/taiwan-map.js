@@ -58,13 +58,14 @@ class TaiwanInteractiveMap {
         const yearlyData = {};
         const uniqueCities = new Set();
         
+        // 與 app/views/analytics.py 相同的合併方式：計數跨動物類型加總，絕育率由加總後的計數計算，
+        // 登記單位數取最大值，使地圖與 LISA 的數值和預先計算的 Moran's I / Gi* 為同一序列
+        const sums = new Map();
         rawData.items.forEach(item => {
             const year = item.年份;
             const city = item.縣市;
-            const registrations = parseInt(item['登記數(A)']) || 0;
-            const neutering = parseInt(item['絕育數(E)']) || 0;
-            const neuteringRate = parseFloat(item['絕育率(E-F)/(A-B)']) || 0;
-            const units = parseInt(item['登記單位數']) || 0;
+            if (city === '合計') return;
+            const counts = parseCounts(item);
             
             uniqueCities.add(city);
             
@@ -77,26 +78,20 @@ class TaiwanInteractiveMap {
                     registrations: 0,
                     neutering: 0,
                     neuteringRate: 0,
-                    units: 0,
-                    count: 0
+                    units: 0
                 };
             }
             
-            yearlyData[year][city].registrations += registrations;
-            yearlyData[year][city].neutering += neutering;
-            yearlyData[year][city].neuteringRate += neuteringRate;
-            yearlyData[year][city].units += units;
-            yearlyData[year][city].count += 1;
+            const data = yearlyData[year][city];
+            data.registrations += counts.registrations;
+            data.neutering += counts.neutered;
+            data.units = Math.max(data.units, counts.registrationUnits);
+            addCounts(sums, `${year}|${city}`, counts);
         });
         
-        // 計算平均值
         Object.keys(yearlyData).forEach(year => {
             Object.keys(yearlyData[year]).forEach(city => {
-                const data = yearlyData[year][city];
-                if (data.count > 1) {
-                    data.neuteringRate = data.neuteringRate / data.count;
-                    data.units = Math.round(data.units / data.count);
-                }
+                yearlyData[year][city].neuteringRate = pooledNeuteringRate(sums.get(`${year}|${city}`));
             });
         });
         